@@ -0,0 +1,127 @@
+"""
+Benchmarks the listing of a file system extraction by FileSeekerDir.
+
+FileSeekerDir used to list the extraction with a recursive, single-threaded os.scandir
+walk appending every path to a list. build_files_list now lists the directories from a
+pool of threads and keeps a FileListing (directory prefixes plus interned basenames and
+entry types). This lists a synthetic tree (by default 1,000,000 files in 10,000
+directories, iOS-like basenames repeating across directories) or an existing one:
+
+- with the recursive walk it replaced;
+- with build_files_list on a single thread (the default), then on --threads threads
+  (the --listing-threads of ileapp).
+
+The listings are compared path by path, and the time and the memory held by each
+listing are printed. The tree is listed once before timing, so every run finds the
+directories in the OS cache and the timings show the CPU cost of the walk. The threads
+pay off where each directory listing waits on the storage (network shares, slow
+external disks), which a warm cache hides: run it with --tree on such a mount, or with
+--latency to add a delay to every os.scandir call as a network round trip would.
+
+Run from the repository root:
+    python admin/scripts/benchmark_directory_listing.py [--files N] [--tree PATH] [--latency MS] [--threads N]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+# pylint: disable=wrong-import-position
+from scripts.search_files import FileListing, FileSeekerDir
+# pylint: enable=wrong-import-position
+
+BASENAMES = ('Info.plist', 'Cache.db', 'Cache.db-wal', 'Cache.db-shm', 'metadata.plist', 'data.sqlite',
+             'preferences.plist', 'state.json', 'log.txt', 'image.jpg')
+
+
+def build_tree(root, file_count):
+    """Create file_count empty files in directories of 100, under folders of 100 directories"""
+    for index in range(file_count):
+        if index % 100 == 0:
+            folder = os.path.join(root, f'Container{index // 10000:04d}', f'Data{index // 100 % 100:02d}')
+            os.makedirs(folder)
+        name = BASENAMES[index % 100 % len(BASENAMES)]
+        with open(os.path.join(folder, f'{index % 100 // len(BASENAMES)}-{name}'), 'wb'):
+            pass
+
+
+def recursive_listing(directory, paths):
+    """List directory the way FileSeekerDir.build_files_list used to"""
+    try:
+        for item in os.scandir(directory):
+            paths.append(item.path)
+            if item.is_dir(follow_symlinks=False):
+                recursive_listing(item.path, paths)
+    except OSError as ex:
+        print(f'Error reading {directory} {ex}')
+    return paths
+
+
+def threaded_listing(directory, threads):
+    """List directory with build_files_list, on a number of threads"""
+    seeker = FileSeekerDir.__new__(FileSeekerDir)
+    seeker._all_files = FileListing()  # pylint: disable=protected-access
+    seeker.walk_threads = threads
+    seeker.build_files_list(directory)
+    return seeker._all_files  # pylint: disable=protected-access
+
+
+def measure(label, list_tree):
+    """Time list_tree, then list again under tracemalloc for the memory the listing holds"""
+    start = time.perf_counter()
+    listing = list_tree()
+    seconds = time.perf_counter() - start
+    del listing
+    tracemalloc.start()
+    listing = list_tree()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f'{label:<32} {seconds:8.2f} s {size / 1024 / 1024:10.1f} MB  ({len(listing):,} entries)')
+    return listing
+
+
+def main():
+    """
+    Parse the arguments, build or take the tree, list it each way and print the results.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the directory listing of FileSeekerDir.')
+    parser.add_argument('--files', type=int, default=1_000_000, help='Number of files of the synthetic tree')
+    parser.add_argument('--tree', help='List this directory instead of a synthetic tree')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='Milliseconds added to every directory listing (default: 0)')
+    parser.add_argument('--threads', type=int, default=min(32, (os.cpu_count() or 1) * 4),
+                        help='Threads of the threaded listing (default: 4 per CPU, up to 32)')
+    args = parser.parse_args()
+
+    root = args.tree
+    if not root:
+        root = tempfile.mkdtemp()
+        print(f'Creating {args.files:,} files in {root}...')
+        build_tree(root, args.files)
+    scandir = os.scandir
+    if args.latency:
+        def slow_scandir(path):
+            time.sleep(args.latency / 1000)
+            return scandir(path)
+        os.scandir = slow_scandir
+    try:
+        recursive_listing(root, [])  # warm the OS cache
+        expected = measure('recursive walk (before)', lambda: recursive_listing(root, []))
+        for threads in (1, args.threads):
+            listing = measure(f'build_files_list, {threads} thread(s)', lambda threads=threads: threaded_listing(root, threads))
+            if list(listing) != expected:
+                raise RuntimeError(f'The listing on {threads} thread(s) differs from the recursive walk')
+        print('The listings are identical.')
+    finally:
+        os.scandir = scandir
+        if not args.tree:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmarks the writes to the LAVA database (_lava_artifacts.db).
+
+Two workloads are timed against a fresh LAVA database in a temporary folder:
+
+- lava_insert_sqlite_data with one large artifact shaped like walStringsDetails
+  (1,000,000 rows by default), reported in rows per second.
+- the small inserts crunch_artifacts and the media check-in make one row at a time
+  (_artifact_pattern_to_file links), once committing after every row with a rollback
+  journal, the way lavafuncs used to, and once in WAL mode with the batched commits of
+  lava_commit.
+
+Run from the repository root:
+    python admin/scripts/benchmark_lava_writes.py [--rows N] [--links N]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+# pylint: disable=wrong-import-position
+import scripts.lavafuncs as lavafuncs
+# pylint: enable=wrong-import-position
+
+WAL_STRINGS_DETAILS_HEADERS = ('String', 'Length', 'First Byte Offset', 'Occurrence Count', 'Filename',
+                               'Source File')
+
+
+def wal_strings_rows(count):
+    """
+    Build rows shaped like the walStringsDetails artifact.
+
+    Args:
+        count (int): The number of rows.
+
+    Returns:
+        list: The rows.
+    """
+    return [(f'com.apple.string.{index:08d}', 26, index * 37, index % 17 + 1, 'sms.db-wal',
+             'private/var/mobile/Library/SMS/sms.db-wal') for index in range(count)]
+
+
+def run_bulk_insert(rows):
+    """Insert the rows as one artifact table. Returns the seconds taken, commit included."""
+    start = time.perf_counter()
+    table_name, object_columns, column_map = lavafuncs.lava_create_sqlite_table('walStringsDetails',
+                                                                                WAL_STRINGS_DETAILS_HEADERS)
+    lavafuncs.lava_insert_sqlite_data(table_name, rows, object_columns, WAL_STRINGS_DETAILS_HEADERS, column_map)
+    lavafuncs.lava_commit()
+    return time.perf_counter() - start
+
+
+def run_links(count, flush_size, journal_mode='WAL', synchronous='NORMAL'):
+    """Insert count pattern-to-file links with the given settings. Returns the seconds taken."""
+    lavafuncs.lava_flush_size = flush_size
+    lavafuncs.lava_db.execute(f'PRAGMA journal_mode = {journal_mode}')
+    lavafuncs.lava_db.execute(f'PRAGMA synchronous = {synchronous}')
+    start = time.perf_counter()
+    for index in range(count):
+        lavafuncs.lava_insert_sqlite_artifact_link_pattern_to_file(index % 600, index)
+    lavafuncs.lava_commit()
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Parse the arguments, run both workloads and print the timings.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the writes to the LAVA database.')
+    parser.add_argument('--rows', type=int, default=1_000_000,
+                        help='Number of rows of the walStringsDetails-like artifact')
+    parser.add_argument('--links', type=int, default=100_000,
+                        help='Number of single-row pattern-to-file inserts')
+    args = parser.parse_args()
+
+    output_folder = tempfile.mkdtemp()
+    default_flush_size = lavafuncs.lava_flush_size
+    try:
+        lavafuncs.initialize_lava('benchmark', output_folder, 'fs')
+
+        rows = wal_strings_rows(args.rows)
+        seconds = run_bulk_insert(rows)
+        print(f'lava_insert_sqlite_data: {args.rows:,} rows in {seconds:.2f} s '
+              f'({args.rows / seconds:,.0f} rows/s)')
+
+        # SQLite's defaults (rollback journal, full sync) are what the database used before
+        per_row = run_links(args.links, 1, 'DELETE', 'FULL')
+        batched = run_links(args.links, default_flush_size)
+        print(f'{args.links:,} pattern-to-file links, commit per row: {per_row:8.2f} s')
+        print(f'{args.links:,} pattern-to-file links, batched:        {batched:8.2f} s '
+              f'(flush size {default_flush_size:,}, {per_row / batched:.1f} x)')
+    finally:
+        if lavafuncs.lava_db:
+            lavafuncs.lava_db.close()
+        shutil.rmtree(output_folder, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmarks the media lookups and inserts of the media check-in.
+
+For every media file, _check_in_media looks up its media reference, then its media item,
+and inserts whichever is missing; get_data_list_with_media then reads the full media info
+of every reference to build the report. This replays that sequence against a fresh LAVA
+database in a temporary folder, for a number of media items each referenced by two
+artifacts and checked in twice (the second pass only finds existing references):
+
+- once with the media registry disabled (media_cache_size 0), so that every lookup is a
+  SELECT on _lava_media_references, _lava_media_items or _lava_media_info and every
+  insert is written on its own, the way lavafuncs used to;
+- once with the media registry answering the lookups and batching the inserts.
+
+Run from the repository root:
+    python admin/scripts/benchmark_media_registry.py [--media N]
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+# pylint: disable=wrong-import-position
+import scripts.lavafuncs as lavafuncs
+from scripts.ilapfuncs import MediaItem, MediaReferences
+# pylint: enable=wrong-import-position
+
+
+def check_in(media_id, artifact_name):
+    """Look up and insert a media reference and its item like _check_in_media. Returns the reference id."""
+    media_ref_id = hashlib.sha1(f'{media_id}-{artifact_name}-'.encode()).hexdigest()
+    if lavafuncs.lava_get_media_references(media_ref_id):
+        return media_ref_id
+    if not lavafuncs.lava_get_media_item(media_id):
+        media_item = MediaItem(media_id)
+        media_item.set_values((media_id, f'/private/var/mobile/Media/DCIM/100APPLE/IMG_{media_id[:4]}.JPG',
+                               f'media/{media_id}.jpg', 'image/jpeg', 'not parsed yet', 1700000000,
+                               1700000000, 0))
+        lavafuncs.lava_insert_sqlite_media_item(media_item)
+    media_references = MediaReferences(media_ref_id)
+    media_references.set_values((media_ref_id, media_id, 'benchmark', artifact_name, ''))
+    lavafuncs.lava_insert_sqlite_media_references(media_references)
+    return media_ref_id
+
+
+def run_check_ins(media_ids, cache_size):
+    """Check in every media twice for two artifacts and read back the full info. Returns the seconds taken."""
+    lavafuncs.media_cache_size = cache_size
+    start = time.perf_counter()
+    ref_ids = []
+    for _ in range(2):
+        for artifact_name in ('photos', 'messages'):
+            ref_ids.extend(check_in(media_id, artifact_name) for media_id in media_ids)
+    for ref_id in ref_ids:
+        if not lavafuncs.lava_get_full_media_info(ref_id)['extraction_path']:
+            raise RuntimeError(f'No media info for {ref_id}')
+    lavafuncs.lava_commit()
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Parse the arguments, run the check-ins with and without the registry and print the timings.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the media lookups and inserts of the check-in.')
+    parser.add_argument('--media', type=int, default=50_000, help='Number of distinct media items')
+    args = parser.parse_args()
+
+    media_ids = [hashlib.sha1(str(index).encode()).hexdigest() for index in range(args.media)]
+    default_cache_size = lavafuncs.media_cache_size
+    timings = {}
+    try:
+        for label, cache_size in (('per-row queries', 0), ('media registry', default_cache_size)):
+            output_folder = tempfile.mkdtemp()
+            try:
+                lavafuncs.initialize_lava('benchmark', output_folder, 'fs')
+                timings[label] = run_check_ins(media_ids, cache_size)
+            finally:
+                lavafuncs.lava_db.close()
+                shutil.rmtree(output_folder, ignore_errors=True)
+    finally:
+        lavafuncs.media_cache_size = default_cache_size
+
+    calls = args.media * 4
+    for label, seconds in timings.items():
+        print(f'{calls:,} check-ins and {calls:,} media info reads, {label}: {seconds:8.2f} s')
+    print(f'Speed-up: {timings["per-row queries"] / timings["media registry"]:.1f} x')
+
+
+if __name__ == '__main__':
+    main()
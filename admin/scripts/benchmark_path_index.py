@@ -0,0 +1,136 @@
+"""
+Benchmarks the seekers' PathIndex against the linear fnmatch scan it replaced.
+
+Every path glob declared by the loaded artifacts is run against the file listings in
+admin/data/filepath-lists (real iOS extractions), once with the linear scan that
+FileSeekerDir/Tar/Zip used to do and once through PathIndex. The two result lists are
+compared pattern by pattern, so the benchmark doubles as an equivalence check on real
+data, and the timings of both approaches are printed per file listing.
+
+The listings can be inflated with --scale to approximate a large full file system
+extraction: each copy gets its own top-level folder, so matches grow with the scale.
+
+Run from the repository root:
+    python admin/scripts/benchmark_path_index.py [--scale N] [--list NAME]
+"""
+import argparse
+import csv
+import glob
+import os
+import sys
+import time
+import zipfile
+from fnmatch import _compile_pattern
+from io import StringIO
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+# pylint: disable=wrong-import-position
+import scripts.plugin_loader as plugin_loader
+from scripts.search_files import PathIndex, normcase
+# pylint: enable=wrong-import-position
+
+FILEPATH_LISTS_DIR = 'admin/data/filepath-lists'
+
+
+def get_patterns():
+    """
+    Collect every path glob declared by the loaded artifacts.
+
+    Returns:
+        list: The sorted, de-duplicated glob patterns.
+    """
+    patterns = set()
+    for plugin in plugin_loader.PluginLoader().plugins:
+        if isinstance(plugin.search, str):
+            patterns.add(plugin.search)
+        elif isinstance(plugin.search, (list, tuple)):
+            patterns.update(plugin.search)
+    return sorted(patterns)
+
+
+def read_filepath_list(zip_path):
+    """
+    Read the file paths from a filepath list zip file.
+
+    Args:
+        zip_path (str): The path to the zip file holding the CSV listing.
+
+    Returns:
+        list: The file paths, in listing order.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        csv_files = [f for f in zf.namelist() if f.endswith('.csv') and not os.path.basename(f).startswith('.')]
+        paths = []
+        for csv_file in csv_files:
+            content = zf.read(csv_file).decode('utf-8', errors='replace')
+            rows = csv.reader(StringIO(content))
+            next(rows, None)  # Skip header
+            paths.extend(row[0] for row in rows if row)
+    return paths
+
+
+def run_linear(items, patterns, root):
+    """Run every pattern with the linear scan. Returns (results, seconds)."""
+    start = time.perf_counter()
+    results = {}
+    for pattern in patterns:
+        pat = _compile_pattern(normcase(pattern))
+        results[pattern] = [item for item in items if pat(root + normcase(item)) is not None]
+    return results, time.perf_counter() - start
+
+
+def run_indexed(items, patterns, root):
+    """Build the index and run every pattern through it. Returns (results, build seconds, search seconds)."""
+    start = time.perf_counter()
+    index = PathIndex(items, key=lambda item: root + normcase(item))
+    built = time.perf_counter()
+    results = {pattern: index.search(normcase(pattern)) for pattern in patterns}
+    return results, built - start, time.perf_counter() - built
+
+
+def main():
+    """
+    Parse the arguments, run both approaches on each file listing and print the timings.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark PathIndex against the linear glob scan.')
+    parser.add_argument('--scale', type=int, default=1,
+                        help='Replicate each listing N times to simulate a larger extraction')
+    parser.add_argument('--list', dest='list_name', default=None,
+                        help='Only run the file listing whose zip name contains this text')
+    args = parser.parse_args()
+
+    patterns = get_patterns()
+    print(f'{len(patterns)} artifact path patterns loaded\n')
+    root = normcase('root/')
+
+    for zip_path in sorted(glob.glob(os.path.join(FILEPATH_LISTS_DIR, '*.zip'))):
+        list_name = os.path.basename(zip_path).replace('.csv.zip', '')
+        if args.list_name and args.list_name not in list_name:
+            continue
+        paths = read_filepath_list(zip_path)
+        if args.scale > 1:
+            paths = [f'copy{copy}/{path}' for copy in range(args.scale) for path in paths]
+
+        print(f'{list_name}: {len(paths):,} paths')
+        linear_results, linear_secs = run_linear(paths, patterns, root)
+        indexed_results, build_secs, search_secs = run_indexed(paths, patterns, root)
+
+        mismatches = [pattern for pattern in patterns if linear_results[pattern] != indexed_results[pattern]]
+        hits = sum(len(found) for found in linear_results.values())
+        print(f'  matched files:      {hits:,}')
+        print(f'  linear scan:        {linear_secs:8.2f} s')
+        print(f'  index build:        {build_secs:8.2f} s')
+        print(f'  index searches:     {search_secs:8.2f} s')
+        print(f'  speed-up:           {linear_secs / (build_secs + search_secs):8.1f} x')
+        if mismatches:
+            print(f'  MISMATCHES ({len(mismatches)}):')
+            for pattern in mismatches:
+                print(f'    {pattern}')
+        else:
+            print('  results identical for every pattern')
+        print()
+
+
+if __name__ == '__main__':
+    main()
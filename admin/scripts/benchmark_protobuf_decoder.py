@@ -0,0 +1,161 @@
+"""
+Benchmarks the decoding of protobuf records with blackboxprotobuf and with the compiled typedefs
+of scripts/protobuf_decoder.
+
+The Biome artifacts decode the protobuf message of every written SEGB entry with the typedef
+of their stream. This decodes the records of a Biome stream:
+
+- with blackboxprotobuf.decode_message, which copies the typedef and looks every field up
+  in its dicts for each record;
+- with protobuf_decoder.decode_protobuf, which compiles the typedef once,
+
+checks that both give the same values and prints the records decoded per second.
+
+The records are those of the SEGB files given (a Biome stream of an extraction, e.g.
+private/var/mobile/Library/Biome/streams/public/NowPlaying/local/*), decoded with the
+typedef of a JSON file if one is given, guessing all the fields otherwise. Without files,
+Now Playing records are generated, with the typedef biomeNowplaying pins and the fields
+it does not pin.
+
+Run from the repository root:
+    python admin/scripts/benchmark_protobuf_decoder.py [SEGB_FILE ...] [--typedef JSON_FILE] [--records N]
+"""
+import argparse
+import json
+import os
+import random
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+# pylint: disable=wrong-import-position
+from scripts import blackboxprotobuf
+from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.ccl_segb.ccl_segb_common import EntryState
+from scripts.protobuf_decoder import decode_protobuf
+# pylint: enable=wrong-import-position
+
+# The typedef of biomeNowplaying
+NOW_PLAYING_TYPEDEF = {
+    '2': {'type': 'double', 'name': ''},
+    '3': {'type': 'int', 'name': ''},
+    '5': {'type': 'str', 'name': ''},
+    '6': {'type': 'int', 'name': ''},
+    '8': {'type': 'str', 'name': ''},
+    '9': {'type': 'int', 'name': ''},
+    '10': {'type': 'str', 'name': ''},
+    '13': {'type': 'int', 'name': ''},
+    '14': {'type': 'message', 'name': '', 'message_typedef': {
+        '1': {'type': 'int', 'name': ''},
+        '2': {'type': 'int', 'name': ''},
+        '3': {'type': 'str', 'name': ''}}},
+    '15': {'type': 'str', 'name': ''},
+}
+# The fields of the records, those biomeNowplaying does not pin included, with their strings
+# as bytes (blackboxprotobuf has no encoder for str)
+RECORD_TYPEDEF = {
+    '1': {'type': 'bytes', 'name': ''},
+    '2': {'type': 'double', 'name': ''},
+    '3': {'type': 'int', 'name': ''},
+    '4': {'type': 'double', 'name': ''},
+    '5': {'type': 'bytes', 'name': ''},
+    '6': {'type': 'int', 'name': ''},
+    '7': {'type': 'message', 'name': '', 'message_typedef': {
+        '1': {'type': 'bytes', 'name': ''},
+        '2': {'type': 'int', 'name': ''}}},
+    '8': {'type': 'bytes', 'name': ''},
+    '9': {'type': 'int', 'name': ''},
+    '10': {'type': 'bytes', 'name': ''},
+    '13': {'type': 'int', 'name': ''},
+    '14': {'type': 'message', 'name': '', 'message_typedef': {
+        '1': {'type': 'int', 'name': ''},
+        '2': {'type': 'int', 'name': ''},
+        '3': {'type': 'bytes', 'name': ''}}},
+    '15': {'type': 'bytes', 'name': ''},
+    '16': {'type': 'bytes', 'name': ''},
+}
+
+
+def generate_records(count):
+    """Returns Now Playing records"""
+    rng = random.Random(0)
+    bundles = ['com.apple.Music', 'com.spotify.client', 'com.apple.podcasts', 'com.google.ios.youtube']
+    records = []
+    for index in range(count):
+        bundle = rng.choice(bundles)
+        records.append(bytes(blackboxprotobuf.encode_message({
+            '1': f'{rng.getrandbits(128):032X}',
+            '2': 700000000.0 + index,
+            '3': rng.randint(0, 3),
+            '4': rng.random() * 300,
+            '5': bundle,
+            '6': rng.randint(0, 1),
+            '7': {'1': 'AirPods Pro', '2': rng.randint(1, 5)},
+            '8': f'Track {index}',
+            '9': rng.randint(100, 400),
+            '10': f'Artist {index % 50}',
+            '13': rng.randint(0, 2),
+            '14': {'1': rng.randint(0, 10), '2': rng.randint(0, 10), '3': 'Speaker'},
+            '15': f'Album {index % 20}',
+            '16': struct.pack('<Q', rng.getrandbits(64)),
+        }, RECORD_TYPEDEF)))
+    return records
+
+
+def read_records(paths):
+    """Returns the data of the written entries of SEGB files"""
+    records = []
+    for path in paths:
+        for record in read_segb_file(path):
+            if record.state == EntryState.Written:
+                records.append(bytes(record.data))
+    return records
+
+
+def decode_all(records, typedef, decode):
+    """Decode every record. Returns the values and the seconds taken."""
+    start = time.perf_counter()
+    values = []
+    for data in records:
+        try:
+            values.append(decode(data, typedef))
+        except Exception as ex:  # pylint: disable=broad-except
+            values.append(type(ex).__name__)
+    return values, time.perf_counter() - start
+
+
+def main():
+    """
+    Parse the arguments, decode the records both ways and print the timings.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the decoding of protobuf records.')
+    parser.add_argument('segb_files', nargs='*', help='SEGB files of a Biome stream')
+    parser.add_argument('--typedef', help='JSON file of the typedef of the records')
+    parser.add_argument('--records', type=int, default=100_000, help='Number of records generated without files')
+    args = parser.parse_args()
+
+    if args.segb_files:
+        records = read_records(args.segb_files)
+        typedef = None
+        if args.typedef:
+            with open(args.typedef, encoding='utf-8') as typedef_file:
+                typedef = json.load(typedef_file)
+    else:
+        records = generate_records(args.records)
+        typedef = NOW_PLAYING_TYPEDEF
+
+    expected, blackbox_seconds = decode_all(
+        records, typedef, lambda data, typedef: blackboxprotobuf.decode_message(data, typedef)[0])
+    values, compiled_seconds = decode_all(records, typedef, decode_protobuf)
+    if values != expected:
+        raise RuntimeError('decode_protobuf and blackboxprotobuf.decode_message decoded different values')
+
+    for label, seconds in (('blackboxprotobuf', blackbox_seconds), ('compiled typedef', compiled_seconds)):
+        print(f'{len(records):,} records, {label}: {seconds:8.2f} s, {len(records) / seconds:12,.0f} records/s')
+    print(f'Speed-up: {blackbox_seconds / compiled_seconds:.1f} x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmarks the reading of SEGB files with ccl_segb and with scripts/segb_reader.
+
+The Biome artifacts read every file of their stream with read_segb_file. This reads
+SEGB files:
+
+- with ccl_segb.read_segb_file, which opens a file for each signature it checks and reads
+  the records with read calls;
+- with segb_reader.read_segb_file, which memory-maps the file once,
+
+checks that they read the same entries and prints the entries read per second.
+
+The files are those given (a Biome stream of an extraction, e.g.
+private/var/mobile/Library/Biome/streams/restricted/App.InFocus/local/*). Without files,
+SEGB v1 and v2 files are generated in a temporary folder.
+
+Run from the repository root:
+    python admin/scripts/benchmark_segb_reader.py [SEGB_FILE ...] [--files N] [--entries N]
+"""
+import argparse
+import os
+import random
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+# pylint: disable=wrong-import-position
+from scripts import segb_reader
+from scripts.ccl_segb import ccl_segb
+# pylint: enable=wrong-import-position
+
+
+def generate_segb1(rng, entries):
+    """Returns a SEGB v1 file"""
+    body = bytearray()
+    for _ in range(entries):
+        data = rng.randbytes(rng.randint(40, 400))
+        body += struct.pack('<iiddIi', len(data), rng.choice((1, 1, 1, 3)), 7e8 + rng.random() * 1e7,
+                            7e8 + rng.random() * 1e7, zlib.crc32(data), 0) + data
+        body += b'\0' * (-len(body) % 8)
+    return struct.pack('<I', 56 + len(body)) + b'\0' * 48 + b'SEGB' + bytes(body)
+
+
+def generate_segb2(rng, entries):
+    """Returns a SEGB v2 file"""
+    body = bytearray()
+    trailer = bytearray()
+    for _ in range(entries):
+        data = rng.randbytes(rng.randint(40, 400))
+        body += struct.pack('<Ii', zlib.crc32(data), 0) + data
+        trailer += struct.pack('<2id', len(body), rng.choice((1, 1, 1, 3)), 7e8 + rng.random() * 1e7)
+        body += b'\0' * (-len(body) % 4)
+    return struct.pack('<4sid16s', b'SEGB', entries, 7e8, b'\0' * 16) + bytes(body) + bytes(trailer)
+
+
+def read_all(paths, read):
+    """Read every file. Returns the entries and the seconds taken."""
+    start = time.perf_counter()
+    entries = [entry for path in paths for entry in read(path)]
+    return entries, time.perf_counter() - start
+
+
+def main():
+    """
+    Parse the arguments, read the files both ways and print the timings.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the reading of SEGB files.')
+    parser.add_argument('segb_files', nargs='*', help='SEGB files of a Biome stream')
+    parser.add_argument('--files', type=int, default=200, help='Number of files generated without files')
+    parser.add_argument('--entries', type=int, default=1000, help='Number of entries of a generated file')
+    args = parser.parse_args()
+
+    temp_folder = None
+    paths = args.segb_files
+    if not paths:
+        temp_folder = tempfile.mkdtemp()
+        rng = random.Random(0)
+        for index in range(args.files):
+            path = os.path.join(temp_folder, str(index))
+            generate = generate_segb1 if index % 2 else generate_segb2
+            with open(path, 'wb') as segb_file:
+                segb_file.write(generate(rng, args.entries))
+            paths.append(path)
+
+    try:
+        expected, ccl_seconds = read_all(paths, ccl_segb.read_segb_file)
+        entries, mapped_seconds = read_all(paths, segb_reader.read_segb_file)
+    finally:
+        if temp_folder:
+            shutil.rmtree(temp_folder, ignore_errors=True)
+    if entries != expected:
+        raise RuntimeError('segb_reader and ccl_segb read different entries')
+
+    for label, seconds in (('ccl_segb', ccl_seconds), ('memory-mapped', mapped_seconds)):
+        print(f'{len(expected):,} entries, {label}: {seconds:8.2f} s, {len(expected) / seconds:12,.0f} entries/s')
+    print(f'Speed-up: {ccl_seconds / mapped_seconds:.1f} x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmarks the rows of a database built row by row and yielded by get_sqlite_db_rows.
+
+The artifacts reading a database iterate over get_sqlite_db_records and build each row of
+their output, converting its timestamps one value at a time. This reads the samples of a
+generated Health-like database with three timestamp columns:
+
+- with get_sqlite_db_records, converting the timestamps of every row as the artifacts did;
+- with get_sqlite_db_rows, converting the timestamp columns of every batch of rows fetched,
+
+checks that they give the same rows and prints the rows read per second.
+
+Run from the repository root:
+    python admin/scripts/benchmark_sqlite_db_rows.py [--rows N]
+"""
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+# pylint: disable=wrong-import-position
+from scripts.ilapfuncs import close_sqlite_dbs, convert_cocoa_core_data_ts_to_utc, get_sqlite_db_records, \
+    get_sqlite_db_rows
+# pylint: enable=wrong-import-position
+
+QUERY = '''
+SELECT samples.start_date, samples.end_date, objects.creation_date, samples.quantity, samples.device
+FROM samples LEFT JOIN objects ON samples.data_id = objects.data_id
+'''
+
+
+def generate_database(path, rows):
+    """Writes a database of samples and their objects"""
+    rng = random.Random(0)
+    db = sqlite3.connect(path)
+    db.execute('CREATE TABLE samples (data_id INTEGER PRIMARY KEY, start_date, end_date, quantity, device)')
+    db.execute('CREATE TABLE objects (data_id INTEGER PRIMARY KEY, creation_date)')
+    start_dates = [6e8 + rng.random() * 1e8 for _ in range(rows)]
+    db.executemany('INSERT INTO samples VALUES (?, ?, ?, ?, ?)', (
+        (index, start_date, start_date + rng.random() * 600, rng.random() * 200, rng.choice(('Watch6,1', 'iPhone14,2')))
+        for index, start_date in enumerate(start_dates)))
+    db.executemany('INSERT INTO objects VALUES (?, ?)', (
+        (index, start_date + 60) for index, start_date in enumerate(start_dates)))
+    db.commit()
+    db.close()
+
+
+def read_row_by_row(path):
+    """The rows, built the way the artifacts built them"""
+    data_list = []
+    for record in get_sqlite_db_records(path, QUERY):
+        start_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
+        end_timestamp = convert_cocoa_core_data_ts_to_utc(record[1])
+        added_timestamp = convert_cocoa_core_data_ts_to_utc(record[2])
+        data_list.append((start_timestamp, end_timestamp, added_timestamp, record[3], record[4]))
+    return data_list
+
+
+def read_rows(path):
+    """The rows yielded by get_sqlite_db_rows"""
+    return list(get_sqlite_db_rows(path, QUERY, {0: 'cocoa_date', 1: 'cocoa_date', 2: 'cocoa_date'}))
+
+
+def main():
+    """
+    Parse the arguments, read the database both ways and print the timings.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark get_sqlite_db_rows.')
+    parser.add_argument('--rows', type=int, default=500000, help='Number of rows of the generated database')
+    args = parser.parse_args()
+
+    temp_folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_folder, 'healthdb_secure.sqlite')
+        generate_database(path, args.rows)
+        timings = []
+        results = []
+        for read in (read_row_by_row, read_rows):
+            start = time.perf_counter()
+            results.append(read(path))
+            timings.append(time.perf_counter() - start)
+        close_sqlite_dbs()
+    finally:
+        shutil.rmtree(temp_folder, ignore_errors=True)
+    if results[0] != results[1]:
+        raise RuntimeError('get_sqlite_db_rows and the rows built row by row differ')
+
+    for label, seconds in zip(('row by row', 'get_sqlite_db_rows'), timings):
+        print(f'{args.rows:,} rows, {label:18}: {seconds:6.2f} s, {args.rows / seconds:10,.0f} rows/s')
+    print(f'Speed-up: {timings[0] / timings[1]:.1f} x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmarks the conversion of timestamp columns one value at a time and a column at once.
+
+The artifacts reading the Health, SMS... databases convert every timestamp of a column.
+This converts columns of Cocoa timestamps in seconds and of Unix timestamps in
+milliseconds and nanoseconds:
+
+- with convert_cocoa_core_data_ts_to_utc or convert_unix_ts_to_utc, value by value;
+- with convert_*_ts_column_to_utc, the column at once;
+- with convert_*_ts_column_to_seconds, to the Unix timestamps LAVA stores,
+
+checks that they give the same timestamps and prints the values converted per second.
+
+Run from the repository root:
+    python admin/scripts/benchmark_timestamp_columns.py [--values N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+# pylint: disable=wrong-import-position
+from scripts.ilapfuncs import convert_cocoa_core_data_ts_column_to_seconds, \
+    convert_cocoa_core_data_ts_column_to_utc, convert_cocoa_core_data_ts_to_utc, \
+    convert_unix_ts_column_to_seconds, convert_unix_ts_column_to_utc, convert_unix_ts_to_utc
+# pylint: enable=wrong-import-position
+
+
+def timed(convert, values):
+    """Converts the values. Returns the timestamps and the seconds taken."""
+    start = time.perf_counter()
+    converted = convert(values)
+    return converted, time.perf_counter() - start
+
+
+def main():
+    """
+    Parse the arguments, convert the columns the three ways and print the timings.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the conversion of timestamp columns.')
+    parser.add_argument('--values', type=int, default=1000000, help='Number of values of a column')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    seconds = [rng.uniform(1.2e9, 1.8e9) for _ in range(args.values)]
+    columns = (
+        ('Cocoa seconds', [value - 978307200 for value in seconds], convert_cocoa_core_data_ts_to_utc,
+         convert_cocoa_core_data_ts_column_to_utc, convert_cocoa_core_data_ts_column_to_seconds),
+        ('Unix milliseconds', [int(value * 1e3) for value in seconds], convert_unix_ts_to_utc,
+         convert_unix_ts_column_to_utc, convert_unix_ts_column_to_seconds),
+        ('Unix nanoseconds', [int(value * 1e9) for value in seconds], convert_unix_ts_to_utc,
+         convert_unix_ts_column_to_utc, convert_unix_ts_column_to_seconds))
+
+    for label, values, convert, convert_column, convert_column_to_seconds in columns:
+        expected, scalar_seconds = timed(lambda values, convert=convert: [convert(value) for value in values], values)
+        converted, column_seconds = timed(convert_column, values)
+        unix_seconds, to_seconds_seconds = timed(convert_column_to_seconds, values)
+        if converted != expected or unix_seconds != [int(value.timestamp()) for value in expected]:
+            raise RuntimeError(f'{label}: the column and scalar conversions differ')
+
+        print(label)
+        for method, elapsed in (('value by value', scalar_seconds), ('column', column_seconds),
+                                ('column to seconds', to_seconds_seconds)):
+            print(f'  {method:18}: {elapsed:6.2f} s, {len(values) / elapsed:12,.0f} values/s, '
+                  f'{scalar_seconds / elapsed:.1f} x')
+
+
+if __name__ == '__main__':
+    main()
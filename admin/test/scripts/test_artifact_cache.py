@@ -0,0 +1,227 @@
+"""A result loaded from the artifact cache must produce the same report as parsing the files.
+
+With --cache-dir, artifact_processor stores the headers and rows an artifact returned and,
+when a later run finds the same files for it, writes the stored rows to the outputs without
+calling the artifact. What an artifact records besides its rows (device information, the
+iOS version) has to come back with them, a file that changed has to be parsed again, and
+an artifact whose output is not all in its rows (media, extra files in its report folder)
+must never be served from the cache, or a re-run would quietly give an incomplete report.
+An entry that was not written with the signing key, which is kept outside the cache
+directory, must not be unpickled. The keychain of the run and the files an artifact
+searches for itself are read like the found files: a change to them must be parsed again.
+"""
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+import scripts.artifact_cache as artifact_cache
+import scripts.ilapfuncs as ilapfuncs
+from scripts import ios_keychain, lavafuncs
+from scripts.context import Context
+from scripts.ilapfuncs import artifact_processor, device_info, iOS
+# pylint: enable=wrong-import-position
+
+__artifacts_v2__ = {
+    name: {
+        'name': f'Cache Test {name}',
+        'description': 'test artifact',
+        'category': 'Testing',
+        'paths': ('*/source.txt',),
+        'output_types': ['html', 'tsv', 'lava'],
+    }
+    for name in ('listed', 'streamed', 'with_extra_file', 'with_media', 'with_search')
+}
+
+calls = []
+
+
+def _read_rows(files_found):
+    with open(files_found[0], encoding='utf-8') as source:
+        for index, line in enumerate(source.read().splitlines()):
+            yield (index, line)
+
+
+@artifact_processor
+def listed(context):
+    calls.append('listed')
+    files_found = context.get_files_found()
+    device_info('Testing', 'Source lines', len(list(_read_rows(files_found))), files_found[0])
+    iOS.set_version('17.4')
+    return ('Index', 'Line'), list(_read_rows(files_found)), files_found[0]
+
+
+@artifact_processor
+def streamed(context):
+    calls.append('streamed')
+    files_found = context.get_files_found()
+    return ('Index', 'Line'), _read_rows(files_found), files_found[0]
+
+
+@artifact_processor
+def with_search(context):
+    calls.append('with_search')
+    files_found = context.get_files_found()
+    searched = context.get_seeker().search('*/searched.txt')
+    return ('Index', 'Line'), list(_read_rows(files_found)) + list(_read_rows(searched)), files_found[0]
+
+
+@artifact_processor
+def with_extra_file(context):
+    calls.append('with_extra_file')
+    files_found = context.get_files_found()
+    with open(os.path.join(context.get_report_folder(), 'extra.txt'), 'w', encoding='utf-8') as extra:
+        extra.write('not in the rows')
+    return ('Index', 'Line'), list(_read_rows(files_found)), files_found[0]
+
+
+@artifact_processor
+def with_media(context):
+    calls.append('with_media')
+    files_found = context.get_files_found()
+    return ('Index', ('Line', 'media')), [], files_found[0]
+
+
+class _Seeker:
+    '''Finds the files of the input folder'''
+
+    def __init__(self, input_folder):
+        self.input_folder = input_folder
+        self.file_infos = {}
+
+    def search(self, pattern, return_on_first_hit=False):
+        found = sorted(str(path) for path in self.input_folder.glob(pattern.split('/', 1)[1]))
+        return (found[0] if found else []) if return_on_first_hit else found
+
+
+class TestArtifactCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.source = self.tmpdir / 'input' / 'source.txt'
+        self.source.parent.mkdir()
+        self.source.write_text('first\nsecond <b>\nthird\n', encoding='utf-8')
+        artifact_cache.enable_cache(str(self.tmpdir / 'cache'), str(self.tmpdir / 'settings' / 'artifact_cache.key'))
+        calls.clear()
+        self.runs = 0
+
+    def tearDown(self):
+        artifact_cache.enable_cache(None)
+        Context.set_keychain_path(None)
+        ios_keychain._discovered.clear()  # pylint: disable=protected-access
+        ilapfuncs.identifiers.clear()
+        iOS._version = None  # pylint: disable=protected-access
+        if lavafuncs.lava_db is not None:
+            lavafuncs.lava_db.close()
+            lavafuncs.lava_db = None
+        lavafuncs.lava_data = None
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _run(self, artifact, seeker=None):
+        self.runs += 1
+        output = self.tmpdir / f'output{self.runs}'
+        report_folder = output / '_HTML' / 'Testing'
+        report_folder.mkdir(parents=True)
+        lavafuncs.initialize_lava('input', str(output), 'fs')
+        ilapfuncs.identifiers.clear()
+        iOS._version = None  # pylint: disable=protected-access
+        artifact([str(self.source)], str(report_folder), seeker, False, 'UTC')
+        table = lavafuncs.lava_db.execute(f'SELECT * FROM {artifact.__name__}').fetchall()
+        lavafuncs.lava_db.close()
+        lavafuncs.lava_db = None
+        name = f'Cache Test {artifact.__name__}'
+        return {
+            'html': (report_folder / f'{name}.temphtml').read_text(encoding='utf8'),
+            'tsv': (output / '_TSV Exports' / f'{name}.tsv').read_text(encoding='utf-8-sig'),
+            'lava': table,
+            'identifiers': repr(ilapfuncs.identifiers),
+            'ios_version': iOS.get_version(),
+        }
+
+    def test_unchanged_files_are_loaded_from_the_cache(self):
+        for artifact in (listed, streamed):
+            expected = self._run(artifact)
+            result = self._run(artifact)
+            self.assertEqual(calls, [artifact.__name__], artifact.__name__)
+            for output in ('html', 'tsv', 'lava', 'identifiers', 'ios_version'):
+                self.assertEqual(result[output], expected[output], f'{artifact.__name__} {output}')
+            self.assertEqual(len(result['lava']), 3)
+            calls.clear()
+        result = self._run(listed)
+        self.assertEqual(result['ios_version'], '17.4')
+        self.assertIn('Source lines', result['identifiers'])
+        self.assertEqual(calls, [])
+        self.assertEqual(len(artifact_cache.stats['stored']), 2)
+        self.assertEqual(len(artifact_cache.stats['hit']), 3)
+
+    def test_changed_files_are_parsed_again(self):
+        self._run(listed)
+        self.source.write_text('first\nchanged\n', encoding='utf-8')
+        result = self._run(listed)
+        self.assertEqual(calls, ['listed', 'listed'])
+        self.assertEqual(len(result['lava']), 2)
+
+    def test_changed_keychain_is_read_again(self):
+        keychain = self.tmpdir / 'keychain.plist'
+        keychain.write_bytes(b'first')
+        Context.set_keychain_path(str(keychain))
+        self._run(listed)
+        self._run(listed)
+        self.assertEqual(calls, ['listed'])
+        keychain.write_bytes(b'other')
+        self._run(listed)
+        self.assertEqual(calls, ['listed', 'listed'])
+
+    def test_changed_searched_files_are_parsed_again(self):
+        searched = self.source.parent / 'searched.txt'
+        searched.write_text('searched\n', encoding='utf-8')
+        seeker = _Seeker(self.source.parent)
+        expected = self._run(with_search, seeker)
+        self.assertEqual(len(expected['lava']), 4)
+        self.assertEqual(self._run(with_search, seeker)['lava'], expected['lava'])
+        self.assertEqual(calls, ['with_search'])
+        searched.write_text('searched\nchanged\n', encoding='utf-8')
+        self.assertEqual(len(self._run(with_search, seeker)['lava']), 5)
+        self.assertEqual(calls, ['with_search', 'with_search'])
+        # The seeker is put back after the run
+        self.assertNotIn('search', vars(seeker))
+
+    def test_entries_not_signed_with_the_key_are_ignored(self):
+        expected = self._run(listed)
+        for kind in ('meta', 'rows'):
+            entry_path, = (self.tmpdir / 'cache').glob(f'*.{kind}')
+            content = entry_path.read_bytes()
+            entry_path.write_bytes(content[:-1] + bytes([content[-1] ^ 1]))
+            self.assertEqual(self._run(listed)['lava'], expected['lava'])
+        self.assertEqual(calls, ['listed', 'listed', 'listed'])
+        self.assertEqual(self._run(listed)['lava'], expected['lava'])
+        self.assertEqual(calls, ['listed', 'listed', 'listed'])
+        # Another key does not load the entries either
+        artifact_cache.enable_cache(str(self.tmpdir / 'cache'), str(self.tmpdir / 'other.key'))
+        self._run(listed)
+        self.assertEqual(len(calls), 4)
+
+    def test_output_outside_the_rows_is_not_cached(self):
+        for artifact in (with_extra_file, with_extra_file, with_media, with_media):
+            self.runs += 1
+            output = self.tmpdir / f'output{self.runs}'
+            report_folder = output / '_HTML' / 'Testing'
+            report_folder.mkdir(parents=True)
+            lavafuncs.initialize_lava('input', str(output), 'fs')
+            # artifact_processor calls the artifact with a context, pylint only sees that signature
+            artifact([str(self.source)], str(report_folder), None, False, 'UTC')  # pylint: disable=too-many-function-args
+            lavafuncs.lava_db.close()
+            lavafuncs.lava_db = None
+        self.assertEqual(calls, ['with_extra_file', 'with_extra_file', 'with_media', 'with_media'])
+        self.assertEqual(len(artifact_cache.stats['not cacheable']), 4)
+        self.assertEqual(list((self.tmpdir / 'cache').iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""The timing of an artifact must account for its rows and for the time spent on each output.
+
+crunch_artifacts runs every artifact inside artifact_profiler.measure, and the outputs
+written by artifact_processor add their time to the artifact being measured. The parse
+time is what is left of the wall time, so time spent writing an output that is not
+counted against it would show up as parsing; rows that are not counted, or counted twice
+for an artifact that yields them in chunks, would make the _artifact_timings table and
+the "Artifact timings" tab point at the wrong module.
+"""
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+import scripts.artifact_profiler as artifact_profiler
+import scripts.ilapfuncs as ilapfuncs
+from scripts import lavafuncs
+from scripts.ilapfuncs import artifact_processor
+# pylint: enable=wrong-import-position
+
+__artifacts_v2__ = {
+    'timed': {
+        'name': 'Timed <Test>',
+        'description': 'test artifact',
+        'category': 'Testing',
+        'output_types': ['html', 'tsv', 'lava'],
+    },
+}
+
+
+@artifact_processor
+def timed(_context):
+    return ('Index', 'Value'), ((index, f'value {index}') for index in range(25)), 'private/var/source.db'
+
+
+class TestArtifactProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.chunk_size = ilapfuncs.artifact_chunk_size
+        ilapfuncs.artifact_chunk_size = 10
+        artifact_profiler.timings.clear()
+        lavafuncs.initialize_lava('input', str(self.tmpdir), 'fs')
+
+    def tearDown(self):
+        ilapfuncs.artifact_chunk_size = self.chunk_size
+        artifact_profiler.timings.clear()
+        artifact_profiler.enable_profiling(None)
+        lavafuncs.lava_db.close()
+        lavafuncs.lava_db = None
+        lavafuncs.lava_data = None
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _run(self):
+        report_folder = self.tmpdir / '_HTML' / 'Testing'
+        report_folder.mkdir(parents=True)
+        source = self.tmpdir / 'source.db'
+        source.write_bytes(b'x' * 1000)
+        with artifact_profiler.measure(7, 'timedModule', 'timed', [str(source)], 0.5):
+            # artifact_processor calls the artifact with a context, pylint only sees that signature
+            timed([str(source)], str(report_folder), None, False, 'UTC')  # pylint: disable=too-many-function-args
+        return artifact_profiler.timings[-1]
+
+    def test_timing_of_an_artifact(self):
+        timing = self._run()
+        self.assertEqual((timing.number, timing.module_name, timing.artifact_name), (7, 'timedModule', 'timed'))
+        self.assertEqual(timing.rows, 25)
+        self.assertEqual((timing.files_found, timing.files_bytes, timing.search_secs), (1, 1000, 0.5))
+        self.assertEqual(sorted(timing.output_secs), ['html', 'lava', 'tsv'])
+        self.assertGreater(timing.wall_secs, 0)
+        self.assertAlmostEqual(timing.parse_secs + sum(timing.output_secs.values()), timing.wall_secs)
+        if artifact_profiler.resource is not None:
+            self.assertGreaterEqual(timing.peak_rss_delta_kb, 0)
+
+    def test_timings_go_to_the_lava_database_and_the_report(self):
+        timing = self._run()
+        lavafuncs.lava_insert_sqlite_artifact_timings(artifact_profiler.timings)
+        row = lavafuncs.lava_db.execute(
+            'SELECT id, module_name, rows, wall_secs, parse_secs, tsv_secs, kml_secs FROM _artifact_timings').fetchall()
+        self.assertEqual(row, [(7, 'timedModule', 25, timing.wall_secs, timing.parse_secs,
+                                timing.output_secs['tsv'], 0.0)])
+        log_path = self.tmpdir / 'Artifact_Timings.html'
+        artifact_profiler.write_timings_log(str(log_path))
+        timings_log = log_path.read_text(encoding='utf8')
+        self.assertIn('id="artifact-timings"', timings_log)
+        self.assertIn('<td>timedModule</td><td>timed</td>', timings_log)
+
+    def test_profile_of_an_artifact(self):
+        artifact_profiler.enable_profiling(str(self.tmpdir / '_Profiles'))
+        self._run()
+        profiles = sorted(path.name for path in (self.tmpdir / '_Profiles').iterdir())
+        self.assertEqual(profiles, ['timedModule.timed.prof', 'timedModule.timed.txt'])
+        self.assertIn('function calls', (self.tmpdir / '_Profiles' / 'timedModule.timed.txt').read_text(encoding='utf-8'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""run_artifacts must give the same report as a sequential run, whatever order workers finish in.
+
+With --workers, artifacts run in forked worker processes. Everything they keep in memory
+(the screen log, device info, report icons, LAVA metadata) is lost with the worker unless
+it is handed back and merged, and merging in completion order would shuffle the log and
+the Device Info page from one run to the next. These tests make a slow artifact finish
+last and check that its output still lands in plugin order, that last_build and the
+artifacts reading _lava_artifacts.db stay in the main process, and that 'depends_on'
+holds an artifact back until the one it names has completed. The artifacts of a module
+keeping a module-level cache redo the cached work in their own worker, so they must
+name one another in 'depends_on' for that work not to run twice at the same time.
+"""
+import ast
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+import types
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts.artifact_scheduler import ArtifactTask, can_run_in_parallel, run_artifacts
+from scripts.ilapfuncs import OutputParameters, device_info, identifiers, logfunc
+# pylint: enable=wrong-import-position
+
+
+def _plugin(name, search='*/file', depends_on=None):
+    artifact_info = {'depends_on': depends_on} if depends_on else {}
+    return types.SimpleNamespace(name=name, module_name=name, search=search, artifact_info=artifact_info)
+
+
+@unittest.skipUnless(can_run_in_parallel(), 'worker processes require the fork start method')
+class TestRunArtifacts(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.marker = os.path.join(self.tmpdir, 'slow_done')
+        identifiers.clear()
+        OutputParameters.log_buffer = []
+
+    def tearDown(self):
+        OutputParameters.log_buffer = None
+        identifiers.clear()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _run(self, plugins, workers=3):
+        tasks = [ArtifactTask(number, plugin, ['found'] if plugin.search != 'missing' else [], self.tmpdir)
+                 for number, plugin in enumerate(plugins, start=1)]
+        done = []
+
+        def run_task(task):
+            name = task.plugin.name
+            if name == 'slow':
+                time.sleep(0.5)
+                pathlib.Path(self.marker).touch()
+            logfunc(f'{name} ran in {"main" if os.getpid() == main_pid else "worker"}')
+            if name == 'after_slow':
+                logfunc(f'slow was done: {os.path.exists(self.marker)}')
+            device_info('Device Info', 'Seen by', name)
+            return name != 'broken'
+
+        main_pid = os.getpid()
+        run_artifacts(tasks, workers, None, run_task, lambda task, ok: done.append((task.plugin.name, ok)))
+        return done
+
+    def test_output_is_merged_in_plugin_order(self):
+        done = self._run([_plugin('last_build'), _plugin('slow'), _plugin('fast'), _plugin('broken'),
+                          _plugin('missing', search='missing')])
+        self.assertEqual(done, [('last_build', True), ('slow', True), ('fast', True), ('broken', False),
+                                ('missing', True)])
+        self.assertEqual(OutputParameters.log_buffer, [
+            'last_build ran in main', 'slow ran in worker', 'fast ran in worker', 'broken ran in worker',
+            'missing ran in main'])
+        self.assertEqual([value['value'] for value in identifiers['Device Info']['Seen by']],
+                         ['last_build', 'slow', 'fast', 'broken', 'missing'])
+
+    def test_lava_readers_run_last_in_main_process(self):
+        done = self._run([_plugin('reader', search=None), _plugin('slow'), _plugin('fast')])
+        self.assertEqual([name for name, _ in done], ['slow', 'fast', 'reader'])
+        self.assertIn('reader ran in main', OutputParameters.log_buffer)
+
+    def test_depends_on_waits_for_the_named_artifact(self):
+        self._run([_plugin('slow'), _plugin('after_slow', depends_on='slow'), _plugin('fast')])
+        self.assertIn('slow was done: True', OutputParameters.log_buffer)
+
+    def test_worker_state_does_not_leak_between_tasks(self):
+        self._run([_plugin(f'artifact{number}') for number in range(6)], workers=2)
+        self.assertEqual([value['value'] for value in identifiers['Device Info']['Seen by']],
+                         [f'artifact{number}' for number in range(6)])
+
+
+class TestSharedModuleState(unittest.TestCase):
+
+    def test_artifacts_sharing_a_cache_depend_on_one_another(self):
+        for module_path in sorted((REPO_ROOT / 'scripts' / 'artifacts').glob('*.py')):
+            tree = ast.parse(module_path.read_text(encoding='utf-8'))
+            assignments = {target.id: node.value for node in tree.body if isinstance(node, ast.Assign)
+                           for target in node.targets if isinstance(target, ast.Name)}
+            artifacts = assignments.get('__artifacts_v2__')
+            if not isinstance(artifacts, ast.Dict) or len(artifacts.keys) < 2 or \
+                    not any('cache' in name for name in assignments if name != '__artifacts_v2__'):
+                continue
+            artifacts_info = ast.literal_eval(artifacts)
+            names = list(artifacts_info)
+            for name in names[1:]:
+                depends_on = artifacts_info[name].get('depends_on') or []
+                depends_on = {depends_on} if isinstance(depends_on, str) else set(depends_on)
+                self.assertTrue(depends_on & set(names), f'{module_path.name}: {name}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""An artifact that yields its rows must produce the same report as one returning a list.
+
+artifact_processor writes the rows of an artifact that yields them (a generator, a
+database cursor) to the outputs artifact_chunk_size rows at a time, instead of walking a
+complete data_list once per output. The chunks must add up to exactly what the list gives:
+a row lost or written twice at a chunk boundary, a total of entries in the HTML report
+that does not match the table, or a LAVA record count that stays empty would all go
+unnoticed in a report with a million rows.
+"""
+import datetime
+import pathlib
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+import scripts.ilapfuncs as ilapfuncs
+from scripts import lavafuncs
+from scripts.ilapfuncs import artifact_processor
+# pylint: enable=wrong-import-position
+
+ARTIFACT = {
+    'name': 'Streaming Test',
+    'description': 'test artifact',
+    'category': 'Testing',
+    'output_types': 'all',
+}
+__artifacts_v2__ = {'listed': ARTIFACT, 'streamed': ARTIFACT}
+
+HEADERS = (('Timestamp', 'datetime'), 'Row', 'Latitude', 'Longitude', 'Value')
+
+
+def _rows(count):
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    for index in range(count):
+        yield (start + datetime.timedelta(minutes=index), index, 45.5 if index % 3 else '', -73.5,
+               f'<value {index}>')
+
+
+@artifact_processor
+def listed(_context):
+    return HEADERS, list(_rows(50)), 'private/var/source.db'
+
+
+@artifact_processor
+def streamed(_context):
+    return HEADERS, _rows(50), 'private/var/source.db'
+
+
+class TestStreamedArtifact(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.chunk_size = ilapfuncs.artifact_chunk_size
+        ilapfuncs.artifact_chunk_size = 7
+
+    def tearDown(self):
+        ilapfuncs.artifact_chunk_size = self.chunk_size
+        if lavafuncs.lava_db is not None:
+            lavafuncs.lava_db.close()
+            lavafuncs.lava_db = None
+        lavafuncs.lava_data = None
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _run(self, artifact):
+        output = self.tmpdir / artifact.__name__
+        report_folder = output / '_HTML' / 'Testing'
+        report_folder.mkdir(parents=True)
+        lavafuncs.initialize_lava('input', str(output), 'fs')
+        data_headers, data_list, _ = artifact([], str(report_folder), None, False, 'UTC')
+        table = lavafuncs.lava_db.execute(f'SELECT * FROM {artifact.__name__}').fetchall()
+        record_count = lavafuncs.lava_data['artifacts']['Testing'][0]['record_count']
+        lavafuncs.lava_db.close()
+        lavafuncs.lava_db = None
+        ilapfuncs.finalize_output_dbs(str(output))
+        with sqlite3.connect(output / '_Timeline' / 'tl.db') as timeline:
+            timeline_rows = timeline.execute('SELECT * FROM data').fetchall()
+        return {
+            'headers': data_headers,
+            'rows': len(data_list),
+            # The total of a streamed table is written over blanks once it is known
+            'html': re.sub(r'(Total number of entries: \d+) +<', r'\1<',
+                           (report_folder / 'Streaming Test.temphtml').read_text(encoding='utf8')),
+            'tsv': (output / '_TSV Exports' / 'Streaming Test.tsv').read_text(encoding='utf-8-sig'),
+            'kml': (output / '_KML Exports' / 'Streaming Test.kml').read_text(encoding='utf8'),
+            'timeline': timeline_rows,
+            'lava': table,
+            'record_count': record_count,
+        }
+
+    def test_streamed_output_matches_listed_output(self):
+        expected = self._run(listed)
+        result = self._run(streamed)
+        for output in ('html', 'tsv', 'kml', 'timeline', 'lava', 'record_count'):
+            self.assertEqual(result[output], expected[output], output)
+        self.assertEqual(expected['record_count'], 50)
+        self.assertEqual(len(result['lava']), 50)
+        self.assertIn('Total number of entries: 50', result['html'])
+        # The rows were written as they came, they are not handed back
+        self.assertEqual(result['rows'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""FileSeekerDir must list a directory tree exactly as the recursive scandir walk did.
+
+build_files_list lists the directories of the extraction from a pool of threads and
+stores the result as directory prefixes plus basenames, with the type of each entry.
+Searches return their results in listing order and return_on_first_hit takes the first
+of them, so the listing has to come out in the order of the recursive walk it replaced,
+whatever order the threads finish in. The stored types decide what search copies:
+a symbolic link has to be followed the way os.path.isfile and os.path.isdir do.
+"""
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts.search_files import FileListing, FileSeekerDir
+# pylint: enable=wrong-import-position
+
+
+def recursive_listing(directory):
+    """The listing FileSeekerDir.build_files_list used to produce"""
+    paths = []
+    for item in os.scandir(directory):
+        paths.append(item.path)
+        if item.is_dir(follow_symlinks=False):
+            paths.extend(recursive_listing(item.path))
+    return paths
+
+
+class TestDirectoryListing(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.extraction = self.tmpdir / 'extraction'
+        for top in range(4):
+            for sub in range(5):
+                folder = self.extraction / 'private' / f'var{top}' / f'Library{sub}' / 'Caches'
+                folder.mkdir(parents=True)
+                for index in range(3):
+                    (folder / f'cache{index}.db').write_text(f'{top} {sub} {index}')
+                (folder.parent / 'Info.plist').write_text('plist')
+        (self.extraction / 'private' / 'empty').mkdir()
+        self.links = hasattr(os, 'symlink') and sys.platform != 'win32'
+        if self.links:
+            os.symlink(self.extraction / 'private' / 'var0' / 'Library0' / 'Info.plist',
+                       self.extraction / 'private' / 'link.plist')
+            os.symlink(self.extraction / 'private' / 'var1', self.extraction / 'private' / 'var_link')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _seeker(self, threads):
+        return FileSeekerDir(str(self.extraction), str(self.tmpdir / f'data{threads}'), walk_threads=threads)
+
+    def test_listing_order_matches_the_recursive_walk(self):
+        expected = recursive_listing(str(self.extraction))
+        for threads in (1, 8):
+            listing = self._seeker(threads)._all_files  # pylint: disable=protected-access
+            self.assertIsInstance(listing, FileListing)
+            self.assertEqual(list(listing), expected, threads)
+            self.assertEqual([listing[index] for index in range(len(listing))], expected)
+        kinds = {path: listing.kind(index) for index, path in enumerate(listing)}
+        self.assertEqual(kinds[str(self.extraction / 'private' / 'empty')], FileListing.DIRECTORY)
+        self.assertEqual(kinds[str(self.extraction / 'private' / 'var0' / 'Library0' / 'Info.plist')],
+                         FileListing.FILE)
+        # Entries sharing a basename share the string
+        plists = [listing._names[index] for index, path in enumerate(listing)  # pylint: disable=protected-access
+                  if path.endswith('Info.plist') and kinds[path] == FileListing.FILE]
+        self.assertEqual(len({id(name) for name in plists}), 1)
+
+    def test_search_copies_files_and_followed_links(self):
+        seeker = self._seeker(8)
+        found = seeker.search('*/Library2/Caches/cache1.db')
+        self.assertEqual(len(found), 4)
+        for path in found:
+            self.assertTrue(os.path.isfile(path))
+            self.assertIn(path, seeker.file_infos)
+        source = str(self.extraction / 'private' / 'var3' / 'Library2' / 'Caches' / 'cache1.db')
+        file_info = seeker.file_infos[seeker.copied[source]]
+        self.assertEqual(file_info.modification_date, os.stat(source).st_mtime)
+        if self.links:
+            link = seeker.search('*/link.plist', return_on_first_hit=True)
+            self.assertEqual(pathlib.Path(link).read_text(encoding='utf-8'), 'plist')
+            # A link to a directory is neither walked nor copied
+            self.assertEqual(seeker.search('*/var_link/*'), [])
+            self.assertEqual(len(seeker.search('*/var_link')), 1)
+            self.assertFalse(os.path.exists(seeker.search('*/var_link')[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
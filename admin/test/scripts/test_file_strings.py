@@ -0,0 +1,82 @@
+"""The strings of the journals must not depend on how their files are scanned.
+
+walStrings scans the files memory mapped, from a pool of processes each writing the
+strings of a file to the report folder, and walStringsUTF16Details does the same for the
+strings encoded in UTF-16LE. A string is stripped of its spaces and kept if four
+characters are left, counted once per value with the byte offset of its first occurrence
+(after the leading spaces), and the results must come back in the order of the files,
+whether a pool is used or not: the report numbers the files in that order. In a worker
+process of the artifact scheduler, the files are scanned without a pool of its own.
+"""
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts.file_strings import extract_strings, read_strings_file, write_strings_files
+from scripts.ilapfuncs import OutputParameters
+# pylint: enable=wrong-import-position
+
+CONTENTS = (b'\x01\x02  Hello world\xff' + b'abc\x00' + b'Hello world\x00\x00' + '  Bonjour'.encode('utf-16-le') +
+            b'\x9a' + 'ab'.encode('utf-16-le') + b'\x00\x00' + 'Bonjour'.encode('utf-16-le') + b'     \x00ZYXWVU')
+
+
+class TestFileStrings(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.files = []
+        for index in range(5):
+            path = self.tmpdir / f'{index}.db-wal'
+            path.write_bytes(b'' if index == 2 else CONTENTS + f'file {index}'.encode())
+            self.files.append(str(path))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_strings_are_counted_at_their_first_offset(self):
+        strings, total_matches = extract_strings(self.files[0])
+        self.assertEqual(strings, {'Hello world': [4, 2], 'ZYXWVUfile 0': [len(CONTENTS) - 6, 1]})
+        self.assertEqual(total_matches, 3)
+        strings, total_matches = extract_strings(self.files[0], utf16=True)
+        offset = CONTENTS.index('Bonjour'.encode('utf-16-le'))
+        self.assertEqual(strings, {'Bonjour': [offset, 2]})
+        self.assertEqual(total_matches, 2)
+        self.assertEqual(extract_strings(self.files[2]), ({}, 0))
+
+    def test_pool_writes_the_files_in_order(self):
+        results = {}
+        for processes in (1, 2):
+            folder = self.tmpdir / str(processes)
+            folder.mkdir()
+            jobs = [(path, str(folder / f'{index}.txt'), False) for index, path in enumerate(self.files)]
+            jobs.append((str(self.tmpdir / 'missing-wal'), str(folder / 'missing.txt'), False))
+            results[processes] = list(write_strings_files(jobs, processes))
+            self.assertEqual(results[processes][:5], [(3, 2), (3, 2), (0, 0), (3, 2), (3, 2)])
+            self.assertIsInstance(results[processes][5], str)
+            self.assertFalse(os.path.exists(folder / '2.txt'))
+            self.assertEqual(list(read_strings_file(folder / '3.txt')),
+                             [('Hello world', '4', '2'), ('ZYXWVUfile 3', str(len(CONTENTS) - 6), '1')])
+        self.assertEqual(results[1], results[2])
+
+    def test_no_pool_in_a_worker_process(self):
+        jobs = [(path, str(self.tmpdir / f'{index}.txt'), False) for index, path in enumerate(self.files)]
+        OutputParameters.log_buffer = []
+        try:
+            with mock.patch('multiprocessing.context.ForkContext.Pool') as pool:
+                results = list(write_strings_files(jobs))
+        finally:
+            OutputParameters.log_buffer = None
+        pool.assert_not_called()
+        self.assertEqual(results, [(3, 2), (3, 2), (0, 0), (3, 2), (3, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
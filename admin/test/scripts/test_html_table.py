@@ -0,0 +1,84 @@
+"""The rows of an HTML report table are rendered a batch at a time.
+
+write_artifact_data_rows used to format every cell on its own, looking its header up in
+the html_no_escape list, and wrote the rows one at a time. The columns to escape are now
+worked out when the table starts and the rows are joined into large writes: the table
+must read exactly as it did, None and N/A cells left empty, the cells of html_no_escape
+columns written as they are, and those of the columns without a header dropped when
+some columns are not escaped. Past inline_rows rows, the rows of a large table are
+written as JSON for its script to add, one cell per column, without any text that could
+end the script element.
+"""
+import json
+import pathlib
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts.artifact_report import ArtifactHtmlReport
+# pylint: enable=wrong-import-position
+
+HEADERS = ('Name', 'Media', 'Size')
+ROWS = [
+    ('<b>bold</b> & "quoted"', '<img src="a.jpg">', 3.5),
+    (None, 'N/A', 'None'),
+    ('short',),
+    (),
+    ('extra', '<a>', 0, '<i>no header</i>'),
+]
+
+
+class TestHtmlTable(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _table(self, rows, **kwargs):
+        report = ArtifactHtmlReport('Table Test')
+        report.start_artifact_report(self.tmpdir, 'Table Test')
+        report.add_script()
+        report.start_artifact_data_table(HEADERS, 'private/var/source.db', write_location=False, **kwargs)
+        report.write_artifact_data_rows(rows[:2])
+        report.write_artifact_data_rows(rows[2:])
+        report.end_artifact_data_table()
+        report.end_artifact_report()
+        text = pathlib.Path(self.tmpdir, 'Table Test.temphtml').read_text(encoding='utf8')
+        self.assertIn(f'Total number of entries: {len(rows)} ', text)
+        return re.search('<tbody>(.*)</tbody>', text).group(1)
+
+    def test_rows_are_rendered_as_before(self):
+        self.assertEqual(self._table(ROWS), (
+            '<tr><td>&lt;b&gt;bold&lt;/b&gt; &amp; &quot;quoted&quot;</td><td>&lt;img src=&quot;a.jpg&quot;&gt;</td>'
+            '<td>3.5</td></tr><tr><td></td><td></td><td>None</td></tr><tr><td>short</td></tr><tr></tr>'
+            '<tr><td>extra</td><td>&lt;a&gt;</td><td>0</td><td>&lt;i&gt;no header&lt;/i&gt;</td></tr>'))
+        self.assertEqual(self._table(ROWS, html_no_escape=['Media']), (
+            '<tr><td>&lt;b&gt;bold&lt;/b&gt; &amp; &quot;quoted&quot;</td><td><img src="a.jpg"></td><td>3.5</td></tr>'
+            '<tr><td></td><td></td><td>None</td></tr><tr><td>short</td></tr><tr></tr>'
+            '<tr><td>extra</td><td><a></td><td>0</td></tr>'))
+        self.assertEqual(self._table(ROWS[:1], html_escape=False),
+                         '<tr><td><b>bold</b> & "quoted"</td><td><img src="a.jpg"></td><td>3.5</td></tr>')
+
+    def test_rows_past_inline_rows_are_json(self):
+        rows = ROWS + [('</script><!-- é', '<video>', None)]
+        body = self._table(rows, html_no_escape=['Media'], inline_rows=1)
+        self.assertTrue(body.startswith(
+            '<tr><td>&lt;b&gt;bold&lt;/b&gt; &amp; &quot;quoted&quot;</td><td><img src="a.jpg"></td><td>3.5</td></tr>'
+            '<script type="application/json" class="table-rows">'))
+        blocks = re.findall('<script type="application/json" class="table-rows">(.*?)</script>', body)
+        self.assertNotIn('<', ''.join(blocks))
+        self.assertEqual([row for block in blocks for row in json.loads(block)], [
+            ['', '', 'None'], ['short', '', ''], ['', '', ''], ['extra', '<a>', '0'],
+            ['&lt;/script&gt;&lt;!-- é', '<video>', '']])
+
+
+if __name__ == '__main__':
+    unittest.main()
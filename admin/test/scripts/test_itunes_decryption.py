@@ -0,0 +1,104 @@
+"""The files of an encrypted iTunes backup must decrypt the same whatever path extracts them.
+
+FileSeekerItunes decrypts a file a chunk at a time, so the padding is cut at the Size of
+the file's metadata while it is written rather than from the whole plaintext, and its
+key is only unwrapped when the file is extracted. prefetch extracts the files of all the
+selected artifacts from a pool of threads, and search then returns those files: both
+have to write the same plaintext and the same file information as a search extracting
+one file at a time, and a file whose key cannot be unwrapped must only cost that file.
+"""
+import os
+import pathlib
+import plistlib
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.keywrap import aes_key_wrap
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts.search_files import FileSeekerItunes
+# pylint: enable=wrong-import-position
+
+CLASS_KEY = bytes(range(32))
+MANIFEST_KEY = bytes(range(32, 64))
+
+
+def encrypt(key, data):
+    padder = padding.PKCS7(128).padder()
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(bytes(16))).encryptor()
+    return encryptor.update(padder.update(data) + padder.finalize()) + encryptor.finalize()
+
+
+class TestItunesDecryption(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.backup = self.tmpdir / 'backup'
+        self.backup.mkdir()
+        self.contents = {}
+        rows = []
+        for index in range(12):
+            relative_path = f'Library/Preferences/file{index}.plist'
+            contents = os.urandom(100 * index + 7)
+            file_key = os.urandom(32)
+            # The last file is of a protection class the backup has no key for
+            protection_class = 9 if index == 11 else 3
+            metadata = plistlib.dumps({
+                'EncryptionKey': {'NS.data': protection_class.to_bytes(4, 'little') +
+                                  aes_key_wrap(CLASS_KEY, file_key)},
+                'Size': len(contents), 'Birth': 1000 + index, 'LastModified': 2000 + index},
+                fmt=plistlib.PlistFormat.FMT_BINARY)
+            file_id = f'{index:02d}' + 'a' * 38
+            (self.backup / file_id[:2]).mkdir()
+            (self.backup / file_id[:2] / file_id).write_bytes(encrypt(file_key, contents))
+            rows.append((file_id, 'HomeDomain', relative_path, 1, metadata))
+            self.contents[f'private/var/mobile/{relative_path}'] = contents
+        manifest_path = self.tmpdir / 'Manifest.db'
+        with sqlite3.connect(manifest_path) as db:
+            db.execute('CREATE TABLE Files (fileID TEXT, domain TEXT, relativePath TEXT, flags INTEGER, file BLOB)')
+            db.executemany('INSERT INTO Files VALUES (?, ?, ?, ?, ?)', rows)
+        db.close()
+        (self.backup / 'Manifest.db').write_bytes(encrypt(MANIFEST_KEY, manifest_path.read_bytes())[:-16])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _seeker(self, name):
+        data_folder = self.tmpdir / name
+        data_folder.mkdir()
+        seeker = FileSeekerItunes(str(self.backup), str(data_folder), 'db', ({3: {'Unwrapped': CLASS_KEY}}, MANIFEST_KEY))
+        seeker.decrypt_chunk_size = 64
+        return seeker
+
+    def _check(self, seeker, found):
+        self.assertEqual(len(found), 12)
+        for path in found[:11]:
+            relative_path = os.path.relpath(path, seeker.data_folder).replace('\\', '/')
+            self.assertEqual(pathlib.Path(path).read_bytes(), self.contents[relative_path])
+            self.assertEqual(seeker.file_infos[path].source_path, relative_path)
+        self.assertEqual(seeker.file_infos[found[3]].creation_date, 1003)
+        self.assertEqual(seeker.file_infos[found[3]].modification_date, 2003)
+        self.assertFalse(os.path.exists(found[11]))
+        self.assertNotIn(found[11], seeker.file_infos)
+
+    def test_search_decrypts_each_file(self):
+        seeker = self._seeker('search')
+        self._check(seeker, seeker.search('*/Preferences/file*.plist'))
+
+    def test_prefetch_decrypts_the_files_of_all_the_patterns(self):
+        seeker = self._seeker('prefetch')
+        seeker.prefetch(['*/file1*.plist', '*/file*.plist'])
+        self.assertEqual(len(seeker.copied), 11)
+        self._check(seeker, seeker.search('*/Preferences/file*.plist'))
+
+
+if __name__ == '__main__':
+    unittest.main()
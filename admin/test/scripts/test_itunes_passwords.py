@@ -0,0 +1,117 @@
+"""A list of candidate passwords and the key cache must yield the keys of the one password.
+
+decrypt_itunes_backup_with_passwords runs the key derivation of the candidates in a
+pool of processes and keeps the first candidate whose derived key unwraps a protection
+class key; the keys it returns have to be those decrypt_itunes_backup returns for the
+right password, and a list without it must fail the same way a wrong password does.
+With --cache-backup-keys the derived key is stored in the cache folder, wrapped with a
+key kept outside of it, and a later run loads it instead of asking for the password: it
+must only ever load the key of the same keybag, never store the derived key as it is,
+and ignore a cache file that does not unwrap with the key outside the cache folder.
+"""
+import hashlib
+import os
+import pathlib
+import plistlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+from cryptography.hazmat.primitives.keywrap import aes_key_wrap
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+import scripts.search_files as search_files
+from scripts.search_files import decrypt_itunes_backup, decrypt_itunes_backup_with_passwords, \
+    load_cached_itunes_backup_keys
+# pylint: enable=wrong-import-position
+
+
+def tlv(tag, value):
+    if isinstance(value, int):
+        value = value.to_bytes(4, 'big')
+    return tag + len(value).to_bytes(4, 'big') + value
+
+
+def make_backup(folder, password):
+    """Writes the Manifest.plist of an encrypted backup, with low iteration counts"""
+    salt, double_protection_salt = os.urandom(20), os.urandom(20)
+    derived_key = hashlib.pbkdf2_hmac('sha1', hashlib.pbkdf2_hmac('sha256', password.encode(), double_protection_salt, 10),
+                                      salt, 10, dklen=32)
+    keybag = tlv(b'VERS', 3) + tlv(b'TYPE', 1) + tlv(b'UUID', os.urandom(16)) + tlv(b'HMCK', os.urandom(40)) + \
+        tlv(b'WRAP', 0) + tlv(b'SALT', salt) + tlv(b'ITER', 10) + tlv(b'DPWT', 1) + tlv(b'DPIC', 10) + \
+        tlv(b'DPSL', double_protection_salt)
+    class_keys = {}
+    for protection_class in (1, 2, 3):
+        class_keys[protection_class] = os.urandom(32)
+        keybag += tlv(b'UUID', os.urandom(16)) + tlv(b'CLAS', protection_class) + tlv(b'WRAP', 2) + \
+            tlv(b'KTYP', 0) + tlv(b'WPKY', aes_key_wrap(derived_key, class_keys[protection_class]))
+    manifest_key = os.urandom(32)
+    folder.mkdir()
+    with open(folder / 'Manifest.plist', 'wb') as manifest:
+        plistlib.dump({'IsEncrypted': True, 'BackupKeyBag': keybag,
+                       'ManifestKey': (3).to_bytes(4, 'little') + aes_key_wrap(class_keys[3], manifest_key)}, manifest)
+    return manifest_key
+
+
+class TestItunesPasswords(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.backup = self.tmpdir / 'backup'
+        self.manifest_key = make_backup(self.backup, 'secret')
+        search_files.backup_key_wrapping_key_path = str(self.tmpdir / 'settings' / 'itunes_key_cache.key')
+
+    def tearDown(self):
+        search_files.backup_key_wrapping_key_path = None
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_password_list(self):
+        expected, _ = decrypt_itunes_backup(str(self.backup), 'secret')
+        self.assertEqual(expected[1], self.manifest_key)
+        for processes in (1, 3):
+            keys, message = decrypt_itunes_backup_with_passwords(
+                str(self.backup), ['wrong', 'secret', 'nope', 'wrong'], processes=processes)
+            self.assertEqual(message, 'Decryption successful')
+            self.assertEqual(keys, expected)
+        self.assertEqual(decrypt_itunes_backup_with_passwords(str(self.backup), ['wrong', 'nope'], processes=2),
+                         (None, 'Incorrect password'))
+        self.assertEqual(decrypt_itunes_backup(str(self.backup), 'wrong'), (None, 'Incorrect password'))
+
+    def test_key_cache(self):
+        cache_dir = str(self.tmpdir / 'cache')
+        self.assertIsNone(load_cached_itunes_backup_keys(str(self.backup), cache_dir))
+        expected, _ = decrypt_itunes_backup(str(self.backup), 'secret', cache_dir)
+        self.assertEqual(load_cached_itunes_backup_keys(str(self.backup), cache_dir), expected)
+        self.assertIsNone(load_cached_itunes_backup_keys(str(self.backup), None))
+        with open(self.backup / 'Manifest.plist', 'rb') as manifest:
+            keybag_hash = hashlib.sha256(plistlib.load(manifest)['BackupKeyBag']).hexdigest()
+        entry_path = os.path.join(cache_dir, 'itunes_keys', f'{keybag_hash}.key')
+        if sys.platform != 'win32':
+            self.assertEqual(os.stat(entry_path).st_mode & 0o777, 0o600)
+        with open(entry_path, 'rb') as entry_file:
+            wrapped_key = entry_file.read()
+        self.assertEqual(len(wrapped_key), 40)
+        # The cache folder alone is not enough: with another wrapping key the entry is a miss
+        search_files.backup_key_wrapping_key_path = str(self.tmpdir / 'other_settings' / 'itunes_key_cache.key')
+        self.assertIsNone(load_cached_itunes_backup_keys(str(self.backup), cache_dir))
+        search_files.backup_key_wrapping_key_path = str(self.tmpdir / 'settings' / 'itunes_key_cache.key')
+        self.assertEqual(load_cached_itunes_backup_keys(str(self.backup), cache_dir), expected)
+        # Another backup, even with the same password, is not in the cache
+        other = self.tmpdir / 'other'
+        make_backup(other, 'secret')
+        self.assertIsNone(load_cached_itunes_backup_keys(str(other), cache_dir))
+        keys, _ = decrypt_itunes_backup_with_passwords(str(other), ['secret'], cache_dir)
+        self.assertEqual(load_cached_itunes_backup_keys(str(other), cache_dir), keys)
+        self.assertEqual(load_cached_itunes_backup_keys(str(self.backup), cache_dir), expected)
+        for content in (b'', os.urandom(32), os.urandom(40)):
+            with open(entry_path, 'wb') as entry_file:
+                entry_file.write(content)
+            self.assertIsNone(load_cached_itunes_backup_keys(str(self.backup), cache_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""The KML export of an artifact is written a placemark at a time.
+
+The rows of an artifact with a location used to be added to a simplekml document kept
+in memory until the artifact ended, then saved along with its rows of _latlong.db,
+through a connection opened for each artifact. KmlWriter writes the placemarks as the
+chunks of rows come, and _latlong.db through the connection of the run: the export must
+read as the one simplekml saved (without the element ids it numbered), with its text
+escaped the same way, the timestamp taken from the Timestamp column or else the first
+datetime of the row, and nothing must be left behind by an artifact that failed. A worker
+process commits the rows of _latlong.db after every chunk, so that the other workers can
+write meanwhile, and exits without closing its connection: the run must still end with
+_latlong.db as a single file.
+"""
+import datetime
+import multiprocessing
+import pathlib
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+import simplekml
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts.ilapfuncs import KmlWriter, finalize_output_dbs, kmlgen, output_dbs_commit_each_write
+# pylint: enable=wrong-import-position
+
+HEADERS = ('Start', 'Latitude', 'Longitude', 'Place')
+ROWS = [
+    (datetime.datetime(2026, 1, 1, 10, 0, tzinfo=datetime.timezone.utc), 45.5, -73.5, 'Café <"Olimpico">'),
+    (datetime.datetime(2026, 1, 1, 11, 0), '', -73.5, 'no latitude'),
+    ('N/A', '48.85', '2.35', 'Paris & co'),
+]
+
+
+def _write_in_worker(report_folder, written, done):
+    '''Writes the first chunk of a streamed artifact, and the rest once done is set'''
+    output_dbs_commit_each_write()
+    kml = KmlWriter(report_folder, 'Worker')
+    kml.write(ROWS[:1], HEADERS)
+    written.set()
+    done.wait(30)
+    kml.write(ROWS[1:], HEADERS)
+    kml.finish()
+    kml.close()
+
+
+def _simplekml_export(path, activity):
+    '''What the export used to be, saved by simplekml'''
+    kml = simplekml.Kml(open=1)
+    for start, lat, lon, _ in ROWS:
+        if lat and lon:
+            point = kml.newpoint()
+            times_header, times = ('Start', start) if isinstance(start, datetime.datetime) else ('Timestamp', 'N/A')
+            point.name = times
+            point.description = f"{times_header}: {times} - {activity}"
+            point.coords = [(lon, lat)]
+    kml.save(str(path))
+    return re.sub(r' id="\d+"', '', path.read_text(encoding='utf-8'))
+
+
+class TestKmlWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.report_folder = str(self.tmpdir / '_HTML' / 'Locations')
+        self.kml_folder = self.tmpdir / '_KML Exports'
+
+    def tearDown(self):
+        finalize_output_dbs(str(self.tmpdir))
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_export_matches_simplekml(self):
+        kml = KmlWriter(self.report_folder, 'Visits')
+        kml.write(ROWS[:1], HEADERS)
+        kml.write([], HEADERS)
+        kml.write(ROWS[1:], HEADERS)
+        kml.finish()
+        kml.close()
+        self.assertEqual((self.kml_folder / 'Visits.kml').read_text(encoding='utf-8'),
+                         _simplekml_export(self.tmpdir / 'simplekml.kml', 'Visits'))
+        finalize_output_dbs(str(self.tmpdir))
+        db = sqlite3.connect(self.kml_folder / '_latlong.db')
+        self.assertEqual(db.execute('SELECT * FROM data').fetchall(),
+                         [('2026-01-01 10:00:00+00:00', '45.5', '-73.5', 'Visits'), ('N/A', '48.85', '2.35', 'Visits')])
+        db.close()
+
+    def test_nothing_is_left_without_location_or_on_failure(self):
+        kmlgen(self.report_folder, 'Nowhere', ROWS[1:2], HEADERS)
+        kmlgen(self.report_folder, 'No columns', ROWS, ('Start', 'Lat', 'Lon', 'Place'))
+        kml = KmlWriter(self.report_folder, 'Failed')
+        kml.write(ROWS, HEADERS)
+        self.assertTrue((self.kml_folder / 'Failed.kml').exists())
+        kml.close()
+        self.assertEqual(sorted(path.name for path in self.kml_folder.iterdir() if path.suffix == '.kml'), [])
+        finalize_output_dbs(str(self.tmpdir))
+        db = sqlite3.connect(self.kml_folder / '_latlong.db')
+        self.assertEqual(db.execute('SELECT COUNT(*) FROM data').fetchone(), (0,))
+        db.close()
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'workers are forked')
+    def test_worker_commits_every_chunk(self):
+        context = multiprocessing.get_context('fork')
+        written = context.Event()
+        done = context.Event()
+        worker = context.Process(target=_write_in_worker, args=(self.report_folder, written, done))
+        worker.start()
+        try:
+            self.assertTrue(written.wait(30))
+            # Another worker writing while the first one is still running its artifact
+            db = sqlite3.connect(self.kml_folder / '_latlong.db', timeout=2)
+            db.execute("INSERT INTO data VALUES('N/A', '1.0', '2.0', 'Other')")
+            db.commit()
+            db.close()
+        finally:
+            done.set()
+            worker.join()
+        finalize_output_dbs(str(self.tmpdir))
+
+        self.assertFalse((self.kml_folder / '_latlong.db-wal').exists())
+        self.assertFalse((self.kml_folder / '_latlong.db-shm').exists())
+        db = sqlite3.connect(self.kml_folder / '_latlong.db')
+        self.assertEqual(db.execute('PRAGMA journal_mode').fetchone(), ('delete',))
+        self.assertEqual(db.execute('SELECT activity FROM data ORDER BY rowid').fetchall(),
+                         [('Worker',), ('Other',), ('Worker',)])
+        db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""The rows written to the LAVA database are committed in batches and kept at the end of the run.
+
+The LAVA inserts used to commit after every row with a rollback journal. The database is
+now in WAL mode during the run, the inserts leave their rows in the open transaction and
+commit every lava_flush_size rows, lava_commit commits the rest, and lava_finalize_output
+switches the database back to a rollback journal before closing it. A worker process
+commits after every insert call instead: while its transaction is open, the other
+workers cannot write. Another connection
+must see the rows of every batch committed, every row once the run is finalized, and
+the database must then be a single file: viewers open it from read-only media, where a
+-wal or -shm file left next to it could not be read or created.
+"""
+import contextlib
+import pathlib
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+import scripts.lavafuncs as lavafuncs
+# pylint: enable=wrong-import-position
+
+
+class TestLavaWrites(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.db_path = self.tmpdir / lavafuncs.lava_db_name
+        self.flush_size = lavafuncs.lava_flush_size
+        lavafuncs.initialize_lava('input', str(self.tmpdir), 'fs')
+
+    def tearDown(self):
+        lavafuncs.lava_flush_size = self.flush_size
+        with contextlib.suppress(sqlite3.ProgrammingError):
+            lavafuncs.lava_db.close()
+        lavafuncs.lava_db = None
+        lavafuncs.lava_data = None
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _committed_links(self):
+        '''The links another connection sees'''
+        with contextlib.closing(sqlite3.connect(self.db_path)) as db:
+            return db.execute('SELECT artifact_search_pattern_id, file_path_id FROM _artifact_pattern_to_file '
+                              'ORDER BY id').fetchall()
+
+    def test_rows_are_committed_in_batches_and_kept(self):
+        lavafuncs.lava_flush_size = 10
+        self.assertEqual(lavafuncs.lava_db.execute('PRAGMA journal_mode').fetchone(), ('wal',))
+        for index in range(25):
+            if index == 4:
+                # 8 rows inserted, none committed yet
+                self.assertEqual(self._committed_links(), [])
+            lavafuncs.lava_insert_sqlite_file_path(index, f'/private/var/file{index}')
+            lavafuncs.lava_insert_sqlite_artifact_link_pattern_to_file(index % 3, index)
+        # 50 rows were inserted: the last intermediate commit was at the 50th
+        self.assertEqual(len(self._committed_links()), 25)
+        lavafuncs.lava_insert_sqlite_artifact_link_pattern_to_file(7, 25)
+        self.assertEqual(len(self._committed_links()), 25)
+        lavafuncs.lava_commit()
+        self.assertEqual(self._committed_links(), [(index % 3, index) for index in range(25)] + [(7, 25)])
+        self.assertTrue(pathlib.Path(f'{self.db_path}-wal').exists())
+
+        lavafuncs.lava_finalize_output(str(self.tmpdir))
+        self.assertFalse(pathlib.Path(f'{self.db_path}-wal').exists())
+        self.assertFalse(pathlib.Path(f'{self.db_path}-shm').exists())
+        with contextlib.closing(sqlite3.connect(self.db_path)) as db:
+            self.assertEqual(db.execute('PRAGMA journal_mode').fetchone(), ('delete',))
+            self.assertEqual(db.execute('SELECT COUNT(*) FROM _file_path_list').fetchone(), (25,))
+        self.assertEqual(len(self._committed_links()), 26)
+        self.assertTrue((self.tmpdir / lavafuncs.lava_json_name).exists())
+
+    def test_worker_commits_every_insert(self):
+        lavafuncs.lava_commit()
+        lavafuncs.lava_reopen_db()
+        table_name, column_map, object_columns = lavafuncs.lava_create_sqlite_table('worker_rows', ['Index', 'Line'])
+        lavafuncs.lava_insert_sqlite_data(table_name, [(1, 'first'), (2, 'second')], object_columns,
+                                          ['Index', 'Line'], column_map)
+        self.assertFalse(lavafuncs.lava_db.in_transaction)
+        lavafuncs.lava_insert_sqlite_file_path(1, '/private/var/file1')
+        self.assertFalse(lavafuncs.lava_db.in_transaction)
+        with contextlib.closing(sqlite3.connect(self.db_path)) as db:
+            self.assertEqual(db.execute(f'SELECT COUNT(*) FROM {table_name}').fetchone(), (2,))
+            self.assertEqual(db.execute('SELECT COUNT(*) FROM _file_path_list').fetchone(), (1,))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""With --link-files, FileSeekerDir must hard link only the files nothing writes to.
+
+The files found for the artifacts are placed in the data folder of the report, where
+the report paths are taken from. A hard link shares the file with the extraction, so
+anything written to it changes the evidence: SQLite databases and their -wal, -shm and
+-journal files are written to by SQLite itself, even through read-only connections, and
+have to be cloned or copied; a parser modifying a file in place calls materialize first.
+The data folder paths and the file information (source timestamps) must be the same as
+when the files are copied, or the report would change with the option. In a worker
+process, which does not see what the other workers placed, a file is placed under a name
+of its own and renamed, so that a worker placing a file another one is reading does not
+truncate it.
+"""
+import os
+import pathlib
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts.ilapfuncs import OutputParameters
+from scripts.search_files import FileSeekerDir
+# pylint: enable=wrong-import-position
+
+
+class TestLinkedFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.extraction = self.tmpdir / 'extraction'
+        folder = self.extraction / 'private' / 'var' / 'mobile' / 'Library' / 'Preferences'
+        folder.mkdir(parents=True)
+        (folder / 'com.apple.test.plist').write_bytes(b'bplist00 test')
+        self.database = folder / 'test.db'
+        db = sqlite3.connect(self.database)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('CREATE TABLE test (value TEXT)')
+        db.execute("INSERT INTO test VALUES ('row')")
+        db.commit()
+        shutil.copy(self.database.with_name('test.db-wal'), folder / 'copy.db-wal')
+        db.close()
+        # Closing the connection checkpoints the database and removes its -wal file
+        shutil.move(folder / 'copy.db-wal', self.database.with_name('test.db-wal'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _search(self, link_files):
+        seeker = FileSeekerDir(str(self.extraction), str(self.tmpdir / f'data-{link_files}'), link_files=link_files)
+        return seeker, {os.path.basename(path): path for path in seeker.search('*/Preferences/*')}
+
+    def test_only_files_that_are_not_written_to_are_linked(self):
+        seeker, found = self._search(True)
+        source = os.stat(self.extraction / 'private' / 'var' / 'mobile' / 'Library' / 'Preferences' /
+                         'com.apple.test.plist')
+        plist = found['com.apple.test.plist']
+        self.assertEqual(os.stat(plist).st_ino, source.st_ino)
+        self.assertEqual(seeker.linked, {plist})
+        for name in ('test.db', 'test.db-wal'):
+            self.assertNotEqual(os.stat(found[name]).st_ino, os.stat(self.database.with_name(name)).st_ino)
+        self.assertEqual(seeker.materialize(plist), plist)
+        self.assertNotEqual(os.stat(plist).st_ino, source.st_ino)
+        self.assertEqual(pathlib.Path(plist).read_bytes(), b'bplist00 test')
+        self.assertEqual(seeker.linked, set())
+
+    def test_report_paths_are_those_of_copied_files(self):
+        copy_seeker, copied = self._search(False)
+        link_seeker, linked = self._search(True)
+        self.assertEqual(sorted(copied), sorted(linked))
+        for name, path in linked.items():
+            self.assertEqual(os.path.relpath(path, link_seeker.data_folder),
+                             os.path.relpath(copied[name], copy_seeker.data_folder))
+            self.assertEqual(vars(link_seeker.file_infos[path]), vars(copy_seeker.file_infos[copied[name]]))
+        with sqlite3.connect(f'file:{linked["test.db"]}?mode=ro', uri=True) as db:
+            self.assertEqual(db.execute('SELECT value FROM test').fetchall(), [('row',)])
+        self.assertFalse(os.path.exists(self.database.with_name('test.db-shm')))
+
+    def test_workers_do_not_write_over_a_placed_file(self):
+        OutputParameters.log_buffer = []
+        try:
+            for link_files in (False, True):
+                seeker, found = self._search(link_files)
+                self.assertEqual(seeker.linked, {found['com.apple.test.plist']} if link_files else set())
+                with open(found['test.db'], 'rb') as database:
+                    # Another worker placing the same file while the first one reads it
+                    _, found_again = self._search(link_files)
+                    self.assertEqual(found_again, found)
+                    self.assertEqual(database.read(), self.database.read_bytes())
+                    self.assertNotEqual(os.fstat(database.fileno()).st_ino, os.stat(found['test.db']).st_ino)
+                self.assertEqual(sorted(os.listdir(os.path.dirname(found['test.db']))),
+                                 ['com.apple.test.plist', 'test.db', 'test.db-wal'])
+        finally:
+            OutputParameters.log_buffer = None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""The logarchive entries loaded straight into LAVA must match what artifact_processor wrote.
+
+The logarchive artifact streams the entries of the JSON export into the logarchive table
+itself, already in their stored form (Unix timestamps), then indexes the event messages
+with an FTS5 trigram table. logarchive_artifacts looks its substrings up in that index
+instead of matching them against every entry, and falls back to the full scan without
+it: both must keep the same entries, in the same order, with LIKE's own matching (ASCII
+case folding, _ as a wildcard), and the table must be recorded in the LAVA data with its
+record count, as artifact_processor did. The entries it keeps are tagged in the same pass
+with the rules of the other logarchive artifacts, which used to select theirs from the
+logarchive_artifacts table with LIKE conditions: the tags must select the same entries.
+"""
+import json
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts import lavafuncs
+from scripts.artifacts import logarchive
+from scripts.search_files import FileSeekerBase
+# pylint: enable=wrong-import-position
+
+MESSAGES = ('Take screenshot', 'take SCREENSHOT now', 'Nothing to see', 'WiFiSettlementObserver xhandleScanResults',
+            'Écran: Screen did lock', 'screen is unlocked', 'Launching application com.apple.Maps', '',
+            'AIRPLANE MODE NOW ACTIVE', 'Proceed to\\ then arrive at your destination', 'Bluetooth state changed')
+
+
+class TestLogarchiveLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.output = self.tmpdir / 'output'
+        self.report_folder = self.output / '_HTML' / 'Unified Logs'
+        self.report_folder.mkdir(parents=True)
+        records = [{'timestamp': f'2025-05-06 10:00:{index:02d}.250000-0400', 'processID': index,
+                    'processImagePath': '/usr/libexec/test', 'subsystem': 'com.apple.test', 'category': 'test',
+                    'eventMessage': message, 'traceID': 1000 + index, 'backtrace': {'frames': []}}
+                   for index, message in enumerate(MESSAGES * 3)]
+        self.source = self.tmpdir / 'logarchive.json'
+        # An interrupted export ends with a partial entry after the last bracket
+        self.source.write_text(json.dumps(records) + '\n{"timestamp', encoding='utf-8')
+        lavafuncs.initialize_lava('input', str(self.output), 'fs')
+
+    def tearDown(self):
+        lavafuncs.lava_db.close()
+        lavafuncs.lava_db = None
+        lavafuncs.lava_data = None
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _run(self, artifact, files_found):
+        '''Calls an artifact the way the plugin loader does'''
+        return artifact(files_found, str(self.report_folder), FileSeekerBase(), False, 'UTC')
+
+    def _logarchive_artifacts(self):
+        lavafuncs.lava_commit()
+        lava_path = str(self.output / lavafuncs.lava_db_name)
+        _, data_list, _ = self._run(logarchive.logarchive_artifacts, [lava_path])
+        lavafuncs.lava_commit()
+        rows = lavafuncs.lava_db.execute('SELECT * FROM logarchive_artifacts').fetchall()
+        lavafuncs.lava_db.execute('DROP TABLE logarchive_artifacts')
+        return data_list, rows
+
+    def test_entries_are_loaded_and_indexed(self):
+        self._run(logarchive.logarchive, [str(self.source)])
+        rows = lavafuncs.lava_db.execute('SELECT * FROM logarchive').fetchall()
+        self.assertEqual(len(rows), 33)
+        self.assertEqual(rows[1], (1746540001.25, '2', '/usr/libexec/test', '1', 'com.apple.test', 'test',
+                                   'take SCREENSHOT now', '1001'))
+        artifact = lavafuncs.lava_data['artifacts']['Unified Logs'][0]
+        self.assertEqual((artifact['tablename'], artifact['record_count']), ('logarchive', 33))
+        self.assertEqual(artifact['object_columns'], [{'name': 'timestamp', 'type': 'datetime'}])
+        indexed = lavafuncs.lava_db.execute(
+            "SELECT rowid FROM logarchive_fts WHERE event_message LIKE '%screen%'").fetchall()
+        self.assertEqual(len(indexed), 12)
+
+        _, with_index = self._logarchive_artifacts()
+        lavafuncs.lava_db.execute('DROP TABLE logarchive_fts')
+        _, full_scan = self._logarchive_artifacts()
+        self.assertEqual(with_index, full_scan)
+        self.assertEqual([row[6] for row in with_index[:5]],
+                         ['Take screenshot', 'take SCREENSHOT now', 'WiFiSettlementObserver xhandleScanResults',
+                          'Écran: Screen did lock', 'screen is unlocked'])
+        self.assertEqual(len(with_index), 27)
+
+    def test_entries_are_tagged_with_the_rules_of_the_other_artifacts(self):
+        self._run(logarchive.logarchive, [str(self.source)])
+        self._logarchive_artifacts()
+        lavafuncs.lava_commit()
+        lava_path = str(self.output / lavafuncs.lava_db_name)
+        like = logarchive._like  # pylint: disable=protected-access
+        kept = ' OR '.join(f'event_message LIKE {like(pattern)}' for pattern in logarchive.LOGARCHIVE_ARTIFACTS_PATTERNS)
+        found = {}
+        for rule_id, patterns in logarchive.LOGARCHIVE_RULES.items():
+            # The conditions the artifact used on the logarchive_artifacts table
+            conditions = ' OR '.join(f'event_message LIKE {like(pattern)}' for pattern in patterns)
+            expected = lavafuncs.lava_db.execute(
+                f'SELECT * FROM logarchive WHERE ({kept}) AND ({conditions}) ORDER BY rowid').fetchall()
+            found[rule_id] = [tuple(row) for row in
+                              logarchive._matched_records(lava_path, rule_id)]  # pylint: disable=protected-access
+            self.assertEqual(found[rule_id], expected, rule_id)
+        self.assertEqual(len(found['logarchive_lock_status']), 6)
+        self.assertEqual(len(found['logarchive_airplane_mode']), 3)
+        self.assertEqual(len(found['logarchive_navigation']), 3)
+        self.assertEqual(len(found['logarchive_bluetooth_status']), 3)
+        self.assertEqual(len(found['logarchive_wifi_status']), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
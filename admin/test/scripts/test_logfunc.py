@@ -0,0 +1,88 @@
+"""logfunc appends its messages to Screen_Output.html from a thread.
+
+logfunc used to open Screen_Output.html, append a message and close it again for every
+message. The messages are now queued for a thread that keeps the file open for the run
+and writes those logged in the meantime together: once flush_log returns, the file must
+hold every message in order, a run writing to another output folder writes to its own
+file, and a worker forked from the process appends its messages itself, after those
+logged before it was forked. Messages below
+OutputParameters.log_level, like those of logdebug by default, are not logged at all,
+neither by the main process nor by the workers handing their messages back.
+"""
+import contextlib
+import io
+import logging
+import multiprocessing
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts.ilapfuncs import OutputParameters, close_log, flush_log, logdebug, logfunc
+# pylint: enable=wrong-import-position
+
+
+def _log_in_worker():
+    logfunc('from the worker')
+
+
+class TestLogfunc(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        OutputParameters.screen_output_file_path = str(self.tmpdir / 'Screen_Output.html')
+
+    def tearDown(self):
+        close_log()
+        OutputParameters.screen_output_file_path = ''
+        OutputParameters.log_level = logging.INFO
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _log(self):
+        return pathlib.Path(OutputParameters.screen_output_file_path).read_text(encoding='utf8')
+
+    def test_messages_are_written_in_order(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for index in range(1000):
+                logfunc(f'message {index} é')
+        logdebug('per record')
+        flush_log()
+        self.assertEqual(self._log(), ''.join(f'message {index} é<br>\n' for index in range(1000)))
+
+        first = OutputParameters.screen_output_file_path
+        OutputParameters.screen_output_file_path = str(self.tmpdir / 'Other.html')
+        OutputParameters.log_level = logging.DEBUG
+        logdebug('per record')
+        logfunc('warning', logging.WARNING)
+        flush_log()
+        self.assertEqual(self._log(), 'per record<br>\nwarning<br>\n')
+        self.assertEqual(pathlib.Path(first).read_text(encoding='utf8').count('<br>'), 1000)
+
+    def test_workers(self):
+        OutputParameters.log_buffer = []
+        try:
+            logdebug('per record')
+            logfunc('kept')
+            self.assertEqual(OutputParameters.log_buffer, ['kept'])
+        finally:
+            OutputParameters.log_buffer = None
+
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            return
+        logfunc('before the worker')
+        worker = multiprocessing.get_context('fork').Process(target=_log_in_worker)
+        worker.start()
+        worker.join()
+        logfunc('after the worker')
+        flush_log()
+        self.assertEqual(self._log().splitlines(),
+                         ['before the worker<br>', 'from the worker<br>', 'after the worker<br>'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""The media registry must answer media lookups exactly as the LAVA database would.
+
+_check_in_media and get_data_list_with_media no longer query _lava_media_items,
+_lava_media_references and _lava_media_info for every call: lavafuncs keeps the media rows
+it writes in a bounded in-memory registry and writes them in batches. A lookup that misses
+the registry is only taken as "not checked in yet" while the registry holds every media row
+of the database; once rows were evicted, or once worker processes write media too, a miss
+has to go to the database, or the same media would be checked in twice and a reference
+written by another process would show as missing in the report.
+"""
+import pathlib
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+import scripts.lavafuncs as lavafuncs
+from scripts.ilapfuncs import MediaItem, MediaReferences
+# pylint: enable=wrong-import-position
+
+
+def _insert(media_id, ref_id):
+    media_item = MediaItem(media_id)
+    media_item.set_values((media_id, f'/private/var/{media_id}.jpg', f'media/{media_id}.jpg', 'image/jpeg',
+                           'not parsed yet', 1700000000, 1700000001, 0))
+    lavafuncs.lava_insert_sqlite_media_item(media_item)
+    media_references = MediaReferences(ref_id)
+    media_references.set_values((ref_id, media_id, 'module', 'artifact', f'{media_id}.jpg'))
+    lavafuncs.lava_insert_sqlite_media_references(media_references)
+
+
+class TestMediaRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache_size = lavafuncs.media_cache_size
+        lavafuncs.initialize_lava('input', self.tmpdir, 'fs')
+
+    def tearDown(self):
+        lavafuncs.media_cache_size = self.cache_size
+        lavafuncs.lava_db.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _view_row(self, ref_id):
+        with sqlite3.connect(pathlib.Path(self.tmpdir) / lavafuncs.lava_db_name) as db:
+            db.row_factory = sqlite3.Row
+            return db.execute('SELECT * FROM _lava_media_info WHERE media_ref_id = ?', (ref_id,)).fetchone()
+
+    def test_registry_rows_match_the_database_view(self):
+        _insert('item1', 'ref1')
+        info = lavafuncs.lava_get_full_media_info('ref1')
+        lavafuncs.lava_commit()
+        expected = self._view_row('ref1')
+        self.assertEqual(tuple(info), tuple(expected))
+        self.assertEqual(info.keys(), expected.keys())
+        self.assertEqual(info['extraction_path'], 'media/item1.jpg')
+        self.assertEqual(info[-2], expected['updated_at'])
+        self.assertIsNone(lavafuncs.lava_get_full_media_info('unknown'))
+
+    def test_evicted_rows_are_read_back_from_the_database(self):
+        lavafuncs.media_cache_size = 10
+        for index in range(50):
+            _insert(f'item{index}', f'ref{index}')
+        self.assertLessEqual(len(lavafuncs._media_items), 10)  # pylint: disable=protected-access
+        for index in range(50):
+            self.assertEqual(lavafuncs.lava_get_full_media_info(f'ref{index}')['media_item_id'], f'item{index}')
+        lavafuncs.lava_commit()
+        with sqlite3.connect(pathlib.Path(self.tmpdir) / lavafuncs.lava_db_name) as db:
+            self.assertEqual(db.execute('SELECT COUNT(*) FROM _lava_media_references').fetchone()[0], 50)
+
+    def test_shared_database_misses_go_to_the_database(self):
+        lavafuncs.lava_commit()
+        with sqlite3.connect(pathlib.Path(self.tmpdir) / lavafuncs.lava_db_name) as other_process:
+            other_process.execute("INSERT INTO _lava_media_items (id, extraction_path) VALUES ('item', 'media/item.jpg')")
+            other_process.execute("INSERT INTO _lava_media_references (id, media_item_id) VALUES ('ref', 'item')")
+        self.assertIsNone(lavafuncs.lava_get_media_item('item'))
+        lavafuncs.lava_mark_db_shared()
+        self.assertIsNotNone(lavafuncs.lava_get_media_item('item'))
+        self.assertEqual(lavafuncs.lava_get_full_media_info('ref')['extraction_path'], 'media/item.jpg')
+
+
+if __name__ == '__main__':
+    unittest.main()
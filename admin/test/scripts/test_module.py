@@ -227,6 +227,9 @@ def process_artifact(zip_path, module_name, artifact_name, artifact_data, target
                                                                mock_seeker,
                                                                mock_wrap_text,
                                                                timezone_offset)
+                # Artifacts can yield their rows to artifact_processor
+                if not isinstance(data_list, (list, tuple)):
+                    data_list = list(data_list)
             finally:
                 Context.clear()
 
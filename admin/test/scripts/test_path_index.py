@@ -0,0 +1,172 @@
+"""The seekers' path index must return exactly what the linear glob scan returned.
+
+FileSeekerDir, FileSeekerTar, FileSeekerZip and FileSeekerItunes used to run the compiled
+fnmatch pattern against every path of the extraction, once per pattern. PathIndex narrows
+each pattern to candidates picked from its literal parts, so a bucket chosen on
+a wrong assumption about fnmatch (a '*' that crosses '/', a '?' that matches the
+separator, characters inside a '[...]' set) would silently drop files and the artifact
+would report "No file found". These tests hold the index to the linear scan, pattern by
+pattern, using every path glob the loaded artifacts declare.
+"""
+import pathlib
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+from fnmatch import _compile_pattern
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+import scripts.plugin_loader as plugin_loader  # pylint: disable=wrong-import-position
+from scripts.search_files import (  # pylint: disable=wrong-import-position
+    FileSeekerDir, PathIndex, normcase, split_glob, _glob_suffixes, _glob_tokens)
+
+EDGE_PATTERNS = [
+    '*/sms.db', '*sms.db', '*/SMS/sms.db*', '**/*-wal', '*/PhotoData/*', '*',
+    '*/Library/?ookies/*', '*/[Cc]ache.db', '*/[!a]ache.db', '*/x[.db', '*/.db',
+    '*.db?', '*/Preferences/com.apple.*.plist', 'root/private/var/*',
+    'root/private/var/mobile/Library/SMS/sms.db', 'private/var/*', '*?', '*/a',
+    '*.[jJ][pP][gG]', '*/IMG_[0-9][0-9]*.HEIC', '*/Caches/[a-c-e]ache.db', '*/Caches/[z-a].db',
+    '*/Library/*/Cache.db', '*/mobile/Media/*', '**/sms.db*', '*/Library/SMS*',
+]
+
+EDGE_PATHS = [
+    '/private/var/mobile/Library/SMS/sms.db',
+    '/private/var/mobile/Library/SMS/sms.db-wal',
+    '/private/var/mobile/Library/SMS/sms.db-shm',
+    '/private/var/mobile/Library/SMS/oldsms.db',
+    '/private/var/mobile/Library/Cookies/Cookies.binarycookies',
+    '/private/var/mobile/Library/cookies/Cookies.binarycookies',
+    '/private/var/mobile/Library/Caches/Cache.db',
+    '/private/var/mobile/Library/Caches/cache.db',
+    '/private/var/mobile/Library/Caches/bache.db',
+    '/private/var/mobile/Library/Caches/x[.db',
+    '/private/var/mobile/Library/Caches/.db',
+    '/private/var/mobile/Library/Caches/a.db1',
+    '/private/var/mobile/Media/PhotoData/Photos.sqlite',
+    '/private/var/mobile/Media/PhotoData',
+    '/private/var/mobile/Library/Preferences/com.apple.Maps.plist',
+    '/a', 'noslash', '/private/var/mobile/Library/Preferences',
+    '/private/var/mobile/Media/DCIM/100APPLE/IMG_0001.JPG',
+    '/private/var/mobile/Media/DCIM/100APPLE/IMG_0002.jpg',
+    '/private/var/mobile/Media/DCIM/100APPLE/IMG_0003.HEIC',
+    '/private/var/mobile/Library/Caches/-ache.db',
+    '/private/var/mobile/Library/Caches/eache.db',
+    '/private/var/mobile/Library/SMS/sms.db.bak/inner.txt',
+]
+
+
+def _example_paths(pattern):
+    '''Builds paths a pattern should match, so every artifact glob has hits to compare'''
+    concrete = pattern.replace('**', '*')
+    concrete = re.sub(r'\[!?\]?[^\]]*\]', lambda m: m.group(0)[-2] if m.group(0)[-2] != '!' else 'z', concrete)
+    results = []
+    for star in ('x', 'deep/er/dir'):
+        path = concrete.replace('*', star).replace('?', 'q')
+        if path.startswith('root/'):
+            path = path[len('root'):]
+        results.append('/' + path.lstrip('/'))
+    return results
+
+
+class TestSplitGlob(unittest.TestCase):
+
+    def test_literal_runs_and_wildcards(self):
+        self.assertEqual(split_glob('*/SMS/sms.db*'), [None, '/SMS/sms.db', None])
+        self.assertEqual(split_glob('**/*-wal'), [None, '/', None, '-wal'])
+        self.assertEqual(split_glob('root/a'), ['root/a'])
+
+    def test_bracket_contents_are_not_literal(self):
+        self.assertEqual(split_glob('*/[Cc]ache.db'), [None, '/', None, 'ache.db'])
+        self.assertEqual(split_glob('a[!]b]c'), ['a', None, 'c'])
+
+    def test_unclosed_bracket_is_literal(self):
+        self.assertEqual(split_glob('*/x[.db'), [None, '/x[.db'])
+
+    def test_trailing_sets_expand_to_every_spelling(self):
+        suffixes = _glob_suffixes(_glob_tokens('*.[jJ][pP][gG]'))
+        self.assertEqual(len(suffixes), 8)
+        self.assertIn('.jPg', suffixes)
+        self.assertIsNone(_glob_suffixes(_glob_tokens('*/tmp/*')))
+        self.assertEqual(_glob_suffixes(_glob_tokens('*/[!a]ache.db')), ['ache.db'])
+
+
+class TestPathIndexMatchesLinearScan(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        patterns = set(EDGE_PATTERNS)
+        loader = plugin_loader.PluginLoader()
+        for plugin in loader.plugins:
+            search = plugin.search
+            if isinstance(search, str):
+                patterns.add(search)
+            elif isinstance(search, (list, tuple)):
+                patterns.update(search)
+        cls.patterns = sorted(patterns)
+        paths = list(EDGE_PATHS)
+        for pattern in cls.patterns:
+            paths.extend(_example_paths(pattern))
+        cls.paths = paths
+
+    def _assert_same_as_linear(self, items, root):
+        index = PathIndex(items, key=lambda item: root + normcase(item))
+        for pattern in self.patterns:
+            pat = _compile_pattern(normcase(pattern))
+            expected = [item for item in items if pat(root + normcase(item)) is not None]
+            self.assertEqual(index.search(normcase(pattern)), expected, pattern)
+
+    def test_dir_style_keys(self):
+        self._assert_same_as_linear(self.paths, normcase('root/'))
+
+    def test_archive_style_keys(self):
+        self._assert_same_as_linear([path.lstrip('/') for path in self.paths], normcase('root/'))
+
+    def test_itunes_style_keys(self):
+        self._assert_same_as_linear([path.lstrip('/') for path in self.paths], '')
+
+    def test_artifact_patterns_have_hits(self):
+        """Guards the corpus: an equivalence test over empty results proves nothing."""
+        index = PathIndex(self.paths, key=lambda item: normcase('root/') + normcase(item))
+        hits = sum(1 for pattern in self.patterns if index.search(normcase(pattern)))
+        self.assertGreater(hits, len(self.patterns) * 0.9)
+
+
+class TestFileSeekerDirUsesIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.extraction = pathlib.Path(self.tmpdir) / 'extraction'
+        self.data_folder = pathlib.Path(self.tmpdir) / 'data'
+        for path in EDGE_PATHS:
+            if path in ('/private/var/mobile/Media/PhotoData', '/private/var/mobile/Library/Preferences'):
+                continue
+            target = self.extraction / path.lstrip('/')
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_search_returns_linear_results(self):
+        seeker = FileSeekerDir(str(self.extraction), str(self.data_folder))
+        root = normcase('root/')
+        for pattern in EDGE_PATTERNS:
+            pat = _compile_pattern(normcase(pattern))
+            expected = [item for item in seeker._all_files  # pylint: disable=protected-access
+                        if pat(root + normcase(item)) is not None]
+            found = seeker.search(pattern)
+            self.assertEqual(len(found), len(expected), pattern)
+
+    def test_first_hit_is_first_in_listing_order(self):
+        seeker = FileSeekerDir(str(self.extraction), str(self.data_folder))
+        first = seeker.search('*/Caches/*.db', return_on_first_hit=True)
+        listed = [item for item in seeker._all_files  # pylint: disable=protected-access
+                  if item.endswith('.db') and '/Caches/' in item]
+        self.assertTrue(first.endswith(listed[0][len(str(self.extraction)):]))
+
+
+if __name__ == '__main__':
+    unittest.main()
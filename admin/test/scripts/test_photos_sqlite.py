@@ -0,0 +1,103 @@
+"""The Photos.sqlite artifacts must run the query of their iOS version on a shared connection.
+
+The Ph artifacts used to open Photos.sqlite again for each artifact, in an if/elif chain
+over the iOS versions. They now declare their queries in a registry that run_photos_query
+dispatches on: the query whose range holds the iOS version runs (from its first version up
+to, not including, the next one), an unsupported version or a missing database is logged
+and gives no rows, and the rows only keep the columns that have a header, as the loops of
+the artifacts did. The connection is the one open_sqlite_db_readonly shares with the
+artifacts that follow, until close_sqlite_dbs, with the larger page cache of the Ph
+artifacts.
+"""
+import pathlib
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts import photos_sqlite
+from scripts.ilapfuncs import close_sqlite_dbs, iOS, release_sqlite_dbs
+from scripts.photos_sqlite import PhotosQuery, run_photos_query, select_photos_query
+# pylint: enable=wrong-import-position
+
+QUERIES = (
+    PhotosQuery('11', '17', 'SELECT ZUUID, ZFILENAME, Z_PK FROM ZASSET ORDER BY Z_PK', ('UUID', 'Filename')),
+    PhotosQuery('17', '18.2', 'SELECT ZFILENAME, ZUUID FROM ZASSET ORDER BY Z_PK', ('Filename', 'UUID')),
+)
+
+
+class Context:
+
+    def __init__(self, files_found):
+        self.files_found = files_found
+
+    def get_files_found(self):
+        return self.files_found
+
+
+class TestPhotosSqlite(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.db_path = str(self.tmpdir / 'Photos.sqlite')
+        with sqlite3.connect(self.db_path) as db:
+            db.execute('CREATE TABLE ZASSET (Z_PK INTEGER PRIMARY KEY, ZUUID TEXT, ZFILENAME TEXT)')
+            db.executemany('INSERT INTO ZASSET VALUES (?, ?, ?)', [(2, 'B', 'IMG_2.HEIC'), (1, 'A', 'IMG_1.JPG')])
+        db.close()
+        self.context = Context([self.db_path + '-wal', self.db_path])
+        self.ios_version = mock.patch.object(iOS, '_version', '16.5')
+        self.ios_version.start()
+
+    def tearDown(self):
+        self.ios_version.stop()
+        close_sqlite_dbs()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_query_of_the_version_is_selected(self):
+        self.assertIs(select_photos_query(QUERIES, '11'), QUERIES[0])
+        self.assertIs(select_photos_query(QUERIES, '16.7.8'), QUERIES[0])
+        self.assertIs(select_photos_query(QUERIES, '17'), QUERIES[1])
+        self.assertIsNone(select_photos_query(QUERIES, '10.3.4'))
+        self.assertIsNone(select_photos_query(QUERIES, '18.2'))
+        self.assertIsNone(select_photos_query(QUERIES, None))
+
+    def test_rows_keep_the_columns_with_a_header(self):
+        headers, rows, source_path = run_photos_query(self.context, QUERIES)
+        self.assertEqual(headers, ('UUID', 'Filename'))
+        self.assertEqual(list(rows), [('A', 'IMG_1.JPG'), ('B', 'IMG_2.HEIC')])
+        self.assertEqual(source_path, self.db_path)
+        with mock.patch.object(iOS, '_version', '17.1'):
+            headers, rows, _ = run_photos_query(self.context, QUERIES)
+        self.assertEqual((headers, list(rows)), (('Filename', 'UUID'), [('IMG_1.JPG', 'A'), ('IMG_2.HEIC', 'B')]))
+
+    def test_unsupported_version_and_missing_database_are_logged(self):
+        with mock.patch.object(photos_sqlite, 'logfunc') as logfunc:
+            with mock.patch.object(iOS, '_version', '26'):
+                self.assertEqual(run_photos_query(self.context, QUERIES, 'GenerativePlayground-Photos.sqlite'),
+                                 ((), [], self.db_path))
+            self.assertEqual(run_photos_query(Context([str(self.tmpdir / 'Syndication.sqlite')]), QUERIES),
+                             ((), [], None))
+        self.assertEqual([call.args[0] for call in logfunc.call_args_list],
+                         ['Unsupported version for GenerativePlayground-Photos.sqlite iOS 26',
+                          'Photos.sqlite not found for iOS version 16.5'])
+
+    def test_connection_is_shared_until_closed(self):
+        db = photos_sqlite.open_photos_db(self.db_path)
+        # The next artifact
+        release_sqlite_dbs()
+        self.assertIs(photos_sqlite.open_photos_db(self.db_path), db)
+        self.assertEqual(db.execute('PRAGMA cache_size').fetchone()[0], -photos_sqlite.photos_cache_kib)
+        with self.assertRaises(sqlite3.OperationalError):
+            db.execute('DELETE FROM ZASSET')
+        close_sqlite_dbs()
+        self.assertIsNot(photos_sqlite.open_photos_db(self.db_path), db)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""decode_protobuf must decode the values blackboxprotobuf.decode_message decodes.
+
+The artifacts decoding a protobuf message per record (the Biome SEGB entries, WhatsApp
+messages) used blackboxprotobuf.decode_message, which copies the typedef on every call.
+decode_protobuf decodes with the typedef compiled once, and must still give the same
+values: the fields the typedef does not pin guessed as messages or else bytes, the types
+guessed for a field used for its next occurrences (a field first guessed as bytes stays
+bytes), groups, repeated fields merged into lists, and named fields. What it does not
+port (a message that does not decode with its typedef) and the errors must give what
+blackboxprotobuf gives, the same exception for a truncated record.
+"""
+import copy
+import pathlib
+import random
+import sys
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import compile_typedef, decode_protobuf
+# pylint: enable=wrong-import-position
+
+TYPEDEF = {
+    '2': {'type': 'double', 'name': ''},
+    '3': {'type': 'int', 'name': 'state'},
+    '5': {'type': 'str', 'name': ''},
+    '14': {'type': 'message', 'name': '', 'message_typedef': {
+        '1': {'type': 'int', 'name': ''},
+        '3': {'type': 'str', 'name': ''}}},
+}
+ENCODING_TYPEDEF = {
+    '1': {'type': 'bytes', 'name': ''},
+    '2': {'type': 'double', 'name': ''},
+    '3': {'type': 'int', 'name': ''},
+    '5': {'type': 'bytes', 'name': ''},
+    '7': {'type': 'message', 'name': '', 'message_typedef': {
+        '1': {'type': 'bytes', 'name': ''},
+        '2': {'type': 'int', 'name': ''}}},
+    '9': {'type': 'fixed32', 'name': ''},
+    '14': {'type': 'message', 'name': '', 'message_typedef': {
+        '1': {'type': 'int', 'name': ''},
+        '3': {'type': 'bytes', 'name': ''}}},
+}
+
+
+def _record(index):
+    return bytes(blackboxprotobuf.encode_message({
+        '1': f'{index * 7919:032X}',
+        '2': 700000000.5 + index,
+        '3': index - 2,
+        '5': 'com.apple.Music' if index % 2 else 'héllo',
+        '7': [{'1': b'\x08\x01', '2': index}, {'1': b'\xff', '2': 300}],
+        '9': index,
+        '14': {'1': 2 ** 40, '3': 'Speaker'},
+    }, ENCODING_TYPEDEF))
+
+
+def _decoded(decode, *args):
+    try:
+        return 'values', repr(decode(*args))
+    except Exception as ex:  # pylint: disable=broad-except
+        return 'error', type(ex)
+
+
+def _blackboxprotobuf_values(data, typedef=None):
+    return blackboxprotobuf.decode_message(data, typedef)[0]
+
+
+class TestProtobufDecoder(unittest.TestCase):
+
+    def assertDecodesAsBlackboxprotobuf(self, data, typedef=None):
+        self.assertEqual(_decoded(decode_protobuf, data, typedef),
+                         _decoded(_blackboxprotobuf_values, data, typedef), data)
+
+    def test_records_decode_as_with_blackboxprotobuf(self):
+        typedef = copy.deepcopy(TYPEDEF)
+        for index in range(20):
+            data = _record(index)
+            self.assertDecodesAsBlackboxprotobuf(data, typedef)
+            self.assertDecodesAsBlackboxprotobuf(data)
+        self.assertEqual(typedef, TYPEDEF)
+        values = decode_protobuf(_record(3), typedef)
+        self.assertEqual((values['state'], values['5'], values['14']), (1, 'com.apple.Music', {'1': 2 ** 40,
+                                                                                             '3': 'Speaker'}))
+        # Field 1 of the first 7 is guessed as a message, the second does not decode with it
+        self.assertEqual((values['7'], values['7-1']), ({'1': {'1': 1}, '2': 3}, {'1': b'\xff', '2': 300}))
+        self.assertIs(compile_typedef(copy.deepcopy(TYPEDEF)), compile_typedef(typedef))
+
+    def test_learned_types_groups_and_repeats(self):
+        messages = [
+            # Field 1 is first guessed as bytes, then stays bytes where it could be a message
+            b'\x0a\x01\xff\x0a\x02\x08\x01',
+            # Then guessed as a message, it is decoded as one with the types guessed so far
+            b'\x0a\x02\x08\x01\x0a\x02\x08\x02\x0a\x02\x10\x05',
+            # A varint then a length delimited value of the same field is an error
+            b'\x08\x01\x0a\x01\x00',
+            # Groups, and an END_GROUP outside of one
+            b'\x0b\x08\x01\x0c\x10\x02', b'\x0b\x08\x01', b'\x0c',
+            # Packed values, repeated
+            b'\x22\x02\x01\x02\x22\x01\x03',
+        ]
+        typedefs = (None, {'4': {'type': 'packed_int', 'name': ''}}, {'1': {'type': 'int', 'name': 'count'}},
+                    {'1': {'type': 'group', 'name': '', 'group_typedef': {'1': {'type': 'sint', 'name': ''}}}})
+        for data in messages:
+            for typedef in typedefs:
+                self.assertDecodesAsBlackboxprotobuf(data, typedef)
+
+    def test_fallback_and_errors(self):
+        # Field 14 does not decode with its typedef, blackboxprotobuf decodes it as 14-1
+        data = b'\x72\x03\x0a\x01\x41'
+        self.assertEqual(decode_protobuf(data, TYPEDEF), {'14-1': {'1': b'A'}})
+        rng = random.Random(0)
+        for index in range(300):
+            data = bytearray(_record(index))
+            cut = rng.randrange(len(data))
+            del data[cut:cut + rng.randint(1, 3)]
+            if index % 3 == 0:
+                data[rng.randrange(len(data))] = rng.getrandbits(8)
+            self.assertDecodesAsBlackboxprotobuf(bytes(data), TYPEDEF)
+        self.assertEqual(_decoded(decode_protobuf, b'\x0a\x05abc', TYPEDEF)[0], 'error')
+
+
+if __name__ == '__main__':
+    unittest.main()
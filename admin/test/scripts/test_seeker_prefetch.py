@@ -0,0 +1,70 @@
+"""Prefetching archive members must not change what the searches return.
+
+crunch_artifacts extracts the files of every selected artifact in one pass over a tar or
+zip input before any artifact runs, then searches pattern by pattern as before. The later
+searches have to return the same paths, and the patterns must not be marked as searched:
+crunch_artifacts only records a file in the LAVA _file_path_list the first time its
+pattern is searched, so a prefetch that filled the search cache would empty that table.
+"""
+import io
+import pathlib
+import shutil
+import sys
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.search_files import FileSeekerTar, FileSeekerZip  # pylint: disable=wrong-import-position
+
+MEMBERS = {
+    'private/var/mobile/Library/SMS/sms.db': b'sms',
+    'private/var/mobile/Library/filler/a.bin': b'x' * 4096,
+    'private/var/mobile/Library/Caches/Cache.db': b'cache',
+    'private/var/mobile/Library/filler/b.bin': b'y' * 4096,
+    'private/var/mobile/Library/Preferences/com.apple.Maps.plist': b'plist',
+}
+PATTERNS = ['*/SMS/sms.db*', '*/Caches/Cache.db', '*/Preferences/com.apple.*.plist', '*/missing.db']
+
+
+class TestPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        with tarfile.open(self.tmpdir / 'input.tar.gz', 'w:gz') as tar:
+            for name, data in MEMBERS.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        with zipfile.ZipFile(self.tmpdir / 'input.zip', 'w') as archive:
+            for name, data in MEMBERS.items():
+                archive.writestr(name, data)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _compare(self, seeker_class, archive):
+        plain = seeker_class(str(self.tmpdir / archive), str(self.tmpdir / 'plain'))
+        prefetched = seeker_class(str(self.tmpdir / archive), str(self.tmpdir / 'prefetched'))
+        prefetched.prefetch(PATTERNS)
+        self.assertEqual(prefetched.searched, {})
+        self.assertEqual(len(prefetched.copied), 3)
+        for pattern in PATTERNS:
+            expected = [path.replace('plain', 'prefetched') for path in plain.search(pattern)]
+            self.assertEqual(prefetched.search(pattern), expected, pattern)
+            for path in expected:
+                name = pathlib.Path(path).relative_to(self.tmpdir / 'prefetched').as_posix()
+                self.assertEqual(pathlib.Path(path).read_bytes(), MEMBERS[name])
+
+    def test_tar_gz(self):
+        self._compare(FileSeekerTar, 'input.tar.gz')
+
+    def test_zip(self):
+        self._compare(FileSeekerZip, 'input.zip')
+
+
+if __name__ == '__main__':
+    unittest.main()
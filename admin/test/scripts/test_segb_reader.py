@@ -0,0 +1,104 @@
+"""segb_reader.read_segb_file must read the entries ccl_segb.read_segb_file reads.
+
+The Biome artifacts read their SEGB files with ccl_segb.read_segb_file, which opens a file
+for each signature it checks and reads every record with read calls. segb_reader reads a
+file once from a memory mapping: it must give the same
+Segb1Entry and Segb2Entry objects, the v2 trailer slots that are empty skipped and the
+entries sharing an end offset read from the same data, and for a damaged file the entries
+before the damage then the error ccl_segb raises.
+"""
+import os
+import pathlib
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+import zlib
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts import segb_reader
+from scripts.ccl_segb import ccl_segb
+from scripts.ccl_segb.ccl_segb_common import EntryState
+# pylint: enable=wrong-import-position
+
+RECORDS = [(b'\x0a\x03abc', 1, 700000000.5), (b'', 3, 700000100.0), (b'\x08' * 13, 1, 700000200.25)]
+
+
+def _segb1(records):
+    body = bytearray()
+    for data, state, timestamp in records:
+        body += struct.pack('<iiddIi', len(data), state, timestamp, timestamp + 1, zlib.crc32(data), 0) + data
+        body += b'\0' * (-len(body) % 8)
+    return struct.pack('<I', 56 + len(body)) + b'\0' * 48 + b'SEGB' + bytes(body)
+
+
+def _segb2(records):
+    body = bytearray()
+    trailer = bytearray()
+    for data, state, timestamp in records:
+        body += struct.pack('<Ii', zlib.crc32(data), 0) + data
+        trailer += struct.pack('<2id', len(body), state, timestamp)
+        body += b'\0' * (-len(body) % 4)
+    # The first record deleted again, and an empty slot
+    trailer += struct.pack('<2id', struct.unpack_from('<i', trailer)[0], 3, 700000300.0) + b'\0' * 16
+    return struct.pack('<4sid16s', b'SEGB', len(trailer) // 16, 700000000.0, b'\0' * 16) + bytes(body) + trailer
+
+
+def _read(read, path):
+    entries = []
+    try:
+        for entry in read(path):
+            entries.append(entry)
+    except Exception as ex:  # pylint: disable=broad-except
+        entries.append((type(ex), str(ex)))
+    return entries
+
+
+class TestSegbReader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _file(self, name, data):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'wb') as segb_file:
+            segb_file.write(data)
+        return path
+
+    def assertReadsAsCclSegb(self, path):
+        expected = _read(ccl_segb.read_segb_file, path)
+        self.assertEqual(_read(segb_reader.read_segb_file, path), expected)
+        return expected
+
+    def test_entries_are_those_of_ccl_segb(self):
+        entries = self.assertReadsAsCclSegb(self._file('v1', _segb1(RECORDS)))
+        self.assertEqual([(entry.data, entry.state) for entry in entries],
+                         [(data, state) for data, state, _ in RECORDS])
+        entries = self.assertReadsAsCclSegb(self._file('v2', _segb2(RECORDS)))
+        self.assertEqual([(entry.data, entry.state, entry.data_start_offset) for entry in entries], [
+            (b'\x0a\x03abc', EntryState.Written, 32), (b'\x0a\x03abc', EntryState.Deleted, 32),
+            (b'', EntryState.Deleted, 48), (b'\x08' * 13, EntryState.Written, 56)])
+
+    def test_damaged_files(self):
+        for data in (_segb1(RECORDS), _segb2(RECORDS)):
+            for cut in range(0, len(data), 3):
+                self.assertReadsAsCclSegb(self._file(f'{cut}', data[:cut]))
+                damaged = bytearray(data)
+                damaged[cut] ^= 0xa5
+                self.assertReadsAsCclSegb(self._file(f'{cut}', bytes(damaged)))
+        # The entries before the damage, then the error
+        entries = _read(segb_reader.read_segb_file, self._file('bad', _segb1(RECORDS[:1] + [(b'', 7, 0.0)])))
+        self.assertEqual((entries[0].data, entries[1]), (RECORDS[0][0], (ValueError, '7 is not a valid EntryState')))
+        with self.assertRaisesRegex(ValueError, 'not a SEGB File'):
+            segb_reader.read_segb_file(self._file('empty', b''))
+
+
+if __name__ == '__main__':
+    unittest.main()
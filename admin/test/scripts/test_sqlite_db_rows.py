@@ -0,0 +1,97 @@
+"""get_sqlite_db_rows yields the rows an artifact built from get_sqlite_db_records.
+
+The artifacts reading a database iterated over get_sqlite_db_records and built each row
+of their output, converting its timestamps and plists one value at a time. With
+get_sqlite_db_rows they give the types of those columns and return the rows it yields:
+they must be those the artifacts built, the columns converted for every batch of rows
+fetched (across the batches, with the attached database of the query), the other
+values as the query returns them, and a query that fails must log its error and yield
+no row, as get_sqlite_db_records did.
+"""
+import logging
+import pathlib
+import plistlib
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts import ilapfuncs
+from scripts.ilapfuncs import OutputParameters, attach_sqlite_db_readonly, close_log, close_sqlite_dbs, \
+    convert_cocoa_core_data_ts_to_utc, convert_unix_ts_to_utc, flush_log, get_plist_content, \
+    get_sqlite_db_records, get_sqlite_db_rows
+# pylint: enable=wrong-import-position
+
+QUERY = '''
+SELECT ZOBJECT.ZSTARTDATE, ZOBJECT.ZCREATED, CASE ZOBJECT.ZREAD WHEN 0 THEN '' WHEN 1 THEN 'Yes' END,
+       ZOBJECT.ZMETADATA, ZSOURCE.ZNAME
+FROM ZOBJECT LEFT JOIN other.ZSOURCE ON ZOBJECT.ZSOURCE = ZSOURCE.Z_PK
+ORDER BY ZOBJECT.Z_PK
+'''
+
+
+class TestSqliteDbRows(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.db_path = str(self.tmpdir / 'knowledgeC.db')
+        self.other_path = str(self.tmpdir / 'other.db')
+        db = sqlite3.connect(self.db_path)
+        db.execute('CREATE TABLE ZOBJECT (Z_PK INTEGER PRIMARY KEY, ZSTARTDATE, ZCREATED, ZREAD, ZMETADATA, ZSOURCE)')
+        metadata = plistlib.dumps({'bundle': 'com.apple.mobilesafari'}, fmt=plistlib.PlistFormat.FMT_BINARY)
+        db.executemany('INSERT INTO ZOBJECT VALUES (?, ?, ?, ?, ?, ?)', [
+            (index, 700000000.5 + index * 60 if index % 7 else None, 1700000000123 + index if index % 5 else 0,
+             index % 3, metadata if index % 2 else None, index % 4) for index in range(1, 250)])
+        db.commit()
+        db.close()
+        db = sqlite3.connect(self.other_path)
+        db.execute('CREATE TABLE ZSOURCE (Z_PK INTEGER PRIMARY KEY, ZNAME TEXT)')
+        db.executemany('INSERT INTO ZSOURCE VALUES (?, ?)', [(1, 'Safari'), (2, 'Mail'), (3, 'Maps')])
+        db.commit()
+        db.close()
+        self.attach_query = attach_sqlite_db_readonly(self.other_path, 'other')
+
+    def tearDown(self):
+        close_sqlite_dbs()
+        close_log()
+        OutputParameters.screen_output_file_path = ''
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_rows_are_those_the_artifacts_built(self):
+        expected = [(convert_cocoa_core_data_ts_to_utc(record[0]), convert_unix_ts_to_utc(record[1]), record[2],
+                     get_plist_content(record[3]) if record[3] else record[3], record[4])
+                    for record in get_sqlite_db_records(self.db_path, QUERY, self.attach_query)]
+        self.assertEqual(len(expected), 249)
+        fetch_size = ilapfuncs.sqlite_fetch_size
+        try:
+            for batch_size in (1, 100, 10000):
+                ilapfuncs.sqlite_fetch_size = batch_size
+                rows = get_sqlite_db_rows(self.db_path, QUERY, {0: 'cocoa_date', 1: 'unix_date', 3: 'plist_blob'},
+                                          self.attach_query)
+                self.assertEqual(list(rows), expected)
+        finally:
+            ilapfuncs.sqlite_fetch_size = fetch_size
+        self.assertEqual(expected[0][3], {'bundle': 'com.apple.mobilesafari'})
+
+        seconds = list(get_sqlite_db_rows(self.db_path, 'SELECT ZSTARTDATE, ZCREATED FROM ZOBJECT ORDER BY Z_PK',
+                                          {0: 'cocoa_seconds', 1: 'unix_seconds'}))
+        self.assertEqual(seconds[:2], [(1678307260, 1700000000), (1678307320, 1700000000)])
+        self.assertEqual(list(get_sqlite_db_rows(self.db_path, 'SELECT Z_PK FROM ZOBJECT WHERE Z_PK < 3', {})),
+                         [(1,), (2,)])
+
+    def test_failing_query(self):
+        OutputParameters.screen_output_file_path = str(self.tmpdir / 'Screen_Output.html')
+        OutputParameters.log_level = logging.INFO
+        self.assertEqual(list(get_sqlite_db_rows(self.db_path, 'SELECT * FROM ZMISSING', {0: 'cocoa_date'})), [])
+        self.assertEqual(list(get_sqlite_db_rows(str(self.tmpdir / 'missing' / 'missing.db'), QUERY, {})), [])
+        flush_log()
+        self.assertIn('no such table: ZMISSING', (self.tmpdir / 'Screen_Output.html').read_text(encoding='utf8'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""The read-only SQLite connections are shared by the artifacts of a run.
+
+open_sqlite_db_readonly used to open a new connection on each call, and so did the
+does_table/view/column_exist_in_db checks, which artifacts repeat against the same
+database. The connection of a database is now kept open for the next calls, with its
+schema read once: an artifact must not see what the previous one changed on it (row and
+text factories, attached databases), closing it must leave it usable, and a database
+written during the run (the LAVA database) must be read again rather than from the
+snapshot of an old connection. Within an artifact, a connection the artifact is still
+reading with its own factories must not be reset by the next call for the same database,
+which gets a connection of its own. release_sqlite_dbs hands the connections to the next
+artifact, and close_sqlite_dbs closes them at the end of the run.
+"""
+import pathlib
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts import ilapfuncs
+from scripts.ilapfuncs import attach_sqlite_db_readonly, close_sqlite_dbs, does_column_exist_in_db, \
+    does_table_exist_in_db, does_view_exist_in_db, get_sqlite_db_records, open_sqlite_db_readonly, \
+    release_sqlite_dbs
+# pylint: enable=wrong-import-position
+
+
+class TestSqlitePool(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.db_path = str(self.tmpdir / 'knowledgeC.db')
+        self.other_path = str(self.tmpdir / 'other.db')
+        for path in (self.db_path, self.other_path):
+            db = sqlite3.connect(path)
+            db.execute('CREATE TABLE ZOBJECT (Z_PK INTEGER PRIMARY KEY, ZVALUESTRING TEXT)')
+            db.execute('CREATE VIEW ZVIEW AS SELECT ZVALUESTRING FROM ZOBJECT')
+            db.execute("INSERT INTO ZOBJECT VALUES (1, 'com.apple.mobilesafari')")
+            db.commit()
+            db.close()
+
+    def tearDown(self):
+        close_sqlite_dbs()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_connection_is_shared_and_reset(self):
+        db = open_sqlite_db_readonly(self.db_path)
+        db.row_factory = sqlite3.Row
+        db.execute(attach_sqlite_db_readonly(self.other_path, 'other'))
+        db.close()
+        release_sqlite_dbs()
+        self.assertIs(open_sqlite_db_readonly(pathlib.Path(self.db_path)), db)
+        self.assertIsNone(db.row_factory)
+        self.assertEqual([row[1] for row in db.execute('PRAGMA database_list')], ['main'])
+        self.assertEqual(db.execute('PRAGMA query_only').fetchone(), (1,))
+        records = get_sqlite_db_records(self.db_path, 'SELECT * FROM ZOBJECT', attach_sqlite_db_readonly(
+            self.other_path, 'other'))
+        self.assertEqual([row['ZVALUESTRING'] for row in records], ['com.apple.mobilesafari'])
+        close_sqlite_dbs()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            db.execute('SELECT 1')
+
+    def test_artifact_keeps_its_connection_state(self):
+        db = open_sqlite_db_readonly(self.db_path)
+        db.text_factory = bytes
+        cursor = db.execute('SELECT ZVALUESTRING FROM ZOBJECT')
+        # Calls made by the same artifact while it reads its rows
+        records = get_sqlite_db_records(self.db_path, 'SELECT ZVALUESTRING FROM ZOBJECT')
+        self.assertEqual([row['ZVALUESTRING'] for row in records], ['com.apple.mobilesafari'])
+        other = open_sqlite_db_readonly(self.db_path)
+        self.assertIsNot(other, db)
+        self.assertIsNone(other.row_factory)
+        self.assertTrue(does_table_exist_in_db(self.db_path, 'ZOBJECT'))
+        self.assertTrue(does_column_exist_in_db(self.db_path, 'ZOBJECT', 'ZVALUESTRING'))
+        self.assertEqual(cursor.fetchall(), [(b'com.apple.mobilesafari',)])
+        self.assertIs(db.text_factory, bytes)
+        other.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            other.execute('SELECT 1')
+        # The next artifact gets the pooled connection back, reset
+        release_sqlite_dbs()
+        self.assertIs(open_sqlite_db_readonly(self.db_path), db)
+        self.assertIs(db.text_factory, str)
+
+    def test_schema_checks(self):
+        db = open_sqlite_db_readonly(self.db_path)
+        db.row_factory = sqlite3.Row
+        self.assertTrue(does_table_exist_in_db(self.db_path, 'ZOBJECT'))
+        self.assertFalse(does_table_exist_in_db(self.db_path, 'ZVIEW'))
+        self.assertTrue(does_view_exist_in_db(self.db_path, 'ZVIEW'))
+        self.assertTrue(does_column_exist_in_db(self.db_path, 'zobject', 'zValueString'))
+        self.assertFalse(does_column_exist_in_db(self.db_path, 'ZOBJECT', 'ZSTARTDATE'))
+        # The checks leave the connection of the artifact as it is
+        self.assertIs(db.row_factory, sqlite3.Row)
+        with mock.patch.object(ilapfuncs, 'logfunc') as logfunc:
+            self.assertFalse(does_table_exist_in_db(str(self.tmpdir / 'missing.db'), 'ZOBJECT'))
+        self.assertTrue(logfunc.called)
+
+    def test_written_database_is_read_again(self):
+        self.assertFalse(does_table_exist_in_db(self.db_path, 'ZSTRUCTUREDMETADATA'))
+        db = sqlite3.connect(self.db_path)
+        db.execute('PRAGMA journal_mode = WAL')
+        db.execute('CREATE TABLE ZSTRUCTUREDMETADATA (Z_PK INTEGER PRIMARY KEY)')
+        db.commit()
+        self.assertTrue(does_table_exist_in_db(self.db_path, 'ZSTRUCTUREDMETADATA'))
+        self.assertFalse(does_column_exist_in_db(self.db_path, 'ZOBJECT', 'ZSOURCE'))
+        db.execute('ALTER TABLE ZOBJECT ADD COLUMN ZSOURCE INTEGER')
+        db.commit()
+        self.assertTrue(does_column_exist_in_db(self.db_path, 'ZOBJECT', 'ZSOURCE'))
+        db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
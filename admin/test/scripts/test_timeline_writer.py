@@ -0,0 +1,105 @@
+"""The timeline database is written through one connection per run.
+
+open_timeline_db used to open _Timeline/tl.db for every artifact, with synchronous writes,
+and inserted its rows one executemany call per row. The connection now stays open for the
+artifacts of the run, which insert their rows in batches and commit when they end, and
+the key of a row is stored as an integer: the Unix timestamp of the first column when it
+is a date and time (a datetime, or the text str gives for one, naive ones being UTC),
+its text otherwise, whatever other formats the fromisoformat of the Python version
+accepts. The datalist column keeps the JSON of the row as text, and the table is indexed
+by key once the run is over. A worker process commits its rows after every batch, so that
+another worker writing to the timeline does not wait for the end of a streamed artifact.
+"""
+import datetime
+import json
+import multiprocessing
+import pathlib
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts.ilapfuncs import add_timeline_rows, finalize_output_dbs, open_timeline_db, \
+    output_dbs_commit_each_write, timeline
+# pylint: enable=wrong-import-position
+
+HEADERS = ('Timestamp', 'Event')
+
+
+def _write_in_worker(report_folder, written, done):
+    '''Writes a batch of a streamed artifact, and waits before its next one'''
+    output_dbs_commit_each_write()
+    add_timeline_rows(open_timeline_db(report_folder), 'Worker', [('2026-01-01 10:00:00', 'worker')], HEADERS)
+    written.set()
+    done.wait(30)
+
+
+class TestTimelineWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = pathlib.Path(tempfile.mkdtemp())
+        self.report_folder = str(self.tmpdir / '_HTML' / 'Testing') + '/'
+
+    def tearDown(self):
+        finalize_output_dbs(str(self.tmpdir))
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_rows_are_keyed_by_timestamp(self):
+        paris = datetime.timezone(datetime.timedelta(hours=1))
+        timeline(self.report_folder, 'First', [
+            (datetime.datetime(2026, 1, 1, 10, 0, 0, 750000, tzinfo=datetime.timezone.utc), 'aware'),
+            (datetime.datetime(2026, 1, 1, 10, 0, 1), 'naive'),
+            (datetime.datetime(2026, 1, 1, 11, 0, 2, tzinfo=paris), 'offset'),
+        ], HEADERS)
+        db = open_timeline_db(self.report_folder)
+        self.assertIs(open_timeline_db(str(self.tmpdir / '_HTML' / 'Other')), db)
+        timeline(self.report_folder, 'Second', [('2026-01-01 10:00:03', 1), ('', 2), ('N/A', 3), (1767261604, 4),
+                                                ('2026-01-01T10:00:05Z', 5), ('2026-01-01', 6),
+                                                ('2026-01-01 10:00:06.75-01:00', 7), ('2026-13-01 10:00:07', 8)],
+                 HEADERS)
+        finalize_output_dbs(str(self.tmpdir))
+
+        db = sqlite3.connect(self.tmpdir / '_Timeline' / 'tl.db')
+        rows = db.execute('SELECT key, activity, datalist FROM data ORDER BY rowid').fetchall()
+        self.assertEqual([row[0] for row in rows],
+                         [1767261600, 1767261601, 1767261602, 1767261603, '', 'N/A', 1767261604,
+                          '2026-01-01T10:00:05Z', '2026-01-01', '2026-01-01 10:00:06.75-01:00', '2026-13-01 10:00:07'])
+        self.assertEqual([row[1] for row in rows], ['First'] * 3 + ['Second'] * 8)
+        self.assertEqual(json.loads(rows[0][2]), {'Timestamp': '2026-01-01 10:00:00.750000+00:00', 'Event': 'aware'})
+        self.assertEqual(json.loads(rows[6][2]), {'Timestamp': '1767261604', 'Event': '4'})
+        self.assertEqual(db.execute("SELECT name FROM sqlite_master WHERE type='index'").fetchall(),
+                         [('data_key',)])
+        db.close()
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'workers are forked')
+    def test_worker_commits_every_batch(self):
+        context = multiprocessing.get_context('fork')
+        written = context.Event()
+        done = context.Event()
+        worker = context.Process(target=_write_in_worker, args=(self.report_folder, written, done))
+        worker.start()
+        try:
+            self.assertTrue(written.wait(30))
+            # Another worker writing while the first one is still running its artifact
+            db = sqlite3.connect(self.tmpdir / '_Timeline' / 'tl.db', timeout=2)
+            db.execute("INSERT INTO data VALUES(1767261601, 'Other', '{}')")
+            db.commit()
+            db.close()
+        finally:
+            done.set()
+            worker.join()
+        finalize_output_dbs(str(self.tmpdir))
+
+        db = sqlite3.connect(self.tmpdir / '_Timeline' / 'tl.db')
+        self.assertEqual(db.execute('SELECT key, activity FROM data ORDER BY rowid').fetchall(),
+                         [(1767261600, 'Worker'), (1767261601, 'Other')])
+        db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""The column timestamp converters give what the scalar ones give for every value.
+
+The artifacts converting millions of timestamps now convert a column at once with
+convert_unix_ts_column_to_utc and convert_cocoa_core_data_ts_column_to_utc, which do the
+arithmetic of convert_unix_ts_in_seconds with numpy: a column must convert to the list
+the scalar converters give value by value, in seconds, milliseconds, microseconds or
+nanoseconds, next to the powers of ten where the number of digits changes, and with the
+values they leave unchanged (None, 0, strings, NaN...) or convert one at a time. The
+*_to_seconds versions give the Unix timestamps of those datetimes, which LAVA stores
+as they are, and without numpy the scalar converters are used.
+"""
+import math
+import pathlib
+import random
+import sys
+import unittest
+from datetime import datetime
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from scripts import ilapfuncs
+from scripts.ilapfuncs import convert_cocoa_core_data_ts_column_to_seconds, \
+    convert_cocoa_core_data_ts_column_to_utc, convert_cocoa_core_data_ts_to_utc, \
+    convert_unix_ts_column_to_seconds, convert_unix_ts_column_to_utc, convert_unix_ts_to_utc
+from scripts.lavafuncs import _lava_timestamp
+# pylint: enable=wrong-import-position
+
+CONVERTERS = (
+    (convert_unix_ts_to_utc, convert_unix_ts_column_to_utc, convert_unix_ts_column_to_seconds),
+    (convert_cocoa_core_data_ts_to_utc, convert_cocoa_core_data_ts_column_to_utc,
+     convert_cocoa_core_data_ts_column_to_seconds))
+
+
+def _columns():
+    rng = random.Random(0)
+    seconds = [rng.uniform(1e8, 2e9) for _ in range(200)]
+    yield seconds
+    for scale in (10 ** 3, 10 ** 6, 10 ** 9):
+        yield [int(value * scale) for value in seconds]
+        yield [value * scale for value in seconds]
+    powers = [10 ** digits for digits in range(25)]
+    yield powers + [power + offset for power in powers for offset in (-1, 1)] + \
+        [math.nextafter(float(power), direction) for power in powers for direction in (0, math.inf)]
+    yield seconds[:100] + [None, 0, 0.0, '', True, -1, -978307200, 978307200, 2 ** 70, 10 ** 400, 0.5]
+
+
+class TestTimestampColumns(unittest.TestCase):
+
+    def assertConvertsAsScalar(self):
+        for column in _columns():
+            for convert, convert_column, convert_column_to_seconds in CONVERTERS:
+                expected = [convert(value) for value in column]
+                converted = convert_column(iter(column))
+                self.assertEqual([(type(value), value) for value in converted],
+                                 [(type(value), value) for value in expected])
+                self.assertEqual(convert_column_to_seconds(column),
+                                 [int(value.timestamp()) if isinstance(value, datetime) else value
+                                  for value in expected])
+
+    def test_columns_convert_as_the_scalar_converters(self):
+        self.assertConvertsAsScalar()
+        # A column of nanoseconds
+        self.assertEqual(convert_unix_ts_column_to_utc([1700000000123456789] * 100)[0].isoformat(),
+                         '2023-11-14T22:13:20+00:00')
+        # Strings are converted by convert_unix_ts_to_utc, convert_cocoa_core_data_ts_to_utc raises
+        self.assertEqual(convert_unix_ts_column_to_utc(['1600000000', 'abc', b'\0'] * 30)[:3],
+                         [convert_unix_ts_to_utc('1600000000'), 'abc', b'\0'])
+        with self.assertRaises(TypeError):
+            convert_cocoa_core_data_ts_column_to_utc([1.0] * 100 + ['abc'])
+        with self.assertRaises(ValueError):
+            convert_unix_ts_column_to_utc([1.0] * 100 + [math.nan])
+        self.assertEqual(_lava_timestamp(convert_unix_ts_column_to_seconds([1700000000123])[0]), 1700000000)
+
+    def test_without_numpy(self):
+        numpy = ilapfuncs.numpy
+        ilapfuncs.numpy = None
+        try:
+            self.assertConvertsAsScalar()
+        finally:
+            ilapfuncs.numpy = numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@ import pathlib
 import json
 import argparse
 import io
+import logging
+import multiprocessing
 import pytz
 import os.path
 import typing
@@ -12,6 +14,8 @@ import traceback
 import sys
 
 import scripts.plugin_loader as plugin_loader
+import scripts.artifact_cache as artifact_cache
+import scripts.artifact_profiler as artifact_profiler
 import leapp_functions.app.history as history
 
 from shutil import copy2
@@ -23,6 +27,7 @@ from scripts.version_info import leapp_name, leapp_version, check_runtime_depend
 from time import process_time, gmtime, strftime, perf_counter
 from scripts.lavafuncs import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from scripts.context import Context
+from scripts.artifact_scheduler import ArtifactTask, can_run_in_parallel, run_artifacts
 from scripts.ios_keychain import report_supplied_keychain
 from scripts.lavafuncs import lava_json_name
 
@@ -77,6 +82,21 @@ def validate_args(args):
     if args.keychain and not os.path.isfile(args.keychain):
         raise argparse.ArgumentError(None, 'Keychain file not found! Run the program again.')
 
+    if args.itunes_password_list and not os.path.isfile(args.itunes_password_list):
+        raise argparse.ArgumentError(None, 'iTunes password list file not found! Run the program again.')
+
+    if args.workers < 1:
+        raise argparse.ArgumentError(None, 'Number of WORKERS must be at least 1! Run the program again.')
+
+    if args.listing_threads < 1:
+        raise argparse.ArgumentError(None, 'Number of LISTING_THREADS must be at least 1! Run the program again.')
+
+    if args.cache_dir and os.path.exists(args.cache_dir) and not os.path.isdir(args.cache_dir):
+        raise argparse.ArgumentError(None, 'CACHE_DIR is not a folder! Run the program again.')
+
+    if args.cache_backup_keys and not args.cache_dir:
+        raise argparse.ArgumentError(None, '--cache-backup-keys requires --cache-dir! Run the program again.')
+
     try:
         pytz.timezone(args.timezone)
     except pytz.UnknownTimeZoneError as ex:
@@ -199,10 +219,45 @@ def main():
     parser.add_argument('--custom_output_folder', required=False, action="store", help="Custom name for the output folder")
     parser.add_argument('--custom_artifacts_path', required=False, action="store", help="Additional path to load artifacts from (e.g., scripts/alternate_artifacts)")
     parser.add_argument('--itunes_password', required=False, action="store", help="Password used for encrypted iTunes backup")
+    parser.add_argument('--itunes_password_list', required=False, action="store",
+                        help=("Text file of candidate passwords for an encrypted iTunes backup, one per line. "
+                              "They are tried in parallel and the first that works is used. When none "
+                              "works, --itunes_password is tried or the password is prompted for."))
     parser.add_argument('--keychain', required=False, action="store",
                         help=("Path to a keychain file captured from the device. Some apps keep "
                               "their database key in the keychain, which is collected separately "
                               "from the file system extraction."))
+    parser.add_argument('--workers', required=False, action="store", type=int, default=1,
+                        help=("Number of worker processes used to run artifacts in parallel once their files "
+                              "have been located (default: 1, one artifact at a time)."))
+    parser.add_argument('--listing-threads', required=False, action="store", type=int, default=1,
+                        dest='listing_threads',
+                        help=("Number of threads listing the directories of a file system extraction (default: 1). "
+                              "More threads only help when the extraction is on a network share or a slow disk."))
+    parser.add_argument('--wal-strings-utf16', required=False, action="store_true", dest='wal_strings_utf16',
+                        help=("Also extract the UTF-16LE strings of the SQLite WAL and journal files "
+                              "(Database Journal Strings - UTF-16 Details), a second pass over these files."))
+    parser.add_argument('--profile-artifacts', required=False, action="store_true", dest='profile_artifacts',
+                        help=("Run each artifact under cProfile and write its statistics to the _Profiles "
+                              "folder of the report."))
+    parser.add_argument('--cache-dir', required=False, action="store", dest='cache_dir',
+                        help=("Folder where the results of the artifacts are kept. A later run on the same "
+                              "extraction with the same folder loads the results of the artifacts whose "
+                              "files did not change instead of parsing them again."))
+    parser.add_argument('--cache-backup-keys', required=False, action="store_true", dest='cache_backup_keys',
+                        help=("Also keep the key of an encrypted iTunes backup in the CACHE_DIR folder, so that "
+                              "a later run needs no password. The key is wrapped with a key kept in the LEAPP "
+                              "settings folder: together they decrypt the backup as the password does."))
+    parser.add_argument('--link-files', required=False, action="store_true", dest='link_files',
+                        help=("For a file system extraction, hard link the files needed by the artifacts into "
+                              "the report instead of copying them, when both are on the same file system. "
+                              "The report then shares these files with the extraction: only use it on a "
+                              "working copy of the extraction. SQLite files are cloned or copied."))
+    parser.add_argument('--log-level', required=False, action="store", dest='log_level', default='info',
+                        choices=['debug', 'info', 'warning', 'error'],
+                        help=("Level of the messages logged to the screen and to Screen_Output.html "
+                              "(default: info). The messages about each record or file an artifact "
+                              "skips are only logged at the debug level."))
 
     # Check if no arguments were provided
     if len(sys.argv) == 1:
@@ -219,7 +274,9 @@ def main():
     for plugin in sorted(loader.plugins, key=lambda p: p.category):
         if (plugin.module_name == 'iTunesBackupInfo'
                 or plugin.name == 'last_build'
-                or plugin.module_name == 'logarchive' and plugin.name != 'logarchive'):
+                or plugin.module_name == 'logarchive' and plugin.name != 'logarchive'
+                # A second pass over the journals, only run when asked for
+                or plugin.name == 'walStringsUTF16Details' and not args.wal_strings_utf16):
             continue
         else:
             available_plugins.append(plugin)
@@ -341,7 +398,12 @@ def main():
     time_offset = args.timezone
     custom_output_folder = args.custom_output_folder
     itunes_backup_password = args.itunes_password
+    itunes_password_list = None
+    if args.itunes_password_list:
+        with open(args.itunes_password_list, 'r', encoding='utf-8') as password_list:
+            itunes_password_list = [line.rstrip('\r\n') for line in password_list if line.rstrip('\r\n')]
     Context.set_keychain_path(args.keychain)
+    OutputParameters.log_level = getattr(logging, args.log_level.upper())
 
     # ios file system extractions contain paths > 260 char, which causes problems
     # This fixes the problem by prefixing \\?\ on each windows path.
@@ -359,13 +421,17 @@ def main():
     history.record_output_path(output_path)
 
     crunch_artifacts(selected_plugins, extracttype, input_path, out_params, wrap_text, loader, casedata, time_offset,
-        profile_filename, itunes_backup_password)
+        profile_filename, itunes_backup_password, workers=args.workers, cache_dir=args.cache_dir,
+        profile_artifacts=args.profile_artifacts, link_files=args.link_files, listing_threads=args.listing_threads,
+        itunes_password_list=itunes_password_list, cache_backup_keys=args.cache_backup_keys)
 
     lava_finalize_output(out_params.output_folder_base)
 
 def crunch_artifacts(
         plugins: typing.Sequence[plugin_loader.PluginSpec], extracttype, input_path, out_params, wrap_text,
-        loader: plugin_loader.PluginLoader, casedata, time_offset, profile_filename, itunes_backup_password=None, decryption_keys=None):
+        loader: plugin_loader.PluginLoader, casedata, time_offset, profile_filename, itunes_backup_password=None, decryption_keys=None,
+        workers=1, cache_dir=None, profile_artifacts=False, link_files=False, listing_threads=1,
+        itunes_password_list=None, cache_backup_keys=False):
     start = process_time()
     start_wall = perf_counter()
 
@@ -378,11 +444,17 @@ def crunch_artifacts(
     logfunc('By: Yogesh Khatri   | @SwiftForensics | swiftforensics.com\n')
     logdevinfo()
     report_supplied_keychain()
+    artifact_cache.enable_cache(cache_dir)
+    artifact_profiler.timings.clear()
+    artifact_profiler.enable_profiling(
+        os.path.join(out_params.output_folder_base, '_Profiles') if profile_artifacts else None)
     seeker = None
     password = itunes_backup_password
+    key_cache_dir = cache_dir if cache_backup_keys else None
     try:
         if extracttype == 'fs':
-            seeker = FileSeekerDir(input_path, out_params.data_folder)
+            seeker = FileSeekerDir(input_path, out_params.data_folder, link_files=link_files,
+                                   walk_threads=listing_threads)
 
         elif extracttype == 'file':
             seeker = FileSeekerFile(input_path, out_params.data_folder)
@@ -403,10 +475,17 @@ def crunch_artifacts(
                     return False
                 else:
                     if encrypted:
+                        # A backup processed before with --cache-backup-keys needs no password
+                        if not decryption_keys:
+                            decryption_keys = load_cached_itunes_backup_keys(input_path, key_cache_dir)
+                        # The password list is tried first, then the password given or prompted for
+                        if not decryption_keys and itunes_password_list:
+                            decryption_keys, _ = decrypt_itunes_backup_with_passwords(
+                                input_path, itunes_password_list, key_cache_dir)
                         while not decryption_keys:
                             if not password:
                                 password = getpass("iTunes Backup password: ")
-                            decryption_keys, _ = decrypt_itunes_backup(input_path, password)
+                            decryption_keys, _ = decrypt_itunes_backup(input_path, password, key_cache_dir)
                             if not decryption_keys:
                                 return False
             else:
@@ -470,17 +549,19 @@ def crunch_artifacts(
             logfunc('Info.plist not found for iTunes Backup!')
             log.write('Info.plist not found for iTunes Backup!')
 
+    # Extract the files of all the selected artifacts in one pass over the input, instead of
+    # one pattern at a time between artifacts
+    seeker.prefetch([pattern for plugin in plugins if plugin.search
+                     for pattern in ([plugin.search] if isinstance(plugin.search, str) else plugin.search)])
+
     # Search for the files per the arguments
     parsed_modules = 0
     lava_only = False
     artifact_search_pattern_id = 0
     file_path_ids = set()
 
-    for plugin_number, plugin in enumerate(plugins, start=1):
-        logfunc()
-        logfunc('[{}/{}] {} [{}] artifact started'.format(plugin_number, len(plugins),
-                                                              plugin.name, plugin.module_name))
-        output_types = plugin.artifact_info.get('output_types', '')
+    def locate_files(plugin):
+        nonlocal artifact_search_pattern_id
         if isinstance(plugin.search, list) or isinstance(plugin.search, tuple):
             search_regexes = plugin.search
         elif plugin.search is None:
@@ -522,8 +603,16 @@ def crunch_artifacts(
                             lava_insert_sqlite_artifact_link_pattern_to_file(artifact_search_pattern_id, file_path_id)
                     log.write('</li></ul>')
                     files_found.extend(found)
+        return files_found
+
+    def prepare_task(plugin_number, plugin):
+        nonlocal lava_only
+        search_start = perf_counter()
+        files_found = locate_files(plugin)
+        search_secs = perf_counter() - search_start
+        category_folder = None
         if files_found:
-            if not lava_only and 'lava_only' in output_types:
+            if not lava_only and 'lava_only' in plugin.artifact_info.get('output_types', ''):
                 lava_only = True
             category_folder = os.path.join(out_params.output_folder_base, '_HTML',
                                            sanitize_report_name(plugin.category, 'category'))
@@ -533,35 +622,84 @@ def crunch_artifacts(
                 except (FileExistsError, FileNotFoundError) as ex:
                     logfunc('Error creating {} report directory at path {}'.format(plugin.name, category_folder))
                     logfunc('Error was {}'.format(str(ex)))
-                    continue  # cannot do work
-            try:
-                plugin.method(files_found, category_folder, seeker, wrap_text, time_offset)
-                if plugin.name == 'logarchive':
-                    lava_db_path = os.path.join(out_params.output_folder_base, '_lava_artifacts.db')
-                    if does_table_exist_in_db(lava_db_path, 'logarchive'):
-                        loader["logarchive_artifacts"].method([lava_db_path], category_folder, seeker, wrap_text, time_offset)
-                    if does_table_exist_in_db(lava_db_path, 'logarchive_artifacts'):
-                        unifed_logs_artifacts = []
-                        unifed_logs_artifacts = [plugin.name for plugin in loader.plugins
-                                                 if plugin.module_name=='logarchive'
-                                                 and plugin.name != 'logarchive'
-                                                 and plugin.name != 'logarchive_artifacts']
-                        for unifed_log_artifact in unifed_logs_artifacts:
-                            loader[unifed_log_artifact].method([lava_db_path], category_folder, seeker, wrap_text, time_offset)
-            except Exception as ex:  # pylint: disable=broad-exception-caught
-                logfunc('Reading {} artifact had errors!'.format(plugin.name))
-                logfunc('Error was {}'.format(str(ex)))
-                logfunc('Exception Traceback: {}'.format(traceback.format_exc()))
-                continue  # nope
-        else:
+                    category_folder = None
+        return ArtifactTask(plugin_number, plugin, files_found, category_folder, search_secs)
+
+    def run_artifact(task):
+        with artifact_profiler.measure(task.number, task.plugin.module_name, task.plugin.name,
+                                       task.files_found, task.search_secs):
+            return execute_artifact(task)
+
+    def execute_artifact(task):
+        plugin = task.plugin
+        logfunc()
+        logfunc('[{}/{}] {} [{}] artifact started'.format(task.number, len(plugins),
+                                                              plugin.name, plugin.module_name))
+        if not task.files_found:
             logfunc("No file found")
-        logfunc('{} [{}] artifact completed'.format(plugin.name, plugin.module_name))
-        parsed_modules += 1
-        GuiWindow.SetProgressBar(parsed_modules, len(plugins))
+            return True
+        if task.category_folder is None:
+            return False  # cannot do work
+        category_folder = task.category_folder
+        try:
+            plugin.method(task.files_found, category_folder, seeker, wrap_text, time_offset)
+            if plugin.name == 'logarchive':
+                # The logarchive artifacts read the LAVA database through their own connection
+                lava_commit()
+                lava_db_path = os.path.join(out_params.output_folder_base, '_lava_artifacts.db')
+                if does_table_exist_in_db(lava_db_path, 'logarchive'):
+                    loader["logarchive_artifacts"].method([lava_db_path], category_folder, seeker, wrap_text, time_offset)
+                    lava_commit()
+                # logarchive_artifacts tags the entries of the other logarchive artifacts
+                if does_table_exist_in_db(lava_db_path, 'logarchive_matches'):
+                    unifed_logs_artifacts = []
+                    unifed_logs_artifacts = [plugin.name for plugin in loader.plugins
+                                             if plugin.module_name=='logarchive'
+                                             and plugin.name != 'logarchive'
+                                             and plugin.name != 'logarchive_artifacts']
+                    for unifed_log_artifact in unifed_logs_artifacts:
+                        loader[unifed_log_artifact].method([lava_db_path], category_folder, seeker, wrap_text, time_offset)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            logfunc('Reading {} artifact had errors!'.format(plugin.name))
+            logfunc('Error was {}'.format(str(ex)))
+            logfunc('Exception Traceback: {}'.format(traceback.format_exc()))
+            return False  # nope
+        finally:
+            lava_commit()
+        return True
+
+    def artifact_done(task, succeeded):
+        nonlocal parsed_modules
+        if succeeded:
+            logfunc('{} [{}] artifact completed'.format(task.plugin.name, task.plugin.module_name))
+            parsed_modules += 1
+            GuiWindow.SetProgressBar(parsed_modules, len(plugins))
         log.flush()
+
+    if workers > 1 and not can_run_in_parallel():
+        logfunc('Worker processes are not supported on this platform, artifacts will run one at a time.')
+    if workers > 1 and can_run_in_parallel():
+        logfunc(f'Locating the files of {len(plugins)} artifacts before running them in {workers} worker processes...')
+        tasks = [prepare_task(plugin_number, plugin) for plugin_number, plugin in enumerate(plugins, start=1)]
+        lava_commit()  # the workers cannot write while the search results hold the write lock
+        run_artifacts(tasks, workers, seeker, run_artifact, artifact_done)
+    else:
+        for plugin_number, plugin in enumerate(plugins, start=1):
+            task = prepare_task(plugin_number, plugin)
+            artifact_done(task, run_artifact(task))
+    close_sqlite_dbs()
+    finalize_output_dbs(out_params.output_folder_base)
     log.close()
 
+    if artifact_cache.is_enabled():
+        for line in artifact_cache.cache_report():
+            logfunc(line)
+    artifact_profiler.write_timings_log(OutputParameters.screen_output_file_path_timings)
+    lava_insert_sqlite_artifact_timings(artifact_profiler.timings)
+
     write_device_info()
+    # Artifacts writing their own LAVA table ('output_types': 'none') are listed there too
+    lava_only = lava_only or bool(lava_only_artifacts)
     if lava_only:
         write_lava_only_log()
     logfunc('')
@@ -584,6 +722,7 @@ def crunch_artifacts(
         if input_path.startswith('\\\\?\\'):
             input_path = input_path[4:]
 
+    flush_log()  # the report shows Screen_Output.html
     report.generate_report(out_params.output_folder_base, run_time_secs, run_time_HMS, extracttype, input_path, casedata, profile_filename, icons, lava_only)
     logfunc('Report generation Completed.')
 
@@ -597,4 +736,6 @@ def crunch_artifacts(
     return True
 
 if __name__ == '__main__':
+    # A worker process started by the frozen application runs its task instead of iLEAPP
+    multiprocessing.freeze_support()
     main()
@@ -6,6 +6,7 @@ import json
 import ileapp
 import webbrowser
 import base64
+import multiprocessing
 
 import scripts.plugin_loader as plugin_loader
 import leapp_functions.app.history as history
@@ -29,6 +30,11 @@ from leapp_functions.app.output import default_output_folder_name, validate_outp
 from scripts.context import Context
 from scripts.lavafuncs import lava_json_name
 
+if __name__ == '__main__':
+    # A worker process started by the frozen application runs its task instead of the GUI,
+    # which is built below when this script is loaded
+    multiprocessing.freeze_support()
+
 
 def allow_output_folder_name_chars(proposed):
     return sanitize_file_name(proposed) == proposed
@@ -80,6 +80,7 @@ import os
 import plistlib
 import re
 import sys
+from collections.abc import Sequence
 from datetime import datetime, timezone
 
 import biplist
@@ -294,7 +295,7 @@ def _iter_extraction_files(seeker):
         for path in all_files:
             yield path, '', ''
         return
-    if isinstance(all_files, list):
+    if isinstance(all_files, Sequence):
         directory = getattr(seeker, 'directory', '')
         for item in all_files:
             try:
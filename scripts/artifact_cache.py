@@ -0,0 +1,446 @@
+"""
+Persistent cache of artifact results, for re-runs on the same extraction.
+
+With --cache-dir, artifact_processor stores what each artifact returned in the cache
+directory, under a key made of:
+    - the artifact function name and the source of its module and of the other modules
+      of the scripts package (ilapfuncs, photos_sqlite, the vendored parsers...),
+    - the iLEAPP version,
+    - the files found for the artifact: their path in the extraction, size, modification
+      date and, up to cache_hash_limit bytes, a hash of their content,
+    - the iOS version known when the artifact starts and the timezone offset,
+    - the keychain the run reads app secrets from (--keychain, or one the extraction
+      carries), fingerprinted as the found files are.
+When a later run computes the same key, the stored rows are written to the HTML, TSV,
+timeline, LAVA and KML outputs without running the artifact again.
+
+Some artifacts search for more files through the seeker while they run. The searches
+are recorded with the entry, and the fingerprints of the files they returned: on a
+later run they are made again (which also copies the files to the report) and the
+entry is only loaded if they return the same files.
+
+Besides its rows, an artifact can record device information and the iOS version; both
+are stored with the rows and replayed on a hit. Artifacts that check in media, that write
+other files to their report folder, that read the LAVA database ('paths': None) or that
+set 'cache': False in their __artifacts_v2__ block are never cached.
+
+The paths of the output folder change from one run to the next, so the output folder
+in the stored strings is replaced by a marker and put back on replay.
+
+The entries are pickled, and unpickling can run code: each entry is signed with an HMAC
+whose key is kept outside the cache directory, in the LEAPP settings folder, and an
+entry whose signature does not match is ignored as a miss.
+
+Classes:
+    SearchRecorder: Records the searches an artifact makes through the seeker.
+    CacheWriter: Stores the result of an artifact under its key.
+
+Functions:
+    load_local_key: Returns a key kept in the LEAPP settings folder, created on first use.
+    enable_cache: Sets the cache directory for the run.
+    is_enabled: Tells if results are cached in this run.
+    artifact_key: Computes the cache key of an artifact run.
+    load: Returns the cached result of a key, or None.
+    searches_fingerprints: Fingerprints the files returned by searches of the seeker.
+    record_result: Counts an artifact as loaded, stored or not cacheable.
+    cache_report: Lines summing up the use of the cache in the run.
+"""
+
+import hashlib
+import hmac
+import os
+import pickle
+
+from leapp_functions.app.history import get_shared_directory
+from scripts.version_info import leapp_version
+
+cache_dir = None
+# Files larger than this are keyed on their size and modification date only
+cache_hash_limit = 16 * 1024 * 1024
+# Artifact names by outcome: 'hit', 'stored' or 'not cacheable'
+stats = {'hit': [], 'stored': [], 'not cacheable': []}
+
+_OUTPUT_MARKER = '\x00iLEAPP-output\x00'
+_END_OF_ROWS = '\x00end-of-rows\x00'
+_source_hashes = {}
+_scripts_hash = None
+_signing_key = None
+
+
+def load_local_key(key_path):
+    '''
+    Returns the 32 byte key stored in key_path, created on first use. The key signs (or wraps)
+    what is stored in a cache directory, so key_path must not be in that directory.
+    '''
+    try:
+        with open(key_path, 'rb') as key_file:
+            key = key_file.read()
+        if len(key) == 32:
+            return key
+    except OSError:
+        pass
+    key = os.urandom(32)
+    temp_path = f'{key_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(key_path), exist_ok=True)
+        # Only readable by the examiner running iLEAPP, where the file system has such permissions
+        with os.fdopen(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as key_file:
+            key_file.write(key)
+        os.replace(temp_path, key_path)
+    except OSError:
+        # The entries stored in this run are then not loaded by later runs
+        pass
+    return key
+
+
+def enable_cache(directory, key_path=None):
+    '''
+    Set the directory where artifact results are cached for the run.
+    Args:
+        directory (str): The cache directory, created if needed. None disables the cache.
+        key_path (str): The file of the key signing the entries, artifact_cache.key in
+                        the LEAPP settings folder by default. It must not be in the cache
+                        directory.
+    '''
+
+    global cache_dir, stats, _signing_key  # pylint: disable=global-statement
+
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        _signing_key = load_local_key(key_path or os.path.join(get_shared_directory(), 'artifact_cache.key'))
+    cache_dir = directory
+    stats = {'hit': [], 'stored': [], 'not cacheable': []}
+
+
+def is_enabled():
+    '''True when --cache-dir was given'''
+    return cache_dir is not None
+
+
+def _source_hash(path):
+    if path not in _source_hashes:
+        with open(path, 'rb') as source:
+            _source_hashes[path] = hashlib.sha256(source.read()).hexdigest()
+    return _source_hashes[path]
+
+
+def _scripts_source_hash():
+    '''Hash of the source of the scripts package, without the artifact modules'''
+
+    global _scripts_hash  # pylint: disable=global-statement
+
+    if _scripts_hash is None:
+        scripts_folder = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+        for folder, subfolders, file_names in os.walk(scripts_folder):
+            if folder == scripts_folder:
+                subfolders[:] = [name for name in subfolders
+                                 if name not in ('artifacts', 'alternate_artifacts', 'test_artifacts')]
+            subfolders.sort()
+            for file_name in sorted(file_names):
+                if file_name.endswith('.py'):
+                    path = os.path.join(folder, file_name)
+                    digest.update(os.path.relpath(path, scripts_folder).encode('utf-8', 'surrogateescape'))
+                    digest.update(_source_hash(path).encode('ascii'))
+        _scripts_hash = digest.hexdigest()
+    return _scripts_hash
+
+
+def _file_fingerprint(path, relative_path, file_info):
+    '''Identifies the content of a found file without reading large files'''
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (relative_path, None)
+    if os.path.isdir(path):
+        return (relative_path, 'dir')
+    modification_date = file_info.modification_date if file_info else stat.st_mtime
+    fingerprint = [relative_path, stat.st_size, str(modification_date)]
+    if stat.st_size <= cache_hash_limit:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as found_file:
+            for block in iter(lambda: found_file.read(1024 * 1024), b''):
+                digest.update(block)
+        fingerprint.append(digest.hexdigest())
+    return tuple(fingerprint)
+
+
+def _files_fingerprints(paths, relative_path, file_infos):
+    return sorted((_file_fingerprint(str(path), relative_path(str(path)), file_infos.get(str(path)))
+                   for path in paths),
+                  key=repr)
+
+
+def artifact_key(func, module_file_path, files_found, relative_path, file_infos, ios_version, timezone_offset,
+                 keychain_path=None):
+    '''
+    Compute the cache key of an artifact run.
+    Args:
+        func (Callable): The artifact function.
+        module_file_path (str): The path of the artifact's module.
+        files_found (list): The files found for the artifact.
+        relative_path (Callable): Converts a found file to its path in the extraction.
+        file_infos (dict): The seeker's FileInfo objects, by found file.
+        ios_version (str): The iOS version known when the artifact starts.
+        timezone_offset (str): The timezone offset of the run.
+        keychain_path (str): The keychain of the run, None if there is none.
+    Returns:
+        str: The key.
+    '''
+    fingerprints = _files_fingerprints(files_found, relative_path, file_infos)
+    keychain = _file_fingerprint(keychain_path, relative_path(keychain_path), None) if keychain_path else None
+    key_data = repr((func.__name__, _source_hash(module_file_path), _scripts_source_hash(), leapp_version,
+                     fingerprints, ios_version, str(timezone_offset), keychain))
+    return hashlib.sha256(key_data.encode('utf-8', 'surrogateescape')).hexdigest()
+
+
+class SearchRecorder:
+    '''
+    Records the searches an artifact makes through the seeker while it runs.
+    The search method of the seeker is replaced on the instance until stop is called,
+    so the artifact, Context.get_seeker() and the helpers it calls all go through it.
+    '''
+
+    def __init__(self, seeker):
+        self.seeker = seeker
+        self.searches = []
+        self.paths = []
+        self._previous = vars(seeker).get('search')
+        self._search = seeker.search
+        seeker.search = self._record
+
+    def _record(self, *args, **kwargs):
+        result = self._search(*args, **kwargs)
+        self.searches.append((args, kwargs))
+        self.paths.append(_search_paths(result))
+        return result
+
+    def stop(self):
+        '''Gives the seeker its search method back'''
+        if self._previous is None:
+            vars(self.seeker).pop('search', None)
+        else:
+            self.seeker.search = self._previous
+
+
+def _search_paths(result):
+    '''The paths returned by a search, a list or a single path with return_on_first_hit'''
+    if not result:
+        return []
+    return [str(path) for path in result] if isinstance(result, (list, tuple)) else [str(result)]
+
+
+def searches_fingerprints(seeker, searches, relative_path, paths=None):
+    '''
+    Fingerprints the files returned by searches of the seeker.
+    Args:
+        seeker: The seeker of the run.
+        searches (list): The (args, kwargs) of the searches, as SearchRecorder records them.
+        relative_path (Callable): Converts a file to its path in the extraction.
+        paths (list): The paths each search returned, the searches are made again when None.
+    Returns:
+        list: The fingerprints of the files of each search.
+    '''
+    if paths is None:
+        paths = [_search_paths(seeker.search(*args, **kwargs)) for args, kwargs in searches]
+    file_infos = getattr(seeker, 'file_infos', {})
+    return [_files_fingerprints(search_paths, relative_path, file_infos) for search_paths in paths]
+
+
+def _convert_value(value, old, new):
+    if isinstance(value, str):
+        return value.replace(old, new) if old in value else value
+    if isinstance(value, dict):
+        return {key: _convert_value(item, old, new) for key, item in value.items()}
+    return value
+
+
+def _convert_rows(rows, old, new):
+    return [tuple(_convert_value(value, old, new) for value in row) for row in rows]
+
+
+def load(key, output_folder, seeker=None, relative_path=None):
+    '''
+    Return the cached result of a key.
+    Args:
+        key (str): The key computed by artifact_key.
+        output_folder (str): The output folder of the run, put back in the stored strings.
+        seeker: The seeker of the run, to make the searches of the artifact again.
+        relative_path (Callable): Converts a file to its path in the extraction.
+    Returns:
+        dict or None: 'data_headers', 'data_list' (a list, a tuple of the list and its
+                      HTML version, or a generator for an artifact that yielded its rows),
+                      'source_path', 'identifiers' and 'ios_version'; None on a miss.
+    '''
+    path = os.path.join(cache_dir, key)
+    try:
+        with open(f'{path}.meta', 'rb') as meta_file:
+            signature, meta_data = meta_file.read(32), meta_file.read()
+        rows_file = open(f'{path}.rows', 'rb')  # pylint: disable=consider-using-with
+    except OSError:
+        return None
+    # Nothing is unpickled before its signature is checked
+    if not hmac.compare_digest(signature, hmac.digest(_signing_key, meta_data, 'sha256')):
+        rows_file.close()
+        return None
+    entry = pickle.loads(meta_data)
+    rows_signature = hmac.new(_signing_key, digestmod='sha256')
+    for block in iter(lambda: rows_file.read(1024 * 1024), b''):
+        rows_signature.update(block)
+    if not hmac.compare_digest(entry['rows_signature'], rows_signature.digest()):
+        rows_file.close()
+        return None
+    # The files the artifact searched for itself must not have changed either
+    if entry.get('searches') and (seeker is None or searches_fingerprints(
+            seeker, entry['searches'], relative_path) != entry['searches_fingerprints']):
+        rows_file.close()
+        return None
+    rows_file.seek(0)
+    entry = _convert_value(entry, _OUTPUT_MARKER, output_folder)
+    if entry['streamed']:
+        entry['data_list'] = _read_chunks(rows_file, output_folder)
+    else:
+        with rows_file:
+            data_list = _convert_rows(pickle.load(rows_file), _OUTPUT_MARKER, output_folder)
+            if entry['html_data_list']:
+                data_list = (data_list, _convert_rows(pickle.load(rows_file), _OUTPUT_MARKER, output_folder))
+        entry['data_list'] = data_list
+    return entry
+
+
+def _read_chunks(rows_file, output_folder):
+    with rows_file:
+        while (chunk := pickle.load(rows_file)) != _END_OF_ROWS:
+            yield from _convert_rows(chunk, _OUTPUT_MARKER, output_folder)
+
+
+class CacheWriter:
+    '''
+    Stores the result of an artifact under its key.
+    The rows are written to a temporary file as they come; the entry only becomes
+    visible when its .meta file is written by commit, so an interrupted run or a worker
+    process writing the same key at the same time never leaves a partial entry behind.
+    The .meta file starts with the signature of the entry, which holds the signature
+    of the rows.
+    '''
+
+    def __init__(self, key, output_folder, chunk_size):
+        self.output_folder = output_folder
+        self.chunk_size = chunk_size
+        self.path = os.path.join(cache_dir, key)
+        self.temp_suffix = f'.{os.getpid()}.tmp'
+        self.entry = None
+        self.rows_file = None
+        self.rows_signature = hmac.new(_signing_key, digestmod='sha256')
+        self.failed = False
+
+    def start(self, data_headers, source_path, streamed, html_data_list=False):
+        '''Opens the entry, html_data_list tells if the rows come with an HTML version'''
+        self.entry = {
+            'data_headers': data_headers,
+            'source_path': _convert_value(source_path, self.output_folder, _OUTPUT_MARKER),
+            'streamed': streamed,
+            'html_data_list': html_data_list,
+        }
+        self.rows_file = open(f'{self.path}.rows{self.temp_suffix}', 'wb')  # pylint: disable=consider-using-with
+
+    def _pickle(self, value):
+        if self.failed:
+            return b''
+        try:
+            return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Results holding objects that cannot be pickled are just not cached
+            self.failed = True
+            return b''
+
+    def _dump(self, value):
+        data = self._pickle(value)
+        if self.failed:
+            return
+        try:
+            self.rows_file.write(data)
+        except OSError:
+            self.failed = True
+        self.rows_signature.update(data)
+
+    def write_rows(self, data_list):
+        '''Stores the rows of an artifact that returned a list, call it again for the HTML version'''
+        self._dump(_convert_rows(data_list, self.output_folder, _OUTPUT_MARKER))
+
+    def record_stream(self, rows):
+        '''Stores the rows of an artifact that yields them, as they go through'''
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            yield row
+            if len(chunk) == self.chunk_size:
+                self._dump(_convert_rows(chunk, self.output_folder, _OUTPUT_MARKER))
+                chunk = []
+        self._dump(_convert_rows(chunk, self.output_folder, _OUTPUT_MARKER))
+        self._dump(_END_OF_ROWS)
+
+    def commit(self, identifiers, ios_version, searches=(), fingerprints=()):
+        '''
+        Makes the entry available to later runs.
+        Args:
+            identifiers (list): The (category, label, value) device information recorded.
+            ios_version (str): The iOS version the artifact set, None if it set none.
+            searches (list): The searches the artifact made through the seeker.
+            fingerprints (list): The fingerprints of the files they returned, see searches_fingerprints.
+        Returns:
+            bool: False if the result could not be stored.
+        '''
+        self.rows_file.close()
+        self.entry['searches'] = list(searches)
+        self.entry['searches_fingerprints'] = list(fingerprints)
+        self.entry['identifiers'] = [_convert_value(identifier, self.output_folder, _OUTPUT_MARKER)
+                                     for identifier in identifiers]
+        self.entry['ios_version'] = ios_version
+        self.entry['rows_signature'] = self.rows_signature.digest()
+        meta_data = self._pickle(self.entry)
+        meta_temp_path = f'{self.path}.meta{self.temp_suffix}'
+        try:
+            with open(meta_temp_path, 'wb') as meta_file:
+                meta_file.write(hmac.digest(_signing_key, meta_data, 'sha256') + meta_data)
+        except OSError:
+            self.failed = True
+        if self.failed:
+            self.discard()
+            return False
+        os.replace(f'{self.path}.rows{self.temp_suffix}', f'{self.path}.rows')
+        os.replace(meta_temp_path, f'{self.path}.meta')
+        return True
+
+    def discard(self):
+        '''Drops the entry'''
+        if self.rows_file:
+            self.rows_file.close()
+        for kind in ('rows', 'meta'):
+            try:
+                os.remove(f'{self.path}.{kind}{self.temp_suffix}')
+            except OSError:
+                pass
+
+
+def record_result(artifact_name, outcome):
+    '''
+    Count an artifact in the cache report.
+    Args:
+        artifact_name (str): The name of the artifact.
+        outcome (str): 'hit', 'stored' or 'not cacheable'.
+    '''
+    stats[outcome].append(artifact_name)
+
+
+def cache_report():
+    '''
+    Returns:
+        list: Lines summing up the use of the cache in the run, for the screen log.
+    '''
+    lines = [f'Artifact cache ({cache_dir}): {len(stats["hit"])} loaded from the cache, '
+             f'{len(stats["stored"])} parsed and stored, {len(stats["not cacheable"])} not cacheable']
+    for outcome, label in (('hit', 'Loaded from the cache'), ('not cacheable', 'Not cacheable')):
+        if stats[outcome]:
+            lines.append(f'{label}: {", ".join(sorted(stats[outcome]))}')
+    return lines
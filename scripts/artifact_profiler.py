@@ -0,0 +1,214 @@
+"""
+Per-artifact timings of a run, for the _artifact_timings LAVA table and the
+"Artifact timings" tab of index.html.
+
+crunch_artifacts runs every artifact inside measure(), which records its wall and CPU
+time and the growth of the peak memory of the process. artifact_processor adds the
+rows the artifact produced and the time spent in each output (html, tsv, timeline,
+lava, kml); what is left of the wall time is the parsing, including the rows of an
+artifact that yields them, which are produced while the outputs are written. The time
+spent locating the files of the artifact is measured before it runs.
+
+With --profile-artifacts, each artifact also runs under cProfile and its statistics are
+written to the _Profiles folder of the report, as a .prof file for pstats or snakeviz
+and as a text summary of the most expensive functions.
+
+Classes:
+    ArtifactTiming: What was measured for one artifact.
+
+Functions:
+    enable_profiling: Sets the folder the cProfile statistics are written to.
+    files_size: Returns the total size of the files found for an artifact.
+    measure: Context manager measuring an artifact run.
+    add_rows: Adds rows produced by the running artifact.
+    add_output_time: Adds time spent writing an output of the running artifact.
+    write_timings_log: Writes the HTML table of the timings for index.html.
+"""
+
+import cProfile
+import contextlib
+import dataclasses
+import html
+import io
+import os
+import pstats
+import sys
+import typing
+from time import perf_counter, process_time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+OUTPUTS = ('html', 'tsv', 'timeline', 'lava', 'kml')
+
+# Timings of the artifacts run by this process, in the order they completed
+timings = []
+# Folder the cProfile statistics are written to, None unless --profile-artifacts was given
+profile_folder = None
+# Number of functions listed in the text summary of a profile
+profile_summary_lines = 40
+
+_current = None
+
+
+@dataclasses.dataclass
+class ArtifactTiming:
+    """
+    What was measured for one artifact.
+    Attributes:
+        number (int): Position of the artifact in the run, starting at 1.
+        module_name (str): The module of the artifact.
+        artifact_name (str): The name of the artifact.
+        files_found (int): Number of files located for the artifact.
+        files_bytes (int): Total size of those files, as extracted to the report's data folder.
+        search_secs (float): Time spent locating the files.
+        wall_secs (float): Time the artifact ran, outputs included.
+        cpu_secs (float): CPU time of the process while the artifact ran.
+        peak_rss_delta_kb (int): Growth of the peak resident memory of the process, None
+                                 where it cannot be measured.
+        rows (int): Rows written to the outputs.
+        output_secs (dict): Time spent writing each output, by output type.
+    """
+
+    number: int
+    module_name: str
+    artifact_name: str
+    files_found: int = 0
+    files_bytes: int = 0
+    search_secs: float = 0.0
+    wall_secs: float = 0.0
+    cpu_secs: float = 0.0
+    peak_rss_delta_kb: typing.Optional[int] = None
+    rows: int = 0
+    output_secs: dict = dataclasses.field(default_factory=dict)
+
+    @property
+    def parse_secs(self):
+        '''Time the artifact ran that was not spent writing its outputs'''
+        return max(self.wall_secs - sum(self.output_secs.values()), 0.0)
+
+
+def enable_profiling(folder):
+    '''
+    Run the artifacts under cProfile and write their statistics to a folder.
+    Args:
+        folder (str): The folder, created if needed. None disables the profiling.
+    '''
+
+    global profile_folder  # pylint: disable=global-statement
+
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    profile_folder = folder
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def files_size(files_found):
+    '''Returns the total size in bytes of the files found for an artifact'''
+    total = 0
+    for path in files_found:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+@contextlib.contextmanager
+def measure(number, module_name, artifact_name, files_found, search_secs):
+    '''
+    Measure an artifact run and add its timing to timings.
+    Args:
+        number (int): Position of the artifact in the run.
+        module_name (str): The module of the artifact.
+        artifact_name (str): The name of the artifact.
+        files_found (list): The files located for the artifact.
+        search_secs (float): Time spent locating them.
+    '''
+
+    global _current  # pylint: disable=global-statement
+
+    timing = ArtifactTiming(number, module_name, artifact_name, len(files_found), files_size(files_found),
+                            search_secs)
+    profiler = cProfile.Profile() if profile_folder and files_found else None
+    peak_rss = _peak_rss_kb()
+    _current = timing
+    start_cpu = process_time()
+    start = perf_counter()
+    if profiler:
+        profiler.enable()
+    try:
+        yield timing
+    finally:
+        if profiler:
+            profiler.disable()
+        timing.wall_secs = perf_counter() - start
+        timing.cpu_secs = process_time() - start_cpu
+        if peak_rss is not None:
+            timing.peak_rss_delta_kb = _peak_rss_kb() - peak_rss
+        _current = None
+        timings.append(timing)
+        if profiler:
+            _write_profile(profiler, f'{module_name}.{artifact_name}')
+
+
+def _write_profile(profiler, name):
+    name = ''.join(char if char.isalnum() or char in '._-' else '_' for char in name)
+    profiler.dump_stats(os.path.join(profile_folder, f'{name}.prof'))
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(profile_summary_lines)
+    with open(os.path.join(profile_folder, f'{name}.txt'), 'w', encoding='utf-8') as summary_file:
+        summary_file.write(summary.getvalue())
+
+
+def add_rows(count):
+    '''Adds rows written to the outputs by the running artifact'''
+    if _current is not None:
+        _current.rows += count
+
+
+def add_output_time(output_type, seconds):
+    '''Adds time the running artifact spent writing one of its outputs'''
+    if _current is not None:
+        _current.output_secs[output_type] = _current.output_secs.get(output_type, 0.0) + seconds
+
+
+def write_timings_log(path):
+    '''
+    Write the timings of the run as an HTML table, slowest artifact first, for the
+    "Artifact timings" tab of index.html.
+    Args:
+        path (str): The HTML file to write.
+    '''
+
+    headers = ['#', 'Module', 'Artifact', 'Wall (s)', 'CPU (s)', 'Search (s)', 'Parse (s)'] + \
+        [f'{output_type.upper()} (s)' for output_type in OUTPUTS] + \
+        ['Rows', 'Files', 'File bytes', 'Peak RSS delta (KB)']
+    with open(path, 'w', encoding='utf8') as timings_log:
+        timings_log.write(
+            '<p class="note alert-info mb-4">Time spent on each artifact of the run. Click on a column '
+            'to sort the artifacts. The same figures are in the <i>_artifact_timings</i> table of '
+            'the <i>_lava_artifacts.db</i> SQLite database.</p>\n')
+        timings_log.write('<div class="table-responsive">\n'
+                          '<table id="artifact-timings" class="table table-striped table-bordered table-sm">\n'
+                          '<thead><tr>')
+        timings_log.write(''.join(f'<th>{header}</th>' for header in headers))
+        timings_log.write('</tr></thead>\n<tbody>\n')
+        for timing in sorted(timings, key=lambda timing: timing.wall_secs, reverse=True):
+            values = [timing.number, html.escape(timing.module_name), html.escape(timing.artifact_name)] + \
+                [f'{seconds:.3f}' for seconds in (timing.wall_secs, timing.cpu_secs, timing.search_secs,
+                                                   timing.parse_secs)] + \
+                [f'{timing.output_secs.get(output_type, 0.0):.3f}' for output_type in OUTPUTS] + \
+                [timing.rows, timing.files_found, timing.files_bytes,
+                 '' if timing.peak_rss_delta_kb is None else timing.peak_rss_delta_kb]
+            timings_log.write('<tr>' + ''.join(f'<td>{value}</td>' for value in values) + '</tr>\n')
+        timings_log.write('</tbody>\n</table>\n</div>\n')
@@ -1,10 +1,18 @@
 import html
+import json
 import os
 import sys
+from itertools import islice
 from scripts.html_parts import *
 #from scripts.ilapfuncs import is_platform_windows
 from scripts.version_info import leapp_version
 
+# Room left for the total number of entries of a table whose rows are written in chunks
+total_entries_width = 20
+# Bytes written to the report file at a time, and rows of a table rendered per write
+report_buffer_size = 1024 * 1024
+table_rows_per_write = 1000
+
 class ArtifactHtmlReport:
 
     def __init__(self, artifact_name, artifact_category=''):
@@ -13,6 +21,15 @@ class ArtifactHtmlReport:
         self.script_code = ''
         self.artifact_name = artifact_name
         self.artifact_category = artifact_category # unused
+        self.table_headers = ()
+        self.table_html_escape = True
+        self.table_html_no_escape = []
+        self.table_escaped_columns = None
+        self.table_inline_rows = None
+        self.table_cols_repeated_at_bottom = True
+        self.table_responsive = True
+        self.table_entries = 0
+        self.table_total_position = None
 
     def __del__(self):
         if self.report_file:
@@ -21,7 +38,8 @@ class ArtifactHtmlReport:
     def start_artifact_report(self, report_folder, artifact_file_name, artifact_description=''):
         '''Creates the report HTML file and writes the artifact name as a heading'''
         # artifact_file_name =  artifact_file_name.replace(" ", "_") # Replace " " with "_" in HTML filenames
-        self.report_file = open(os.path.join(report_folder, f'{artifact_file_name}.temphtml'), 'w', encoding='utf8')
+        self.report_file = open(os.path.join(report_folder, f'{artifact_file_name}.temphtml'), 'w', encoding='utf8',
+                                buffering=report_buffer_size)
         self.report_file.write(page_header.format(f'iLEAPP - {self.artifact_name} report'))
         self.report_file.write(body_start.format(f'iLEAPP {leapp_version}'))
         self.report_file.write(body_sidebar_setup)
@@ -51,7 +69,8 @@ class ArtifactHtmlReport:
         table_responsive=True,
         table_style='',
         table_id='dtBasicExample',
-        html_no_escape=[]
+        html_no_escape=None,
+        inline_rows=None
     ):
         ''' Writes info about data, then writes the table to html file
             Parameters
@@ -77,13 +96,63 @@ class ArtifactHtmlReport:
             table_id       : Specify an identifier string, which will be referenced in javascript
 
             html_no_escape  : if html_escape=True, list of columns not to escape
+
+            inline_rows    : If set, rows past the first inline_rows are written as JSON, see start_artifact_data_table
+        '''
+        self.start_artifact_data_table(data_headers, source_path, len(data_list), write_total, write_location,
+                                       html_escape, cols_repeated_at_bottom, table_responsive, table_style,
+                                       table_id, html_no_escape, inline_rows)
+        self.write_artifact_data_rows(data_list)
+        self.end_artifact_data_table()
+
+    def start_artifact_data_table(
+        self,
+        data_headers,
+        source_path,
+        num_entries=None,
+        write_total=True,
+        write_location=True,
+        html_escape=True,
+        cols_repeated_at_bottom=True,
+        table_responsive=True,
+        table_style='',
+        table_id='dtBasicExample',
+        html_no_escape=None,
+        inline_rows=None
+    ):
+        ''' Writes info about data and the table header, for rows written in chunks with
+            write_artifact_data_rows. The parameters are those of write_artifact_data_table;
+            when num_entries is None, the total is filled in by end_artifact_data_table.
+
+            inline_rows    : If set, only the first inline_rows rows are written as table rows,
+                             the others as JSON that default_responsive_table_script adds to the
+                             table, whose rows are then only rendered when they are shown
         '''
         if (not self.report_file):
             raise ValueError('Output report file is closed/unavailable!')
 
-        num_entries = len(data_list)
+        self.table_headers = data_headers
+        self.table_html_escape = html_escape
+        html_no_escape = html_no_escape or []
+        self.table_html_no_escape = html_no_escape
+        # Whether each column is escaped, the cells of the columns without a header are then dropped
+        self.table_escaped_columns = None
+        if html_escape and html_no_escape:
+            html_no_escape = set(html_no_escape)
+            self.table_escaped_columns = [h not in html_no_escape for h in data_headers]
+        self.table_inline_rows = inline_rows
+        self.table_cols_repeated_at_bottom = cols_repeated_at_bottom
+        self.table_responsive = table_responsive
+        self.table_entries = 0
+        self.table_total_position = None
+
         if write_total:
-            self.write_minor_header(f'Total number of entries: {num_entries}', 'h6')
+            if num_entries is None:
+                self.report_file.write('<h6>Total number of entries: ')
+                self.table_total_position = self.report_file.tell()
+                self.report_file.write(' ' * total_entries_width + '</h6>')
+            else:
+                self.write_minor_header(f'Total number of entries: {num_entries}', 'h6')
         if write_location:
             if sys.platform == 'win32':
                 source_path = source_path.replace('/', '\\')
@@ -103,27 +172,67 @@ class ArtifactHtmlReport:
             '<tr>' + ''.join(('<th class="th-sm">{}</th>'.format(html.escape(str(x))) for x in data_headers)) + '</tr>')
         self.report_file.write('</thead><tbody>')
 
-        if html_escape:
-            for row in data_list:
-                if html_no_escape:
-                    self.report_file.write('<tr>' + ''.join(('<td>{}</td>'.format(html.escape(
-                        str(x) if x not in [None, 'N/A'] else '')) if h not in html_no_escape else '<td>{}</td>'.format(
-                        str(x) if x not in [None, 'N/A'] else '') for x, h in zip(row, data_headers))) + '</tr>')
-                else:
-                    self.report_file.write('<tr>' + ''.join(
-                        ('<td>{}</td>'.format(html.escape(str(x) if x not in [None, 'N/A'] else '')) for x in
-                         row)) + '</tr>')
-        else:
-            for row in data_list:
-                self.report_file.write('<tr>' + ''.join( ('<td>{}</td>'.format(str(x) if x not in [None, 'N/A'] else '') for x in row) ) + '</tr>')
-        
+    def write_artifact_data_rows(self, data_list):
+        ''' Writes rows to the table started by start_artifact_data_table '''
+        rows = iter(data_list)
+        while True:
+            if self.table_inline_rows is not None and self.table_entries >= self.table_inline_rows:
+                self.write_json_data_rows(rows)
+                return
+            count = table_rows_per_write
+            if self.table_inline_rows is not None:
+                count = min(count, self.table_inline_rows - self.table_entries)
+            cells = self.table_cells(islice(rows, count))
+            if not cells:
+                return
+            self.report_file.write(''.join(['<tr><td>' + '</td><td>'.join(row) + '</td></tr>' if row else '<tr></tr>'
+                                            for row in cells]))
+            self.table_entries += len(cells)
+
+    def write_json_data_rows(self, data_list):
+        ''' Writes rows as JSON, that default_responsive_table_script adds to the table.
+            The cells are those of the table rows, one per column.
+        '''
+        columns = len(self.table_headers)
+        rows = iter(data_list)
+        while True:
+            cells = self.table_cells(islice(rows, table_rows_per_write))
+            if not cells:
+                return
+            for row in cells:
+                if len(row) != columns:
+                    row[columns:] = []
+                    row.extend([''] * (columns - len(row)))
+            # < is escaped so that no cell can end the script element
+            data = json.dumps(cells, ensure_ascii=False, separators=(',', ':')).replace('<', '\\u003c')
+            self.report_file.write(f'<script type="application/json" class="table-rows">{data}</script>')
+            self.table_entries += len(cells)
+
+    def table_cells(self, data_list):
+        ''' Returns the HTML of the cells of the rows, as lists '''
+        escape = html.escape
+        if not self.table_html_escape:
+            return [[str(x) if x is not None and x != 'N/A' else '' for x in row] for row in data_list]
+        escaped_columns = self.table_escaped_columns
+        if escaped_columns is None:
+            return [[escape(str(x)) if x is not None and x != 'N/A' else '' for x in row] for row in data_list]
+        return [[(escape(str(x)) if escaped else str(x)) if x is not None and x != 'N/A' else ''
+                 for x, escaped in zip(row, escaped_columns)] for row in data_list]
+
+    def end_artifact_data_table(self):
+        ''' Closes the table started by start_artifact_data_table and fills in the total if it was not known '''
         self.report_file.write('</tbody>')
-        if cols_repeated_at_bottom:
+        if self.table_cols_repeated_at_bottom:
             self.report_file.write('<tfoot><tr>' + ''.join(
-                ('<th>{}</th>'.format(html.escape(str(x))) for x in data_headers)) + '</tr></tfoot>')
+                ('<th>{}</th>'.format(html.escape(str(x))) for x in self.table_headers)) + '</tr></tfoot>')
         self.report_file.write('</table>')
-        if table_responsive:
+        if self.table_responsive:
             self.report_file.write("</div>")
+        if self.table_total_position is not None:
+            end_position = self.report_file.tell()
+            self.report_file.seek(self.table_total_position)
+            self.report_file.write(str(self.table_entries).ljust(total_entries_width))
+            self.report_file.seek(end_position)
 
     def add_section_heading(self, heading, size='h2'):
         heading = html.escape(heading)
@@ -0,0 +1,249 @@
+"""
+Parallel execution of artifacts for crunch_artifacts.
+
+Once the files of every selected artifact have been located, the artifacts are run in a
+pool of worker processes and what each worker produced is merged back into the main
+process in plugin order, so the screen log, the device info, the report icons and the
+LAVA metadata come out the same as in a sequential run.
+
+Workers are forked from the main process, so they inherit the seeker, the loaded
+plugins and everything last_build recorded without pickling any of it. The artifact
+output that goes to disk (HTML, TSV, KML, _Timeline/tl.db, _lava_artifacts.db) is
+written by the workers themselves; each worker opens its own connection to the LAVA
+database and waits for the others' writes. Platforms without the fork start method
+run the artifacts sequentially.
+
+What a worker changes in the seeker is not merged back: the files it searches for at
+run time, and the files it places in the data folder (copied, searched, file_infos), are
+only known to that worker. Another worker searching the same file places it again, under
+a name of its own renamed over the first copy, so that neither reads a half written file.
+
+Scheduling rules:
+    - last_build runs first, in the main process, because most artifacts read the
+      iOS version it records.
+    - Artifacts without search paths ('paths': None) read the _lava_artifacts.db
+      written by the other artifacts, so they run in the main process once the pool
+      has drained.
+    - Artifacts whose files were not found only log that fact, in the main process.
+    - An artifact can name the artifacts it needs with a 'depends_on' entry in its
+      __artifacts_v2__ block; it is only started once they have completed. Workers do
+      not see each other's in-memory state, only what was written to disk, so the
+      artifacts of a module sharing a module-level cache each redo the work it saves
+      and have to depend on one another when that work writes to the same files.
+
+Classes:
+    ArtifactTask: An artifact to run, with the files found for it.
+
+Functions:
+    can_run_in_parallel: Tells if worker processes can be used on this platform.
+    run_artifacts: Runs the tasks in worker processes and merges their output in order.
+"""
+
+import dataclasses
+import multiprocessing
+import traceback
+import typing
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import scripts.artifact_cache as artifact_cache
+import scripts.artifact_profiler as artifact_profiler
+import scripts.lavafuncs as lavafuncs
+from scripts.ilapfuncs import OutputParameters, add_identifier, icons, identifiers, logfunc, \
+    lava_only_artifacts, output_dbs_commit_each_write
+
+def _no_run_task(task):
+    '''Stands for the run_task of run_artifacts outside of it'''
+    raise RuntimeError(f'{task.plugin.name} was handed to a worker outside of run_artifacts')
+
+
+# Set in the main process right before the pool starts, inherited by the forked workers
+_tasks = []
+_run_task = _no_run_task
+_seeker = None
+
+
+@dataclasses.dataclass
+class ArtifactTask:
+    """
+    An artifact to run and the files located for it.
+    Attributes:
+        number (int): Position of the artifact in the run, starting at 1.
+        plugin (PluginSpec): The artifact.
+        files_found (list): The files located for the artifact.
+        category_folder (str): The report folder of the artifact's category, None if it
+                               could not be created.
+        search_secs (float): Time spent locating the files.
+    """
+
+    number: int
+    plugin: typing.Any
+    files_found: list
+    category_folder: typing.Optional[str]
+    search_secs: float = 0.0
+
+    @property
+    def in_main_process(self):
+        '''True when there is nothing to hand to a worker, only a message to log'''
+        return not self.files_found or self.category_folder is None
+
+    @property
+    def depends_on(self):
+        '''Names of the artifacts that have to complete first'''
+        depends_on = self.plugin.artifact_info.get('depends_on') or []
+        return {depends_on} if isinstance(depends_on, str) else set(depends_on)
+
+
+def can_run_in_parallel():
+    '''Workers inherit the state of the main process, which requires the fork start method'''
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _init_worker():
+    output_dbs_commit_each_write()
+    if lavafuncs.lava_data is not None:
+        lavafuncs.lava_reopen_db()
+    if _seeker is not None:
+        _seeker.reopen()
+
+
+def _reset_worker_state():
+    '''Empties the run-level collections so that they only hold what the next task adds'''
+    identifiers.clear()
+    icons.clear()
+    lava_only_artifacts.clear()
+    for artifact_names in artifact_cache.stats.values():
+        artifact_names.clear()
+    artifact_profiler.timings.clear()
+    if lavafuncs.lava_data is not None:
+        lavafuncs.lava_data['artifacts'] = OrderedDict()
+        lavafuncs.lava_data['modules'] = []
+        lavafuncs.lava_data['meta']['modules'] = []
+
+
+def _collect_worker_state():
+    state = {
+        'identifiers': dict(identifiers),
+        'icons': dict(icons),
+        'lava_only_artifacts': dict(lava_only_artifacts),
+        'artifact_cache': {outcome: list(artifact_names) for outcome, artifact_names in artifact_cache.stats.items()},
+        'artifact_timings': list(artifact_profiler.timings),
+    }
+    if lavafuncs.lava_data is not None:
+        state['lava_artifacts'] = lavafuncs.lava_data['artifacts']
+        state['lava_modules'] = lavafuncs.lava_data['modules']
+        state['lava_meta_modules'] = lavafuncs.lava_data['meta']['modules']
+    return state
+
+
+def _run_in_worker(index):
+    _reset_worker_state()
+    OutputParameters.log_buffer = []
+    try:
+        succeeded = _run_task(_tasks[index])
+    except Exception:  # pylint: disable=broad-exception-caught
+        logfunc(f'Exception Traceback: {traceback.format_exc()}')
+        succeeded = False
+    messages = OutputParameters.log_buffer
+    OutputParameters.log_buffer = None
+    return succeeded, messages, _collect_worker_state()
+
+
+def _merge_worker_state(state):
+    for category, values in state['identifiers'].items():
+        for label, data in values.items():
+            for value_obj in data if isinstance(data, list) else [data]:
+                add_identifier(category, label, value_obj)
+    for category, artifact_icons in state['icons'].items():
+        icons.setdefault(category, {}).update(artifact_icons)
+    for category, artifacts in state['lava_only_artifacts'].items():
+        lava_only_artifacts.setdefault(category, []).extend(artifacts)
+    for outcome, artifact_names in state['artifact_cache'].items():
+        artifact_cache.stats[outcome].extend(artifact_names)
+    artifact_profiler.timings.extend(state['artifact_timings'])
+    if lavafuncs.lava_data is None or 'lava_artifacts' not in state:
+        return
+    for category, artifacts in state['lava_artifacts'].items():
+        lavafuncs.lava_data['artifacts'].setdefault(category, []).extend(artifacts)
+    lavafuncs.lava_data['modules'].extend(state['lava_modules'])
+    meta_modules = lavafuncs.lava_data['meta']['modules']
+    for module_info in state['lava_meta_modules']:
+        known = next((m for m in meta_modules if m['module_name'] == module_info['module_name']), None)
+        if known:
+            known['artifacts'].extend(module_info['artifacts'])
+        else:
+            meta_modules.append(module_info)
+
+
+def run_artifacts(tasks, workers, seeker, run_task, task_done):
+    '''
+    Run the tasks, in worker processes where the scheduling rules allow it.
+    Args:
+        tasks (list): The ArtifactTask objects, in plugin order.
+        workers (int): The maximum number of worker processes.
+        seeker: The seeker of the extraction, its archive handles are reopened in each worker.
+        run_task (Callable): Runs the artifact of a task and returns False if it failed.
+        task_done (Callable): Called in the main process with each task and the result of
+                              run_task, in plugin order, once the task's output was merged.
+    '''
+
+    global _tasks, _run_task, _seeker  # pylint: disable=global-statement
+
+    first, middle, last = [], [], []
+    for task in tasks:
+        if task.plugin.name == 'last_build':
+            first.append(task)
+        elif task.plugin.search is None:
+            last.append(task)
+        else:
+            middle.append(task)
+
+    for task in first:
+        task_done(task, run_task(task))
+
+    _tasks, _run_task, _seeker = middle, run_task, seeker
+    pooled = {index for index, task in enumerate(middle) if not task.in_main_process}
+    if pooled and lavafuncs.lava_data is not None:
+        # The media the workers check in are not in the main process's media registry
+        lavafuncs.lava_mark_db_shared()
+    pooled_names = {middle[index].plugin.name: index for index in pooled}
+    waiting = sorted(pooled)
+    running = {}
+    results = {}
+    completed = set()
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as executor:
+        for index, task in enumerate(middle):
+            while index in pooled and index not in results:
+                for waiting_index in list(waiting):
+                    dependencies = {pooled_names[name] for name in middle[waiting_index].depends_on
+                                    if name in pooled_names}
+                    # A task that is next to merge and still waiting is part of a dependency
+                    # cycle, the cycle is broken by starting it anyway
+                    if dependencies <= completed or waiting_index == index:
+                        running[executor.submit(_run_in_worker, waiting_index)] = waiting_index
+                        waiting.remove(waiting_index)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished = running.pop(future)
+                    completed.add(finished)
+                    try:
+                        results[finished] = future.result()
+                    except Exception as ex:  # pylint: disable=broad-exception-caught
+                        # The worker process itself died, nothing it logged can be recovered
+                        results[finished] = (False, [
+                            f'Reading {middle[finished].plugin.name} artifact had errors!',
+                            f'Error was {ex!r}'], None)
+            if index in pooled:
+                succeeded, messages, state = results.pop(index)
+                for message in messages:
+                    logfunc(message)
+                if state:
+                    _merge_worker_state(state)
+            else:
+                succeeded = run_task(task)
+            task_done(task, succeeded)
+    _tasks, _run_task, _seeker = [], _no_run_task, None
+
+    for task in last:
+        task_done(task, run_task(task))
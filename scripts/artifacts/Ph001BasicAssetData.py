@@ -80,35 +80,13 @@ __artifacts_v2__ = {
 }	
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph001_1AssetBasicDataPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph001_1AssetBasicDataPhDaPsql': (
+        PhotosQuery('11', '14', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -150,15 +128,8 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -178,22 +149,8 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
         'zAsset-zPK-16',
         'zAddAssetAttr-zPK-17',
         'zAsset-UUID = store.cloudphotodb-18',
-        'zAddAssetAttr-Master Fingerprint-19')
-    # data_list = get_sqlite_db_records(source_path, query)
-    # NOTE: commenting it out because it overwrites the previously processed
-    #   results, will do the same on all the other instances where this
-    #   happens all over the file, and the other artifacts too
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-19')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -241,15 +198,8 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -271,20 +221,8 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
         'zAsset-zPK-18',
         'zAddAssetAttr-zPK-19',
         'zAsset-UUID = store.cloudphotodb-20',
-        'zAddAssetAttr-Master Fingerprint-21')
-
-    # data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-21')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -350,14 +288,8 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -382,19 +314,8 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
         'zAsset-zPK-21',
         'zAddAssetAttr-zPK-22',
         'zAsset-UUID = store.cloudphotodb-23',
-        'zAddAssetAttr-Master Fingerprint-24')
-    # data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-24')),
+        PhotosQuery('16', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -466,14 +387,8 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -500,19 +415,8 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
         'zAsset-zPK-23',
         'zAddAssetAttr-zPK-24',
         'zAsset-UUID = store.cloudphotodb-25',
-        'zAddAssetAttr-Master Fingerprint-26')
-    # data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-26')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -590,16 +494,8 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -628,37 +524,10 @@ def Ph001_1AssetBasicDataPhDaPsql(context):
         'zAddAssetAttr-zPK-25',
         'zAsset-UUID = store.cloudphotodb-26',
         'zAddAssetAttr-Original Stable Hash-27',
-        'zAddAssetAttr.Adjusted Stable Hash-28')
-
-    # data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph001_2AssetBasicDataSyndPL(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-28')),
+    ),
+    'Ph001_2AssetBasicDataSyndPL': (
+        PhotosQuery('11', '14', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -700,15 +569,8 @@ def Ph001_2AssetBasicDataSyndPL(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -728,19 +590,8 @@ def Ph001_2AssetBasicDataSyndPL(context):
         'zAsset-zPK-16',
         'zAddAssetAttr-zPK-17',
         'zAsset-UUID = store.cloudphotodb-18',
-        'zAddAssetAttr-Master Fingerprint-19')
-    # data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-19')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -788,15 +639,8 @@ def Ph001_2AssetBasicDataSyndPL(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -818,19 +662,8 @@ def Ph001_2AssetBasicDataSyndPL(context):
         'zAsset-zPK-18',
         'zAddAssetAttr-zPK-19',
         'zAsset-UUID = store.cloudphotodb-20',
-        'zAddAssetAttr-Master Fingerprint-21')
-    # data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-21')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -896,15 +729,8 @@ def Ph001_2AssetBasicDataSyndPL(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -929,19 +755,8 @@ def Ph001_2AssetBasicDataSyndPL(context):
         'zAsset-zPK-21',
         'zAddAssetAttr-zPK-22',
         'zAsset-UUID = store.cloudphotodb-23',
-        'zAddAssetAttr-Master Fingerprint-24')
-    # data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-24')),
+        PhotosQuery('16', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -1013,15 +828,8 @@ def Ph001_2AssetBasicDataSyndPL(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -1048,19 +856,8 @@ def Ph001_2AssetBasicDataSyndPL(context):
         'zAsset-zPK-23',
         'zAddAssetAttr-zPK-24',
         'zAsset-UUID = store.cloudphotodb-25',
-        'zAddAssetAttr-Master Fingerprint-26')
-    # data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-26')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -1138,16 +935,8 @@ def Ph001_2AssetBasicDataSyndPL(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -1176,36 +965,10 @@ def Ph001_2AssetBasicDataSyndPL(context):
         'zAddAssetAttr-zPK-25',
         'zAsset-UUID = store.cloudphotodb-26',
         'zAddAssetAttr-Original Stable Hash-27',
-        'zAddAssetAttr.Adjusted Stable Hash-28')
-    # data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph001_3AssetBasicDataGenPlayPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-28')),
+    ),
+    'Ph001_3AssetBasicDataGenPlayPsql': (
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -1283,16 +1046,8 @@ def Ph001_3AssetBasicDataGenPlayPsql(context):
             LEFT JOIN ZADDITIONALASSETATTRIBUTES zAddAssetAttr ON zAddAssetAttr.Z_PK = zAsset.ZADDITIONALATTRIBUTES
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28]))
-
-        data_headers = (
+        ''',
+        (
         ('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
@@ -1321,8 +1076,21 @@ def Ph001_3AssetBasicDataGenPlayPsql(context):
         'zAddAssetAttr-zPK-25',
         'zAsset-UUID = store.cloudphotodb-26',
         'zAddAssetAttr-Original Stable Hash-27',
-        'zAddAssetAttr.Adjusted Stable Hash-28')
+        'zAddAssetAttr.Adjusted Stable Hash-28')),
+    ),
+}
 
-    # data_list = get_sqlite_db_records(source_path, query)
 
-        return data_headers, data_list, source_path
\ No newline at end of file
+@artifact_processor
+def Ph001_1AssetBasicDataPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph001_1AssetBasicDataPhDaPsql'])
+
+
+@artifact_processor
+def Ph001_2AssetBasicDataSyndPL(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph001_2AssetBasicDataSyndPL'], 'Syndication.photoslibrary')
+
+
+@artifact_processor
+def Ph001_3AssetBasicDataGenPlayPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph001_3AssetBasicDataGenPlayPsql'], 'GenPlay-Photos.sqlite')
@@ -93,35 +93,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph002_1AssetBasicGenAlbumDataPhDaPsql': (
+        PhotosQuery('11', '12', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -260,18 +238,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
             LEFT JOIN Z_20ASSETS z20Assets ON z20Assets.Z_27ASSETS = zAsset.Z_PK
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z20Assets.Z_20ALBUMS
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -318,19 +286,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAsset-zPK-44',
         'zAddAssetAttr-zPK-45',
         'zAsset-UUID = store.cloudphotodb-46',
-        'zAddAssetAttr-Master Fingerprint-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-47')),
+        PhotosQuery('12', '13', '''
         SELECT 
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -469,18 +426,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
             LEFT JOIN Z_23ASSETS z23Assets ON z23Assets.Z_30ASSETS = zAsset.Z_PK
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z23Assets.Z_23ALBUMS
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -527,19 +474,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAsset-zPK-44',
         'zAddAssetAttr-zPK-45',
         'zAsset-UUID = store.cloudphotodb-46',
-        'zAddAssetAttr-Master Fingerprint-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-47')),
+        PhotosQuery('13', '14', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -742,20 +678,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
             LEFT JOIN Z_26ASSETS z26Assets ON z26Assets.Z_34ASSETS = zAsset.Z_PK
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z26Assets.Z_26ALBUMS
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -820,19 +744,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAsset-zPK-62',
         'zAddAssetAttr-zPK-63',
         'zAsset-UUID = store.cloudphotodb-64',
-        'zAddAssetAttr-Master Fingerprint-65')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-65')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -1049,20 +962,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
             LEFT JOIN Z_26ASSETS z26Assets ON z26Assets.Z_3ASSETS = zAsset.Z_PK
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z26Assets.Z_26ALBUMS
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -1134,19 +1035,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAsset-zPK-69',
         'zAddAssetAttr-zPK-70',
         'zAsset-UUID = store.cloudphotodb-71',
-        'zAddAssetAttr-Master Fingerprint-72')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-72')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -1384,21 +1274,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z27Assets.Z_27ALBUMS
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -1475,19 +1352,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAsset-zPK-74',
         'zAddAssetAttr-zPK-75',
         'zAsset-UUID = store.cloudphotodb-76',
-        'zAddAssetAttr-Master Fingerprint-77')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-77')),
+        PhotosQuery('16', '17', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -1731,21 +1597,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -1824,19 +1677,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAsset-zPK-76',
         'zAddAssetAttr-zPK-77',
         'zAsset-UUID = store.cloudphotodb-78',
-        'zAddAssetAttr-Master Fingerprint-79')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-79')),
+        PhotosQuery('17', '17.6', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -2081,21 +1923,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -2175,19 +2004,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAsset-zPK-77',
         'zAddAssetAttr-zPK-78',
         'zAsset-UUID = store.cloudphotodb-79',
-        'zAddAssetAttr-Master Fingerprint-80')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-80')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -2432,21 +2250,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -2526,19 +2331,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAsset-zPK-77',
         'zAddAssetAttr-zPK-78',
         'zAsset-UUID = store.cloudphotodb-79',
-        'zAddAssetAttr-Master Fingerprint-80')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-80')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -2790,22 +2584,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -2888,19 +2668,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAddAssetAttr-zPK-80',
         'zAsset-UUID = store.cloudphotodb-81',
         'zAddAssetAttr-Original Stable Hash-82',
-        'zAddAssetAttr.Adjusted Stable Hash-83')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-83')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -3152,22 +2921,8 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -3250,36 +3005,10 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
         'zAddAssetAttr-zPK-80',
         'zAsset-UUID = store.cloudphotodb-81',
         'zAddAssetAttr-Original Stable Hash-82',
-        'zAddAssetAttr.Adjusted Stable Hash-83')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph002_2AssetBasicConversationDataSyndPL(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-83')),
+    ),
+    'Ph002_2AssetBasicConversationDataSyndPL': (
+        PhotosQuery('11', '12', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -3419,18 +3148,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
             LEFT JOIN Z_20ASSETS z20Assets ON z20Assets.Z_27ASSETS = zAsset.Z_PK
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z20Assets.Z_20ALBUMS
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -3477,19 +3196,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAsset-zPK-44',
         'zAddAssetAttr-zPK-45',
         'zAsset-UUID = store.cloudphotodb-46',
-        'zAddAssetAttr-Master Fingerprint-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-47')),
+        PhotosQuery('12', '13', '''
         SELECT 
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -3629,18 +3337,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
             LEFT JOIN Z_23ASSETS z23Assets ON z23Assets.Z_30ASSETS = zAsset.Z_PK
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z23Assets.Z_23ALBUMS
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -3687,19 +3385,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAsset-zPK-44',
         'zAddAssetAttr-zPK-45',
         'zAsset-UUID = store.cloudphotodb-46',
-        'zAddAssetAttr-Master Fingerprint-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-47')),
+        PhotosQuery('13', '14', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -3903,20 +3590,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
             LEFT JOIN Z_26ASSETS z26Assets ON z26Assets.Z_34ASSETS = zAsset.Z_PK
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z26Assets.Z_26ALBUMS
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -3981,19 +3656,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAsset-zPK-62',
         'zAddAssetAttr-zPK-63',
         'zAsset-UUID = store.cloudphotodb-64',
-        'zAddAssetAttr-Master Fingerprint-65')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-65')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -4211,19 +3875,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
             LEFT JOIN Z_26ASSETS z26Assets ON z26Assets.Z_3ASSETS = zAsset.Z_PK
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z26Assets.Z_26ALBUMS
         ORDER BY zAsset.ZDATECREATED
-        '''
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -4295,19 +3948,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAsset-zPK-69',
         'zAddAssetAttr-zPK-70',
         'zAsset-UUID = store.cloudphotodb-71',
-        'zAddAssetAttr-Master Fingerprint-72')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-72')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -4546,21 +4188,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z27Assets.Z_27ALBUMS
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -4637,19 +4266,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAsset-zPK-74',
         'zAddAssetAttr-zPK-75',
         'zAsset-UUID = store.cloudphotodb-76',
-        'zAddAssetAttr-Master Fingerprint-77')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-77')),
+        PhotosQuery('16', '17', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -4894,21 +4512,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -4987,19 +4592,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAsset-zPK-76',
         'zAddAssetAttr-zPK-77',
         'zAsset-UUID = store.cloudphotodb-78',
-        'zAddAssetAttr-Master Fingerprint-79')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-79')),
+        PhotosQuery('17', '17.6', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -5244,21 +4838,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -5338,19 +4919,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAsset-zPK-77',
         'zAddAssetAttr-zPK-78',
         'zAsset-UUID = store.cloudphotodb-79',
-        'zAddAssetAttr-Master Fingerprint-80')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):	
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-80')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -5595,21 +5165,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -5689,19 +5246,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAsset-zPK-77',
         'zAddAssetAttr-zPK-78',
         'zAsset-UUID = store.cloudphotodb-79',
-        'zAddAssetAttr-Master Fingerprint-80')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-80')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -5953,22 +5499,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -6051,19 +5583,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAddAssetAttr-zPK-80',
         'zAsset-UUID = store.cloudphotodb-81',
         'zAddAssetAttr-Original Stable Hash-82',
-        'zAddAssetAttr.Adjusted Stable Hash-83')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-83')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -6315,22 +5836,8 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -6413,36 +5920,10 @@ def Ph002_2AssetBasicConversationDataSyndPL(context):
         'zAddAssetAttr-zPK-80',
         'zAsset-UUID = store.cloudphotodb-81',
         'zAddAssetAttr-Original Stable Hash-82',
-        'zAddAssetAttr.Adjusted Stable Hash-83')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph002_3AssetBasicGenAlbumGenPlayPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-83')),
+    ),
+    'Ph002_3AssetBasicGenAlbumGenPlayPsql': (
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -6694,22 +6175,8 @@ def Ph002_3AssetBasicGenAlbumGenPlayPsql(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -6792,19 +6259,8 @@ def Ph002_3AssetBasicGenAlbumGenPlayPsql(context):
         'zAddAssetAttr-zPK-80',
         'zAsset-UUID = store.cloudphotodb-81',
         'zAddAssetAttr-Original Stable Hash-82',
-        'zAddAssetAttr.Adjusted Stable Hash-83')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-83')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',  
         DateTime(zAsset.ZSORTTOKEN + 978307200, 'UNIXEPOCH') AS 'zAsset- SortToken -CameraRoll',
@@ -7056,22 +6512,8 @@ def Ph002_3AssetBasicGenAlbumGenPlayPsql(context):
              CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
             LEFT JOIN ZGENERICALBUM SWYConverszGenAlbum ON SWYConverszGenAlbum.Z_PK = zAsset.ZCONVERSATION
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
         ('zAsset-Added Date-2', 'datetime'),
         ('zCldMast-Creation Date-3', 'datetime'),
@@ -7154,7 +6596,21 @@ def Ph002_3AssetBasicGenAlbumGenPlayPsql(context):
         'zAddAssetAttr-zPK-80',
         'zAsset-UUID = store.cloudphotodb-81',
         'zAddAssetAttr-Original Stable Hash-82',
-        'zAddAssetAttr.Adjusted Stable Hash-83')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zAddAssetAttr.Adjusted Stable Hash-83')),
+    ),
+}
+
+
+@artifact_processor
+def Ph002_1AssetBasicGenAlbumDataPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph002_1AssetBasicGenAlbumDataPhDaPsql'])
+
+
+@artifact_processor
+def Ph002_2AssetBasicConversationDataSyndPL(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph002_2AssetBasicConversationDataSyndPL'], 'Syndication.photoslibrary')
+
 
-        return data_headers, data_list, source_path
+@artifact_processor
+def Ph002_3AssetBasicGenAlbumGenPlayPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph002_3AssetBasicGenAlbumGenPlayPsql'], 'GenPlay-Photos.sqlite')
@@ -84,35 +84,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph003_1TrashedRecentlyDeletedPhDaPsql': (
+        PhotosQuery('11', '14', '''
         SELECT
         DateTime(zAsset.ZTRASHEDDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Trashed Date',
         CASE zAsset.ZTRASHEDSTATE
@@ -134,14 +112,8 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAsset.ZTRASHEDSTATE = 1
         ORDER BY zAsset.ZTRASHEDSTATE      
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10]))
-
-        data_headers = (('zAsset-Trashed Date-0', 'datetime'),
+        ''',
+        (('zAsset-Trashed Date-0', 'datetime'),
         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -151,19 +123,8 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
-        'zAddAssetAttr-Master Fingerprint-10')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-10')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zAsset.ZTRASHEDDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Trashed Date',
         CASE zAsset.ZTRASHEDSTATE
@@ -185,14 +146,8 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAsset.ZTRASHEDSTATE = 1
         ORDER BY zAsset.ZTRASHEDSTATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10]))
-
-        data_headers = (('zAsset-Trashed Date-0', 'datetime'),
+        ''',
+        (('zAsset-Trashed Date-0', 'datetime'),
         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -202,19 +157,8 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
-        'zAddAssetAttr-Master Fingerprint-10')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-10')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAsset.ZTRASHEDDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Trashed Date',
         CASE zAsset.ZTRASHEDSTATE
@@ -247,14 +191,8 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAsset.ZTRASHEDSTATE = 1
         ORDER BY zAsset.ZTRASHEDSTATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12]))
-
-        data_headers = (('zAsset-Trashed Date-0', 'datetime'),
+        ''',
+        (('zAsset-Trashed Date-0', 'datetime'),
         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -266,19 +204,8 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
         'zAsset-zPK-9',
         'zAddAssetAttr-zPK-10',
         'zAsset-UUID = store.cloudphotodb-11',
-        'zAddAssetAttr-Master Fingerprint-12')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-12')),
+        PhotosQuery('16', '18', '''
         SELECT
         DateTime(zAsset.ZTRASHEDDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Trashed Date',
         CASE zAsset.ZTRASHEDSTATE
@@ -318,14 +245,8 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
             LEFT JOIN ZSHAREPARTICIPANT SPLzSharePartic ON SPLzSharePartic.Z_PK = zAssetContrib.ZPARTICIPANT
         WHERE zAsset.ZTRASHEDSTATE = 1
         ORDER BY zAsset.ZTRASHEDSTATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16]))
-
-        data_headers = (('zAsset-Trashed Date-0', 'datetime'),
+        ''',
+        (('zAsset-Trashed Date-0', 'datetime'),
         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
         'zAsset-Trashed by Participant= zShareParticipant_zPK-2',
         'SPLzSharePartic-zPK= TrashedByParticipant-3',
@@ -341,19 +262,8 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
         'zAsset-zPK-13',
         'zAddAssetAttr-zPK-14',
         'zAsset-UUID = store.cloudphotodb-15',
-        'zAddAssetAttr-Master Fingerprint-16')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-16')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZTRASHEDDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Trashed Date',
         CASE zAsset.ZTRASHEDSTATE
@@ -394,14 +304,8 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
             LEFT JOIN ZSHAREPARTICIPANT SPLzSharePartic ON SPLzSharePartic.Z_PK = zAssetContrib.ZPARTICIPANT
         WHERE zAsset.ZTRASHEDSTATE = 1
         ORDER BY zAsset.ZTRASHEDSTATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17]))
-
-        data_headers = (('zAsset-Trashed Date-0', 'datetime'),
+        ''',
+        (('zAsset-Trashed Date-0', 'datetime'),
         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
         'zAsset-Trashed by Participant= zShareParticipant_zPK-2',
         'SPLzSharePartic-zPK= TrashedByParticipant-3',
@@ -418,36 +322,10 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
         'zAddAssetAttr-zPK-14',
         'zAsset-UUID = store.cloudphotodb-15',
         'zAddAssetAttr-Original Stable Hash-16',
-        'zAddAssetAttr.Adjusted Stable Hash-17')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph003_2RemovedfromCameraRollSyndPL(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-17')),
+    ),
+    'Ph003_2RemovedfromCameraRollSyndPL': (
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAddAssetAttr.ZLASTUPLOADATTEMPTDATE + 978307200, 'UNIXEPOCH') AS
          'zAddAssetAttr-Last Upload Attempt Date-SWY_Files',
@@ -482,14 +360,8 @@ def Ph003_2RemovedfromCameraRollSyndPL(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAsset.ZSYNDICATIONSTATE IN (8, 10)
         ORDER BY zAddAssetAttr.ZLASTUPLOADATTEMPTDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13]))
-
-        data_headers = (('zAddAssetAttr-Last Upload Attempt Date-SWY_Files-0', 'datetime'),
+        ''',
+        (('zAddAssetAttr-Last Upload Attempt Date-SWY_Files-0', 'datetime'),
         'zAsset-Syndication State-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -502,19 +374,8 @@ def Ph003_2RemovedfromCameraRollSyndPL(context):
         'zAsset-zPK-10',
         'zAddAssetAttr-zPK-11',
         'zAsset-UUID = store.cloudphotodb-12',
-        'zAddAssetAttr-Master Fingerprint-13')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-13')),
+        PhotosQuery('16', '18', '''
         SELECT
         DateTime(zAddAssetAttr.ZLASTUPLOADATTEMPTDATE + 978307200, 'UNIXEPOCH') AS
          'zAddAssetAttr-Last Upload Attempt Date-SWY_Files',
@@ -556,14 +417,8 @@ def Ph003_2RemovedfromCameraRollSyndPL(context):
             LEFT JOIN ZSHAREPARTICIPANT SPLzSharePartic ON SPLzSharePartic.Z_PK = zAssetContrib.ZPARTICIPANT
         WHERE zAsset.ZSYNDICATIONSTATE IN (8, 10)
         ORDER BY zAddAssetAttr.ZLASTUPLOADATTEMPTDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17]))
-
-        data_headers = (('zAddAssetAttr-Last Upload Attempt Date-SWY_Files-0', 'datetime'),
+        ''',
+        (('zAddAssetAttr-Last Upload Attempt Date-SWY_Files-0', 'datetime'),
         'zAsset-Syndication State-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -580,19 +435,8 @@ def Ph003_2RemovedfromCameraRollSyndPL(context):
         'zAsset-zPK-14',
         'zAddAssetAttr-zPK-15',
         'zAsset-UUID = store.cloudphotodb-16',
-        'zAddAssetAttr-Master Fingerprint-17')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-17')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZTRASHEDDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Trashed Date',
         CASE zAsset.ZTRASHEDSTATE
@@ -633,14 +477,8 @@ def Ph003_2RemovedfromCameraRollSyndPL(context):
             LEFT JOIN ZSHAREPARTICIPANT SPLzSharePartic ON SPLzSharePartic.Z_PK = zAssetContrib.ZPARTICIPANT
         WHERE zAsset.ZTRASHEDSTATE = 1
         ORDER BY zAsset.ZTRASHEDSTATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17]))
-
-        data_headers = (('zAsset-Trashed Date-0', 'datetime'),
+        ''',
+        (('zAsset-Trashed Date-0', 'datetime'),
         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
         'zAsset-Trashed by Participant= zShareParticipant_zPK-2',
         'SPLzSharePartic-zPK= TrashedByParticipant-3',
@@ -657,36 +495,10 @@ def Ph003_2RemovedfromCameraRollSyndPL(context):
         'zAddAssetAttr-zPK-14',
         'zAsset-UUID = store.cloudphotodb-15',
         'zAddAssetAttr-Original Stable Hash-16',
-        'zAddAssetAttr.Adjusted Stable Hash-17')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph003_3TrashedRecentlyDeletedGenPlayPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-17')),
+    ),
+    'Ph003_3TrashedRecentlyDeletedGenPlayPsql': (
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZTRASHEDDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Trashed Date',
         CASE zAsset.ZTRASHEDSTATE
@@ -727,14 +539,8 @@ def Ph003_3TrashedRecentlyDeletedGenPlayPsql(context):
             LEFT JOIN ZSHAREPARTICIPANT SPLzSharePartic ON SPLzSharePartic.Z_PK = zAssetContrib.ZPARTICIPANT
         WHERE zAsset.ZTRASHEDSTATE = 1
         ORDER BY zAsset.ZTRASHEDSTATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17]))
-
-        data_headers = (('zAsset-Trashed Date-0', 'datetime'),
+        ''',
+        (('zAsset-Trashed Date-0', 'datetime'),
         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
         'zAsset-Trashed by Participant= zShareParticipant_zPK-2',
         'SPLzSharePartic-zPK= TrashedByParticipant-3',
@@ -751,7 +557,21 @@ def Ph003_3TrashedRecentlyDeletedGenPlayPsql(context):
         'zAddAssetAttr-zPK-14',
         'zAsset-UUID = store.cloudphotodb-15',
         'zAddAssetAttr-Original Stable Hash-16',
-        'zAddAssetAttr.Adjusted Stable Hash-17')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zAddAssetAttr.Adjusted Stable Hash-17')),
+    ),
+}
+
+
+@artifact_processor
+def Ph003_1TrashedRecentlyDeletedPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph003_1TrashedRecentlyDeletedPhDaPsql'])
+
+
+@artifact_processor
+def Ph003_2RemovedfromCameraRollSyndPL(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph003_2RemovedfromCameraRollSyndPL'], 'Syndication.photoslibrary')
+
 
-        return data_headers, data_list, source_path
\ No newline at end of file
+@artifact_processor
+def Ph003_3TrashedRecentlyDeletedGenPlayPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph003_3TrashedRecentlyDeletedGenPlayPsql'], 'GenPlay-Photos.sqlite')
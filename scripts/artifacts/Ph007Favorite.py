@@ -53,35 +53,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph007_1FavoritePhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph007_1FavoritePhDaPsql': (
+        PhotosQuery('11', '14', '''
         SELECT
         DateTime(zAsset.ZMODIFICATIONDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Modification Date',
         CASE zAsset.ZFAVORITE
@@ -102,14 +80,8 @@ def Ph007_1FavoritePhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAsset.ZFAVORITE = 1
         ORDER BY zAsset.ZMODIFICATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10]))
-
-        data_headers = (('zAsset-Modification Date-0', 'datetime'),
+        ''',
+        (('zAsset-Modification Date-0', 'datetime'),
         'zAsset-Favorite-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -119,19 +91,8 @@ def Ph007_1FavoritePhDaPsql(context):
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
-        'zAddAssetAttr-Master Fingerprint-10')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-10')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zAsset.ZMODIFICATIONDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Modification Date',
         CASE zAsset.ZFAVORITE
@@ -152,14 +113,8 @@ def Ph007_1FavoritePhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAsset.ZFAVORITE = 1
         ORDER BY zAsset.ZMODIFICATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10]))
-
-        data_headers = (('zAsset-Modification Date-0', 'datetime'),
+        ''',
+        (('zAsset-Modification Date-0', 'datetime'),
         'zAsset-Favorite-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -169,19 +124,8 @@ def Ph007_1FavoritePhDaPsql(context):
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
-        'zAddAssetAttr-Master Fingerprint-10')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-10')),
+        PhotosQuery('15', '18', '''
         SELECT
         DateTime(zAsset.ZMODIFICATIONDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Modification Date',
         CASE zAsset.ZFAVORITE
@@ -203,14 +147,8 @@ def Ph007_1FavoritePhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAsset.ZFAVORITE = 1
         ORDER BY zAsset.ZMODIFICATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11]))
-
-        data_headers = (('zAsset-Modification Date-0', 'datetime'),
+        ''',
+        (('zAsset-Modification Date-0', 'datetime'),
         'zAsset-Favorite-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -221,19 +159,8 @@ def Ph007_1FavoritePhDaPsql(context):
         'zAsset-zPK-8',
         'zAddAssetAttr-zPK-9',
         'zAsset-UUID = store.cloudphotodb-10',
-        'zAddAssetAttr-Master Fingerprint-11')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-11')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZMODIFICATIONDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Modification Date',
         CASE zAsset.ZFAVORITE
@@ -256,14 +183,8 @@ def Ph007_1FavoritePhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAsset.ZFAVORITE = 1
         ORDER BY zAsset.ZMODIFICATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12]))
-
-        data_headers = (('zAsset-Modification Date-0', 'datetime'),
+        ''',
+        (('zAsset-Modification Date-0', 'datetime'),
         'zAsset-Favorite-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -275,36 +196,10 @@ def Ph007_1FavoritePhDaPsql(context):
         'zAddAssetAttr-zPK-9',
         'zAsset-UUID = store.cloudphotodb-10',
         'zAddAssetAttr-Original Stable Hash-11',
-        'zAddAssetAttr.Adjusted Stable Hash-12')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph007_3FavoriteGenPlayPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-12')),
+    ),
+    'Ph007_3FavoriteGenPlayPsql': (
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZMODIFICATIONDATE + 978307200, 'UNIXEPOCH') AS 'zAsset-Modification Date',
         CASE zAsset.ZFAVORITE
@@ -327,14 +222,8 @@ def Ph007_3FavoriteGenPlayPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAsset.ZFAVORITE = 1
         ORDER BY zAsset.ZMODIFICATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12]))
-
-        data_headers = (('zAsset-Modification Date-0', 'datetime'),
+        ''',
+        (('zAsset-Modification Date-0', 'datetime'),
         'zAsset-Favorite-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -346,7 +235,16 @@ def Ph007_3FavoriteGenPlayPsql(context):
         'zAddAssetAttr-zPK-9',
         'zAsset-UUID = store.cloudphotodb-10',
         'zAddAssetAttr-Original Stable Hash-11',
-        'zAddAssetAttr.Adjusted Stable Hash-12')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zAddAssetAttr.Adjusted Stable Hash-12')),
+    ),
+}
+
 
-        return data_headers, data_list, source_path
\ No newline at end of file
+@artifact_processor
+def Ph007_1FavoritePhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph007_1FavoritePhDaPsql'])
+
+
+@artifact_processor
+def Ph007_3FavoriteGenPlayPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph007_3FavoriteGenPlayPsql'], 'GenPlay-Photos.sqlite')
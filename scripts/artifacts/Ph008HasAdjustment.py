@@ -53,35 +53,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph008_1HasAdjustmentPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph008_1HasAdjustmentPhDaPsql': (
+        PhotosQuery('11', '14', '''
         SELECT
         DateTime(zUnmAdj.ZADJUSTMENTTIMESTAMP + 978307200, 'UNIXEPOCH') AS 'zUnmAdj-Adjustment Timestamp',
         CASE zAsset.ZHASADJUSTMENTS
@@ -129,14 +107,8 @@ def Ph008_1HasAdjustmentPhDaPsql(context):
             LEFT JOIN ZUNMANAGEDADJUSTMENT zUnmAdj ON zAddAssetAttr.ZUNMANAGEDADJUSTMENT = zUnmAdj.Z_PK
         WHERE zAsset.ZHASADJUSTMENTS = 1
         ORDER BY zUnmAdj.ZADJUSTMENTTIMESTAMP
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15]))
-
-        data_headers = (('zUnmAdj-Adjustment Timestamp', 'datetime'),
+        ''',
+        (('zUnmAdj-Adjustment Timestamp', 'datetime'),
         'zAsset-Has Adjustments-Camera-Effects-Filters',
         'zAddAssetAttr-Editor Bundle ID',
         'zUnmAdj-Editor Localized Name',
@@ -151,19 +123,8 @@ def Ph008_1HasAdjustmentPhDaPsql(context):
         'zAsset-zPK',
         'zAddAssetAttr-zPK',
         'zAsset-UUID = store.cloudphotodb',
-        'zAddAssetAttr-Master Fingerprint')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint')),
+        PhotosQuery('14', '18', '''
         SELECT
         DateTime(zUnmAdj.ZADJUSTMENTTIMESTAMP + 978307200, 'UNIXEPOCH') AS 'zUnmAdj-Adjustment Timestamp',
         CASE zAsset.ZHASADJUSTMENTS
@@ -212,14 +173,8 @@ def Ph008_1HasAdjustmentPhDaPsql(context):
             LEFT JOIN ZUNMANAGEDADJUSTMENT zUnmAdj ON zAddAssetAttr.ZUNMANAGEDADJUSTMENT = zUnmAdj.Z_PK
         WHERE zAsset.ZHASADJUSTMENTS = 1
         ORDER BY zUnmAdj.ZADJUSTMENTTIMESTAMP
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16]))
-
-        data_headers = (('zUnmAdj-Adjustment Timestamp-0', 'datetime'),
+        ''',
+        (('zUnmAdj-Adjustment Timestamp-0', 'datetime'),
         'zAsset-Has Adjustments-Camera-Effects-Filters-1',
         'zAddAssetAttr-Editor Bundle ID-2',
         'zUnmAdj-Editor Localized Name-3',
@@ -235,19 +190,8 @@ def Ph008_1HasAdjustmentPhDaPsql(context):
         'zAddAssetAttr-zPK-13',
         'zAsset-UUID = store.cloudphotodb-14',
         'zAddAssetAttr-Master Fingerprint-15',
-        'zAddAssetAttr.Adjusted Fingerprint-16')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Fingerprint-16')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zUnmAdj.ZADJUSTMENTTIMESTAMP + 978307200, 'UNIXEPOCH') AS 'zUnmAdj-Adjustment Timestamp',
         CASE zAsset.ZADJUSTMENTSSTATE
@@ -331,16 +275,8 @@ def Ph008_1HasAdjustmentPhDaPsql(context):
             LEFT JOIN ZCOMPUTESYNCATTRIBUTES zCompSyncAttr ON zCompSyncAttr.Z_PK = zAsset.ZCOMPUTESYNCATTRIBUTES
         WHERE zAsset.ZADJUSTMENTSSTATE > 0
         ORDER BY zUnmAdj.ZADJUSTMENTTIMESTAMP
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32]))
-
-        data_headers = (('zUnmAdj-Adjustment Timestamp-0', 'datetime'),
+        ''',
+        (('zUnmAdj-Adjustment Timestamp-0', 'datetime'),
         'zAsset-Adjustments_State/Camera-Effects-Filters-1',
         'zCompSyncAttr-Cloud_Compute_State_Last_Updated_Date-2',
         'zCompSyncAttr-Local_Analysis_Major_Version-3',
@@ -372,36 +308,10 @@ def Ph008_1HasAdjustmentPhDaPsql(context):
         'zUnmAdj-Similar to Orig Adjustments Fingerprint-29',
         'zCompSyncAttr-Cloud_Compute_State_Adjustment_Fingerprint-30',
         'zExtAttr-Generative_AI_Type-31',
-        'zExtAttr-Credit-32')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph008_3HasAdjustmentGenPlayPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zExtAttr-Credit-32')),
+    ),
+    'Ph008_3HasAdjustmentGenPlayPsql': (
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zUnmAdj.ZADJUSTMENTTIMESTAMP + 978307200, 'UNIXEPOCH') AS 'zUnmAdj-Adjustment Timestamp',
         CASE zAsset.ZADJUSTMENTSSTATE
@@ -485,16 +395,8 @@ def Ph008_3HasAdjustmentGenPlayPsql(context):
             LEFT JOIN ZCOMPUTESYNCATTRIBUTES zCompSyncAttr ON zCompSyncAttr.Z_PK = zAsset.ZCOMPUTESYNCATTRIBUTES
         WHERE zAsset.ZADJUSTMENTSSTATE > 0
         ORDER BY zUnmAdj.ZADJUSTMENTTIMESTAMP
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32]))
-
-        data_headers = (('zUnmAdj-Adjustment Timestamp-0', 'datetime'),
+        ''',
+        (('zUnmAdj-Adjustment Timestamp-0', 'datetime'),
         'zAsset-Adjustments_State/Camera-Effects-Filters-1',
         'zCompSyncAttr-Cloud_Compute_State_Last_Updated_Date-2',
         'zCompSyncAttr-Local_Analysis_Major_Version-3',
@@ -526,7 +428,16 @@ def Ph008_3HasAdjustmentGenPlayPsql(context):
         'zUnmAdj-Similar to Orig Adjustments Fingerprint-29',
         'zCompSyncAttr-Cloud_Compute_State_Adjustment_Fingerprint-30',
         'zExtAttr-Generative_AI_Type-31',
-        'zExtAttr-Credit-32')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zExtAttr-Credit-32')),
+    ),
+}
+
+
+@artifact_processor
+def Ph008_1HasAdjustmentPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph008_1HasAdjustmentPhDaPsql'])
+
 
-        return data_headers, data_list, source_path
\ No newline at end of file
+@artifact_processor
+def Ph008_3HasAdjustmentGenPlayPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph008_3HasAdjustmentGenPlayPsql'], 'GenPlay-Photos.sqlite')
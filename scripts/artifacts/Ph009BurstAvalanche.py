@@ -53,35 +53,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph009_1BurstAvalanchePhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph009_1BurstAvalanchePhDaPsql': (
+        PhotosQuery('11', '14', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',      
         CASE zAsset.ZAVALANCHEPICKTYPE
@@ -124,14 +102,8 @@ def Ph009_1BurstAvalanchePhDaPsql(context):
        WHERE (zAsset.ZAVALANCHEPICKTYPE > 0) OR
           (zAddAssetAttr.ZCLOUDAVALANCHEPICKTYPE > 0)
         ORDER BY zAsset.ZDATECREATED    
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-Avalanche_Pick_Type-BurstAsset-1',
         'zAddAssetAttr-Cloud_Avalanche_Pick_Type-BurstAsset-2',
         'zAsset-Visibility State-3',
@@ -143,19 +115,8 @@ def Ph009_1BurstAvalanchePhDaPsql(context):
         'zAsset-zPK-9',
         'zAddAssetAttr-zPK-10',
         'zAsset-UUID = store.cloudphotodb-11',
-        'zAddAssetAttr-Master Fingerprint-12')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-12')),
+        PhotosQuery('14', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',      
         CASE zAsset.ZAVALANCHEPICKTYPE
@@ -198,14 +159,8 @@ def Ph009_1BurstAvalanchePhDaPsql(context):
         WHERE (zAsset.ZAVALANCHEPICKTYPE > 0) OR
           (zAddAssetAttr.ZCLOUDAVALANCHEPICKTYPE > 0)
         ORDER BY zAsset.ZDATECREATED    
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-Avalanche_Pick_Type-BurstAsset-1',
         'zAddAssetAttr-Cloud_Avalanche_Pick_Type-BurstAsset-2',
         'zAsset-Visibility State-3',
@@ -217,19 +172,8 @@ def Ph009_1BurstAvalanchePhDaPsql(context):
         'zAsset-zPK-9',
         'zAddAssetAttr-zPK-10',
         'zAsset-UUID = store.cloudphotodb-11',
-        'zAddAssetAttr-Master Fingerprint-12')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr-Master Fingerprint-12')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         CASE zAsset.ZAVALANCHEKIND
@@ -278,14 +222,8 @@ def Ph009_1BurstAvalanchePhDaPsql(context):
         WHERE (zAsset.ZAVALANCHEPICKTYPE > 0) OR
           (zAddAssetAttr.ZCLOUDAVALANCHEPICKTYPE > 0)
         ORDER BY zAsset.ZDATECREATED    
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-Avalanche_Kind-1',
         'zAsset-Avalanche_Pick_Type-BurstAsset-2',
         'zAddAssetAttr-Cloud_Avalanche_Pick_Type-BurstAsset-3',
@@ -299,36 +237,10 @@ def Ph009_1BurstAvalanchePhDaPsql(context):
         'zAddAssetAttr-zPK-11',
         'zAsset-UUID = store.cloudphotodb-12',
         'zAddAssetAttr-Original Stable Hash-13',
-        'zAddAssetAttr.Adjusted Stable Hash-14')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph009_3BurstAvalancheGenPlayPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAddAssetAttr.Adjusted Stable Hash-14')),
+    ),
+    'Ph009_3BurstAvalancheGenPlayPsql': (
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         CASE zAsset.ZAVALANCHEKIND
@@ -377,14 +289,8 @@ def Ph009_3BurstAvalancheGenPlayPsql(context):
         WHERE (zAsset.ZAVALANCHEPICKTYPE > 0) OR
           (zAddAssetAttr.ZCLOUDAVALANCHEPICKTYPE > 0)
         ORDER BY zAsset.ZDATECREATED    
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-Avalanche_Kind-1',
         'zAsset-Avalanche_Pick_Type-BurstAsset-2',
         'zAddAssetAttr-Cloud_Avalanche_Pick_Type-BurstAsset-3',
@@ -398,7 +304,16 @@ def Ph009_3BurstAvalancheGenPlayPsql(context):
         'zAddAssetAttr-zPK-11',
         'zAsset-UUID = store.cloudphotodb-12',
         'zAddAssetAttr-Original Stable Hash-13',
-        'zAddAssetAttr.Adjusted Stable Hash-14')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zAddAssetAttr.Adjusted Stable Hash-14')),
+    ),
+}
+
+
+@artifact_processor
+def Ph009_1BurstAvalanchePhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph009_1BurstAvalanchePhDaPsql'])
+
 
-        return data_headers, data_list, source_path
\ No newline at end of file
+@artifact_processor
+def Ph009_3BurstAvalancheGenPlayPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph009_3BurstAvalancheGenPlayPsql'], 'GenPlay-Photos.sqlite')
@@ -92,35 +92,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph020_1AlbumRecordswithNADPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('-') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph020_1AlbumRecordswithNADPhDaPsql': (
+        PhotosQuery('11', '14', '''
         SELECT 
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
         DateTime(zGenAlbum.ZENDDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-End Date',
@@ -154,14 +132,8 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(context):
         zGenAlbum.ZCLOUDGUID AS 'zGenAlbum-Cloud GUID-4TableStart'
         FROM ZGENERICALBUM zGenAlbum
         ORDER BY zGenAlbum.ZSTARTDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-            row[8], row[9], row[10], row[11]))
-
-        data_headers = (('zGenAlbum-Start Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'zGenAlbum-Album Kind',
         'zGenAlbum-Title',
@@ -172,19 +144,8 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
         'zGenAlbum-UUID',
-        'zGenAlbum-Cloud GUID')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud GUID')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -220,14 +181,8 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(context):
         zGenAlbum.ZCLOUDGUID AS 'zGenAlbum-Cloud GUID-4TableStart'
         FROM ZGENERICALBUM zGenAlbum
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-            row[8], row[9], row[10], row[11], row[12], row[13]))
-
-        data_headers = (('zGenAlbum-Creation Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date', 'datetime'),
         ('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'zGenAlbum-Album Kind',
@@ -240,19 +195,8 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
         'zGenAlbum-UUID',
-        'zGenAlbum-Cloud GUID')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud GUID')),
+        PhotosQuery('15', '18', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -288,14 +232,8 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(context):
         zGenAlbum.ZCLOUDGUID AS 'zGenAlbum-Cloud GUID-4TableStart'
         FROM ZGENERICALBUM zGenAlbum
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-            row[8], row[9], row[10], row[11], row[12], row[13]))
-
-        data_headers = (('zGenAlbum-Creation Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date', 'datetime'),
         ('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'zGenAlbum-Album Kind',
@@ -308,19 +246,8 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
         'zGenAlbum-UUID',
-        'zGenAlbum-Cloud GUID')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud GUID')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -356,14 +283,8 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(context):
         zGenAlbum.ZCLOUDGUID AS 'zGenAlbum-Cloud GUID-4TableStart'
         FROM ZGENERICALBUM zGenAlbum
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-            row[8], row[9], row[10], row[11], row[12], row[13]))
-
-        data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date-0', 'datetime'),
         ('zGenAlbum-Start Date-1', 'datetime'),
         ('zGenAlbum-End Date-2', 'datetime'),
         'zGenAlbum-Album Kind-3',
@@ -376,36 +297,10 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Trashed State-10',
         ('zGenAlbum-Trash Date-11', 'datetime'),
         'zGenAlbum-UUID-12',
-        'zGenAlbum-Cloud GUID-13')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph020_2AlbumRecordswithNADSyndPL(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud GUID-13')),
+    ),
+    'Ph020_2AlbumRecordswithNADSyndPL': (
+        PhotosQuery('11', '14', '''
         SELECT 
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
         DateTime(zGenAlbum.ZENDDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-End Date',
@@ -439,14 +334,8 @@ def Ph020_2AlbumRecordswithNADSyndPL(context):
         zGenAlbum.ZCLOUDGUID AS 'zGenAlbum-Cloud GUID-4TableStart'
         FROM ZGENERICALBUM zGenAlbum
         ORDER BY zGenAlbum.ZSTARTDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-            row[8], row[9], row[10], row[11]))
-
-        data_headers = (('zGenAlbum-Start Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'zGenAlbum-Album Kind',
         'zGenAlbum-Title',
@@ -457,19 +346,8 @@ def Ph020_2AlbumRecordswithNADSyndPL(context):
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
         'zGenAlbum-UUID',
-        'zGenAlbum-Cloud GUID')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud GUID')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -505,14 +383,8 @@ def Ph020_2AlbumRecordswithNADSyndPL(context):
         zGenAlbum.ZCLOUDGUID AS 'zGenAlbum-Cloud GUID-4TableStart'
         FROM ZGENERICALBUM zGenAlbum
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-            row[8], row[9], row[10], row[11], row[12], row[13]))
-
-        data_headers = (('zGenAlbum-Creation Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date', 'datetime'),
         ('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'zGenAlbum-Album Kind',
@@ -525,19 +397,8 @@ def Ph020_2AlbumRecordswithNADSyndPL(context):
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
         'zGenAlbum-UUID',
-        'zGenAlbum-Cloud GUID')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud GUID')),
+        PhotosQuery('15', '18', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -573,14 +434,8 @@ def Ph020_2AlbumRecordswithNADSyndPL(context):
         zGenAlbum.ZCLOUDGUID AS 'zGenAlbum-Cloud GUID-4TableStart'
         FROM ZGENERICALBUM zGenAlbum
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-            row[8], row[9], row[10], row[11], row[12], row[13]))
-
-        data_headers = (('zGenAlbum-Creation Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date', 'datetime'),
         ('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'zGenAlbum-Album Kind',
@@ -593,19 +448,8 @@ def Ph020_2AlbumRecordswithNADSyndPL(context):
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
         'zGenAlbum-UUID',
-        'zGenAlbum-Cloud GUID')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud GUID')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -641,14 +485,8 @@ def Ph020_2AlbumRecordswithNADSyndPL(context):
         zGenAlbum.ZCLOUDGUID AS 'zGenAlbum-Cloud GUID-4TableStart'
         FROM ZGENERICALBUM zGenAlbum
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-            row[8], row[9], row[10], row[11], row[12], row[13]))
-
-        data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date-0', 'datetime'),
         ('zGenAlbum-Start Date-1', 'datetime'),
         ('zGenAlbum-End Date-2', 'datetime'),
         'zGenAlbum-Album Kind-3',
@@ -661,36 +499,10 @@ def Ph020_2AlbumRecordswithNADSyndPL(context):
         'zGenAlbum-Trashed State-10',
         ('zGenAlbum-Trash Date-11', 'datetime'),
         'zGenAlbum-UUID-12',
-        'zGenAlbum-Cloud GUID-13')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph020_3AlbumRecordswithNADGenPlayPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('-') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud GUID-13')),
+    ),
+    'Ph020_3AlbumRecordswithNADGenPlayPsql': (
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -726,14 +538,8 @@ def Ph020_3AlbumRecordswithNADGenPlayPsql(context):
         zGenAlbum.ZCLOUDGUID AS 'zGenAlbum-Cloud GUID-4TableStart'
         FROM ZGENERICALBUM zGenAlbum
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-            row[8], row[9], row[10], row[11], row[12], row[13]))
-
-        data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date-0', 'datetime'),
         ('zGenAlbum-Start Date-1', 'datetime'),
         ('zGenAlbum-End Date-2', 'datetime'),
         'zGenAlbum-Album Kind-3',
@@ -746,7 +552,21 @@ def Ph020_3AlbumRecordswithNADGenPlayPsql(context):
         'zGenAlbum-Trashed State-10',
         ('zGenAlbum-Trash Date-11', 'datetime'),
         'zGenAlbum-UUID-12',
-        'zGenAlbum-Cloud GUID-13')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zGenAlbum-Cloud GUID-13')),
+    ),
+}
+
+
+@artifact_processor
+def Ph020_1AlbumRecordswithNADPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph020_1AlbumRecordswithNADPhDaPsql'])
+
+
+@artifact_processor
+def Ph020_2AlbumRecordswithNADSyndPL(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph020_2AlbumRecordswithNADSyndPL'], 'Syndication.photoslibrary')
+
 
-        return data_headers, data_list, source_path
\ No newline at end of file
+@artifact_processor
+def Ph020_3AlbumRecordswithNADGenPlayPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph020_3AlbumRecordswithNADGenPlayPsql'], 'GenPlay-Photos.sqlite')
@@ -34,35 +34,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph021NonSharedAlbumRecordswithNADPhDaPsql': (
+        PhotosQuery('11', '12', '''
         SELECT
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
         DateTime(zGenAlbum.ZENDDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-End Date',
@@ -203,16 +181,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zGenAlbum.ZSTARTDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35]))
-
-        data_headers = (('zGenAlbum-Start Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'ParentzGenAlbum-UUID',
         'ParentzGenAlbum-Cloud GUID',
@@ -247,19 +217,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Custom Sort Ascending',
         'zGenAlbum-Custom Query Type',
         'zGenAlbum-Trashed State',
-        ('zGenAlbum-Trash Date', 'datetime'))
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        ('zGenAlbum-Trash Date', 'datetime'))),
+        PhotosQuery('12', '13', '''
         SELECT
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
         DateTime(zGenAlbum.ZENDDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-End Date',		
@@ -410,17 +369,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zGenAlbum.ZSTARTDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37]))
-
-        data_headers = (('zGenAlbum-Start Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'ParentzGenAlbum-UUID',
         'ParentzGenAlbum-Cloud GUID',
@@ -457,19 +407,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Custom Query Type',
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
-        'zGenAlbum-Cloud Delete State')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud Delete State')),
+        PhotosQuery('13', '14', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -630,17 +569,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40]))
-
-        data_headers = (('zGenAlbum-Creation Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date', 'datetime'),
         ('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'ParentzGenAlbum-UUID',
@@ -680,19 +610,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Custom Query Type',
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
-        'zGenAlbum-Cloud Delete State')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud Delete State')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -864,17 +783,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44]))
-
-        data_headers = (('zGenAlbum-Creation Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date', 'datetime'),
         ('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'ParentzGenAlbum-UUID',
@@ -918,19 +828,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Custom Query Type',
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
-        'zGenAlbum-Cloud Delete State')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud Delete State')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -1102,17 +1001,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44]))
-
-        data_headers = (('zGenAlbum-Creation Date', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date', 'datetime'),
         ('zGenAlbum-Start Date', 'datetime'),
         ('zGenAlbum-End Date', 'datetime'),
         'ParentzGenAlbum-UUID',
@@ -1156,19 +1046,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Custom Query Type',
         'zGenAlbum-Trashed State',
         ('zGenAlbum-Trash Date', 'datetime'),
-        'zGenAlbum-Cloud Delete State')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud Delete State')),
+        PhotosQuery('16', '17.6', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -1358,18 +1237,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date-0', 'datetime'),
         ('zGenAlbum-Start Date-1', 'datetime'),
         ('zGenAlbum-End Date-2', 'datetime'),
         'ParentzGenAlbum-UUID-3',
@@ -1416,19 +1285,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Cloud Delete State-44',
         'zGenAlbum-Search Index Rebuild State-45',
         'zGenAlbum-Duplicate Type-46',
-        'zGenAlbum-Privacy State-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Privacy State-47')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -1618,18 +1476,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date-0', 'datetime'),
         ('zGenAlbum-Start Date-1', 'datetime'),
         ('zGenAlbum-End Date-2', 'datetime'),
         'ParentzGenAlbum-UUID-3',
@@ -1676,19 +1524,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Cloud Delete State-44',
         'zGenAlbum-Search Index Rebuild State-45',
         'zGenAlbum-Duplicate Type-46',
-        'zGenAlbum-Privacy State-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Privacy State-47')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -1878,18 +1715,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date-0', 'datetime'),
         ('zGenAlbum-Start Date-1', 'datetime'),
         ('zGenAlbum-End Date-2', 'datetime'),
         'ParentzGenAlbum-UUID-3',
@@ -1936,19 +1763,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Cloud Delete State-44',
         'zGenAlbum-Search Index Rebuild State-45',
         'zGenAlbum-Duplicate Type-46',
-        'zGenAlbum-Privacy State-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Privacy State-47')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -2138,18 +1954,8 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Creation Date-0', 'datetime'),
         ('zGenAlbum-Start Date-1', 'datetime'),
         ('zGenAlbum-End Date-2', 'datetime'),
         'ParentzGenAlbum-UUID-3',
@@ -2196,7 +2002,11 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
         'zGenAlbum-Cloud Delete State-44',
         'zGenAlbum-Search Index Rebuild State-45',
         'zGenAlbum-Duplicate Type-46',
-        'zGenAlbum-Privacy State-47')
-        data_list = list(get_sqlite_db_records(source_path, query))
+        'zGenAlbum-Privacy State-47')),
+    ),
+}
 
-        return data_headers, data_list, source_path
+
+@artifact_processor
+def Ph021NonSharedAlbumRecordswithNADPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph021NonSharedAlbumRecordswithNADPhDaPsql'])
@@ -33,35 +33,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph022AssetsinNonSharedAlbumsPhDaPsql': (
+        PhotosQuery('11', '12', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -240,19 +218,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -307,19 +274,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
         'zGenAlbum-Custom Sort Ascending-52',
         'zGenAlbum-Custom Query Type-53',
         'zGenAlbum-Trashed State-54',
-        ('zGenAlbum-Trash Date-55', 'datetime'))
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        ('zGenAlbum-Trash Date-55', 'datetime'))),
+        PhotosQuery('12', '13', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -508,19 +464,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -577,19 +522,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
         'zGenAlbum-Custom Query Type-54',
         'zGenAlbum-Trashed State-55',
         ('zGenAlbum-Trash Date-56', 'datetime'),
-        'zGenAlbum-Cloud Delete State-57')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud Delete State-57')),
+        PhotosQuery('13', '14', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -788,19 +722,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -860,19 +783,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
         'zGenAlbum-Custom Query Type-57',
         'zGenAlbum-Trashed State-58',
         ('zGenAlbum-Trash Date-59', 'datetime'),
-        'zGenAlbum-Cloud Delete State-60')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud Delete State-60')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -1088,20 +1000,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -1167,19 +1067,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
         'zGenAlbum-Custom Query Type-63',
         'zGenAlbum-Trashed State-64',
         ('zGenAlbum-Trash Date-65', 'datetime'),
-        'zGenAlbum-Cloud Delete State-66')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud Delete State-66')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -1414,20 +1303,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -1496,19 +1373,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
         'zGenAlbum-Custom Query Type-66',
         'zGenAlbum-Trashed State-67',
         ('zGenAlbum-Trash Date-68', 'datetime'),
-        'zGenAlbum-Cloud Delete State-69')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Cloud Delete State-69')),
+        PhotosQuery('16', '17.6', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -1766,21 +1632,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -1854,19 +1707,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
         'zGenAlbum-Cloud Delete State-71',
         'zGenAlbum-Search Index Rebuild State-72',
         'zGenAlbum-Duplicate Type-73',
-        'zGenAlbum-Privacy State-74')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Privacy State-74')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -2124,21 +1966,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -2212,19 +2041,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
         'zGenAlbum-Cloud Delete State-71',
         'zGenAlbum-Search Index Rebuild State-72',
         'zGenAlbum-Duplicate Type-73',
-        'zGenAlbum-Privacy State-74')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Privacy State-74')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -2488,21 +2306,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -2578,19 +2383,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
         'zGenAlbum-Cloud Delete State-73',
         'zGenAlbum-Search Index Rebuild State-74',
         'zGenAlbum-Duplicate Type-75',
-        'zGenAlbum-Privacy State-76')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zGenAlbum-Privacy State-76')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -2854,21 +2648,8 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zGenAlbum.ZKIND = 2
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -2944,8 +2725,11 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
         'zGenAlbum-Cloud Delete State-73',
         'zGenAlbum-Search Index Rebuild State-74',
         'zGenAlbum-Duplicate Type-75',
-        'zGenAlbum-Privacy State-76')
-        data_list = list(get_sqlite_db_records(source_path, query))
+        'zGenAlbum-Privacy State-76')),
+    ),
+}
 
-        return data_headers, data_list, source_path
 
+@artifact_processor
+def Ph022AssetsinNonSharedAlbumsPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph022AssetsinNonSharedAlbumsPhDaPsql'])
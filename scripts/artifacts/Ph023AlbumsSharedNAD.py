@@ -34,35 +34,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("26")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph023SharedAlbumRecordsInviteswithNADPhDaPsql': (
+        PhotosQuery('11', '12', '''
         SELECT
         DateTime(zGenAlbum.ZCLOUDCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Cloud Creation Date',
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -243,19 +221,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zGenAlbum.ZSTARTDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57]))
-
-        data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
         ('zGenAlbum-Start Date-1', 'datetime'),
         ('zGenAlbum-End Date-2', 'datetime'),
         ('zGenAlbum-Cloud Subscription Date-3', 'datetime'),
@@ -312,19 +279,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
         'zCldShareAlbumInvRec-Invitee Email Key-54',
         'zCldShareAlbumInvRec-Album GUID-55',
         'zCldShareAlbumInvRec-Cloud GUID-56',
-        'zAlbumList-Needs Reordering Number-57')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-57')),
+        PhotosQuery('12', '13', '''
         SELECT
         DateTime(zGenAlbum.ZCLOUDCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Cloud Creation Date',  
         DateTime(zGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Start Date',
@@ -509,19 +465,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zGenAlbum.ZSTARTDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57]))
-
-        data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
         ('zGenAlbum-Start Date-1', 'datetime'),
         ('zGenAlbum-End Date-2', 'datetime'),
         ('zGenAlbum-Cloud Subscription Date-3', 'datetime'),
@@ -578,19 +523,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
         'zCldShareAlbumInvRec-Invitee Email Key-54',
         'zCldShareAlbumInvRec-Album GUID-55',
         'zCldShareAlbumInvRec-Cloud GUID-56',
-        'zAlbumList-Needs Reordering Number-57')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-57')),
+        PhotosQuery('13', '14', '''
         SELECT
         DateTime(zGenAlbum.ZCLOUDCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Cloud Creation Date',   
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
@@ -784,19 +718,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63]))
-
-        data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
         ('zGenAlbum-Creation Date-1', 'datetime'),
         ('zGenAlbum-Start Date-2', 'datetime'),
         ('zGenAlbum-End Date-3', 'datetime'),
@@ -859,19 +782,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-60',
         'zCldShareAlbumInvRec-Cloud GUID-61',
         'zGenAlbum-Project Render UUID-62',
-        'zAlbumList-Needs Reordering Number-63')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-63')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zGenAlbum.ZCLOUDCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Cloud Creation Date',
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
@@ -1071,20 +983,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65]))
-
-        data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
         ('zGenAlbum-Creation Date-1', 'datetime'),
         ('zGenAlbum-Start Date-2', 'datetime'),
         ('zGenAlbum-End Date-3', 'datetime'),
@@ -1149,19 +1049,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-62',
         'zCldShareAlbumInvRec-Cloud GUID-63',
         'zGenAlbum-Project Render UUID-64',
-        'zAlbumList-Needs Reordering Number-65')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-65')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zGenAlbum.ZCLOUDCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Cloud Creation Date',
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
@@ -1361,20 +1250,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65]))
-
-        data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
         ('zGenAlbum-Creation Date-1', 'datetime'),
         ('zGenAlbum-Start Date-2', 'datetime'),
         ('zGenAlbum-End Date-3', 'datetime'),
@@ -1439,19 +1316,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-62',
         'zCldShareAlbumInvRec-Cloud GUID-63',
         'zGenAlbum-Project Render UUID-64',
-        'zAlbumList-Needs Reordering Number-65')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-65')),
+        PhotosQuery('16', '17.6', '''
         SELECT
         DateTime(zGenAlbum.ZCLOUDCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Cloud Creation Date',
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
@@ -1670,20 +1536,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69]))
-
-        data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
         ('zGenAlbum-Creation Date-1', 'datetime'),
         ('zGenAlbum-Start Date-2', 'datetime'),
         ('zGenAlbum-End Date-3', 'datetime'),
@@ -1752,19 +1606,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-66',
         'zCldShareAlbumInvRec-Cloud GUID-67',
         'zGenAlbum-Project Render UUID-68',
-        'zAlbumList-Needs Reordering Number-69')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-69')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zGenAlbum.ZCLOUDCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Cloud Creation Date',
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
@@ -1983,20 +1826,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69]))
-
-        data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
         ('zGenAlbum-Creation Date-1', 'datetime'),
         ('zGenAlbum-Start Date-2', 'datetime'),
         ('zGenAlbum-End Date-3', 'datetime'),
@@ -2065,19 +1896,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-66',
         'zCldShareAlbumInvRec-Cloud GUID-67',
         'zGenAlbum-Project Render UUID-68',
-        'zAlbumList-Needs Reordering Number-69')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-69')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zGenAlbum.ZCLOUDCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Cloud Creation Date',
         DateTime(zGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zGenAlbum-Creation Date',
@@ -2296,20 +2116,8 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zGenAlbum.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69]))
-
-        data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
+        ''',
+        (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
         ('zGenAlbum-Creation Date-1', 'datetime'),
         ('zGenAlbum-Start Date-2', 'datetime'),
         ('zGenAlbum-End Date-3', 'datetime'),
@@ -2378,8 +2186,11 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-66',
         'zCldShareAlbumInvRec-Cloud GUID-67',
         'zGenAlbum-Project Render UUID-68',
-        'zAlbumList-Needs Reordering Number-69')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zAlbumList-Needs Reordering Number-69')),
+    ),
+}
 
-        return data_headers, data_list, source_path
 
+@artifact_processor
+def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph023SharedAlbumRecordsInviteswithNADPhDaPsql'])
@@ -33,35 +33,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("26")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph024AssetinSharedAlbumsInvitesPhDaPsql': (
+        PhotosQuery('11', '12', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -282,21 +260,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
              zGenAlbum.Z_PK = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -373,19 +338,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
         'zCldShareAlbumInvRec-Invitee Email Key-74',
         'zCldShareAlbumInvRec-Album GUID-75',
         'zCldShareAlbumInvRec-Cloud GUID-76',
-        'zAlbumList-Needs Reordering Number-77')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-77')),
+        PhotosQuery('12', '13', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -610,21 +564,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
              zGenAlbum.Z_PK = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -701,19 +642,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
         'zCldShareAlbumInvRec-Invitee Email Key-74',
         'zCldShareAlbumInvRec-Album GUID-75',
         'zCldShareAlbumInvRec-Cloud GUID-76',
-        'zAlbumList-Needs Reordering Number-77')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-77')),
+        PhotosQuery('13', '14', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -947,22 +877,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
              zGenAlbum.Z_PK = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -1045,19 +961,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-80',
         'zCldShareAlbumInvRec-Cloud GUID-81',
         'zGenAlbum-Project Render UUID-82',
-        'zAlbumList-Needs Reordering Number-83')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-83')),
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -1303,22 +1208,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
              zGenAlbum.Z_PK = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -1405,19 +1296,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-84',
         'zCldShareAlbumInvRec-Cloud GUID-85',
         'zGenAlbum-Project Render UUID-86',
-        'zAlbumList-Needs Reordering Number-87')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-87')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -1681,22 +1561,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
              zGenAlbum.Z_PK = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -1786,19 +1652,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-87',
         'zCldShareAlbumInvRec-Cloud GUID-88',
         'zGenAlbum-Project Render UUID-89',
-        'zAlbumList-Needs Reordering Number-90')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-90')),
+        PhotosQuery('16', '17.6', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -2087,23 +1942,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
              zGenAlbum.Z_PK = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zAsset.ZDATECREATED        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -2199,19 +2039,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-93',
         'zCldShareAlbumInvRec-Cloud GUID-94',
         'zGenAlbum-Project Render UUID-95',
-        'zAlbumList-Needs Reordering Number-96')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-96')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -2500,23 +2329,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
              zGenAlbum.Z_PK = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zAsset.ZDATECREATED        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -2612,19 +2426,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-93',
         'zCldShareAlbumInvRec-Cloud GUID-94',
         'zGenAlbum-Project Render UUID-95',
-        'zAlbumList-Needs Reordering Number-96')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zAlbumList-Needs Reordering Number-96')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         zAsset.Z_PK AS 'zAsset-zPK',
@@ -2914,23 +2717,8 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
              zGenAlbum.Z_PK = zCldShareAlbumInvRec.ZALBUM
         WHERE zGenAlbum.ZKIND = 1505
         ORDER BY zAsset.ZDATECREATED        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-zPK-1',
         'zAsset-Directory-Path-2',
         'zAsset-Filename-3',
@@ -3027,8 +2815,11 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
         'zCldShareAlbumInvRec-Album GUID-94',
         'zCldShareAlbumInvRec-Cloud GUID-95',
         'zGenAlbum-Project Render UUID-96',
-        'zAlbumList-Needs Reordering Number-97')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zAlbumList-Needs Reordering Number-97')),
+    ),
+}
 
-        return data_headers, data_list, source_path
 
+@artifact_processor
+def Ph024AssetinSharedAlbumsInvitesPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph024AssetinSharedAlbumsInvitesPhDaPsql'])
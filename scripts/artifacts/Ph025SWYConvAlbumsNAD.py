@@ -64,35 +64,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph025_1SWYConversationRecordswithNADPhDaPsql': (
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -176,14 +154,8 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date', 'datetime'),
         ('SWYConverszGenAlbum-Start Date', 'datetime'),
         ('SWYConverszGenAlbum-End Date', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK',
@@ -201,19 +173,8 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
         'SWYConverszGenAlbum-Custom Query Type',
         'SWYConverszGenAlbum-Trashed State',
         ('SWYConverszGenAlbum-Trash Date', 'datetime'),
-        'SWYConverszGenAlbum-Cloud Delete State')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Cloud Delete State')),
+        PhotosQuery('16', '17.6', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -303,15 +264,8 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK-3',
@@ -330,19 +284,8 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
         'SWYConverszGenAlbum-Trashed State-16',
         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-18',
-        'SWYConverszGenAlbum-Privacy State-19')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-19')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -432,15 +375,8 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK-3',
@@ -459,19 +395,8 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
         'SWYConverszGenAlbum-Trashed State-16',
         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-18',
-        'SWYConverszGenAlbum-Privacy State-19')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-19')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -561,15 +486,8 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK-3',
@@ -588,19 +506,8 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
         'SWYConverszGenAlbum-Trashed State-16',
         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-18',
-        'SWYConverszGenAlbum-Privacy State-19')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-19')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -690,15 +597,8 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK-3',
@@ -717,36 +617,10 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
         'SWYConverszGenAlbum-Trashed State-16',
         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-18',
-        'SWYConverszGenAlbum-Privacy State-19')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph025_2SWYConversationRecordswithNADSyndPL(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-19')),
+    ),
+    'Ph025_2SWYConversationRecordswithNADSyndPL': (
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -830,14 +704,8 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date', 'datetime'),
         ('SWYConverszGenAlbum-Start Date', 'datetime'),
         ('SWYConverszGenAlbum-End Date', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK',
@@ -855,19 +723,8 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
         'SWYConverszGenAlbum-Custom Query Type',
         'SWYConverszGenAlbum-Trashed State',
         ('SWYConverszGenAlbum-Trash Date', 'datetime'),
-        'SWYConverszGenAlbum-Cloud Delete State')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Cloud Delete State')),
+        PhotosQuery('16', '17.6', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -957,15 +814,8 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK-3',
@@ -984,19 +834,8 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
         'SWYConverszGenAlbum-Trashed State-16',
         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-18',
-        'SWYConverszGenAlbum-Privacy State-19')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-19')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -1086,15 +925,8 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK-3',
@@ -1113,19 +945,8 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
         'SWYConverszGenAlbum-Trashed State-16',
         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-18',
-        'SWYConverszGenAlbum-Privacy State-19')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-19')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -1215,15 +1036,8 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK-3',
@@ -1242,19 +1056,8 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
         'SWYConverszGenAlbum-Trashed State-16',
         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-18',
-        'SWYConverszGenAlbum-Privacy State-19')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-19')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
         DateTime(SWYConverszGenAlbum.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Start Date',
@@ -1344,15 +1147,8 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
              = zCldShareAlbumInvRec.ZALBUM
         WHERE SWYConverszGenAlbum.ZKIND = 1509
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19]))
-
-        data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
+        ''',
+        (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
         'zAsset- Conversation= zGenAlbum_zPK-3',
@@ -1371,7 +1167,16 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(context):
         'SWYConverszGenAlbum-Trashed State-16',
         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-18',
-        'SWYConverszGenAlbum-Privacy State-19')
-        data_list = list(get_sqlite_db_records(source_path, query))
+        'SWYConverszGenAlbum-Privacy State-19')),
+    ),
+}
+
+
+@artifact_processor
+def Ph025_1SWYConversationRecordswithNADPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph025_1SWYConversationRecordswithNADPhDaPsql'])
+
 
-        return data_headers, data_list, source_path
+@artifact_processor
+def Ph025_2SWYConversationRecordswithNADSyndPL(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph025_2SWYConversationRecordswithNADSyndPL'], 'Syndication.photoslibrary')
@@ -82,35 +82,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph026_1SyndicationIDAssetsPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version from PhotoData-Photos.sqlite for iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph026_1SyndicationIDAssetsPhDaPsql': (
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -252,17 +230,8 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -305,19 +274,8 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
         'SWYConverszGenAlbum-Custom Query Type-40',
         'SWYConverszGenAlbum-Trashed State-41',
         ('SWYConverszGenAlbum-Trash Date-42', 'datetime'),
-        'SWYConverszGenAlbum-Cloud Delete State-43')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Cloud Delete State-43')),
+        PhotosQuery('16', '17.6', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -471,18 +429,8 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -528,19 +476,8 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
         'SWYConverszGenAlbum-Trashed State-43',
         ('SWYConverszGenAlbum-Trash Date-44', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-45',
-        'SWYConverszGenAlbum-Privacy State-46')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-46')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -694,18 +631,8 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -751,19 +678,8 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
         'SWYConverszGenAlbum-Trashed State-43',
         ('SWYConverszGenAlbum-Trash Date-44', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-45',
-        'SWYConverszGenAlbum-Privacy State-46')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-46')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -918,18 +834,8 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -976,19 +882,8 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
         'SWYConverszGenAlbum-Trashed State-44',
         ('SWYConverszGenAlbum-Trash Date-45', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-46',
-        'SWYConverszGenAlbum-Privacy State-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-47')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -1143,18 +1038,8 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -1201,36 +1086,10 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(context):
         'SWYConverszGenAlbum-Trashed State-44',
         ('SWYConverszGenAlbum-Trash Date-45', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-46',
-        'SWYConverszGenAlbum-Privacy State-47')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph026_2SyndicationPLAssetsSyndPL(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version from Syndication.photoslibrary for iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-47')),
+    ),
+    'Ph026_2SyndicationPLAssetsSyndPL': (
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -1372,17 +1231,8 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -1425,19 +1275,8 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
         'SWYConverszGenAlbum-Custom Query Type-40',
         'SWYConverszGenAlbum-Trashed State-41',
         ('SWYConverszGenAlbum-Trash Date-42', 'datetime'),
-        'SWYConverszGenAlbum-Cloud Delete State-43')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Cloud Delete State-43')),
+        PhotosQuery('16', '17.6', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -1591,18 +1430,8 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -1648,19 +1477,8 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
         'SWYConverszGenAlbum-Trashed State-43',
         ('SWYConverszGenAlbum-Trash Date-44', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-45',
-        'SWYConverszGenAlbum-Privacy State-46')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-46')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -1814,18 +1632,8 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -1871,19 +1679,8 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
         'SWYConverszGenAlbum-Trashed State-43',
         ('SWYConverszGenAlbum-Trash Date-44', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-45',
-        'SWYConverszGenAlbum-Privacy State-46')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-46')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -2038,18 +1835,8 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -2096,19 +1883,8 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
         'SWYConverszGenAlbum-Trashed State-44',
         ('SWYConverszGenAlbum-Trash Date-45', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-46',
-        'SWYConverszGenAlbum-Privacy State-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SWYConverszGenAlbum-Privacy State-47')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         DateTime(SWYConverszGenAlbum.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'SWYConverszGenAlbum-Creation Date',
@@ -2263,18 +2039,8 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         WHERE zAddAssetAttr.ZSYNDICATIONIDENTIFIER IS NOT NULL
         ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
         ('SWYConverszGenAlbum-End Date-3', 'datetime'),
@@ -2321,7 +2087,16 @@ def Ph026_2SyndicationPLAssetsSyndPL(context):
         'SWYConverszGenAlbum-Trashed State-44',
         ('SWYConverszGenAlbum-Trash Date-45', 'datetime'),
         'SWYConverszGenAlbum-Cloud Delete State-46',
-        'SWYConverszGenAlbum-Privacy State-47')
-        data_list = list(get_sqlite_db_records(source_path, query))
+        'SWYConverszGenAlbum-Privacy State-47')),
+    ),
+}
+
+
+@artifact_processor
+def Ph026_1SyndicationIDAssetsPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph026_1SyndicationIDAssetsPhDaPsql'])
+
 
-        return data_headers, data_list, source_path
+@artifact_processor
+def Ph026_2SyndicationPLAssetsSyndPL(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph026_2SyndicationPLAssetsSyndPL'], 'Syndication.photoslibrary')
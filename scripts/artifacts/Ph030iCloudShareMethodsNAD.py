@@ -36,35 +36,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph030iCloudSharedMethodswithNADPhDaPsql': (
+        PhotosQuery('14', '16', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -151,16 +129,8 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         FROM ZSHARE zShare
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -191,19 +161,8 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         'zShare-Should Ignore Budgets-28',
         'zShare-Trashed State-29',
         'zShare-Cloud Delete State-30',
-        'zShare-zENT-31')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zShare-zENT-31')),
+        PhotosQuery('16', '17.6', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -343,18 +302,8 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         FROM ZSHARE zShare
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -403,19 +352,8 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         ('zShare-Trashed Date-46', 'datetime'),
         ('zShare-LastParticipant Asset Trash Notification Date-47', 'datetime'),
         ('zShare-Last Participant Asset Trash Notification View Date-48', 'datetime'),
-        'zShare-zENT-49')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zShare-zENT-49')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -555,18 +493,8 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         FROM ZSHARE zShare
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -615,19 +543,8 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         ('zShare-Trashed Date-46', 'datetime'),
         ('zShare-LastParticipant Asset Trash Notification Date-47', 'datetime'),
         ('zShare-Last Participant Asset Trash Notification View Date-48', 'datetime'),
-        'zShare-zENT-49')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zShare-zENT-49')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -767,18 +684,8 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         FROM ZSHARE zShare
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -827,19 +734,8 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         ('zShare-Trashed Date-46', 'datetime'),
         ('zShare-LastParticipant Asset Trash Notification Date-47', 'datetime'),
         ('zShare-Last Participant Asset Trash Notification View Date-48', 'datetime'),
-        'zShare-zENT-49')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zShare-zENT-49')),
+        PhotosQuery('26', '27', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -978,18 +874,8 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         FROM ZSHARE zShare
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -1037,8 +923,11 @@ def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
         ('zShare-Trashed Date-45', 'datetime'),
         ('zShare-LastParticipant Asset Trash Notification Date-46', 'datetime'),
         ('zShare-Last Participant Asset Trash Notification View Date-47', 'datetime'),
-        'zShare-zENT-48')
-        data_list = list(get_sqlite_db_records(source_path, query))
+        'zShare-zENT-48')),
+    ),
+}
 
-        return data_headers, data_list, source_path
 
+@artifact_processor
+def Ph030iCloudSharedMethodswithNADPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph030iCloudSharedMethodswithNADPhDaPsql'])
@@ -36,35 +36,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph033iCldSPLAssetsfromothercontribPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("15.8.2")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version PhotoData-Photos.sqlite from iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph033iCldSPLAssetsfromothercontribPhDaPsql': (
+        PhotosQuery('16', '18', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         CASE zAsset.ZACTIVELIBRARYSCOPEPARTICIPATIONSTATE
@@ -211,18 +189,8 @@ def Ph033iCldSPLAssetsfromothercontribPhDaPsql(context):
           LEFT JOIN ZSHAREPARTICIPANT SPLzSharePartic ON SPLzSharePartic.Z_PK = zAssetContrib.ZPARTICIPANT
         WHERE SPLzSharePartic.ZISCURRENTUSER = 0
         ORDER BY zAsset.ZDATECREATED     
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-Active Library Scope Participation State-1',
         'zAsset-zPK-2',
         'zAsset-Directory-Path-3',
@@ -269,19 +237,8 @@ def Ph033iCldSPLAssetsfromothercontribPhDaPsql(context):
         ('SPLzShare-Expiry Date-SPL-44', 'datetime'),
         'SPLzShare-Cloud Photo Count-SPL-45',
         'SPLzShare-Assets AddedByCamera SmartSharing-46',
-        'SPLzShare-Cloud Video Count-SPL-47')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'SPLzShare-Cloud Video Count-SPL-47')),
+        PhotosQuery('18', '27', '''
         SELECT
         DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created',
         CASE zAsset.ZACTIVELIBRARYSCOPEPARTICIPATIONSTATE
@@ -456,18 +413,8 @@ def Ph033iCldSPLAssetsfromothercontribPhDaPsql(context):
           LEFT JOIN ZSHAREPARTICIPANT SPLzSharePartic ON SPLzSharePartic.Z_PK = zAssetContrib.ZPARTICIPANT
         WHERE zAsset.ZACTIVELIBRARYSCOPEPARTICIPATIONSTATE = 1
         ORDER BY zAsset.ZDATECREATED     
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53]))
-
-        data_headers = (('zAsset-Date Created-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-0', 'datetime'),
         'zAsset-Active Library Scope Participation State-1',
         'zAsset-zPK-2',
         'zAsset-Directory-Path-3',
@@ -520,7 +467,11 @@ def Ph033iCldSPLAssetsfromothercontribPhDaPsql(context):
         'SPLzShare-Assets AddedByCamera SmartSharing-50',
         'SPLzShare-Cloud Video Count-SPL-51',
         'zExtAttr-Generative_AI_Type-52',
-        'zExtAttr-Credit-53')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zExtAttr-Credit-53')),
+    ),
+}
+
 
-        return data_headers, data_list, source_path
+@artifact_processor
+def Ph033iCldSPLAssetsfromothercontribPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph033iCldSPLAssetsfromothercontribPhDaPsql'])
@@ -33,35 +33,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("26")):
-        logfunc("Unsupported version PhotoData-Photos.sqlite from iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph035iCloudSharedLinkAssetsPhDaPsql': (
+        PhotosQuery('14', '15', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -193,18 +171,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         WHERE zAsset.ZSAVEDASSETTYPE = 8
         ORDER BY zShare.ZCREATIONDATE        
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -257,19 +225,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
         'zShare-Should Ignor Budgets-50',
         'zShare-Trashed State-51',
         'zShare-Cloud Delete State-52',
-        'zShare-zENT-53')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zShare-zENT-53')),
+        PhotosQuery('15', '16', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -419,19 +376,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         WHERE zAsset.ZSAVEDASSETTYPE = 8
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -487,19 +433,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
         'zShare-Should Ignor Budgets-53',
         'zShare-Trashed State-54',
         'zShare-Cloud Delete State-55',
-        'zShare-zENT-56')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zShare-zENT-56')),
+        PhotosQuery('16', '17', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -735,21 +670,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         WHERE zAsset.ZSAVEDASSETTYPE = 8
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -825,19 +747,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
         ('zShare-Trashed Date-73', 'datetime'),
         ('zShare-LastParticipant Asset Trash Notification Date-74', 'datetime'),
         ('zShare-Last Participant Asset Trash Notification View Date-75', 'datetime'),
-        'zShare-zENT-76')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("17.6")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zShare-zENT-76')),
+        PhotosQuery('17', '17.6', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -1094,21 +1005,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         WHERE zAsset.ZSAVEDASSETTYPE = 8
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -1189,19 +1087,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
         ('zShare-Trashed Date-78', 'datetime'),
         ('zShare-LastParticipant Asset Trash Notification Date-79', 'datetime'),
         ('zShare-Last Participant Asset Trash Notification View Date-80', 'datetime'),
-        'zShare-zENT-81')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zShare-zENT-81')),
+        PhotosQuery('17.6', '18', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -1458,21 +1345,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         WHERE zAsset.ZSAVEDASSETTYPE = 8
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -1553,19 +1427,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
         ('zShare-Trashed Date-78', 'datetime'),
         ('zShare-LastParticipant Asset Trash Notification Date-79', 'datetime'),
         ('zShare-Last Participant Asset Trash Notification View Date-80', 'datetime'),
-        'zShare-zENT-81')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zShare-zENT-81')),
+        PhotosQuery('18', '26', '''
         SELECT
         DateTime(zShare.ZCREATIONDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Creation Date',
         DateTime(zShare.ZSTARTDATE + 978307200, 'UNIXEPOCH') AS 'zShare-Start Date',
@@ -1822,21 +1685,8 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
             LEFT JOIN ZSHAREPARTICIPANT zSharePartic ON zSharePartic.ZSHARE = zShare.Z_PK
         WHERE zAsset.ZSAVEDASSETTYPE = 8
         ORDER BY zShare.ZCREATIONDATE
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81]))
-
-        data_headers = (('zShare-Creation Date-0', 'datetime'),
+        ''',
+        (('zShare-Creation Date-0', 'datetime'),
         ('zShare-Start Date-1', 'datetime'),
         ('zShare-End Date-2', 'datetime'),
         ('zShare-Expiry Date-3', 'datetime'),
@@ -1917,7 +1767,11 @@ def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
         ('zShare-Trashed Date-78', 'datetime'),
         ('zShare-LastParticipant Asset Trash Notification Date-79', 'datetime'),
         ('zShare-Last Participant Asset Trash Notification View Date-80', 'datetime'),
-        'zShare-zENT-81')
-# data_list = get_sqlite_db_records(source_path, query)
+        'zShare-zENT-81')),
+    ),
+}
+
 
-        return data_headers, data_list, source_path
+@artifact_processor
+def Ph035iCloudSharedLinkAssetsPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph035iCloudSharedLinkAssetsPhDaPsql'])
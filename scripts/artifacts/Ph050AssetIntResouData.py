@@ -98,35 +98,13 @@ __artifacts_v2__ = {
 }
 }
 
-import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor
+from scripts.photos_sqlite import PhotosQuery, run_photos_query
 
-@artifact_processor
-def Ph050_1AssetIntResouPhDaPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite from iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+# The queries of each artifact by range of iOS versions, run by run_photos_query
+PHOTOS_QUERIES = {
+    'Ph050_1AssetIntResouPhDaPsql': (
+        PhotosQuery('14', '15', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -844,41 +822,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
 			LEFT JOIN ZCLOUDMASTERMEDIAMETADATA CMzCldMastMedData ON CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 		ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
@@ -1116,19 +1061,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-235',
         'zMedAnlyAstAttr-zEnt-236',
         'zMedAnlyAstAttr-zOpt-237',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-238')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found,"Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-238')),
+        PhotosQuery('15', '16', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -1928,44 +1862,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
 			LEFT JOIN ZCLOUDMASTERMEDIAMETADATA CMzCldMastMedData ON CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 		ORDER BY zAsset.ZDATECREATED
-        '''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+        ''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
@@ -2227,19 +2125,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-259',
         'zMedAnlyAstAttr-zEnt-260',
         'zMedAnlyAstAttr-zOpt-261',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-262')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-262')),
+        PhotosQuery('16', '17', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -3073,45 +2960,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
 			LEFT JOIN ZCLOUDMASTERMEDIAMETADATA CMzCldMastMedData ON CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
@@ -3382,19 +3232,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-268',
         'zMedAnlyAstAttr-zEnt-269',
         'zMedAnlyAstAttr-zOpt-270',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-271')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-271')),
+        PhotosQuery('17', '18', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -4234,45 +4073,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
 			LEFT JOIN ZCLOUDMASTERMEDIAMETADATA CMzCldMastMedData ON CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271], row[272], row[273], row[274]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-1',
         'zAddAssetAttr-zPK-2',
         'zAsset-UUID = store.cloudphotodb-3',
@@ -4546,19 +4348,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-271',
         'zMedAnlyAstAttr-zEnt-272',
         'zMedAnlyAstAttr-zOpt-273',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-274')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-274')),
+        PhotosQuery('18', '26', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -5463,49 +5254,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 			LEFT JOIN ZCOMPUTESYNCATTRIBUTES zCompSyncAttr ON zCompSyncAttr.Z_PK = zAsset.ZCOMPUTESYNCATTRIBUTES
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271], row[272], row[273], row[274], row[275],
-            row[276], row[277], row[278], row[279], row[280], row[281], row[282], row[283],
-            row[284], row[285], row[286], row[287], row[288], row[289], row[290], row[291],
-            row[292], row[293], row[294], row[295], row[296], row[297], row[298], row[299],
-            row[300], row[301], row[302]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-1',
         'zAddAssetAttr-zPK-2',
         'zAsset-UUID = store.cloudphotodb-3',
@@ -5807,19 +5557,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-300',
         'zMedAnlyAstAttr-zEnt-301',
         'zMedAnlyAstAttr-zOpt-302',
-        'zMedAnlyAstAttr-Asset= zAsset-Zpk-303')
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-Zpk-303')),
+        PhotosQuery('26', '27', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart- datetime',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -6710,49 +6449,8 @@ def Ph050_1AssetIntResouPhDaPsql(context):
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 			LEFT JOIN ZCOMPUTESYNCATTRIBUTES zCompSyncAttr ON zCompSyncAttr.Z_PK = zAsset.ZCOMPUTESYNCATTRIBUTES
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271], row[272], row[273], row[274], row[275],
-            row[276], row[277], row[278], row[279], row[280], row[281], row[282], row[283],
-            row[284], row[285], row[286], row[287], row[288], row[289], row[290], row[291],
-            row[292], row[293], row[294], row[295], row[296], row[297], row[298], row[299],
-            row[300]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart- datetime-0',  'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart- datetime-0',  'datetime'),
         'zAsset-zPK-1',
         'zAddAssetAttr-zPK-2',
         'zAsset-UUID = store.cloudphotodb-3',
@@ -7052,37 +6750,10 @@ def Ph050_1AssetIntResouPhDaPsql(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-297',
         'zMedAnlyAstAttr-zEnt-298',
         'zMedAnlyAstAttr-zOpt-299',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-300')
-
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph050_2AssetIntResouSyndPL(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for PhotoData-Photos.sqlite from iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-300')),
+    ),
+    'Ph050_2AssetIntResouSyndPL': (
+        PhotosQuery('14', '15', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -7800,41 +7471,8 @@ def Ph050_2AssetIntResouSyndPL(context):
 			LEFT JOIN ZCLOUDMASTERMEDIAMETADATA CMzCldMastMedData ON CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
@@ -8072,19 +7710,8 @@ def Ph050_2AssetIntResouSyndPL(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-235',
         'zMedAnlyAstAttr-zEnt-236',
         'zMedAnlyAstAttr-zOpt-237',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-238')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-238')),
+        PhotosQuery('15', '16', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -8884,44 +8511,8 @@ def Ph050_2AssetIntResouSyndPL(context):
 			LEFT JOIN ZCLOUDMASTERMEDIAMETADATA CMzCldMastMedData ON CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
@@ -9183,19 +8774,8 @@ def Ph050_2AssetIntResouSyndPL(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-259',
         'zMedAnlyAstAttr-zEnt-260',
         'zMedAnlyAstAttr-zOpt-261',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-262')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-262')),
+        PhotosQuery('16', '17', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -10029,45 +9609,8 @@ def Ph050_2AssetIntResouSyndPL(context):
 			LEFT JOIN ZCLOUDMASTERMEDIAMETADATA CMzCldMastMedData ON CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-7',
         'zAddAssetAttr-zPK-8',
         'zAsset-UUID = store.cloudphotodb-9',
@@ -10338,19 +9881,8 @@ def Ph050_2AssetIntResouSyndPL(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-268',
         'zMedAnlyAstAttr-zEnt-269',
         'zMedAnlyAstAttr-zOpt-270',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-271')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("18")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-271')),
+        PhotosQuery('17', '18', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -11190,45 +10722,8 @@ def Ph050_2AssetIntResouSyndPL(context):
 			LEFT JOIN ZCLOUDMASTERMEDIAMETADATA CMzCldMastMedData ON CMzCldMastMedData.Z_PK = zCldMast.ZMEDIAMETADATA
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271], row[272], row[273], row[274]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-1',
         'zAddAssetAttr-zPK-2',
         'zAsset-UUID = store.cloudphotodb-3',
@@ -11502,19 +10997,8 @@ def Ph050_2AssetIntResouSyndPL(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-271',
         'zMedAnlyAstAttr-zEnt-272',
         'zMedAnlyAstAttr-zOpt-273',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-274')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-274')),
+        PhotosQuery('18', '26', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -12419,49 +11903,8 @@ def Ph050_2AssetIntResouSyndPL(context):
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 			LEFT JOIN ZCOMPUTESYNCATTRIBUTES zCompSyncAttr ON zCompSyncAttr.Z_PK = zAsset.ZCOMPUTESYNCATTRIBUTES
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271], row[272], row[273], row[274], row[275],
-            row[276], row[277], row[278], row[279], row[280], row[281], row[282], row[283],
-            row[284], row[285], row[286], row[287], row[288], row[289], row[290], row[291],
-            row[292], row[293], row[294], row[295], row[296], row[297], row[298], row[299],
-            row[300], row[301], row[302]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-1',
         'zAddAssetAttr-zPK-2',
         'zAsset-UUID = store.cloudphotodb-3',
@@ -12763,19 +12206,8 @@ def Ph050_2AssetIntResouSyndPL(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-300',
         'zMedAnlyAstAttr-zEnt-301',
         'zMedAnlyAstAttr-zOpt-302',
-        'zMedAnlyAstAttr-Asset= zAsset-Zpk-303')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-Zpk-303')),
+        PhotosQuery('26', '27', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart- datetime',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -13666,49 +13098,8 @@ def Ph050_2AssetIntResouSyndPL(context):
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 			LEFT JOIN ZCOMPUTESYNCATTRIBUTES zCompSyncAttr ON zCompSyncAttr.Z_PK = zAsset.ZCOMPUTESYNCATTRIBUTES
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271], row[272], row[273], row[274], row[275],
-            row[276], row[277], row[278], row[279], row[280], row[281], row[282], row[283],
-            row[284], row[285], row[286], row[287], row[288], row[289], row[290], row[291],
-            row[292], row[293], row[294], row[295], row[296], row[297], row[298], row[299],
-            row[300]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart- datetime-0',  'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart- datetime-0',  'datetime'),
         'zAsset-zPK-1',
         'zAddAssetAttr-zPK-2',
         'zAsset-UUID = store.cloudphotodb-3',
@@ -14008,37 +13399,10 @@ def Ph050_2AssetIntResouSyndPL(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-297',
         'zMedAnlyAstAttr-zEnt-298',
         'zMedAnlyAstAttr-zOpt-299',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-300')
-
-        data_list = list(get_sqlite_db_records(source_path, query))
-
-        return data_headers, data_list, source_path
-
-@artifact_processor
-def Ph050_3AssetIntResouGenPlayPsql(context):
-    files_found = context.get_files_found()
-    report_folder = context.get_report_folder()
-    source_path = ''
-    for source_path in files_found:
-        source_path = str(source_path)
-
-        if source_path.endswith('.sqlite'):
-            break
-
-    if report_folder.endswith('/') or report_folder.endswith('\\'):
-        report_folder = report_folder[:-1]
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):
-        logfunc("Unsupported version for GenPlay-Photos.sqlite from iOS " + iosversion)
-        return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-300')),
+    ),
+    'Ph050_3AssetIntResouGenPlayPsql': (
+        PhotosQuery('18', '26', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -14943,49 +14307,8 @@ def Ph050_3AssetIntResouGenPlayPsql(context):
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 			LEFT JOIN ZCOMPUTESYNCATTRIBUTES zCompSyncAttr ON zCompSyncAttr.Z_PK = zAsset.ZCOMPUTESYNCATTRIBUTES
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271], row[272], row[273], row[274], row[275],
-            row[276], row[277], row[278], row[279], row[280], row[281], row[282], row[283],
-            row[284], row[285], row[286], row[287], row[288], row[289], row[290], row[291],
-            row[292], row[293], row[294], row[295], row[296], row[297], row[298], row[299],
-            row[300], row[301], row[302]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart-0', 'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart-0', 'datetime'),
         'zAsset-zPK-1',
         'zAddAssetAttr-zPK-2',
         'zAsset-UUID = store.cloudphotodb-3',
@@ -15287,19 +14610,8 @@ def Ph050_3AssetIntResouGenPlayPsql(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-300',
         'zMedAnlyAstAttr-zEnt-301',
         'zMedAnlyAstAttr-zOpt-302',
-        'zMedAnlyAstAttr-Asset= zAsset-Zpk-303')
-# data_list = get_sqlite_db_records(source_path, query)
-
-        return data_headers, data_list, source_path
-
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
-        source_path = get_file_path(files_found, "Photos.sqlite")
-        if source_path is None or not os.path.exists(source_path):
-            logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
-            return (), [], source_path
-        data_list = []
-
-        query = '''
+        'zMedAnlyAstAttr-Asset= zAsset-Zpk-303')),
+        PhotosQuery('26', '27', '''
 		SELECT
 		DateTime(zAsset.ZDATECREATED + 978307200, 'UNIXEPOCH') AS 'zAsset-Date Created-4QueryStart- datetime',
 		zAsset.Z_PK AS 'zAsset-zPK',
@@ -16190,49 +15502,8 @@ def Ph050_3AssetIntResouGenPlayPsql(context):
 			LEFT JOIN ZMEDIAANALYSISASSETATTRIBUTES zMedAnlyAstAttr ON zAsset.ZMEDIAANALYSISATTRIBUTES = zMedAnlyAstAttr.Z_PK
 			LEFT JOIN ZCOMPUTESYNCATTRIBUTES zCompSyncAttr ON zCompSyncAttr.Z_PK = zAsset.ZCOMPUTESYNCATTRIBUTES
 		ORDER BY zAsset.ZDATECREATED
-		'''
-
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-            row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-            row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-            row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-            row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-            row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-            row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-            row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-            row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-            row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-            row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-            row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-            row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-            row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-            row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-            row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-            row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-            row[268], row[269], row[270], row[271], row[272], row[273], row[274], row[275],
-            row[276], row[277], row[278], row[279], row[280], row[281], row[282], row[283],
-            row[284], row[285], row[286], row[287], row[288], row[289], row[290], row[291],
-            row[292], row[293], row[294], row[295], row[296], row[297], row[298], row[299],
-            row[300]))
-
-        data_headers = (('zAsset-Date Created-4QueryStart- datetime-0',  'datetime'),
+		''',
+        (('zAsset-Date Created-4QueryStart- datetime-0',  'datetime'),
         'zAsset-zPK-1',
         'zAddAssetAttr-zPK-2',
         'zAsset-UUID = store.cloudphotodb-3',
@@ -16532,8 +15803,21 @@ def Ph050_3AssetIntResouGenPlayPsql(context):
         'zMedAnlyAstAttr-zPK= zAddAssetAttr-Media Metadata-297',
         'zMedAnlyAstAttr-zEnt-298',
         'zMedAnlyAstAttr-zOpt-299',
-        'zMedAnlyAstAttr-Asset= zAsset-zPK-300')
+        'zMedAnlyAstAttr-Asset= zAsset-zPK-300')),
+    ),
+}
+
+
+@artifact_processor
+def Ph050_1AssetIntResouPhDaPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph050_1AssetIntResouPhDaPsql'])
 
-        data_list = list(get_sqlite_db_records(source_path, query))
 
-        return data_headers, data_list, source_path
+@artifact_processor
+def Ph050_2AssetIntResouSyndPL(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph050_2AssetIntResouSyndPL'])
+
+
+@artifact_processor
+def Ph050_3AssetIntResouGenPlayPsql(context):
+    return run_photos_query(context, PHOTOS_QUERIES['Ph050_3AssetIntResouGenPlayPsql'], 'GenPlay-Photos.sqlite')
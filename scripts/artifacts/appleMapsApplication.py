@@ -31,7 +31,7 @@ __artifacts_v2__ = {
 }
 
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from scripts.ilapfuncs import artifact_processor, get_file_path, get_plist_file_content
 
 @artifact_processor
@@ -55,7 +55,7 @@ def appleMapsApplication(context):
     
     protobuf = plist.get('__internal__LastActivityCamera', None)
     if protobuf:
-        internal_plist, _ = blackboxprotobuf.decode_message(protobuf,types)
+        internal_plist = decode_protobuf(protobuf,types)
         latitude = (internal_plist['Latitude'])
         longitude = (internal_plist['Longitude'])
         
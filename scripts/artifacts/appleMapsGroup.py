@@ -31,7 +31,7 @@ __artifacts_v2__ = {
     }
 }
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from scripts.ilapfuncs import artifact_processor, get_file_path, get_plist_file_content
 
 @artifact_processor
@@ -59,7 +59,7 @@ def appleMapsGroup(context):
                                 '7': {'type': 'int', 'name': ''}},
                         'name': ''}
                 }    
-        internal_deserialized_plist, _ = blackboxprotobuf.decode_message(maps_activity, types)
+        internal_deserialized_plist = decode_protobuf(maps_activity, types)
         latitude = (internal_deserialized_plist['1']['5']['Latitude'])
         longitude = (internal_deserialized_plist['1']['5']['Longitude'])
         data_list.append((latitude, longitude))
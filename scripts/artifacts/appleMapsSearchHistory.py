@@ -21,7 +21,7 @@ __artifacts_v2__ = {
     }
 }
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 import base64
 import binascii
 import pprint
@@ -46,7 +46,7 @@ def get_nested_value(data, path):
 
 def longbase64proto(longstuff, longtypes):
     longstuff = longstuff.split('placeRequest=')[1]
-    longstuff, _ = blackboxprotobuf.decode_message(base64.b64decode(longstuff), longtypes)
+    longstuff = decode_protobuf(base64.b64decode(longstuff), longtypes)
     return longstuff
 
 
@@ -54,7 +54,7 @@ def shortbase64proto(shortstuff, shorttypes):
     try:
         shortstuff = shortstuff.split('=', 1)[1]
         shortstuff += '=' * (-len(shortstuff) % 4)
-        shortstuff, _ = blackboxprotobuf.decode_message(base64.b64decode(shortstuff), shorttypes)
+        shortstuff = decode_protobuf(base64.b64decode(shortstuff), shorttypes)
         return shortstuff
     except (binascii.Error, ValueError) as ex:
         logfunc(f"Error decoding Apple Maps Search History protobuf: {ex}")
@@ -100,7 +100,7 @@ def get_appleMapsSearchHistory(context):
                                                 if isinstance(h, datetime) and h.tzinfo is None else h)
                         if g == 'contents':
                             
-                            protostuff, _ = blackboxprotobuf.decode_message(h)
+                            protostuff = decode_protobuf(h)
                             #pp.pprint(protostuff)
                             items = (protostuff)
                             if protostuff.get('7'):
@@ -27,9 +27,9 @@ __artifacts_v2__ = {
 }
 
 import os
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from datetime import timezone
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
 from scripts.ilapfuncs import artifact_processor, webkit_timestampsconv
 
@@ -98,7 +98,7 @@ def get_biomeAirpMode(context):
             ts = ts.replace(tzinfo=timezone.utc)
 
             if record.state == EntryState.Written:
-                protostuff, _ = blackboxprotobuf.decode_message(record.data, typess)
+                protostuff = decode_protobuf(record.data, typess)
                 timestart = (webkit_timestampsconv(protostuff['2']))
                 timeend = (webkit_timestampsconv(protostuff['3']))
                 event = protostuff['1']['1']
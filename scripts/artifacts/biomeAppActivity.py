@@ -28,11 +28,11 @@ import struct
 from datetime import datetime, timezone
 from urllib.parse import unquote
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, logfunc
+from scripts.ilapfuncs import artifact_processor, logdebug
 
 _DECODE_ERRORS = (DecodeError, struct.error, KeyError, ValueError, TypeError,
                   IndexError)
@@ -95,10 +95,10 @@ def get_biomeAppActivity(context):
 
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data, TYPESS)
+                    protostuff = decode_protobuf(record.data, TYPESS)
                 except _DECODE_ERRORS as ex:
-                    logfunc(f'App Activity: could not decode record at offset '
-                            f'{record.data_start_offset} in {filename}: {ex}')
+                    logdebug(f'App Activity: could not decode record at offset '
+                             f'{record.data_start_offset} in {filename}: {ex}')
                     continue
 
                 expiration = _unix_double(protostuff.get('5'))
@@ -25,11 +25,11 @@ import os
 import struct
 from datetime import datetime, timezone
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, logfunc
+from scripts.ilapfuncs import artifact_processor, logdebug
 
 _DECODE_ERRORS = (DecodeError, struct.error, KeyError, ValueError, TypeError,
                   IndexError)
@@ -80,10 +80,10 @@ def get_biomeAppInstallation(context):
 
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data)
+                    protostuff = decode_protobuf(record.data)
                 except _DECODE_ERRORS as ex:
-                    logfunc(f'App Installation: could not decode record at offset '
-                            f'{record.data_start_offset} in {filename}: {ex}')
+                    logdebug(f'App Installation: could not decode record at offset '
+                             f'{record.data_start_offset} in {filename}: {ex}')
                     continue
 
                 app = protostuff.get('1', {})
@@ -27,11 +27,11 @@ import os
 import struct
 from datetime import datetime, timezone
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, logfunc
+from scripts.ilapfuncs import artifact_processor, logdebug
 
 _DECODE_ERRORS = (DecodeError, struct.error, KeyError, ValueError, TypeError,
                   IndexError)
@@ -118,10 +118,10 @@ def get_biomeAppIntentsTranscript(context):
 
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data)
+                    protostuff = decode_protobuf(record.data)
                 except _DECODE_ERRORS as ex:
-                    logfunc(f'App Intents Transcript: could not decode record at offset '
-                            f'{record.data_start_offset} in {filename}: {ex}')
+                    logdebug(f'App Intents Transcript: could not decode record at offset '
+                             f'{record.data_start_offset} in {filename}: {ex}')
                     continue
 
                 intent = protostuff.get('5', {})
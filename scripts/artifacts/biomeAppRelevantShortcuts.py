@@ -25,12 +25,12 @@ import struct
 from datetime import datetime as _dt
 from datetime import timezone
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
 from scripts.ilapfuncs import (artifact_processor, convert_time_obj_to_utc, get_plist_content,
-                               logfunc)
+                               logdebug)
 
 _DECODE_ERRORS = (DecodeError, struct.error, KeyError, ValueError, TypeError,
                   IndexError)
@@ -96,11 +96,11 @@ def get_biomeAppRelevantShortcuts(context):
 
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data)
+                    protostuff = decode_protobuf(record.data)
                     plist = get_plist_content(protostuff.get('3'))
                 except _DECODE_ERRORS as ex:
-                    logfunc(f'App Relevant Shortcuts: could not decode record at offset '
-                            f'{record.data_start_offset} in {filename}: {ex}')
+                    logdebug(f'App Relevant Shortcuts: could not decode record at offset '
+                             f'{record.data_start_offset} in {filename}: {ex}')
                     continue
 
                 if not isinstance(plist, dict):
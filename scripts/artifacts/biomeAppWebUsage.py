@@ -27,8 +27,8 @@ __artifacts_v2__ = {
 
 import os
 from datetime import timezone
-from scripts import blackboxprotobuf
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.protobuf_decoder import decode_protobuf
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
 from scripts.ilapfuncs import artifact_processor, webkit_timestampsconv
 
@@ -81,7 +81,7 @@ def get_biomeAppWebUsage(context):
             ts = ts.replace(tzinfo=timezone.utc)
 
             if record.state == EntryState.Written:
-                protostuff, _types = blackboxprotobuf.decode_message(record.data, typess)
+                protostuff = decode_protobuf(record.data, typess)
 
                 guid               = protostuff.get('bundle_id', '')
                 timestamp          = webkit_timestampsconv(protostuff['timestamp'])
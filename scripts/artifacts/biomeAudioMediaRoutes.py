@@ -51,11 +51,11 @@ import os
 import struct
 from datetime import timezone
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, logfunc
+from scripts.ilapfuncs import artifact_processor, logdebug
 
 _DECODE_ERRORS = (DecodeError, struct.error, KeyError, ValueError, TypeError,
                   IndexError)
@@ -97,11 +97,10 @@ def _iter_records(context, label, typess=None):
             ts = record.timestamp1.replace(tzinfo=timezone.utc)
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data, typess) \
-                        if typess else blackboxprotobuf.decode_message(record.data)
+                    protostuff = decode_protobuf(record.data, typess)
                 except _DECODE_ERRORS as ex:
-                    logfunc(f'{label}: could not decode record at offset '
-                            f'{record.data_start_offset} in {filename}: {ex}')
+                    logdebug(f'{label}: could not decode record at offset '
+                             f'{record.data_start_offset} in {filename}: {ex}')
                     continue
                 yield ts, record, protostuff, filename
             elif record.state == EntryState.Deleted:
@@ -32,9 +32,9 @@ __artifacts_v2__ = {
 
 
 import os
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from datetime import timezone
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
 from scripts.ilapfuncs import artifact_processor
 
@@ -59,7 +59,7 @@ def get_biomeBluetooth(context):
             ts = ts.replace(tzinfo=timezone.utc)
 
             if record.state == EntryState.Written:
-                protostuff, _ = blackboxprotobuf.decode_message(record.data)
+                protostuff = decode_protobuf(record.data)
                 
                 mac = protostuff['1'].decode()
                 if isinstance(protostuff['2'], dict):
@@ -31,11 +31,11 @@ __artifacts_v2__ = {
 import os
 import struct
 from datetime import timezone
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, webkit_timestampsconv, logfunc
+from scripts.ilapfuncs import artifact_processor, webkit_timestampsconv, logdebug
 
 
 @artifact_processor
@@ -84,7 +84,7 @@ def get_biomeDKInfocus(context):
 
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data, typess)
+                    protostuff = decode_protobuf(record.data, typess)
 
                     activity = (protostuff['1']['1'])
                     timestart = (webkit_timestampsconv(protostuff['2']))
@@ -101,9 +101,9 @@ def get_biomeDKInfocus(context):
                     else:
                         transition = ''
                 except (DecodeError, struct.error, KeyError, ValueError, TypeError, IndexError) as ex:
-                    logfunc(f"Skipping biomeDKInfocus record due to protobuf decode error: {ex} | "
-                            f"File: {context.get_relative_path(file_found)} | "
-                            f"Offset: {record.data_start_offset}")
+                    logdebug(f"Skipping biomeDKInfocus record due to protobuf decode error: {ex} | "
+                             f"File: {context.get_relative_path(file_found)} | "
+                             f"Offset: {record.data_start_offset}")
                     continue
 
                 data_list.append((ts, timestart, timeend, timewrite, record.state.name, activity, bundleid, transition,
@@ -31,11 +31,11 @@ __artifacts_v2__ = {
 import os
 import struct
 from datetime import timezone
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, webkit_timestampsconv, logfunc
+from scripts.ilapfuncs import artifact_processor, webkit_timestampsconv, logdebug
 
 
 @artifact_processor
@@ -97,16 +97,16 @@ def get_biomeDKKeybag(context):
 
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data, typess)
+                    protostuff = decode_protobuf(record.data, typess)
 
                     time2 = (webkit_timestampsconv(protostuff['2']))
                     time3 = (webkit_timestampsconv(protostuff['3']))
 
                     data_list.append((ts, time2, time3, '1 - Locked ' if protostuff['4']['4'] == 1 else '0 - Unlocked', filename))
                 except (DecodeError, struct.error, KeyError, ValueError, TypeError, IndexError) as ex:
-                    logfunc(f"Skipping biomeDKKeybag record due to protobuf decode error: {ex} | "
-                            f"File: {context.get_relative_path(file_found)} | "
-                            f"Offset: {record.data_start_offset}")
+                    logdebug(f"Skipping biomeDKKeybag record due to protobuf decode error: {ex} | "
+                             f"File: {context.get_relative_path(file_found)} | "
+                             f"Offset: {record.data_start_offset}")
                     continue
 
     data_headers = (('SEGB Timestamp', 'datetime'), ('Start Time', 'datetime'), ('End Time', 'datetime'), 'isLocked', 'Filename')
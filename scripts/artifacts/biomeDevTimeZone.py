@@ -21,10 +21,10 @@ __artifacts_v2__ = {
 
 import os
 from datetime import timezone
-from scripts import blackboxprotobuf
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.protobuf_decoder import decode_protobuf
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, logfunc
+from scripts.ilapfuncs import artifact_processor, logdebug
 
 
 @artifact_processor
@@ -47,11 +47,11 @@ def get_biomeDevTimeZone(context):
             ts = ts.replace(tzinfo=timezone.utc)
 
             if record.state == EntryState.Written:
-                protostuff, _ = blackboxprotobuf.decode_message(record.data, typess)
+                protostuff = decode_protobuf(record.data, typess)
 
                 tz = protostuff.get('2')
                 if tz is None:
-                    logfunc(f"Biome - Device TimeZone: record without timezone field in {filename}, skipped")
+                    logdebug(f"Biome - Device TimeZone: record without timezone field in {filename}, skipped")
                     continue
 
                 data_list.append((ts, tz, filename))
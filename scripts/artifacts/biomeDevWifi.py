@@ -29,12 +29,12 @@ __artifacts_v2__ = {
 
 import os
 import struct
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from datetime import timezone
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, logfunc
+from scripts.ilapfuncs import artifact_processor, logdebug, logfunc
 
 
 @artifact_processor
@@ -60,7 +60,7 @@ def get_biomeDevWifi(context):
 
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data, typess)
+                    protostuff = decode_protobuf(record.data, typess)
                     ssid = protostuff['SSID']
                     status = 'Connected' if protostuff['Connect'] == 1 else 'Disconnected'
                 except (DecodeError, struct.error, KeyError, ValueError, TypeError, IndexError) as ex:
@@ -73,9 +73,9 @@ def get_biomeDevWifi(context):
                     if record.crc_passed is False:
                         stale_slots += 1
                     else:
-                        logfunc(f"Skipping biomeDevWifi record due to protobuf decode error: {ex} | "
-                                f"File: {context.get_relative_path(file_found)} | "
-                                f"Offset: {record.data_start_offset}")
+                        logdebug(f"Skipping biomeDevWifi record due to protobuf decode error: {ex} | "
+                                 f"File: {context.get_relative_path(file_found)} | "
+                                 f"Offset: {record.data_start_offset}")
                     continue
                 data_list.append((ts, record.state.name, ssid, status, filename, record.data_start_offset))
 
@@ -31,11 +31,11 @@ __artifacts_v2__ = {
 import os
 import struct
 from datetime import timezone
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, logfunc
+from scripts.ilapfuncs import artifact_processor, logdebug
 
 
 @artifact_processor
@@ -61,12 +61,12 @@ def get_biomeHardware(context):
 
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data, typess)
+                    protostuff = decode_protobuf(record.data, typess)
                     hardware = (protostuff['1'])
                 except (DecodeError, struct.error, KeyError, ValueError, TypeError, IndexError) as ex:
-                    logfunc(f"Skipping biomeHardware record due to protobuf decode error: {ex} | "
-                            f"File: {context.get_relative_path(file_found)} | "
-                            f"Offset: {record.data_start_offset}")
+                    logdebug(f"Skipping biomeHardware record due to protobuf decode error: {ex} | "
+                             f"File: {context.get_relative_path(file_found)} | "
+                             f"Offset: {record.data_start_offset}")
                     continue
 
                 data_list.append((ts, record.state.name, hardware, filename, record.data_start_offset))
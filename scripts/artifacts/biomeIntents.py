@@ -33,11 +33,11 @@ __artifacts_v2__ = {
 
 import os
 import struct
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import convert_time_obj_to_utc, get_plist_content, logfunc, artifact_processor
+from scripts.ilapfuncs import convert_time_obj_to_utc, get_plist_content, logdebug, artifact_processor
 from scripts.html_safe import esc, safe_source
 
 from datetime import datetime as _dt
@@ -93,8 +93,8 @@ def _parse_record(protostuff, filename, offset):
     try:
         typeofintent = typeofintent.decode()
     except (AttributeError, UnicodeDecodeError):
-        logfunc(f'Biome Intents: record at offset {offset} in {filename} skipped, '
-                'app id is not a decodable string')
+        logdebug(f'Biome Intents: record at offset {offset} in {filename} skipped, '
+                 'app id is not a decodable string')
         return None
     appid = typeofintent
 
@@ -108,8 +108,8 @@ def _parse_record(protostuff, filename, offset):
 
     deserialized_plist = get_plist_content(protostuff.get('8'))
     if not deserialized_plist or not isinstance(deserialized_plist, dict):
-        logfunc(f'Biome Intents: record at offset {offset} in {filename} skipped, '
-                'intent plist could not be deserialized')
+        logdebug(f'Biome Intents: record at offset {offset} in {filename} skipped, '
+                 'intent plist could not be deserialized')
         return None
 
     date_interval = deserialized_plist.get('dateInterval')
@@ -132,10 +132,10 @@ def _parse_record(protostuff, filename, offset):
 
     raw_intent = _intent_payload(deserialized_plist)
     if raw_intent is None:
-        logfunc(f'Biome Intents: record at offset {offset} in {filename} skipped, '
-                'intent backing store holds no bytes')
+        logdebug(f'Biome Intents: record at offset {offset} in {filename} skipped, '
+                 'intent backing store holds no bytes')
         return None
-    protostuffinner, _ = blackboxprotobuf.decode_message(raw_intent)
+    protostuffinner = decode_protobuf(raw_intent)
 
     # Defaults, so an app branch that cannot read its own payload still returns a row
     # carrying the record metadata instead of raising.
@@ -238,8 +238,8 @@ def _parse_record(protostuff, filename, offset):
 
                 datoshtml = (esc(datos).replace(',', '<br>'))
     except _RECORD_ERRORS as ex:
-        logfunc(f'Biome Intents: record at offset {offset} in {filename} kept without intent '
-                f'data, {appid} payload could not be read, {type(ex).__name__}: {ex}')
+        logdebug(f'Biome Intents: record at offset {offset} in {filename} kept without intent '
+                 f'data, {appid} payload could not be read, {type(ex).__name__}: {ex}')
         datos = ''
         datoshtml = 'Intent data could not be parsed.'
 
@@ -276,11 +276,11 @@ def get_biomeIntents(context):
                 continue
             offset = record.data_start_offset
             try:
-                protostuff, _ = blackboxprotobuf.decode_message(record.data)
+                protostuff = decode_protobuf(record.data)
                 parsed = _parse_record(protostuff, filename, offset)
             except _RECORD_ERRORS as ex:
-                logfunc(f'Biome Intents: record at offset {offset} in {filename} skipped, '
-                        f'{type(ex).__name__}: {ex}')
+                logdebug(f'Biome Intents: record at offset {offset} in {filename} skipped, '
+                         f'{type(ex).__name__}: {ex}')
                 continue
             if parsed is None:
                 continue
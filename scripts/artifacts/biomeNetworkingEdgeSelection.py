@@ -33,8 +33,8 @@ __artifacts_v2__ = {
 import os
 from datetime import timezone
 
-from scripts import blackboxprotobuf
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.protobuf_decoder import decode_protobuf
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
 from scripts.ilapfuncs import artifact_processor
 
@@ -77,7 +77,7 @@ def get_biomeNetworkingEdgeSelection(context):
             if record.state != EntryState.Written:
                 continue
 
-            protostuff, _ = blackboxprotobuf.decode_message(record.data, typess)
+            protostuff = decode_protobuf(record.data, typess)
 
             # The address is stored already truncated to the prefix length in field 3 (host bits
             # zeroed), so it identifies the network the device was on, not the device's endpoint.
@@ -25,8 +25,8 @@ __artifacts_v2__ = {
 
 import os
 from datetime import timezone
-from scripts import blackboxprotobuf
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.protobuf_decoder import decode_protobuf
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
 from scripts.ilapfuncs import webkit_timestampsconv, artifact_processor
 from scripts.html_safe import safe_source
@@ -64,7 +64,7 @@ def get_biomeNotes(context):
             ts = ts.replace(tzinfo=timezone.utc)
 
             if record.state == EntryState.Written:
-                protostuff, _ = blackboxprotobuf.decode_message(record.data)
+                protostuff = decode_protobuf(record.data)
                 record_counter += 1
                 time = (webkit_timestampsconv(protostuff['3']))
                 identifier1 = protostuff['1']
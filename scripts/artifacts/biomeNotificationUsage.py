@@ -26,8 +26,8 @@ __artifacts_v2__ = {
 
 import os
 from datetime import timezone
-from scripts import blackboxprotobuf
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.protobuf_decoder import decode_protobuf
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
 from scripts.ilapfuncs import artifact_processor, webkit_timestampsconv, logfunc
 
@@ -58,7 +58,7 @@ def get_biomeNotificationUsage(context):
                 ts = record.timestamp1.replace(tzinfo=timezone.utc)
 
                 if record.state == EntryState.Written:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data, typess)
+                    protostuff = decode_protobuf(record.data, typess)
 
                     raw_ts = protostuff.get('2')
                     timeStart = webkit_timestampsconv(raw_ts) if raw_ts is not None else None
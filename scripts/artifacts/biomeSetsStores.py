@@ -120,11 +120,11 @@ __artifacts_v2__ = {
 import re
 import struct
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
 
 from scripts.ilapfuncs import (artifact_processor, open_sqlite_db_readonly, does_table_exist_in_db,
-                               convert_unix_ts_to_utc, logfunc)
+                               convert_unix_ts_to_utc, logdebug, logfunc)
 
 SOURCE_APP_RE = re.compile(r'sourceIdentifier=([^/\\]+)')
 
@@ -152,9 +152,9 @@ def _set_records(file_found):
 
     for modified, blob in rows:
         try:
-            message, _ = blackboxprotobuf.decode_message(blob)
+            message = decode_protobuf(blob)
         except (DecodeError, struct.error, KeyError, ValueError, TypeError, IndexError) as ex:
-            logfunc(f'Skipping Set.db record in {file_found} due to protobuf decode error: {ex}')
+            logdebug(f'Skipping Set.db record in {file_found} due to protobuf decode error: {ex}')
             continue
         # instance.modified is Unix epoch microseconds
         yield convert_unix_ts_to_utc(modified), message
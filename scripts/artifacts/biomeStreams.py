@@ -129,12 +129,12 @@ import os
 import struct
 from datetime import timezone
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 from google.protobuf.message import DecodeError
 
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
-from scripts.ilapfuncs import artifact_processor, convert_cocoa_core_data_ts_to_utc, logfunc
+from scripts.ilapfuncs import artifact_processor, convert_cocoa_core_data_ts_to_utc, logdebug
 
 _DECODE_ERRORS = (DecodeError, struct.error, KeyError, ValueError, TypeError, IndexError)
 
@@ -185,10 +185,10 @@ def _records(context):
             ts = record.timestamp1.replace(tzinfo=timezone.utc)
             if record.state == EntryState.Written and record.data:
                 try:
-                    message, _ = blackboxprotobuf.decode_message(record.data)
+                    message = decode_protobuf(record.data)
                 except _DECODE_ERRORS as ex:
-                    logfunc(f'Skipping {filename} record at offset {record.data_start_offset} '
-                            f'due to protobuf decode error: {ex}')
+                    logdebug(f'Skipping {filename} record at offset {record.data_start_offset} '
+                             f'due to protobuf decode error: {ex}')
                     message = None
                 yield ts, 'Written', message, filename, record.data_start_offset
             elif record.state == EntryState.Deleted:
@@ -17,7 +17,7 @@ __artifacts_v2__ = {
     }
 }
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 import json
 from scripts.ilapfuncs import artifact_processor, get_sqlite_db_records, convert_unix_ts_to_utc
 
@@ -61,8 +61,8 @@ def get_cashAppB(context):
             for row in results:
                 timestamp = convert_unix_ts_to_utc(row[0])
                 customertoken = row[1]
-                protocustomer, _ = blackboxprotobuf.decode_message(row[2], typedef_customer)
-                protopayment, _ = blackboxprotobuf.decode_message(row[3], typedef_payment)
+                protocustomer = decode_protobuf(row[2], typedef_customer)
+                protopayment = decode_protobuf(row[3], typedef_payment)
         
                 # initialize optional fields to avoid NameError if keys are missing
                 role = None
@@ -31,7 +31,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 import re
 from io import BytesIO
 
@@ -291,7 +291,7 @@ def google_chat(context):
                 reaction = ''
                 reactionuser = ''
             else:
-                protostuff, _types = blackboxprotobuf.decode_message(protobufreactions)
+                protostuff = decode_protobuf(protobufreactions)
                 reaction = (protostuff['1']['1']['1']['1']).decode()
                 reaction = (utf8_in_extended_ascii(reaction))[1]
 
@@ -309,7 +309,7 @@ def google_chat(context):
             if check == b'\xfe\xff\x00':
                 mediafilename = ''
             else:
-                protostuff, _ = blackboxprotobuf.decode_message(protobufmedia)
+                protostuff = decode_protobuf(protobufmedia)
                 aggregator = []
                 if isinstance(protostuff['1'], list):
                     nested_whatever = list(fla_tu(protostuff['1']))
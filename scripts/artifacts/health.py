@@ -491,9 +491,9 @@ __artifacts_v2__ = {
 }
 
 from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_sqlite_db_records, \
+from scripts.ilapfuncs import artifact_processor, get_sqlite_db_records, get_sqlite_db_rows, \
     attach_sqlite_db_readonly, does_table_exist_in_db, convert_cocoa_core_data_ts_to_utc, \
-    does_column_exist_in_db
+    convert_cocoa_core_data_ts_column_to_utc, does_column_exist_in_db
 
 
 @artifact_processor
@@ -851,8 +851,6 @@ def health_headphone_audio_levels(context):
     data_source = context.get_source_file_path('healthdb_secure.sqlite')
     healthdb = context.get_source_file_path('healthdb.sqlite')
 
-    data_list = []
-
     attach_query = attach_sqlite_db_readonly(healthdb, 'healthdb')
 
     query = '''
@@ -882,14 +880,8 @@ def health_headphone_audio_levels(context):
         'Bundle Name', 'Device Name', 'Device Manufacturer', 'Device Model',
         'Local Identifier', 'Key', 'Data ID')
 
-    db_records = get_sqlite_db_records(data_source, query, attach_query)
-
-    for record in db_records:
-        start_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        end_timestamp = convert_cocoa_core_data_ts_to_utc(record[1])
-        data_list.append(
-            (start_timestamp, end_timestamp, record[2], record[3], record[4],
-             record[5], record[6], record[7], record[8], record[9]))
+    data_list = get_sqlite_db_rows(
+        data_source, query, {0: 'cocoa_date', 1: 'cocoa_date'}, attach_query)
 
     return data_headers, data_list, data_source
 
@@ -964,9 +956,11 @@ def health_heart_rate(context):
                 WHERE quantity_series_data.series_identifier = ''' + str(record[11]) + '''
                 ORDER BY quantity_series_data.timestamp DESC
                 '''
-                quantity_series_data_records = get_sqlite_db_records(data_source, quantity_series_data_query)
-                for qsd_record in quantity_series_data_records:
-                    series_data_date = convert_cocoa_core_data_ts_to_utc(qsd_record[0])
+                quantity_series_data_records = list(
+                    get_sqlite_db_records(data_source, quantity_series_data_query))
+                series_data_dates = convert_cocoa_core_data_ts_column_to_utc(
+                    [qsd_record[0] for qsd_record in quantity_series_data_records])
+                for qsd_record, series_data_date in zip(quantity_series_data_records, series_data_dates):
                     data_list.append(
                         (series_data_date, qsd_record[1], record[3], added_timestamp,
                          record[5], record[6], record[7], device_model, record[8],
@@ -1027,12 +1021,13 @@ def health_resting_heart_rate(context):
         ('Date added to Health', 'datetime'), 'Hardware ID',
         'Device Model', 'Source')
 
-    db_records = get_sqlite_db_records(data_source, query, attach_query)
+    db_records = list(get_sqlite_db_records(data_source, query, attach_query))
+    start_timestamps = convert_cocoa_core_data_ts_column_to_utc([record[0] for record in db_records])
+    end_timestamps = convert_cocoa_core_data_ts_column_to_utc([record[1] for record in db_records])
+    added_timestamps = convert_cocoa_core_data_ts_column_to_utc([record[3] for record in db_records])
 
-    for record in db_records:
-        start_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        end_timestamp = convert_cocoa_core_data_ts_to_utc(record[1])
-        added_timestamp = convert_cocoa_core_data_ts_to_utc(record[3])
+    for record, start_timestamp, end_timestamp, added_timestamp in zip(
+            db_records, start_timestamps, end_timestamps, added_timestamps):
         device_model = context.lookup_metadata('apple_device_id_to_model', record[4])
         data_list.append(
             (start_timestamp, end_timestamp, record[2], added_timestamp, record[4],
@@ -1045,7 +1040,6 @@ def health_resting_heart_rate(context):
 def health_achievements(context):
     """ See artifact description """
     data_source = context.get_source_file_path('healthdb_secure.sqlite')
-    data_list = []
 
     query = '''
     SELECT
@@ -1062,12 +1056,7 @@ def health_achievements(context):
         ('Created Timestamp', 'datetime'), ('Earned Date', 'date'), 'Achievement',
         'Value', 'Unit', 'Creator Device')
 
-    db_records = get_sqlite_db_records(data_source, query)
-
-    for record in db_records:
-        created_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        data_list.append((created_timestamp, record[1], record[2], record[3],
-                          record[4], record[5]))
+    data_list = get_sqlite_db_rows(data_source, query, {0: 'cocoa_date'})
 
     return data_headers, data_list, data_source
 
@@ -1096,11 +1085,11 @@ def health_steps(context):
         ('Start Time', 'datetime'), ('End Time', 'datetime'), 'Steps',
         'Duration (Seconds)', 'Device ID', 'Device Model')
 
-    db_records = get_sqlite_db_records(data_source, query)
+    db_records = list(get_sqlite_db_records(data_source, query))
+    start_timestamps = convert_cocoa_core_data_ts_column_to_utc([record[0] for record in db_records])
+    end_timestamps = convert_cocoa_core_data_ts_column_to_utc([record[1] for record in db_records])
 
-    for record in db_records:
-        start_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        end_timestamp = convert_cocoa_core_data_ts_to_utc(record[1])
+    for record, start_timestamp, end_timestamp in zip(db_records, start_timestamps, end_timestamps):
         hardware = context.lookup_metadata('apple_device_id_to_model', record[4])
         data_list.append((start_timestamp, end_timestamp, record[2], record[3],
                           record[4], hardware))
@@ -1112,7 +1101,6 @@ def health_steps(context):
 def health_height(context):
     """ See artifact description """
     data_source = context.get_source_file_path('healthdb_secure.sqlite')
-    data_list = []
 
     query = '''
     SELECT
@@ -1133,11 +1121,7 @@ def health_height(context):
         ('Height Value Timestamp', 'datetime'), 'Height (in Meters)',
         'Height (in Centimeters)', 'Height (Feet and Inches)')
 
-    db_records = get_sqlite_db_records(data_source, query)
-
-    for record in db_records:
-        height_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        data_list.append((height_timestamp, record[1], record[2], record[3]))
+    data_list = get_sqlite_db_rows(data_source, query, {0: 'cocoa_date'})
 
     return data_headers, data_list, data_source
 
@@ -1146,7 +1130,6 @@ def health_height(context):
 def health_weight(context):
     """ See artifact description """
     data_source = context.get_source_file_path('healthdb_secure.sqlite')
-    data_list = []
 
     query = '''
     SELECT
@@ -1177,11 +1160,7 @@ def health_weight(context):
         ('Weight Value Timestamp', 'datetime'), 'Weight (in Kilograms)',
         'Weight (in Stone)', 'Weight (Approximate in Pounds)')
 
-    db_records = get_sqlite_db_records(data_source, query)
-
-    for record in db_records:
-        weight_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        data_list.append((weight_timestamp, record[1], record[2], record[3]))
+    data_list = get_sqlite_db_rows(data_source, query, {0: 'cocoa_date'})
 
     return data_headers, data_list, data_source
 
@@ -1190,7 +1169,6 @@ def health_weight(context):
 def health_watch_worn_data(context):
     """ See artifact description """
     data_source = context.get_source_file_path('healthdb_secure.sqlite')
-    data_list = []
 
     query = '''
     WITH TimeData AS (
@@ -1246,12 +1224,7 @@ def health_watch_worn_data(context):
         ('Watch Worn Start Time', 'datetime'), 'Hours Worn',
         ('Last Watch Worn Hour Time', 'datetime'), 'Hours Off Before Next Worn Start Time')
 
-    db_records = get_sqlite_db_records(data_source, query)
-
-    for record in db_records:
-        start_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        last_hour_time = convert_cocoa_core_data_ts_to_utc(record[2])
-        data_list.append((start_timestamp, record[1], last_hour_time, record[3]))
+    data_list = get_sqlite_db_rows(data_source, query, {0: 'cocoa_date', 2: 'cocoa_date'})
 
     return data_headers, data_list, data_source
 
@@ -1260,7 +1233,6 @@ def health_watch_worn_data(context):
 def health_all_watch_sleep_data(context):
     """ See artifact description """
     data_source = context.get_source_file_path('healthdb_secure.sqlite')
-    data_list = []
 
     query = '''
     SELECT
@@ -1286,12 +1258,7 @@ def health_all_watch_sleep_data(context):
         ('Sleep Start Time', 'datetime'), 'Sleep State',
         ('Sleep End Time', 'datetime'), 'Sleep State (HH:MM:SS)')
 
-    db_records = get_sqlite_db_records(data_source, query)
-
-    for record in db_records:
-        start_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        end_timestamp = convert_cocoa_core_data_ts_to_utc(record[2])
-        data_list.append((start_timestamp, record[1], end_timestamp, record[3]))
+    data_list = get_sqlite_db_rows(data_source, query, {0: 'cocoa_date', 2: 'cocoa_date'})
 
     return data_headers, data_list, data_source
 
@@ -1300,7 +1267,6 @@ def health_all_watch_sleep_data(context):
 def health_watch_by_sleep_period(context):
     """ See artifact description """
     data_source = context.get_source_file_path('healthdb_secure.sqlite')
-    data_list = []
 
     query = '''
     WITH lagged_samples AS (
@@ -1383,14 +1349,7 @@ def health_watch_by_sleep_period(context):
         'REM Duration (HH:MM:SS)', 'Core Duration (HH:MM:SS)',
         'Deep Duration (HH:MM:SS)', 'Awake %', 'REM %', 'Core %', 'Deep %')
 
-    db_records = get_sqlite_db_records(data_source, query)
-
-    for record in db_records:
-        start_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        end_timestamp = convert_cocoa_core_data_ts_to_utc(record[1])
-        data_list.append(
-            (start_timestamp, end_timestamp, record[2], record[3], record[4], record[5],
-             record[6], record[7], record[8], record[9], record[10], record[11]))
+    data_list = get_sqlite_db_rows(data_source, query, {0: 'cocoa_date', 1: 'cocoa_date'})
 
     return data_headers, data_list, data_source
 
@@ -1497,8 +1456,6 @@ def health_wrist_temperature(context):
     data_source = context.get_source_file_path('healthdb_secure.sqlite')
     healthdb = context.get_source_file_path('healthdb.sqlite')
 
-    data_list = []
-
     attach_query = attach_sqlite_db_readonly(healthdb, 'healthdb')
 
     query = '''
@@ -1551,15 +1508,7 @@ def health_wrist_temperature(context):
         'Surface Temperature (°C)', 'Surface Temperature (°F)', 'Name',
         'Manufacturer', 'Model', 'Hardware Version', 'Software Version')
 
-    db_records = get_sqlite_db_records(data_source, query, attach_query)
-
-    for record in db_records:
-        start_timestamp = convert_cocoa_core_data_ts_to_utc(record[0])
-        end_timestamp = convert_cocoa_core_data_ts_to_utc(record[1])
-        added_timestamp = convert_cocoa_core_data_ts_to_utc(record[2])
-        data_list.append(
-            (start_timestamp, end_timestamp, added_timestamp, record[3], record[4],
-             record[5], record[6], record[7], record[8], record[9], record[10],
-             record[11], record[12], record[13]))
+    data_list = get_sqlite_db_rows(
+        data_source, query, {0: 'cocoa_date', 1: 'cocoa_date', 2: 'cocoa_date'}, attach_query)
 
     return data_headers, data_list, data_source
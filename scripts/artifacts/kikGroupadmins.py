@@ -23,7 +23,7 @@ __artifacts_v2__ = {
     }
 }
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 
 from scripts.ilapfuncs import artifact_processor, open_sqlite_db_readonly
 
@@ -34,7 +34,7 @@ def _decode_additional_info(blob):
     if blob is None:
         return user_a, user_b, display, value
     try:
-        data, _ = blackboxprotobuf.decode_message(blob)
+        data = decode_protobuf(blob)
         raw = data['1']['1']
         user_a = '' if isinstance(raw, dict) else raw.decode('utf-8')
         if data.get('2') is not None:
@@ -54,7 +54,7 @@ def _decode_entity_blob(blob):
     if blob is None:
         return username, description, interests
     try:
-        data, _ = blackboxprotobuf.decode_message(blob)
+        data = decode_protobuf(blob)
         if data['1'].get('5') is not None:
             for item in data['1']['5']['1']:
                 interests = item['2'].decode('utf-8') + ', ' + interests
@@ -7,10 +7,14 @@ __artifacts_v2__ = {
         "last_update_date": "2025-05-06",
         "requirements": "none",
         "category": "Unified Logs",
-        "notes": "",
+        "notes": "The entries are loaded straight into the logarchive table of the LAVA database, "
+                 "with a full-text index of the event messages",
         "paths": ('*/logarchive*.json',),
-        "output_types": "lava_only",
+        "output_types": "none",
         "artifact_icon": "database",
+        # The rows are in the LAVA database when the function returns, the artifact
+        # cache only replays rows returned to artifact_processor
+        "cache": False,
     },
     "logarchive_artifacts": {
         "name": "logarchive artifacts",
@@ -170,9 +174,286 @@ __artifacts_v2__ = {
     }
 }
 
+import re
 import ijson
 from datetime import datetime, timezone
-from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc
+from scripts.ilapfuncs import artifact_processor, does_table_exist_in_db, get_file_path, get_sqlite_db_records, \
+    lava_only_info, logfunc
+from scripts.lavafuncs import lava_bulk_insert, lava_create_text_index, lava_process_artifact, \
+    lava_set_record_count, lava_write_matches
+
+LOGARCHIVE_HEADERS = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID',
+                      'Subsystem', 'Category', 'Event Message', 'Trace ID')
+
+# Substrings of the event messages of the entries kept in the logarchive_artifacts table
+LOGARCHIVE_ARTIFACTS_PATTERNS = (
+    'Take screenshot',
+    'Time change: Clock shifted by',
+    'BoutDetector (stepBout): Identified potential walking bout',
+    'Has contact name and phone number',
+    'charger connected state change',
+    'Motion State Transition:',
+    'CarPlay Connection Event:',
+    'CoreAnalytics event: com.apple.accessories.connection.added',
+    'CoreAnalytics event: com.apple.accessories.endpoint.accessroryInfoChanged',
+    'Start #SpeechRequest id',
+    'Received Orientation',
+    'Effective device orientation',
+    'Received: Match Started',
+    'Received: Face',
+    'Received: Authenticated',
+    'AppleAccount Authenticated:',
+    '=> Transitioning to state:',
+    'Received: Screen',
+    'Screen did lock',
+    'ScreenOn changed',
+    'Screen shut off',
+    'screen is locked',
+    'screen is unlocked',
+    'Device unlocked',
+    'Device lock status',
+    'Biometric match complete',
+    'SBIconView touches began with event:',
+    'Setting process visibility',
+    'WiFi state changed:',
+    'Toggled WiFi state',
+    'is WiFi associated?',
+    'link status changed',
+    'reachability changed',
+    'ISNetworkObserver',
+    'ForgetSSID',
+    'en0: SSID',
+    'Removing Lease SSID',
+    'SysMon: WiFi state changed:',
+    'WiFiManagerClientRemoveNetworkWithReason:',
+    'WiFiSecurityRemovePassword',
+    'AlwaysOnWifi:',
+    'WiFiDeviceManagerSetNetworks:',
+    'Scanning For Broadcast found:',
+    'Scanning Remaining Channels',
+    'WiFiSettlementObserver _handleScanResults',
+    'Attempting to join',
+    'WiFiLQAMgrSetCurrentNetwork: Joined SSID:',
+    'Preparing background scan request for ',
+    'WiFiNetworkPrepareKnownBssList',
+    'to list of known networks',
+    '{AUTOJOIN, SCAN*} Scanning 2Ghz Channels found:',
+    '{AUTOJOIN, SCAN*} Scanning 5Ghz Channels found:',
+    'ATXModeDrivingFeaturizer: Driving mode',
+    'ATXModeCorrelatedAppsDataSource: user',
+    'VEHICULAR:vehicularStartTime',
+    'Handling com.apple.vehiclePolicy.DNDMode notification',
+    'Get mode configuration, identifier=com.apple.donotdisturb.mode.driving',
+    'Engaging Driving',
+    'ATXModeDrivingFeaturizer: received new DNDWD event',
+    'Airplane Mode is now 1',
+    'Airplane Mode is now On',
+    'Setting airplane mode to true',
+    'Airplane mode now active',
+    'Airplane mode now active',
+    'enabling airplanemode',
+    'Airplane mode changed',
+    'Airplane Mode is now 0',
+    'Airplane Mode is now Off',
+    'Airplane Mode is now On',
+    'Setting airplane mode to false',
+    'Airplane mode now inactive',
+    'Airplane mode Disabled',
+    'Bluetooth state changed',
+    'Sending new bluetooth state',
+    'Bluetooth state changed PoweredOn',
+    'ServiceManager disconnection result for',
+    'Device type is',
+    'is asking to connect device',
+    'Received connection result for',
+    'Received disconnection result for',
+    'Received handsfree disconnection',
+    'Sending ring notification for call',
+    'Accepting incoming audio connection',
+    'Received voice audio connected',
+    'Stopping A2DP audio streaming',
+    'Bluetooth A2DP device',
+    'Bluetooth Daemon: A2DP streaming',
+    'Starting Media connection to device',
+    'Received voice disconnection',
+    'Disconnecting audio from device',
+    'Audio was already disconnected',
+    'Toggled Bluetooth state from',
+    'CUBluetoothDevice',
+    'handsfree device disconnected',
+    'handsfree device connected',
+    'Bluetooth state updated',
+    'Bluetooth power is now off',
+    'Bluetooth state',
+    'Sending call state update',
+    'A2DP LinkQualityReport',
+    'AudioQueueIsPlaying',
+    'VolumeIncrement',
+    'rawVolumeIncreasePress',
+    'rawVolumeDecreasePress',
+    'Volume active',
+    'PlaybackQueueInvalidation',
+    'volumeValueDidChange',
+    'SBVolumeControl',
+    'SBSOSClawGestureObserver - button press noted',
+    'brightness change:',
+    'SBRingerControl activateRingerHUD',
+    'SBRingerHUDViewController setRingerSilent:',
+    'ringer state changed to:',
+    'Allowing tap for icon view',
+    'Launching application',
+    'transition source:',
+    '[Flashlight Controller]',
+    '<<<<AVFlashlight>>>>-',
+    'Tethering is now enabled with',
+    'Received notification that wireless modem state changed',
+    'Previous tethering state was',
+    'Proceed to',
+    'Turn right',
+    'Turn left',
+    'roundabout',
+    'first exit',
+    'Stay in the',
+    'parking lot',
+    'of a mile',
+    'In about',
+    'Arrived',
+    'destination',
+    'At the light',
+    'Starting route to',
+)
+
+# The entries of each of the other logarchive artifacts, among those of logarchive_artifacts,
+# by rule id (the name of the artifact). logarchive_artifacts tags each entry it keeps with
+# the rules it matches, in the logarchive_matches table the artifacts read their entries from:
+# a new rule is one more entry here, not one more scan of the logarchive table.
+LOGARCHIVE_RULES = {
+    'logarchive_time_change': (
+        'Time change: Clock shifted by',
+    ),
+    'logarchive_flashlight': (
+        '[Flashlight Controller]',
+        '<<<<AVFlashlight>>>>-',
+    ),
+    'logarchive_executed_apps': (
+        'Allowing tap for icon view',
+        'Launching application',
+        'transition source:',
+    ),
+    'logarchive_motionstate': (
+        'Motion State Transition:',
+    ),
+    'logarchive_tethering': (
+        'Tethering is now enabled with',
+        'Received notification that wireless modem state changed',
+        'Previous tethering state was',
+    ),
+    'logarchive_airplane_mode': (
+        'Airplane Mode is now 1',
+        'Airplane Mode is now On',
+        'Setting airplane mode to true',
+        'Airplane mode now active',
+        'enabling airplanemode',
+        'Airplane mode changed',
+        'Airplane Mode is now 0',
+        'Airplane Mode is now Off',
+        'Setting airplane mode to false',
+        'Airplane mode now inactive',
+        'Airplane mode Disabled',
+    ),
+    'logarchive_lock_status': (
+        'Screen did lock',
+        'ScreenOn changed',
+        'Screen shut off',
+        'screen is locked',
+        'screen is unlocked',
+        'Device unlocked',
+        'Device lock status',
+        'Biometric match complete',
+    ),
+    'logarchive_wifi_status': (
+        'WiFi state changed:',
+        'Toggled WiFi state',
+        'is WiFi associated?',
+        'link status changed',
+        'reachability changed',
+        'ISNetworkObserver',
+        'ForgetSSID',
+        'en0: SSID',
+        'Removing Lease SSID',
+        'SysMon: WiFi state changed:',
+        'WiFiManagerClientRemoveNetworkWithReason:',
+        'WiFiSecurityRemovePassword',
+        'AlwaysOnWifi:',
+        'WiFiDeviceManagerSetNetworks:',
+        'Scanning For Broadcast found:',
+        'Scanning Remaining Channels',
+        'WiFiSettlementObserver _handleScanResults',
+        'Attempting to join',
+        'WiFiLQAMgrSetCurrentNetwork: Joined SSID:',
+        'Preparing background scan request for ',
+        'WiFiNetworkPrepareKnownBssList',
+        'to list of known networks',
+        '{AUTOJOIN, SCAN*} Scanning 2Ghz Channels found:',
+        '{AUTOJOIN, SCAN*} Scanning 5Ghz Channels found:',
+    ),
+    'logarchive_bluetooth_status': (
+        'Bluetooth state changed',
+        'Sending new bluetooth state',
+        'Bluetooth state changed PoweredOn',
+        'ServiceManager disconnection result for',
+        'Device type is',
+        'is asking to connect device',
+        'Received connection result for',
+        'Received disconnection result for',
+        'Received handsfree disconnection',
+        'Sending ring notification for call',
+        'Accepting incoming audio connection',
+        'Received voice audio connected',
+        'Stopping A2DP audio streaming',
+        'Bluetooth A2DP device',
+        'Bluetooth Daemon: A2DP streaming',
+        'Starting Media connection to device',
+        'Received voice disconnection',
+        'Disconnecting audio from device',
+        'Audio was already disconnected',
+        'Toggled Bluetooth state from',
+        'CUBluetoothDevice',
+        'handsfree device disconnected',
+        'handsfree device connected',
+        'Bluetooth state updated',
+        'Bluetooth power is now off',
+        'Bluetooth state',
+        'Sending call state update',
+        'A2DP LinkQualityReport',
+    ),
+    'logarchive_audio_status': (
+        'AudioQueueIsPlaying',
+        'VolumeIncrement',
+        'rawVolumeIncreasePress',
+        'rawVolumeDecreasePress',
+        'Volume active',
+        'PlaybackQueueInvalidation',
+        'volumeValueDidChange',
+    ),
+    'logarchive_navigation': (
+        'Starting route to',
+        'Proceed to the',
+        'Proceed to\\',
+        'Turn right',
+        'Turn left',
+        'roundabout',
+        'first exit',
+        'Stay in the',
+        'parking lot for',
+        'of a mile',
+        'In about',
+        'then arrive',
+        'your destination',
+        'At the light',
+        'Arrived\\',
+    ),
+}
 
 
 def convert_to_utc(timestamp):
@@ -188,6 +469,30 @@ def convert_to_utc(timestamp):
     return datetime.fromisoformat(timestamp).astimezone(timezone.utc)
 
 
+def _like(pattern):
+    '''Returns the SQL string matching the event messages containing pattern'''
+    return "'%" + pattern.replace("'", "''") + "%'"
+
+
+def _like_regex(patterns):
+    '''Compiles the patterns of LIKE '%...%' conditions into one regular expression matching the
+    same messages: the case of ASCII letters only is ignored, and _ matches any character'''
+    return re.compile('|'.join('.'.join(re.escape(part) for part in pattern.split('_')) for pattern in patterns),
+                      re.IGNORECASE | re.ASCII | re.DOTALL)
+
+
+def _matched_records(source_path, rule_id):
+    '''Returns the entries of the logarchive table tagged with rule_id by logarchive_artifacts'''
+    query = f'''
+    SELECT logarchive.*
+    FROM logarchive_matches
+    JOIN logarchive ON logarchive.rowid = logarchive_matches.row_id
+    WHERE logarchive_matches.rule_id = '{rule_id}'
+    ORDER BY logarchive_matches.row_id
+    '''
+    return get_sqlite_db_records(source_path, query)
+
+
 def truncate_after_last_bracket(file_path):
     with open(file_path, 'rb+') as f:
         # Start from the end of the file and scan backwards
@@ -204,465 +509,163 @@ def truncate_after_last_bracket(file_path):
                 return
         print("No closing bracket `]` found.")
 
+def read_logarchive(source_path):
+    '''Yields the entries of a logarchive JSON export as rows of the logarchive table'''
+    incval = 0
+    with open(source_path, 'rb') as f:
+        for record in ijson.items(f, 'item', multiple_values=True ): # if the json is a list
+            if isinstance(record, dict):
+                incval = incval + 1
+                timestamp = record.get('timestamp', '')
+                # Stored as a Unix timestamp, as LAVA stores the datetime columns
+                timestamp = convert_to_utc(timestamp).timestamp() if timestamp else ''
+                processid = record.get('processID', '')
+                process_image_path = record.get('processImagePath', '')
+                subsystem = record.get('subsystem', '')
+                category = record.get('category', '')
+                eventmessage = str(record.get('eventMessage', ''))
+                traceid = str(record.get('traceID', ''))
+                
+                t0 = ( timestamp, incval,  process_image_path,  processid,  subsystem,  category,  eventmessage,  traceid)
+                yield t0
+
 @artifact_processor
 def logarchive(context):
     source_path = get_file_path(context.get_files_found(), 'logarchive*.json')
-    data_list = []
 
-    incval = 0
     if source_path:
-        truncate_after_last_bracket(source_path)
-        with open(source_path, 'rb') as f:
-            for record in ijson.items(f, 'item', multiple_values=True ): # if the json is a list
-                if isinstance(record, dict):
-                    incval = incval + 1
-                    timestamp = record.get('timestamp', '')
-                    timestamp = convert_to_utc(timestamp) if timestamp else ''
-                    processid = record.get('processID', '')
-                    process_image_path = record.get('processImagePath', '')
-                    subsystem = record.get('subsystem', '')
-                    category = record.get('category', '')
-                    eventmessage = str(record.get('eventMessage', ''))
-                    traceid = str(record.get('traceID', ''))
-                    
-                    t0 = ( timestamp, incval,  process_image_path,  processid,  subsystem,  category,  eventmessage,  traceid)
-                    data_list.append(t0)
-
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID',
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    return data_headers, data_list, source_path
+        # Truncated in place, so it must not be linked to the file of the extraction
+        truncate_after_last_bracket(context.get_seeker().materialize(source_path))
+        # A logarchive can hold millions of entries: they are streamed straight into the
+        # LAVA table, then the event messages are indexed for logarchive_artifacts
+        artifact_info = context.get_artifact_info()
+        category = artifact_info.get('category', '')
+        artifact_name = artifact_info.get('name', 'logarchive')
+        table_name, _, _ = lava_process_artifact(
+            category, context.get_module_name(), artifact_name, LOGARCHIVE_HEADERS, func_name='logarchive',
+            artifact_icon=artifact_info.get('artifact_icon'), source_path=context.get_relative_path(source_path))
+        record_count = lava_bulk_insert(table_name, LOGARCHIVE_HEADERS, read_logarchive(source_path))
+        lava_set_record_count(category, table_name, record_count)
+        lava_only_info(category, artifact_name, table_name, record_count)
+        logfunc(f"Found {record_count:,} {'records' if record_count > 1 else 'record'} for {artifact_name}")
+        if record_count and not lava_create_text_index(table_name, 'Event Message'):
+            logfunc('This SQLite has no FTS5 trigram tokenizer, the logarchive entries are not indexed')
+
+    return LOGARCHIVE_HEADERS, [], source_path
 
 @artifact_processor
 def logarchive_artifacts(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
     data_list = []
 
-    query = '''
-    SELECT *
+    matches = ' OR '.join(f"event_message LIKE {_like(pattern)}" for pattern in LOGARCHIVE_ARTIFACTS_PATTERNS)
+    candidates = ''
+    if does_table_exist_in_db(source_path, 'logarchive_fts'):
+        # Each pattern is looked up in the full-text index built by the logarchive artifact,
+        # instead of matching all of them against every entry; the candidates are matched
+        # again below, as LIKE only ignores the case of ASCII letters and the index of all
+        candidates = 'rowid IN (' + ' UNION '.join(
+            f"SELECT rowid FROM logarchive_fts WHERE event_message LIKE {_like(pattern)}"
+            for pattern in LOGARCHIVE_ARTIFACTS_PATTERNS) + ') AND '
+
+    query = f'''
+    SELECT rowid, event_message
     FROM logarchive
-    WHERE event_message LIKE '%Take screenshot%'
-        OR event_message LIKE '%Time change: Clock shifted by%'
-        OR event_message LIKE '%BoutDetector (stepBout): Identified potential walking bout%'
-        OR event_message LIKE '%Has contact name and phone number%'
-        OR event_message LIKE '%charger connected state change%'
-        OR event_message LIKE '%Motion State Transition:%'
-        OR event_message LIKE '%CarPlay Connection Event:%'
-        OR event_message LIKE '%CoreAnalytics event: com.apple.accessories.connection.added%'
-        OR event_message LIKE '%CoreAnalytics event: com.apple.accessories.endpoint.accessroryInfoChanged%'
-        OR event_message LIKE '%Start #SpeechRequest id%'
-        OR event_message LIKE '%Received Orientation%'
-        OR event_message LIKE '%Effective device orientation%'
-        OR event_message LIKE '%Received: Match Started%'
-        OR event_message LIKE '%Received: Face%'
-        OR event_message LIKE '%Received: Authenticated%'
-        OR event_message LIKE '%AppleAccount Authenticated:%'
-        OR event_message LIKE '%=> Transitioning to state:%'
-        OR event_message LIKE '%Received: Screen%'
-        OR event_message LIKE '%Screen did lock%'
-        OR event_message LIKE '%ScreenOn changed%'
-        OR event_message LIKE '%Screen shut off%'
-        OR event_message LIKE '%screen is locked%'
-        OR event_message LIKE '%screen is unlocked%'
-        OR event_message LIKE '%Device unlocked%'
-        OR event_message LIKE '%Device lock status%'
-        OR event_message LIKE '%Biometric match complete%'
-        OR event_message LIKE '%SBIconView touches began with event:%'
-        OR event_message LIKE '%Setting process visibility%'
-        OR event_message LIKE '%WiFi state changed:%'
-        OR event_message LIKE '%Toggled WiFi state%'
-        OR event_message LIKE '%is WiFi associated?%'
-        OR event_message LIKE '%link status changed%'
-        OR event_message LIKE '%reachability changed%'
-        OR event_message LIKE '%ISNetworkObserver%'
-        OR event_message LIKE '%ForgetSSID%'
-        OR event_message LIKE '%en0: SSID%'
-        OR event_message LIKE '%Removing Lease SSID%'
-        OR event_message LIKE '%SysMon: WiFi state changed:%'
-        OR event_message LIKE '%WiFiManagerClientRemoveNetworkWithReason:%'
-        OR event_message LIKE '%WiFiSecurityRemovePassword%'
-        OR event_message LIKE '%AlwaysOnWifi:%'
-        OR event_message LIKE '%WiFiDeviceManagerSetNetworks:%'
-        OR event_message LIKE '%Scanning For Broadcast found:%'
-        OR event_message LIKE '%Scanning Remaining Channels%'
-        OR event_message LIKE '%WiFiSettlementObserver _handleScanResults%'
-        OR event_message LIKE '%Attempting to join%'
-        OR event_message LIKE '%WiFiLQAMgrSetCurrentNetwork: Joined SSID:%'
-        OR event_message LIKE '%Preparing background scan request for %'
-        OR event_message LIKE '%WiFiNetworkPrepareKnownBssList%'
-        OR event_message LIKE '%to list of known networks%'
-        OR event_message LIKE '%{AUTOJOIN, SCAN*} Scanning 2Ghz Channels found:%'
-        OR event_message LIKE '%{AUTOJOIN, SCAN*} Scanning 5Ghz Channels found:%'
-        OR event_message LIKE '%ATXModeDrivingFeaturizer: Driving mode%'
-        OR event_message LIKE '%ATXModeCorrelatedAppsDataSource: user%'
-        OR event_message LIKE '%VEHICULAR:vehicularStartTime%'
-        OR event_message LIKE '%Handling com.apple.vehiclePolicy.DNDMode notification%'
-        OR event_message LIKE '%Get mode configuration, identifier=com.apple.donotdisturb.mode.driving%'
-        OR event_message LIKE '%Engaging Driving%'
-        OR event_message LIKE '%ATXModeDrivingFeaturizer: received new DNDWD event%'
-        OR event_message LIKE '%Airplane Mode is now 1%'
-        OR event_message LIKE '%Airplane Mode is now On%'
-        OR event_message LIKE '%Setting airplane mode to true%'
-        OR event_message LIKE '%Airplane mode now active%'
-        OR event_message LIKE '%Airplane mode now active%'
-        OR event_message LIKE '%enabling airplanemode%'
-        OR event_message LIKE '%Airplane mode changed%'
-        OR event_message LIKE '%Airplane Mode is now 0%'
-        OR event_message LIKE '%Airplane Mode is now Off%'
-        OR event_message LIKE '%Airplane Mode is now On%'
-        OR event_message LIKE '%Setting airplane mode to false%'
-        OR event_message LIKE '%Airplane mode now inactive%'
-        OR event_message LIKE '%Airplane mode Disabled%'
-        OR event_message LIKE '%Bluetooth state changed%'
-        OR event_message LIKE '%Sending new bluetooth state%'
-        OR event_message LIKE '%Bluetooth state changed PoweredOn%'
-        OR event_message LIKE '%ServiceManager disconnection result for%'
-        OR event_message LIKE '%Device type is%'
-        OR event_message LIKE '%is asking to connect device%'
-        OR event_message LIKE '%Received connection result for%'
-        OR event_message LIKE '%Received disconnection result for%'
-        OR event_message LIKE '%Received handsfree disconnection%'
-        OR event_message LIKE '%Sending ring notification for call%'
-        OR event_message LIKE '%Accepting incoming audio connection%'
-        OR event_message LIKE '%Received voice audio connected%'
-        OR event_message LIKE '%Stopping A2DP audio streaming%'
-        OR event_message LIKE '%Bluetooth A2DP device%'
-        OR event_message LIKE '%Bluetooth Daemon: A2DP streaming%'
-        OR event_message LIKE '%Starting Media connection to device%'
-        OR event_message LIKE '%Received voice disconnection%'
-        OR event_message LIKE '%Disconnecting audio from device%'
-        OR event_message LIKE '%Audio was already disconnected%'
-        OR event_message LIKE '%Toggled Bluetooth state from%'
-        OR event_message LIKE '%CUBluetoothDevice%'
-        OR event_message LIKE '%handsfree device disconnected%'
-        OR event_message LIKE '%handsfree device connected%'
-        OR event_message LIKE '%Bluetooth state updated%'
-        OR event_message LIKE '%Bluetooth power is now off%'
-        OR event_message LIKE '%Bluetooth state%'
-        OR event_message LIKE '%Sending call state update%'
-        OR event_message LIKE '%A2DP LinkQualityReport%'
-        OR event_message LIKE '%AudioQueueIsPlaying%'
-        OR event_message LIKE '%VolumeIncrement%'
-        OR event_message LIKE '%rawVolumeIncreasePress%'
-        OR event_message LIKE '%rawVolumeDecreasePress%'
-        OR event_message LIKE '%Volume active%'
-        OR event_message LIKE '%PlaybackQueueInvalidation%'
-        OR event_message LIKE '%volumeValueDidChange%'
-        OR event_message LIKE '%SBVolumeControl%'
-        OR event_message LIKE '%SBSOSClawGestureObserver - button press noted%'
-        OR event_message LIKE '%brightness change:%'
-        OR event_message LIKE '%SBRingerControl activateRingerHUD%'
-        OR event_message LIKE '%SBRingerHUDViewController setRingerSilent:%'
-        OR event_message LIKE '%ringer state changed to:%'
-        OR event_message LIKE '%Allowing tap for icon view%'
-        OR event_message LIKE '%Launching application%'
-        OR event_message LIKE '%transition source:%'
-        OR event_message LIKE '%[Flashlight Controller]%'
-        OR event_message LIKE '%<<<<AVFlashlight>>>>-%'
-        OR event_message LIKE '%Tethering is now enabled with%'
-        OR event_message LIKE '%Received notification that wireless modem state changed%'
-        OR event_message LIKE '%Previous tethering state was%'
-        OR event_message LIKE '%Proceed to%'
-        OR event_message LIKE '%Turn right%'
-        OR event_message LIKE '%Turn left%'
-        OR event_message LIKE '%roundabout%'
-        OR event_message LIKE '%first exit%'
-        OR event_message LIKE '%Stay in the%'
-        OR event_message LIKE '%parking lot%'
-        OR event_message LIKE '%of a mile%'
-        OR event_message LIKE '%In about%'
-        OR event_message LIKE '%Arrived%'
-        OR event_message LIKE '%destination%'
-        OR event_message LIKE '%At the light%'
-        OR event_message LIKE '%Starting route to%'
+    WHERE {candidates}({matches})
+    ORDER BY rowid
     '''
 
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
+    # The entries kept are tagged in the same pass with the rules of the other artifacts
+    rules = [(rule_id, _like_regex(patterns)) for rule_id, patterns in LOGARCHIVE_RULES.items()]
+
+    def classify(db_records):
+        for row_id, event_message in db_records:
+            yield 'logarchive_artifacts', row_id
+            for rule_id, regex in rules:
+                if regex.search(event_message):
+                    yield rule_id, row_id
 
-    return data_headers, data_list, source_path
+    lava_write_matches('logarchive', classify(get_sqlite_db_records(source_path, query)))
+    # Streamed from the cursor, the logarchive table can match a large number of rows
+    data_list = _matched_records(source_path, 'logarchive_artifacts')
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_time_change(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Time change: Clock shifted by%'
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
+    data_list = list(_matched_records(source_path, 'logarchive_time_change'))
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_flashlight(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%[Flashlight Controller]%' 
-    OR event_message LIKE '%<<<<AVFlashlight>>>>-%'
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
+    data_list = list(_matched_records(source_path, 'logarchive_flashlight'))
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_executed_apps(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Allowing tap for icon view%'
-        OR event_message LIKE '%Launching application%'
-        OR event_message LIKE '%transition source:%'
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
+    data_list = list(_matched_records(source_path, 'logarchive_executed_apps'))
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_motionstate(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Motion State Transition:%'
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
+    data_list = list(_matched_records(source_path, 'logarchive_motionstate'))
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_tethering(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Tethering is now enabled with%'
-        OR event_message LIKE '%Received notification that wireless modem state changed%'
-        OR event_message LIKE '%Previous tethering state was%'
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
+    data_list = list(_matched_records(source_path, 'logarchive_tethering'))
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_airplane_mode(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Airplane Mode is now 1%'
-        OR event_message LIKE '%Airplane Mode is now On%'
-        OR event_message LIKE '%Setting airplane mode to true%'
-        OR event_message LIKE '%Airplane mode now active%'
-        OR event_message LIKE '%Airplane mode now active%'
-        OR event_message LIKE '%enabling airplanemode%'
-        OR event_message LIKE '%Airplane mode changed%'
-        OR event_message LIKE '%Airplane Mode is now 0%'
-        OR event_message LIKE '%Airplane Mode is now Off%'
-        OR event_message LIKE '%Airplane Mode is now On%'
-        OR event_message LIKE '%Setting airplane mode to false%'
-        OR event_message LIKE '%Airplane mode now inactive%'
-        OR event_message LIKE '%Airplane mode Disabled%'
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
+    data_list = list(_matched_records(source_path, 'logarchive_airplane_mode'))
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_lock_status(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Screen did lock%'
-        OR event_message LIKE '%ScreenOn changed%'
-        OR event_message LIKE '%Screen shut off%'
-        OR event_message LIKE '%screen is locked%'
-        OR event_message LIKE '%screen is unlocked%'
-        OR event_message LIKE '%Device unlocked%'
-        OR event_message LIKE '%Device lock status%'
-        OR event_message LIKE '%Biometric match complete%'
+    data_list = list(_matched_records(source_path, 'logarchive_lock_status'))
 
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_wifi_status(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%WiFi state changed:%'
-        OR event_message LIKE '%Toggled WiFi state%'
-        OR event_message LIKE '%is WiFi associated?%'
-        OR event_message LIKE '%link status changed%'
-        OR event_message LIKE '%reachability changed%'
-        OR event_message LIKE '%ISNetworkObserver%'
-        OR event_message LIKE '%ForgetSSID%'
-        OR event_message LIKE '%en0: SSID%'
-        OR event_message LIKE '%Removing Lease SSID%'
-        OR event_message LIKE '%SysMon: WiFi state changed:%'
-        OR event_message LIKE '%WiFiManagerClientRemoveNetworkWithReason:%'
-        OR event_message LIKE '%WiFiSecurityRemovePassword%'
-        OR event_message LIKE '%AlwaysOnWifi:%'
-        OR event_message LIKE '%WiFiDeviceManagerSetNetworks:%'
-        OR event_message LIKE '%Scanning For Broadcast found:%'
-        OR event_message LIKE '%Scanning Remaining Channels%'
-        OR event_message LIKE '%WiFiSettlementObserver _handleScanResults%'
-        OR event_message LIKE '%Attempting to join%'
-        OR event_message LIKE '%WiFiLQAMgrSetCurrentNetwork: Joined SSID:%'
-        OR event_message LIKE '%Preparing background scan request for %'
-        OR event_message LIKE '%WiFiNetworkPrepareKnownBssList%'
-        OR event_message LIKE '%to list of known networks%'
-        OR event_message LIKE '%{AUTOJOIN, SCAN*} Scanning 2Ghz Channels found:%'
-        OR event_message LIKE '%{AUTOJOIN, SCAN*} Scanning 5Ghz Channels found:%'
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
+    data_list = list(_matched_records(source_path, 'logarchive_wifi_status'))
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_bluetooth_status(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Bluetooth state changed%'
-        OR event_message LIKE '%Sending new bluetooth state%'
-        OR event_message LIKE '%Bluetooth state changed PoweredOn%'
-        OR event_message LIKE '%ServiceManager disconnection result for%'
-        OR event_message LIKE '%Device type is%'
-        OR event_message LIKE '%is asking to connect device%'
-        OR event_message LIKE '%Received connection result for%'
-        OR event_message LIKE '%Received disconnection result for%'
-        OR event_message LIKE '%Received handsfree disconnection%'
-        OR event_message LIKE '%Sending ring notification for call%'
-        OR event_message LIKE '%Accepting incoming audio connection%'
-        OR event_message LIKE '%Received voice audio connected%'
-        OR event_message LIKE '%Stopping A2DP audio streaming%'
-        OR event_message LIKE '%Bluetooth A2DP device%'
-        OR event_message LIKE '%Bluetooth Daemon: A2DP streaming%'
-        OR event_message LIKE '%Starting Media connection to device%'
-        OR event_message LIKE '%Received voice disconnection%'
-        OR event_message LIKE '%Disconnecting audio from device%'
-        OR event_message LIKE '%Audio was already disconnected%'
-        OR event_message LIKE '%Toggled Bluetooth state from%'
-        OR event_message LIKE '%CUBluetoothDevice%'
-        OR event_message LIKE '%handsfree device disconnected%'
-        OR event_message LIKE '%handsfree device connected%'
-        OR event_message LIKE '%Bluetooth state updated%'
-        OR event_message LIKE '%Bluetooth power is now off%'
-        OR event_message LIKE '%Bluetooth state%'
-        OR event_message LIKE '%Sending call state update%'
-        OR event_message LIKE '%A2DP LinkQualityReport%'
+    data_list = list(_matched_records(source_path, 'logarchive_bluetooth_status'))
 
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_audio_status(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%AudioQueueIsPlaying%'
-        OR event_message LIKE '%VolumeIncrement%'
-        OR event_message LIKE '%rawVolumeIncreasePress%'
-        OR event_message LIKE '%rawVolumeDecreasePress%'
-        OR event_message LIKE '%Volume active%'
-        OR event_message LIKE '%PlaybackQueueInvalidation%'
-        OR event_message LIKE '%volumeValueDidChange%'
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
+    data_list = list(_matched_records(source_path, 'logarchive_audio_status'))
+
     #Info: https://thesisfriday.com/index.php/2025/05/30/thesis-friday-8-aul-physical-buttons-volume/
-    
-    return data_headers, data_list, source_path
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
 
 @artifact_processor
 def logarchive_navigation(context):
     source_path = get_file_path(context.get_files_found(), '_lava_artifacts.db')
-    data_list = []
-    
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Starting route to%'
-        OR event_message LIKE '%Proceed to the%'
-        OR event_message LIKE '%Proceed to\\%'
-        OR event_message LIKE '%Turn right%'
-        OR event_message LIKE '%Turn left%'
-        OR event_message LIKE '%roundabout%'
-        OR event_message LIKE '%first exit%'
-        OR event_message LIKE '%Stay in the%'
-        OR event_message LIKE '%parking lot for%'
-        OR event_message LIKE '%of a mile%'
-        OR event_message LIKE '%In about%'
-        OR event_message LIKE '%then arrive%'
-        OR event_message LIKE '%your destination%'
-        OR event_message LIKE '%At the light%'
-        OR event_message LIKE '%Arrived\\%'
-    '''
-    
-    data_list = list( get_sqlite_db_records(source_path, query) )
-    data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
-    
-    return data_headers, data_list, source_path
\ No newline at end of file
+    data_list = list(_matched_records(source_path, 'logarchive_navigation'))
+
+    return LOGARCHIVE_HEADERS, data_list, source_path
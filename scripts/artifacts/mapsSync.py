@@ -37,7 +37,7 @@ __artifacts_v2__ = {
 import sqlite3
 import struct
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 
 from scripts.ilapfuncs import (artifact_processor, logfunc, open_sqlite_db_readonly,
                                does_column_exist_in_db)
@@ -87,7 +87,7 @@ def _parse_journey_blob(blob):
         return ''
     agg1 = ''
     try:
-        message, _ = blackboxprotobuf.decode_message(blob)
+        message = decode_protobuf(blob)
         for x in message['1']:
             if isinstance(x, dict):
                 check = x.get('2')
@@ -113,7 +113,7 @@ def _parse_mapitem_blob(blob):
         return ''
     mapitem = ''
     try:
-        message, _ = blackboxprotobuf.decode_message(blob)
+        message = decode_protobuf(blob)
         get101 = get_recursively(message, '101')
         if not isinstance(get101[0]['2'], bytes):
             for address in get101[0]['2']['11']:
@@ -30,9 +30,9 @@ __artifacts_v2__ = {
 import os
 from datetime import timezone
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 
-from scripts.ccl_segb.ccl_segb import read_segb_file
+from scripts.segb_reader import read_segb_file
 from scripts.ccl_segb.ccl_segb_common import EntryState
 from scripts.ilapfuncs import artifact_processor, webkit_timestampsconv
 
@@ -84,7 +84,7 @@ def get_notificationsDuet(context):
             segb_time = record.timestamp1.replace(tzinfo=timezone.utc)
             if record.state == EntryState.Written:
                 try:
-                    protostuff, _ = blackboxprotobuf.decode_message(record.data, _TYPEDEF)
+                    protostuff = decode_protobuf(record.data, _TYPEDEF)
                 except Exception:  # pylint: disable=broad-exception-caught
                     continue  # malformed/variant record
                 p1 = protostuff.get('1') or {}
@@ -44,6 +44,8 @@ __artifacts_v2__ = {
                   '*/keychain-backup.plist'),
         "output_types": "standard",
         "artifact_icon": "users",
+        # Decrypts the database to the same file as the other Signal artifacts
+        "depends_on": "get_signalIOSMessages",
     },
     "get_signalIOSThreads": {
         "name": "Signal - Conversations",
@@ -60,6 +62,7 @@ __artifacts_v2__ = {
                   '*/keychain-backup.plist'),
         "output_types": "standard",
         "artifact_icon": "message-square",
+        "depends_on": "get_signalIOSContacts",
     },
 }
 
@@ -52,7 +52,7 @@ import pandas as pd
 from scripts.artifact_report import ArtifactHtmlReport
 from scripts.chat_rendering import render_chat, chat_HTML
 from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, \
-    convert_cocoa_core_data_ts_to_utc, check_in_media, lava_get_full_media_info, logfunc
+    convert_cocoa_core_data_ts_column_to_utc, check_in_media, lava_get_full_media_info, logfunc
 
 import typedstream
 
@@ -146,23 +146,21 @@ def sms(context):
                     'Chat ID', 'From Me')
 
 
-    # NOTE: moved the definition outside to avoid creating a new function object
-    #   on every turn of the loop
-    def fix_cocoa_date(ts):
-        if not ts or ts == '': return ''
-        if ts > 1000000000000000: # Nanoseconds
-            ts = ts / 1000000000
-        return convert_cocoa_core_data_ts_to_utc(ts)
-    
-    db_records = get_sqlite_db_records(source_path, query)
-    
-    for record in db_records:
+    # The timestamps of a column converted at once
+    def fix_cocoa_dates(column):
+        return convert_cocoa_core_data_ts_column_to_utc(
+            ['' if not ts else ts / 1000000000 if ts > 1000000000000000 else ts  # Nanoseconds
+             for ts in column])
+
+    db_records = list(get_sqlite_db_records(source_path, query))
+    message_timestamps = fix_cocoa_dates([record[0] for record in db_records])
+    read_timestamps = fix_cocoa_dates([record[1] for record in db_records])
+    attachment_timestamps = fix_cocoa_dates([record[13] for record in db_records])
+    delivered_timestamps = fix_cocoa_dates([record[20] for record in db_records])
+
+    for record, message_timestamp, read_timestamp, attachment_timestamp, delivered_timestamp in zip(
+            db_records, message_timestamps, read_timestamps, attachment_timestamps, delivered_timestamps):
 
-        message_timestamp = fix_cocoa_date(record[0])
-        read_timestamp = fix_cocoa_date(record[1])
-        attachment_timestamp = fix_cocoa_date(record[13])
-        delivered_timestamp = fix_cocoa_date(record[20])
-        
         # Use message.text if available, otherwise try to parse from attributedBody
         message_text = record[2]
         if not message_text and record[19]:
@@ -40,8 +40,14 @@ __artifacts_v2__ = {
         "category": "Database Metadata",
         "notes": "LAVA-only detailed string output.",
         "paths": ('**/*-wal', '**/*-journal'),
-        "output_types": "lava_only",
+        "output_types": "none",
         "artifact_icon": "database",
+        # Writes the same report files as walStrings, which have to be complete before
+        # they are written again by another worker
+        "depends_on": "walStrings",
+        # The rows are written to the LAVA database by the function, the artifact cache
+        # only replays rows returned to artifact_processor
+        "cache": False,
         "sample_data": {
             "ctf2020_ios12": "iOS 12.4 | 789973 rows",
             "dexter_ios18": "iOS 18.3.2 | 1161158 rows",
@@ -59,98 +65,96 @@ __artifacts_v2__ = {
             "jess_ios15": "iOS 15.0.2 | 161269 rows",
             "magnet_ios16": "iOS 16.1.1 | 246100 rows",
         }
+    },
+    "walStringsUTF16Details": {
+        "name": "Database Journal Strings - UTF-16 Details",
+        "description": "Provides searchable UTF-16LE strings extracted from SQLite WAL and journal files.",
+        "author": "@AlexisBrignoni",
+        "creation_date": "2026-10-18",
+        "last_update_date": "2026-10-18",
+        "requirements": "none",
+        "category": "Database Metadata",
+        "notes": "LAVA-only detailed string output, for the databases storing their text in UTF-16. "
+                 "The strings of each file are also written to a -utf16.txt file of the report folder. "
+                 "Only run with --wal-strings-utf16 on the command line, and deselected in the GUI.",
+        "paths": ('**/*-wal', '**/*-journal'),
+        "output_types": "none",
+        "artifact_icon": "database",
+        "depends_on": "walStrings",
+        "cache": False,
     }
 }
 
 import os
-import re
-from pathlib import Path
+from scripts.file_strings import read_strings_file, write_strings_files
 from scripts.ilapfuncs import (
     artifact_processor,
+    lava_only_info,
     logfunc
     )
+from scripts.lavafuncs import lava_bulk_insert, lava_process_artifact, lava_set_record_count
 from scripts.html_safe import esc
 
-ASCII_STRINGS_RE = re.compile(rb'[\x20-\x7e]{4,}')
+DETAIL_HEADERS = (
+    'String',
+    'Length',
+    'First Byte Offset',
+    'Occurrence Count',
+    'Filename',
+    'Source File'
+)
 _extraction_cache = {}
 
 
-def extract_strings(file_path):
-    with open(file_path, 'rb') as file:
-        data = file.read()
-
-    strings = {}
-    total_matches = 0
-
-    for match in ASCII_STRINGS_RE.finditer(data):
-        raw_value = match.group()
-        value = raw_value.decode('ascii').strip()
-        if len(value) < 4:
-            continue
-
-        total_matches += 1
-        leading_spaces = len(raw_value) - len(raw_value.lstrip())
-        offset = match.start() + leading_spaces
-
-        if value in strings:
-            strings[value]['count'] += 1
-        else:
-            strings[value] = {
-                'offset': offset,
-                'count': 1
-            }
-
-    return strings, total_matches
-
-
-def process_journal_files(context):
+def process_journal_files(context, utf16=False):
     files_found = context.get_files_found()
     report_folder = context.get_report_folder()
     cache_key = (
         tuple(str(file_path) for file_path in files_found),
-        str(report_folder)
+        str(report_folder),
+        utf16
     )
     if cache_key in _extraction_cache:
         return _extraction_cache[cache_key]
 
     summary_data = []
     summary_html_data = []
-    detail_data = []
+    detail_files = []
     source_path_ref = ''
     report_number = 1
+    suffix = '-utf16' if utf16 else ''
 
-    for file_found in files_found:
+    journals = []
+    for index, file_found in enumerate(files_found):
         file_found = str(file_found)
         source_path = context.get_relative_path(file_found)
 
         if not source_path_ref:
             source_path_ref = source_path
 
-        try:
-            if Path(file_found).stat().st_size == 0:
-                continue
-            strings, total_matches = extract_strings(file_found)
-        except OSError as error:
-            logfunc(f"Error reading {file_found}: {error}")
+        journal_name = os.path.basename(file_found)
+        # Numbered once the files without strings are known, and named after the process
+        # so that two artifacts extracting at once do not write to the same file
+        part_path = os.path.join(report_folder, f"{index}_{journal_name}{suffix}.{os.getpid()}.part")
+        journals.append((file_found, journal_name, source_path, part_path))
+
+    # The files are scanned by a pool of processes, each writing the strings of its file
+    # to the report folder, in the order of the files
+    jobs = [(file_found, part_path, utf16) for file_found, _, _, part_path in journals]
+    for (file_found, journal_name, source_path, part_path), result in zip(journals, write_strings_files(jobs)):
+        if isinstance(result, str):
+            logfunc(f"Error reading {file_found}: {result}")
+            if os.path.exists(part_path):
+                os.remove(part_path)
             continue
 
-        if not strings:
+        total_matches, unique_strings = result
+        if not unique_strings:
             continue
 
-        journal_name = os.path.basename(file_found)
-        output_filename = f"{report_number}_{journal_name}.txt"
+        output_filename = f"{report_number}_{journal_name}{suffix}.txt"
         output_path = os.path.join(report_folder, output_filename)
-
-        try:
-            with open(output_path, 'w', encoding='utf-8') as output_file:
-                for value, string_info in strings.items():
-                    output_file.write(
-                        f"{string_info['offset']}\t"
-                        f"{string_info['count']}\t{value}\n"
-                    )
-        except OSError as error:
-            logfunc(f"Error writing report file {output_path}: {error}")
-            continue
+        os.replace(part_path, output_path)
 
         relative_output_path = (
             f'{os.path.basename(report_folder)}/{output_filename}'
@@ -163,28 +167,22 @@ def process_journal_files(context):
             relative_output_path,
             journal_name,
             total_matches,
-            len(strings),
+            unique_strings,
             source_path
         )
         summary_data.append(summary_row)
         summary_html_data.append((report_link, *summary_row[1:]))
 
-        for value, string_info in strings.items():
-            detail_data.append((
-                value,
-                len(value),
-                string_info['offset'],
-                string_info['count'],
-                journal_name,
-                source_path
-            ))
+        # The details are read back from the report file when walStringsDetails
+        # needs them, as there can be over a million of them
+        detail_files.append((output_path, journal_name, source_path))
 
         report_number += 1
 
     result = (
         summary_data,
         summary_html_data,
-        detail_data,
+        detail_files,
         source_path_ref
     )
     _extraction_cache[cache_key] = result
@@ -209,16 +207,47 @@ def walStrings(context):
     return data_headers, (data_list, html_data_list), source_path
 
 
+def read_string_details(detail_files):
+    for output_path, journal_name, source_path in detail_files:
+        for value, offset, count in read_strings_file(output_path):
+            yield (
+                value,
+                len(value),
+                offset,
+                count,
+                journal_name,
+                source_path
+            )
+
+
+def insert_string_details(context, func_name, utf16=False):
+    '''Streams the strings of the journals into their LAVA table, without holding them in memory'''
+    _, _, detail_files, source_path = process_journal_files(context, utf16)
+    artifact_info = context.get_artifact_info()
+    category = artifact_info.get('category', '')
+    artifact_name = artifact_info.get('name', func_name)
+
+    if not detail_files:
+        logfunc(f"No data found for {artifact_name}")
+        lava_only_info(category, artifact_name, artifact_name, 0)
+        return DETAIL_HEADERS, [], source_path
+
+    table_name, _, _ = lava_process_artifact(
+        category, context.get_module_name(), artifact_name, DETAIL_HEADERS, func_name=func_name,
+        artifact_icon=artifact_info.get('artifact_icon'), source_path=source_path)
+    record_count = lava_bulk_insert(table_name, DETAIL_HEADERS, read_string_details(detail_files))
+    lava_set_record_count(category, table_name, record_count)
+    lava_only_info(category, artifact_name, table_name, record_count)
+    logfunc(f"Found {record_count:,} {'records' if record_count > 1 else 'record'} for {artifact_name}")
+
+    return DETAIL_HEADERS, [], source_path
+
+
 @artifact_processor
 def walStringsDetails(context):
-    _, _, data_list, source_path = process_journal_files(context)
-    data_headers = (
-        'String',
-        'Length',
-        'First Byte Offset',
-        'Occurrence Count',
-        'Filename',
-        'Source File'
-    )
+    return insert_string_details(context, 'walStringsDetails')
 
-    return data_headers, data_list, source_path
+
+@artifact_processor
+def walStringsUTF16Details(context):
+    return insert_string_details(context, 'walStringsUTF16Details', utf16=True)
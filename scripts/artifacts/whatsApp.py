@@ -101,7 +101,7 @@ __artifacts_v2__ = {
 }
 
 
-from scripts import blackboxprotobuf
+from scripts.protobuf_decoder import decode_protobuf
 
 from pathlib import Path
 from scripts.ilapfuncs import (
@@ -301,7 +301,7 @@ def whatsAppMessages(context):
         from_forward = ''
         if metadata:
             try:
-                decoded_data, _ = blackboxprotobuf.decode_message(metadata)
+                decoded_data = decode_protobuf(metadata)
                 number_forward = f'{decoded_data.get("17", "")}'
                 forward_id = decoded_data.get("21")
                 from_forward = forward_id.decode("utf-8") if isinstance(forward_id, bytes) else ''
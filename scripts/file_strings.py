@@ -0,0 +1,131 @@
+"""
+Extraction of the printable strings of binary files, such as SQLite journals.
+
+The files are memory mapped and scanned in place, so a large file is never read into
+memory as a whole, and a list of files is shared between worker processes where they can
+be forked (on the other platforms a spawned worker would run the entry script, the GUI or
+the frozen application again, so the files are scanned one after the other). An artifact
+already running in a --workers process scans them one after the other too, the other
+workers keep the CPUs busy. Each string is counted once per value, with the offset of
+its first occurrence, and the strings of a file are written to a text file, one per line
+(offset, count and string separated by tabs), that the caller reads back: a worker never
+sends the strings of a file back to the main process.
+
+Functions:
+    extract_strings: Returns the strings of a file with their first offset and count.
+    write_strings_file: Writes the strings of a file to a text file.
+    write_strings_files: Writes the strings of several files, from a pool of processes.
+    read_strings_file: Yields the strings of a text file written by write_strings_file.
+"""
+
+import mmap
+import multiprocessing
+import os
+import re
+
+from scripts.ilapfuncs import OutputParameters
+
+ASCII_STRINGS_RE = re.compile(rb'[\x20-\x7e]{4,}')
+# Written with its first character outside of the group, which lets the regular expression
+# engine skip to the bytes that can start a string instead of trying every position
+UTF16_STRINGS_RE = re.compile(rb'[\x20-\x7e]\x00(?:[\x20-\x7e]\x00){3,}')
+
+
+def extract_strings(file_path, utf16=False):
+    '''
+    Returns the strings of at least four printable ASCII characters of a file, without
+    their leading and trailing spaces.
+    Args:
+        file_path (str): The file to scan.
+        utf16 (bool): Extract the strings encoded in UTF-16LE instead of those in ASCII.
+    Returns:
+        tuple: A dict of the strings, with the offset of their first occurrence and their
+               count in a [offset, count] list, and the number of strings found.
+    '''
+
+    strings_re, encoding, char_size = (UTF16_STRINGS_RE, 'utf-16-le', 2) if utf16 else \
+        (ASCII_STRINGS_RE, 'ascii', 1)
+    strings = {}
+    total_matches = 0
+    with open(file_path, 'rb') as file:
+        if not os.fstat(file.fileno()).st_size:
+            return strings, total_matches  # an empty file cannot be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for match in strings_re.finditer(data):
+                raw_value = match.group().decode(encoding)
+                value = raw_value.strip()
+                if len(value) < 4:
+                    continue
+
+                total_matches += 1
+                string_info = strings.get(value)
+                if string_info:
+                    string_info[1] += 1
+                else:
+                    leading_spaces = len(raw_value) - len(raw_value.lstrip())
+                    strings[value] = [match.start() + leading_spaces * char_size, 1]
+    return strings, total_matches
+
+
+def write_strings_file(file_path, output_path, utf16=False):
+    '''
+    Writes the strings of a file to a text file, which is not created if there are none.
+    Args:
+        file_path (str): The file to scan.
+        output_path (str): The text file to write.
+        utf16 (bool): Extract the strings encoded in UTF-16LE instead of those in ASCII.
+    Returns:
+        tuple: The number of strings found and the number of different strings.
+    '''
+
+    strings, total_matches = extract_strings(file_path, utf16)
+    if strings:
+        with open(output_path, 'w', encoding='utf-8') as output_file:
+            output_file.writelines(f'{offset}\t{count}\t{value}\n' for value, (offset, count) in strings.items())
+    return total_matches, len(strings)
+
+
+def _write_strings_file(job):
+    '''Pool worker: returns what write_strings_file returns, or the error message'''
+    try:
+        return write_strings_file(*job)
+    except (OSError, ValueError) as ex:
+        return str(ex)
+
+
+def write_strings_files(jobs, processes=None):
+    '''
+    Writes the strings of several files, each from a process of a pool, or one after the
+    other without the fork start method.
+    Args:
+        jobs (list): (file path, output path, utf16) tuples, as taken by write_strings_file.
+        processes (int): Number of processes, by default the number of CPUs, or 1 in a
+                         worker process of the artifact scheduler.
+    Yields:
+        The result of write_strings_file for each job, in the order of the jobs, or the
+        message of the error that prevented it.
+    '''
+
+    if processes is None and OutputParameters.log_buffer is not None:
+        processes = 1  # the artifacts are already run by a pool of workers
+    processes = min(processes or os.cpu_count() or 1, len(jobs))
+    if processes > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        with multiprocessing.get_context('fork').Pool(processes) as pool:
+            yield from pool.imap(_write_strings_file, jobs)
+    else:
+        yield from map(_write_strings_file, jobs)
+
+
+def read_strings_file(output_path):
+    '''
+    Yields the strings of a text file written by write_strings_file.
+    Args:
+        output_path (str): The text file.
+    Yields:
+        tuple: The string, the offset of its first occurrence and its count, as strings.
+    '''
+
+    with open(output_path, 'r', encoding='utf-8') as output_file:
+        for line in output_file:
+            offset, count, value = line.rstrip('\n').split('\t', 2)
+            yield value, offset, count
@@ -132,12 +132,19 @@ tabs_nav = \
             <a class="nav-link" id="files-list-tab" data-toggle="tab" href="#files" role="tab" aria-controls="files" aria-selected="false">Processed files list</a>
         </li>
 """
-tabs_nav_with_lava = tabs_nav + \
+tabs_nav_lava_item = \
 """
         <li class="nav-item">
             <a class="nav-link" id="lava-tab" data-toggle="tab" href="#lava-only" role="tab" aria-controls="lava" aria-selected="false">LAVA only artifacts</a>
         </li>
 """
+tabs_nav_with_lava = tabs_nav + tabs_nav_lava_item
+tabs_nav_timings_item = \
+"""
+        <li class="nav-item">
+            <a class="nav-link" id="timings-tab" data-toggle="tab" href="#timings" role="tab" aria-controls="timings" aria-selected="false">Artifact timings</a>
+        </li>
+"""
 tabs_contents = \
 """
     </ul>
@@ -147,15 +154,20 @@ tabs_contents = \
         <div class="tab-pane fade text-monospace" id="run" role="tabpanel" aria-labelledby="script-run-tab"><br />{}</div>
         <div class="tab-pane fade" id="files" role="tabpanel" aria-labelledby="profile-tab"><br />{}</div>
 """
-tabs_code_with_lava = tabs_nav_with_lava + tabs_contents + \
+tabs_pane_lava = \
 """
         <div class="tab-pane fade" id="lava-only" role="tabpanel" aria-labelledby="lava-tab"><br />{}</div>
-    </div>
 """
-tabs_code = tabs_nav + tabs_contents + \
+tabs_pane_timings = \
+"""
+        <div class="tab-pane fade" id="timings" role="tabpanel" aria-labelledby="timings-tab"><br />{}</div>
+"""
+tabs_end = \
 """
     </div>
 """
+tabs_code_with_lava = tabs_nav_with_lava + tabs_contents + tabs_pane_lava + tabs_end
+tabs_code = tabs_nav + tabs_contents + tabs_end
 
 # thank you note , at bottom of index.html
 thank_you_note = \
@@ -269,11 +281,25 @@ default_responsive_table_script = \
 """
     <script>
         $(document).ready(function() {
-            $('.table').DataTable({
-                //"scrollY": "60vh",
-                //"scrollX": "10%",
-                //"scrollCollapse": true,
-                "aLengthMenu": [[ 15, 50, 100, -1 ], [ 15, 50, 100, "All" ]],
+            $('.table').each(function() {
+                // Rows written as JSON (ArtifactHtmlReport inline_rows), only rendered when shown
+                var jsonRows = [];
+                $(this).find('script.table-rows').each(function() {
+                    var rows = JSON.parse(this.textContent);
+                    for (var i = 0; i < rows.length; i++) {
+                        jsonRows.push(rows[i]);
+                    }
+                }).remove();
+                var table = $(this).DataTable({
+                    //"scrollY": "60vh",
+                    //"scrollX": "10%",
+                    //"scrollCollapse": true,
+                    "deferRender": true,
+                    "aLengthMenu": [[ 15, 50, 100, -1 ], [ 15, 50, 100, "All" ]],
+                });
+                if (jsonRows.length) {
+                    table.rows.add(jsonRows).draw();
+                }
             });
             $('.dataTables_length').addClass('bs-select');
             $('#mySpinner').remove();
@@ -282,6 +308,20 @@ default_responsive_table_script = \
     </script>
 """
 
+# Sorting of the Artifact timings table of index.html, slowest artifact first
+artifact_timings_script = \
+"""
+    <script>
+        $(document).ready(function() {
+            $('#artifact-timings').DataTable({
+                "order": [[ 3, "desc" ]],
+                "aLengthMenu": [[ 25, 100, -1 ], [ 25, 100, "All" ]],
+            });
+            $('.dataTables_length').addClass('bs-select');
+        });
+    </script>
+"""
+
 page_footer = \
 """
     </body>
@@ -1,25 +1,35 @@
 # common standard imports
+import atexit
 import codecs  # pylint: disable=unused-import  # re-exported
 import contextlib
 import csv
 import hashlib
+import html
 import inspect
 import io
 import json
+import logging
 import math
 import nska_deserialize
 import os
 import plistlib
+import queue
 import re  # pylint: disable=unused-import  # re-exported for modules importing it from here
 import shutil
 import sqlite3
 import sys
+import threading
 import xml
 
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 from urllib.parse import quote
+from time import perf_counter
+import scripts.artifact_cache as artifact_cache
+import scripts.artifact_profiler as artifact_profiler
 import scripts.artifact_report as artifact_report
 from scripts.context import Context
 from scripts.version_info import leapp_name  # pylint: disable=unused-import  # re-exported
@@ -50,7 +60,10 @@ _console_write = sys.stdout.write
 
 # common third party imports
 import pytz
-import simplekml
+try:
+    import numpy
+except ImportError:
+    numpy = None
 from scripts.filetype import guess_mime, guess_extension
 from functools import wraps
 
@@ -60,7 +73,7 @@ from PIL import Image
 
 from scripts.lavafuncs import lava_process_artifact, lava_insert_sqlite_data, lava_get_media_item, \
     lava_insert_sqlite_media_item, lava_insert_sqlite_media_references, lava_get_media_references, \
-    lava_get_full_media_info
+    lava_get_full_media_info, lava_set_record_count, sqlite_busy_timeout
 
 os.path.basename = lru_cache(maxsize=None)(os.path.basename)
 
@@ -71,6 +84,47 @@ thumb_size = 256, 256
 identifiers = {}
 icons = {}
 lava_only_artifacts = {}
+# Rows of an artifact yielding its rows that are written to the outputs at a time
+artifact_chunk_size = 10000
+# Rows of a table of the HTML report written as HTML, its script adds those that follow from JSON
+html_inline_rows = 10000
+# Bytes written to the TSV and KML exports at a time
+export_buffer_size = 1024 * 1024
+# Read-only SQLite connections shared by the artifacts of a run (open_sqlite_db_readonly)
+sqlite_pool_size = 64
+sqlite_mmap_size = 256 * 1024 * 1024
+sqlite_cache_kib = 8192
+# Rows get_sqlite_db_rows fetches, and converts, at a time
+sqlite_fetch_size = 10000
+# Connections by (process id, thread id), then by path, least recently used first: a
+# worker process forked from the main process must not use the connections it inherited
+_sqlite_dbs = {}
+# Connections to the databases written by the artifacts by (process id, path), see _open_output_db
+_output_dbs = {}
+# True in a worker process, which commits the rows of the output databases after every batch
+# instead of when the artifact ends: an open write transaction locks the database for the other workers
+_output_dbs_commit_each_write = False
+# Seconds between two writes of the thread appending the messages of logfunc to Screen_Output.html,
+# the messages logged in between are written together
+log_write_interval = 0.05
+# Seconds between two refreshes of the log window of the GUI
+gui_refresh_interval = 0.1
+# The thread writing Screen_Output.html by process id, see _LogWriter
+_log_writers = {}
+# Set in the worker processes forked from a process writing Screen_Output.html, which append to it themselves
+_forked_log_writer = False
+_unix_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_naive_unix_epoch = datetime(1970, 1, 1)
+_one_second = timedelta(seconds=1)
+# The text of a datetime as str gives it, the only one a timeline key is parsed from
+_timeline_datetime_text = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d{6})?([+-]\d{2}:\d{2})?')
+# Values of a column from which the convert_*_ts_column_* functions convert them with numpy
+ts_column_min_size = 64
+# The powers of ten convert_unix_ts_in_seconds divides by, as the floats it divides by
+_ts_divisors = numpy.array([float(10 ** n) for n in range(301)]) if numpy is not None else None
+# Set by artifact_processor while an artifact runs whose result goes to the artifact cache,
+# collects what device_info records so that it can be replayed on a cache hit
+_recorded_identifiers = None
 
 class iOS:
     _version = None
@@ -92,6 +146,10 @@ class OutputParameters:
     # static parameters
     nl = '\n'
     screen_output_file_path = ''
+    # Set to a list in worker processes, which hand their messages back to the main process
+    log_buffer = None
+    # The messages of logfunc below this level (those of the logging module) are dropped
+    log_level = logging.INFO
 
     def __init__(self, output_folder, custom_folder_name=None):
         self.output_folder_base = get_output_folder_base(output_folder, custom_folder_name)
@@ -104,6 +162,8 @@ class OutputParameters:
             self.output_folder_base, '_HTML', '_Script_Logs', 'DeviceInfo.html')
         OutputParameters.screen_output_file_path_lava_only = os.path.join(
             self.output_folder_base, '_HTML', '_Script_Logs', 'Lava_only_artifacts_log.html')
+        OutputParameters.screen_output_file_path_timings = os.path.join(
+            self.output_folder_base, '_HTML', '_Script_Logs', 'Artifact_Timings.html')
 
         os.makedirs(os.path.join(self.output_folder_base, '_HTML', '_Script_Logs'))
         os.makedirs(self.data_folder)
@@ -113,12 +173,27 @@ class OutputParameters:
 class GuiWindow:
     '''This only exists to hold window handle if script is run from GUI'''
     window_handle = None  # static variable
+    last_refresh = 0.0
+    refresh_pending = False
 
     @staticmethod
     def SetProgressBar(n, total):  # pylint: disable=unused-argument
         if GuiWindow.window_handle:
             progress_bar = GuiWindow.window_handle.nametowidget('progress_bar_frame.progress_bar')
             progress_bar.config(value=n)
+            GuiWindow.refresh(force=True)
+
+    @staticmethod
+    def refresh(force=False):
+        '''Redraws the window, at most every gui_refresh_interval seconds unless forced to show what
+        changed since the last time'''
+        now = perf_counter()
+        if now - GuiWindow.last_refresh >= gui_refresh_interval or (force and GuiWindow.refresh_pending):
+            GuiWindow.window_handle.update()
+            GuiWindow.last_refresh = perf_counter()
+            GuiWindow.refresh_pending = False
+        else:
+            GuiWindow.refresh_pending = True
 
 class MediaItem():
     def __init__(self, id):  # pylint: disable=redefined-builtin
@@ -157,23 +232,144 @@ class MediaReferences():
         self.name = media_ref_info[4]
 
 
-def logfunc(message=""):
+class _LogWriter:
+    '''Appends the messages of logfunc to Screen_Output.html from a thread, the file staying open for the run.
+
+    The messages queued while the thread writes are written with the next write, every
+    log_write_interval seconds at most, or right away when they are flushed. The file is
+    unbuffered: nothing written stays in a buffer that a forked worker would inherit, and
+    the messages are flushed before a fork, so that those of the worker come after them.'''
+
+    def __init__(self, path):
+        self.path = path
+        self.messages = queue.SimpleQueue()
+        self.flushed = threading.Event()
+        self.file = open(path, 'ab', buffering=0)  # pylint: disable=consider-using-with
+        self.thread = threading.Thread(target=self._write_messages, name='logfunc', daemon=True)
+        self.thread.start()
+
+    def write(self, text):
+        self.messages.put(text)
+
+    def flush(self):
+        '''Waits for the messages queued to be written'''
+        written = threading.Event()
+        self.messages.put(written)
+        self.flushed.set()
+        while self.thread.is_alive() and not written.wait(1):
+            pass
+
+    def close(self):
+        self.messages.put(None)
+        self.thread.join()
+
+    def _write_messages(self):
+        try:
+            while True:
+                batch = [self.messages.get()]
+                with contextlib.suppress(queue.Empty):
+                    while True:
+                        batch.append(self.messages.get_nowait())
+                texts = []
+                for item in batch:
+                    if isinstance(item, str):
+                        texts.append(item)
+                        continue
+                    self._write(texts)
+                    texts = []
+                    if item is None:
+                        return
+                    item.set()
+                self._write(texts)
+                self.flushed.wait(log_write_interval)
+                self.flushed.clear()
+        finally:
+            self.file.close()
+
+    def _write(self, texts):
+        if not texts:
+            return
+        data = memoryview(''.join(texts).encode('utf8', 'backslashreplace'))
+        while data:
+            data = data[self.file.write(data):]
+
+
+def _log_writer():
+    '''The writer of Screen_Output.html of this process, None in a forked worker'''
+    if _forked_log_writer:
+        return None
+    path = OutputParameters.screen_output_file_path
+    writer = _log_writers.get(os.getpid())
+    if writer is None or writer.path != path:
+        if writer is not None:
+            writer.close()
+        writer = _log_writers[os.getpid()] = _LogWriter(path)
+    return writer
+
+
+def _forget_log_writer():
+    global _forked_log_writer  # pylint: disable=global-statement
+    _forked_log_writer = bool(_log_writers)
+
+
+def flush_log():
+    '''Waits for the messages logged so far to be written to Screen_Output.html'''
+    writer = _log_writers.get(os.getpid())
+    if writer is not None:
+        writer.flush()
+
+
+def close_log():
+    '''Writes the messages logged so far to Screen_Output.html and closes it'''
+    writer = _log_writers.pop(os.getpid(), None)
+    if writer is not None:
+        writer.close()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=flush_log, after_in_child=_forget_log_writer)
+atexit.register(close_log)
+
+
+def logfunc(message="", level=logging.INFO):
+    '''
+    Logs a message to the console, the log of the GUI and Screen_Output.html.
+    Args:
+        message (str): The message.
+        level (int): Its level, one of the logging module. The messages below
+                     OutputParameters.log_level are dropped.
+    '''
+    if level < OutputParameters.log_level:
+        return
+    if OutputParameters.log_buffer is not None:
+        OutputParameters.log_buffer.append(message)
+        return
+
     def redirect_logs(string):
         _console_write(string)
         log_text.insert('end', string)  # pylint: disable=used-before-assignment
         log_text.see('end')
-        log_text.update()
+        GuiWindow.refresh()
 
     if GuiWindow.window_handle:
         log_text = GuiWindow.window_handle.nametowidget('logs_frame.log_text')
         sys.stdout.write = redirect_logs
 
     if OutputParameters.screen_output_file_path:
-        with open(OutputParameters.screen_output_file_path, 'a', encoding='utf8') as a:
-            a.write(message + '<br>' + OutputParameters.nl)
+        writer = _log_writer()
+        if writer is not None:
+            writer.write(message + '<br>' + OutputParameters.nl)
+        else:
+            with open(OutputParameters.screen_output_file_path, 'a', encoding='utf8') as a:
+                a.write(message + '<br>' + OutputParameters.nl)
     print(message)
 
 
+def logdebug(message=""):
+    '''Logs a message on every record or file, dropped unless the log level is DEBUG'''
+    logfunc(message, logging.DEBUG)
+
+
 def strip_tuple_from_headers(data_headers):
     return [header[0] if isinstance(header, tuple) else header for header in data_headers]
 
@@ -494,9 +690,248 @@ def sanitize_report_name(name, kind='name'):
     return safe_name
 
 
+def _chunks(rows, size):
+    '''Yields lists of up to size rows from an iterable'''
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _output_timed(output_type, start):
+    '''Adds the time since start to the time spent on an output of the artifact, returns the time now'''
+    now = perf_counter()
+    artifact_profiler.add_output_time(output_type, now - start)
+    return now
+
+
+class _ArtifactOutput:
+    '''
+    Writes the rows of an artifact to the HTML report, the TSV export, the timeline, the
+    LAVA database and the KML export enabled for it, one chunk of rows at a time.
+    The outputs stay open between chunks, so an artifact that yields its rows is never
+    held in memory as a whole, not even for its KML export.
+    '''
+
+    def __init__(self, artifact_info, output_types, report_folder, module_name, func_name, data_headers,
+                 source_path):
+        self.artifact_info = artifact_info
+        self.output_types = output_types
+        self.report_folder = report_folder
+        self.module_name = module_name
+        self.func_name = func_name
+        self.data_headers = data_headers
+        self.source_path = source_path
+        self.artifact_name = artifact_info.get('name', func_name)
+        self.category = artifact_info.get('category', '')
+        # Path separators would break (or misplace) the report files, so the HTML, TSV
+        # and KML outputs are written under a path safe name.
+        self.safe_artifact_name = sanitize_report_name(self.artifact_name)
+        self.stripped_headers = strip_tuple_from_headers(data_headers)
+        self.media_header_info = get_media_header_info(data_headers)
+        self.record_count = None
+        self.report = None
+        self.tsv_file = None
+        self.tsv_writer = None
+        self.timeline_db = None
+        self.lava_table = None
+        self.kml = None
+
+    def start(self, record_count=None):
+        '''Opens the outputs, record_count is None when the number of rows is not known yet'''
+        artifact_info = self.artifact_info
+        icon = artifact_info.get('artifact_icon', '')
+        html_columns = artifact_info.get('html_columns', [])
+        self.record_count = record_count
+
+        # The sidebar keys off the on-disk names, so the icon lookup has to use the same safe names.
+        safe_category = sanitize_report_name(self.category, 'category')
+        icons.setdefault(safe_category, {self.safe_artifact_name: icon}).update({self.safe_artifact_name: icon})
+
+        # Check if headers contains a 'media' type
+        if self.media_header_info:
+            html_columns.extend([self.data_headers[idx][0] for idx in self.media_header_info])
+
+        timer = perf_counter()
+        if check_output_types('html', self.output_types):
+            self.report = artifact_report.ArtifactHtmlReport(self.artifact_name)
+            self.report.start_artifact_report(self.report_folder, self.safe_artifact_name,
+                                              artifact_info.get('description', ''))
+            self.report.add_script()
+            self.report.start_artifact_data_table(self.stripped_headers, self.source_path, record_count,
+                                                  html_no_escape=html_columns, inline_rows=html_inline_rows)
+            timer = _output_timed('html', timer)
+
+        if check_output_types('tsv', self.output_types):
+            self.tsv_file = open_tsv(self.report_folder, self.safe_artifact_name)
+            self.tsv_writer = csv.writer(self.tsv_file, delimiter='\t')
+            self.tsv_writer.writerow(self.stripped_headers)
+            timer = _output_timed('tsv', timer)
+
+        if check_output_types('timeline', self.output_types):
+            self.timeline_db = open_timeline_db(self.report_folder)
+            timer = _output_timed('timeline', timer)
+
+        if check_output_types('lava', self.output_types):
+            self.lava_table = lava_process_artifact(self.category,
+                                                    self.module_name,
+                                                    self.artifact_name,
+                                                    self.data_headers,
+                                                    record_count,
+                                                    func_name=self.func_name,
+                                                    data_views=artifact_info.get("data_views"),
+                                                    artifact_icon=icon,
+                                                    source_path=self.source_path)
+            timer = _output_timed('lava', timer)
+
+        if check_output_types('kml', self.output_types) and \
+                'Longitude' in self.stripped_headers and 'Latitude' in self.stripped_headers:
+            self.kml = KmlWriter(self.report_folder, self.safe_artifact_name)
+
+    def write(self, data_list, html_data_list):
+        '''Writes a chunk of rows, html_data_list holds the same rows as shown in the HTML report'''
+        txt_data_list = data_list
+        if self.media_header_info:
+            html_data_list, txt_data_list = get_data_list_with_media(self.media_header_info, data_list)
+
+        timer = perf_counter()
+        if self.report:
+            self.report.write_artifact_data_rows(html_data_list)
+            timer = _output_timed('html', timer)
+
+        if self.tsv_writer:
+            self.tsv_writer.writerows(txt_data_list)
+            timer = _output_timed('tsv', timer)
+
+        if self.timeline_db:
+            add_timeline_rows(self.timeline_db, self.artifact_name, txt_data_list, self.stripped_headers)
+            timer = _output_timed('timeline', timer)
+
+        if self.lava_table:
+            table_name, object_columns, column_map = self.lava_table
+            lava_insert_sqlite_data(table_name, data_list, object_columns, self.data_headers, column_map)
+            timer = _output_timed('lava', timer)
+
+        if self.kml is not None:
+            self.kml.write(txt_data_list, self.stripped_headers)
+            _output_timed('kml', timer)
+
+    def finish(self, record_count):
+        '''Completes the outputs once all the rows were written'''
+        timer = perf_counter()
+        if self.report:
+            self.report.end_artifact_data_table()
+            self.report.end_artifact_report()
+            timer = _output_timed('html', timer)
+
+        if self.lava_table:
+            table_name = self.lava_table[0]
+            if self.record_count is None:
+                lava_set_record_count(self.category, table_name, record_count)
+            if 'lava_only' in self.output_types:
+                lava_only_info(self.category, self.artifact_name, table_name, record_count)
+            timer = _output_timed('lava', timer)
+
+        if self.kml is not None:
+            self.kml.finish()
+            _output_timed('kml', timer)
+        artifact_profiler.add_rows(record_count)
+
+    def close(self):
+        '''Closes the files and databases left open, also when the artifact failed'''
+        if self.tsv_file:
+            self.tsv_file.close()
+            self.tsv_file = self.tsv_writer = None
+        if self.timeline_db:
+            self.timeline_db.commit()
+            self.timeline_db = None
+        if self.kml is not None:
+            self.kml.close()
+        if self.report:
+            self.report.end_artifact_report()
+
+
+def _write_artifact_outputs(artifact_info, output_types, report_folder, module_name, func_name, data_headers,
+                            data_list, source_path):
+    '''
+    Writes what an artifact returned to its outputs.
+    Returns:
+        tuple: The rows, an empty list if they were yielded, and the source path as shown in the report.
+    '''
+    artifact_name = artifact_info.get('name', func_name)
+    category = artifact_info.get('category', '')
+    is_lava_only = 'lava_only' in output_types
+
+    if data_list and not source_path:
+        logfunc("No source_path provided")
+    else:
+        # Report extraction-relative paths, never the examiner's local filesystem
+        source_path = '\n'.join(
+            Context.get_relative_path(p) for p in str(source_path).split('\n'))
+
+    # An artifact can return its rows as a list, or yield them, in which case they are
+    # written to the outputs artifact_chunk_size rows at a time
+    streamed = not isinstance(data_list, (list, tuple))
+    if streamed:
+        chunks = _chunks(data_list, artifact_chunk_size)
+        first_chunk = next(chunks, None)
+        has_data = first_chunk is not None
+    else:
+        has_data = bool(len(data_list))
+
+    if has_data:
+        output = _ArtifactOutput(artifact_info, output_types, report_folder, module_name, func_name,
+                                 data_headers, source_path)
+        try:
+            if streamed:
+                output.start()
+                record_count = 0
+                for chunk in chain([first_chunk], chunks):
+                    output.write(chunk, chunk)
+                    record_count += len(chunk)
+                output.finish(record_count)
+                logfunc(f"Found {record_count:,} {'records' if record_count>1 else 'record'} for {artifact_name}")
+                # The rows were written as they came, they are not kept
+                data_list = []
+            else:
+                if isinstance(data_list, tuple):
+                    data_list, html_data_list = data_list
+                else:
+                    html_data_list = data_list
+                logfunc(f"Found {len(data_list):,} {'records' if len(data_list)>1 else 'record'} for {artifact_name}")
+                output.start(len(data_list))
+                output.write(data_list, html_data_list)
+                output.finish(len(data_list))
+        finally:
+            output.close()
+
+    else:
+        if output_types != 'none':
+            logfunc(f"No data found for {artifact_name}")
+            if is_lava_only:
+                lava_only_info(category, artifact_name, artifact_name, 0)
+
+    return data_list, source_path
+
+
+def _artifact_cache_key(func, artifact_info, files_found, seeker, timezone_offset, module_file_path):
+    '''Returns the key of the artifact run in the artifact cache, None if it is not cached'''
+    if not artifact_cache.is_enabled():
+        return None
+    if artifact_info.get('paths') is None or artifact_info.get('cache') is False:
+        artifact_cache.record_result(artifact_info.get('name', func.__name__), 'not cacheable')
+        return None
+    # ios_keychain logs through this module, it can only be imported once it is loaded
+    from scripts.ios_keychain import active_keychain_path  # pylint: disable=import-outside-toplevel
+    return artifact_cache.artifact_key(func, module_file_path, files_found, Context.get_relative_path,
+                                       getattr(seeker, 'file_infos', {}), iOS.get_version(), timezone_offset,
+                                       active_keychain_path())
+
+
 def artifact_processor(func):
     @wraps(func)
     def wrapper(files_found, report_folder, seeker, wrap_text, timezone_offset):
+        global _recorded_identifiers  # pylint: disable=global-statement
+
         module_name = func.__module__.split('.')[-1]
         func_name = func.__name__
         module_file_path = inspect.getfile(func)
@@ -505,13 +940,8 @@ def artifact_processor(func):
         artifact_info = all_artifacts_info.get(func_name, {})
 
         artifact_name = artifact_info.get('name', func_name)
-        category = artifact_info.get('category', '')
-        description = artifact_info.get('description', '')
-        icon = artifact_info.get('artifact_icon', '')
-        html_columns = artifact_info.get('html_columns', [])
 
         output_types = artifact_info.get('output_types', ['html', 'tsv', 'timeline', 'lava', 'kml'])
-        is_lava_only = 'lava_only' in output_types
 
         Context.clear()
         Context.set_report_folder(report_folder)
@@ -522,76 +952,83 @@ def artifact_processor(func):
         Context.set_module_file_path(module_file_path)
         Context.set_artifact_name(artifact_name)
 
-        sig = inspect.signature(func)
-        if len(sig.parameters) == 1:
-            data_headers, data_list, source_path = func(Context)
-        else:
-            data_headers, data_list, source_path = func(files_found, report_folder, seeker, wrap_text, timezone_offset)
-
-        if data_list and not source_path:
-            logfunc("No source_path provided")
-        else:
-            # Report extraction-relative paths, never the examiner's local filesystem
-            source_path = '\n'.join(
-                Context.get_relative_path(p) for p in str(source_path).split('\n'))
-
-        if len(data_list):
-            if isinstance(data_list, tuple):
-                data_list, html_data_list = data_list
+        cache_key = _artifact_cache_key(func, artifact_info, files_found, seeker, timezone_offset, module_file_path)
+        output_folder = os.path.dirname(os.path.dirname(report_folder.rstrip('/\\')))
+        cached = artifact_cache.load(cache_key, output_folder, seeker, Context.get_relative_path) \
+            if cache_key else None
+        cache_writer = None
+        search_recorder = None
+        report_files = set()
+        ios_version = None
+        try:
+            if cached:
+                logfunc(f"Loaded {artifact_name} from the artifact cache")
+                artifact_cache.record_result(artifact_name, 'hit')
+                for category_label_value in cached['identifiers']:
+                    add_identifier(*category_label_value)
+                if cached['ios_version']:
+                    iOS.set_version(cached['ios_version'])
+                data_headers, data_list, source_path = \
+                    cached['data_headers'], cached['data_list'], cached['source_path']
             else:
-                html_data_list = data_list
-            logfunc(f"Found {len(data_list):,} {'records' if len(data_list)>1 else 'record'} for {artifact_name}")
-            # Path separators would break (or misplace) the report files, so the HTML, TSV
-            # and KML outputs are written under a path safe name. The sidebar keys off the
-            # on-disk names, so the icon lookup has to use the same safe names.
-            safe_artifact_name = sanitize_report_name(artifact_name)
-            safe_category = sanitize_report_name(category, 'category')
-            icons.setdefault(safe_category, {safe_artifact_name: icon}).update({safe_artifact_name: icon})
-
-            # Strip tuples from headers for HTML, TSV, and timeline
-            stripped_headers = strip_tuple_from_headers(data_headers)
-
-            # Check if headers contains a 'media' type
-            media_header_info = get_media_header_info(data_headers)
-            if media_header_info:
-                html_columns.extend([data_headers[idx][0] for idx in media_header_info])
-                html_data_list, txt_data_list = get_data_list_with_media(media_header_info, data_list)
-
-            if check_output_types('html', output_types):
-                report = artifact_report.ArtifactHtmlReport(artifact_name)
-                report.start_artifact_report(report_folder, safe_artifact_name, description)
-                report.add_script()
-                report.write_artifact_data_table(stripped_headers, html_data_list, source_path, html_no_escape=html_columns)
-                report.end_artifact_report()
-
-            if check_output_types('tsv', output_types):
-                tsv(report_folder, stripped_headers, txt_data_list if media_header_info else data_list, safe_artifact_name)
-
-            if check_output_types('timeline', output_types):
-                timeline(report_folder, artifact_name, txt_data_list if media_header_info else data_list, stripped_headers)
-
-            if check_output_types('lava', output_types):
-                table_name, object_columns, column_map = lava_process_artifact(category,
-                                                                               module_name,
-                                                                               artifact_name,
-                                                                               data_headers,
-                                                                               len(data_list),
-                                                                               func_name=func_name,
-                                                                               data_views=artifact_info.get("data_views"),
-                                                                               artifact_icon=icon,
-                                                                               source_path=source_path)
-                if is_lava_only:
-                    lava_only_info(category, artifact_name, table_name, len(data_list))
-                lava_insert_sqlite_data(table_name, data_list, object_columns, data_headers, column_map)
-
-            if check_output_types('kml', output_types):
-                kmlgen(report_folder, safe_artifact_name, txt_data_list if media_header_info else data_list, stripped_headers)
-
-        else:
-            if output_types != 'none':
-                logfunc(f"No data found for {artifact_name}")
-                if is_lava_only:
-                    lava_only_info(category, artifact_name, artifact_name, 0)
+                if cache_key:
+                    # What the artifact records besides its rows has to be replayed on a hit
+                    report_files = set(os.listdir(report_folder))
+                    ios_version = iOS.get_version()
+                    _recorded_identifiers = []
+                    if seeker is not None:
+                        # The files the artifact searches for itself are checked on a hit
+                        search_recorder = artifact_cache.SearchRecorder(seeker)
+
+                sig = inspect.signature(func)
+                if len(sig.parameters) == 1:
+                    data_headers, data_list, source_path = func(Context)
+                else:
+                    data_headers, data_list, source_path = func(files_found, report_folder, seeker, wrap_text, timezone_offset)
+
+                if cache_key and get_media_header_info(data_headers):
+                    # The media files and their LAVA records are not part of the cached rows
+                    artifact_cache.record_result(artifact_name, 'not cacheable')
+                elif cache_key:
+                    cache_writer = artifact_cache.CacheWriter(cache_key, output_folder, artifact_chunk_size)
+                    if not isinstance(data_list, (list, tuple)):
+                        cache_writer.start(data_headers, source_path, True)
+                        data_list = cache_writer.record_stream(data_list)
+                    elif isinstance(data_list, tuple):
+                        cache_writer.start(data_headers, source_path, False, html_data_list=True)
+                        cache_writer.write_rows(data_list[0])
+                        cache_writer.write_rows(data_list[1])
+                    else:
+                        cache_writer.start(data_headers, source_path, False)
+                        cache_writer.write_rows(data_list)
+
+            data_list, source_path = _write_artifact_outputs(artifact_info, output_types, report_folder, module_name,
+                                                             func_name, data_headers, data_list, source_path)
+            if search_recorder:
+                search_recorder.stop()
+
+            if cache_writer:
+                report_files.add(f'{sanitize_report_name(artifact_name)}.temphtml')
+                if set(os.listdir(report_folder)) - report_files:
+                    # Files the artifact wrote next to its report would be missing on a hit
+                    cache_writer.discard()
+                    artifact_cache.record_result(artifact_name, 'not cacheable')
+                elif cache_writer.commit(
+                        _recorded_identifiers, iOS.get_version() if ios_version is None else None,
+                        search_recorder.searches if search_recorder else (),
+                        artifact_cache.searches_fingerprints(seeker, search_recorder.searches, Context.get_relative_path,
+                                                             search_recorder.paths) if search_recorder else ()):
+                    artifact_cache.record_result(artifact_name, 'stored')
+                else:
+                    artifact_cache.record_result(artifact_name, 'not cacheable')
+                cache_writer = None
+        finally:
+            _recorded_identifiers = None
+            release_sqlite_dbs()
+            if search_recorder:
+                search_recorder.stop()
+            if cache_writer:
+                cache_writer.discard()
 
         return data_headers, data_list, source_path
     return wrapper
@@ -742,17 +1179,119 @@ def get_sqlite_db_path(path):
     else:
         return quote(str(path), safe='/')
 
-def open_sqlite_db_readonly(path):
-    '''Opens a sqlite db in read-only mode, so original db (and -wal/journal are intact)'''
+class _PooledConnection(sqlite3.Connection):
+    '''
+    A read-only connection of the pool, with the schema of its database once read.
+    checked_out is True once open_sqlite_db_readonly handed it to the running artifact.
+    '''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.file_state = None
+        self.schema = None
+        self.columns = {}
+        self.checked_out = False
+
+    def close(self):
+        '''Left open for the next artifacts, the connection is closed by close_sqlite_dbs'''
+
+    def close_pooled(self):
+        super().close()
+
+def _sqlite_file_state(path):
+    '''The state of a database and of its WAL file, which changes when the database is written'''
+    state = []
+    for file_path in (path, f'{path}-wal'):
+        try:
+            stat = os.stat(file_path)
+            state.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            state.append(None)
+    return tuple(state)
+
+def _reset_pooled_connection(db):
+    '''Undoes what the previous artifact changed on a connection, False if it cannot be reused'''
+    db.row_factory = None
+    db.text_factory = str
+    try:
+        for _, name, _ in db.execute('PRAGMA database_list').fetchall():
+            if name not in ('main', 'temp'):
+                db.execute(f'DETACH DATABASE "{name}"')
+    except sqlite3.Error:
+        return False  # a cursor of the previous artifact still reads the attached database
+    return True
+
+def _pooled_sqlite_db(path):
+    '''Returns the connection of the pool to a database, opening it if needed, None on error'''
+    if not path:
+        return None
+    path = str(path)
+    pool = _sqlite_dbs.setdefault((os.getpid(), threading.get_ident()), OrderedDict())
+    file_state = _sqlite_file_state(path)
+    db = pool.pop(path, None)
+    # A replaced connection is closed once the cursors still reading it are gone
+    if db is None or db.file_state != file_state:
+        db = _open_pooled_sqlite_db(path, file_state)
+        if db is None:
+            return None
+        if len(pool) >= sqlite_pool_size:
+            pool.popitem(last=False)
+    pool[path] = db
+    return db
+
+def _open_pooled_sqlite_db(path, file_state):
+    '''Opens a read-only connection for the pool, None on error'''
+    db = _connect_sqlite_db_readonly(path, _PooledConnection)
+    if db is not None:
+        db.file_state = file_state
+    return db
+
+def _connect_sqlite_db_readonly(path, factory=sqlite3.Connection):
+    '''Opens a read-only connection, None on error'''
     try:
-        if path:
-            path = get_sqlite_db_path(path)
-            with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as db:
-                return db
+        db = sqlite3.connect(f"file:{get_sqlite_db_path(path)}?mode=ro", uri=True, factory=factory)
     except sqlite3.OperationalError as e:
         logfunc(f"Error with {path}:")
         logfunc(f" - {str(e)}")
-    return None
+        return None
+    try:
+        db.execute(f'PRAGMA mmap_size = {sqlite_mmap_size}')
+        db.execute(f'PRAGMA cache_size = -{sqlite_cache_kib}')
+        db.execute('PRAGMA query_only = ON')
+    except sqlite3.DatabaseError:
+        pass  # not a database, which the queries of the caller report
+    return db
+
+def open_sqlite_db_readonly(path):
+    '''Opens a sqlite db in read-only mode, so original db (and -wal/journal are intact)
+
+    The connection is shared with the next artifacts, until the database changes or
+    close_sqlite_dbs is called: closing it does nothing. Within an artifact, each call
+    after the first one for a database gets a connection of its own, as the artifact can
+    still be reading through the first one with the row or text factory it set on it.'''
+    db = _pooled_sqlite_db(path)
+    if db is None:
+        return None
+    if db.checked_out:
+        return _connect_sqlite_db_readonly(str(path))
+    if not _reset_pooled_connection(db):
+        db = _open_pooled_sqlite_db(str(path), db.file_state)
+        if db is None:
+            return None
+        _sqlite_dbs[(os.getpid(), threading.get_ident())][str(path)] = db
+    db.checked_out = True
+    return db
+
+def release_sqlite_dbs():
+    '''Makes the connections the artifact got from open_sqlite_db_readonly available to the next one'''
+    for db in _sqlite_dbs.get((os.getpid(), threading.get_ident()), {}).values():
+        db.checked_out = False
+
+def close_sqlite_dbs():
+    '''Closes the connections opened by open_sqlite_db_readonly in this process and thread'''
+    pool = _sqlite_dbs.pop((os.getpid(), threading.get_ident()), {})
+    for db in pool.values():
+        db.close_pooled()
 
 def attach_sqlite_db_readonly(path, db_name):
     '''Return the query to attach a sqlite db in read-only mode.
@@ -779,6 +1318,42 @@ def get_sqlite_db_records(path, query, attach_query=None):
             logfunc(f" - {str(e)}")
     return []
 
+def get_sqlite_db_rows(path, query, column_types, attach_query=None):
+    '''
+    Yields the rows of a query with the values of some of its columns converted, for an
+    artifact to return them as they are. The rows are fetched sqlite_fetch_size at a time
+    and the values of a column converted for all the rows fetched at once, instead of the
+    artifact converting them row by row; what SQL converts (CASE ... THEN 'Yes', datetime()...)
+    is better left in the query.
+    Args:
+        path (str): The path of the database.
+        query (str): The query.
+        column_types (dict): The types of the columns to convert by their index in the
+                             rows, see sqlite_column_types.
+        attach_query (str): The query attaching a database, see attach_sqlite_db_readonly.
+    Returns:
+        iterator: The rows as tuples, none if the query fails.
+    '''
+    converters = [(index, sqlite_column_types[column_type]) for index, column_type in column_types.items()]
+    db = open_sqlite_db_readonly(path)
+    if not db:
+        return
+    try:
+        cursor = db.cursor()
+        if attach_query:
+            cursor.execute(attach_query)
+        cursor.execute(query)
+        while rows := cursor.fetchmany(sqlite_fetch_size):
+            if converters:
+                columns = list(zip(*rows))
+                for index, convert in converters:
+                    columns[index] = convert(columns[index])
+                rows = zip(*columns)
+            yield from rows
+    except sqlite3.DatabaseError as e:
+        logfunc(f"Error with {path}:")
+        logfunc(f" - {str(e)}")
+
 def get_sqlite_multiple_db_records(path_list, query, data_headers):
     multiple_source_files = len(path_list) > 1
     source_path = ""
@@ -800,162 +1375,309 @@ def get_sqlite_multiple_db_records(path_list, query, data_headers):
             data_list.append(record)
     return data_headers, data_list, source_path
 
-def does_column_exist_in_db(path, table_name, col_name):
-    '''Checks if a specific col exists'''
-    db = open_sqlite_db_readonly(path)
-    col_name = col_name.lower()
+def _sqlite_schema(path):
+    '''The (type, name) of the objects of a database, read once per connection, None on error'''
+    db = _pooled_sqlite_db(path)
+    if db and db.schema is None:
+        query = "SELECT type, name FROM sqlite_master"
+        try:
+            db.schema = frozenset(_read_schema_rows(db, query))
+        except sqlite3.Error as ex:
+            logfunc(f"Query error, query={query} Error={str(ex)}")
+            return None
+    return db.schema if db else None
+
+def _read_schema_rows(db, query):
+    '''
+    Returns the rows of a schema query as tuples of str, whatever row or text factory the
+    artifact set on the connection, which is put back for the rows it is still reading
+    '''
+    text_factory = db.text_factory
+    db.text_factory = str
     try:
-        db.row_factory = sqlite3.Row # For fetching columns by name
-        query = f"pragma table_info('{table_name}');"
         cursor = db.cursor()
-        cursor.execute(query)
-        all_rows = cursor.fetchall()
-        for row in all_rows:
-            if row['name'].lower() == col_name:
-                return True
-    except sqlite3.Error as ex:
-        logfunc(f"Query error, query={query} Error={str(ex)}")
-    return False
+        cursor.row_factory = None
+        return cursor.execute(query).fetchall()
+    finally:
+        db.text_factory = text_factory
 
-def does_table_exist_in_db(path, table_name):
-    '''Checks if a table with specified name exists in an sqlite db'''
-    db = open_sqlite_db_readonly(path)
-    if db:    
+def does_column_exist_in_db(path, table_name, col_name):
+    '''Checks if a specific col exists'''
+    db = _pooled_sqlite_db(path)
+    if not db:
+        return False
+    columns = db.columns.get(table_name.lower())
+    if columns is None:
+        query = f"pragma table_info('{table_name}');"
         try:
-            query = f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'"
-            cursor = db.execute(query)
-            for _ in cursor:
-                return True
+            columns = frozenset(row[1].lower() for row in _read_schema_rows(db, query))
         except sqlite3.Error as ex:
             logfunc(f"Query error, query={query} Error={str(ex)}")
-    return False
+            return False
+        db.columns[table_name.lower()] = columns
+    return col_name.lower() in columns
+
+def does_table_exist_in_db(path, table_name):
+    '''Checks if a table with specified name exists in an sqlite db'''
+    schema = _sqlite_schema(path)
+    return bool(schema) and ('table', table_name) in schema
 
 def does_view_exist_in_db(path, table_name):
     '''Checks if a table with specified name exists in an sqlite db'''
-    db = open_sqlite_db_readonly(path)
-    if db:
-        try:
-            query = f"SELECT name FROM sqlite_master WHERE type='view' AND name='{table_name}'"
-            cursor = db.execute(query)
-            for _ in cursor:
-                return True
-        except sqlite3.Error as ex:
-            logfunc(f"Query error, query={query} Error={str(ex)}")
-    return False
+    schema = _sqlite_schema(path)
+    return bool(schema) and ('view', table_name) in schema
 
 
 def tsv(report_folder, data_headers, data_list, tsvname, source_file=None):  # pylint: disable=unused-argument
-    report_folder = report_folder.rstrip('/')
-    report_folder = report_folder.rstrip('\\')
-    report_folder_base = os.path.dirname(os.path.dirname(report_folder))
-    tsv_report_folder = os.path.join(report_folder_base, '_TSV Exports')
-
-    if os.path.isdir(tsv_report_folder):
-        pass
-    else:
-        os.makedirs(tsv_report_folder)
-    
-    with open(os.path.join(tsv_report_folder, tsvname + '.tsv'), 'a', encoding='utf-8-sig') as tsvfile:
+    with open_tsv(report_folder, tsvname) as tsvfile:
         tsv_writer = csv.writer(tsvfile, delimiter='\t')
         tsv_writer.writerow(data_headers)
         
         for i in data_list:
             tsv_writer.writerow(i)
-            
-def timeline(report_folder, tlactivity, data_list, data_headers):
+
+@lru_cache(maxsize=None)
+def _export_folder(report_folder, folder_name):
+    '''Returns the folder of an export (_TSV Exports, _Timeline, _KML Exports) of the report, created once'''
     report_folder = report_folder.rstrip('/')
     report_folder = report_folder.rstrip('\\')
     report_folder_base = os.path.dirname(os.path.dirname(report_folder))
-    tl_report_folder = os.path.join(report_folder_base, '_Timeline')
+    export_folder = os.path.join(report_folder_base, folder_name)
+    # Artifacts running in parallel workers can get here at the same time, so creating the
+    # folder must not fail when another process did it first
+    os.makedirs(export_folder, exist_ok=True)
+    return export_folder
+
+def open_tsv(report_folder, tsvname):
+    '''Opens the file of the TSV export named tsvname for appending'''
+    tsv_report_folder = _export_folder(report_folder, '_TSV Exports')
+    return open(os.path.join(tsv_report_folder, tsvname + '.tsv'), 'a', encoding='utf-8-sig',
+                buffering=export_buffer_size)
+
+def timeline(report_folder, tlactivity, data_list, data_headers):
+    db = open_timeline_db(report_folder)
+    add_timeline_rows(db, tlactivity, data_list, data_headers)
+    db.commit()
 
-    if os.path.isdir(tl_report_folder):
-        tldb = os.path.join(tl_report_folder, 'tl.db')
-        db = sqlite3.connect(tldb)
+def _open_output_db(db_path, create_table):
+    '''
+    Returns the connection of the process to a database of the report written by the
+    artifacts (the timeline, _latlong.db), opening it and creating its table if needed.
+    The connection stays open for the next artifacts, which commit their rows when they
+    end (in a worker process, after every batch), until finalize_output_dbs.
+    '''
+    key = (os.getpid(), db_path)
+    db = _output_dbs.get(key)
+    if db is None:
+        db = sqlite3.connect(db_path, timeout=sqlite_busy_timeout)
         cursor = db.cursor()
-        cursor.execute('''PRAGMA synchronous = EXTRA''')
+        # An interrupted run is run again rather than recovered, the rows are not synced to disk
+        cursor.execute('''PRAGMA synchronous = OFF''')
         cursor.execute('''PRAGMA journal_mode = WAL''')
+        cursor.execute(create_table)
         db.commit()
-    else:
-        os.makedirs(tl_report_folder)
-        # create database
-        tldb = os.path.join(tl_report_folder, 'tl.db')
-        db = sqlite3.connect(tldb, isolation_level = 'exclusive')
-        cursor = db.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE data(key TEXT, activity TEXT, datalist TEXT)
-            """
-        )
+        _output_dbs[key] = db
+    return db
+
+def output_dbs_commit_each_write():
+    '''
+    Makes the artifacts of a worker process commit the rows of the timeline and _latlong.db
+    after every batch, so that no worker holds the write lock of a database for a whole artifact.
+    '''
+    global _output_dbs_commit_each_write  # pylint: disable=global-statement
+    _output_dbs_commit_each_write = True
+
+def _commit_output_db_if_shared(db):
+    '''Commits the rows of a batch in a worker process, see output_dbs_commit_each_write'''
+    if _output_dbs_commit_each_write:
         db.commit()
-    
-    for entry in data_list:
-        entry = [str(field) for field in entry]
-        
-        data_dict = dict(zip(data_headers, entry))
 
-        data_str = json.dumps(data_dict)
-        cursor.executemany(
-            "INSERT INTO data VALUES(?,?,?)", [(str(entry[0]), tlactivity, data_str)])
+def open_timeline_db(report_folder):
+    '''Returns the connection of the run to _Timeline/tl.db, creating the database if needed'''
+    tldb = os.path.join(_export_folder(report_folder, '_Timeline'), 'tl.db')
+    # key: the first column of the row, as a Unix timestamp when it is a date and time
+    return _open_output_db(tldb, '''CREATE TABLE IF NOT EXISTS data(key INTEGER, activity TEXT, datalist TEXT)''')
 
-    db.commit()
-    db.close()
+def open_latlong_db(report_folder):
+    '''Returns the connection of the run to _KML Exports/_latlong.db, creating the database if needed'''
+    latlongdb = os.path.join(_export_folder(report_folder, '_KML Exports'), '_latlong.db')
+    return _open_output_db(latlongdb, '''CREATE TABLE IF NOT EXISTS data(timestamp TEXT, latitude TEXT, longitude TEXT,
+                                      activity TEXT)''')
+
+def finalize_output_dbs(output_folder_base):
+    '''
+    Closes the timeline and _latlong.db connections of the process, indexes _Timeline/tl.db
+    by key and leaves both databases as single files. The worker processes exit without
+    closing their connections, so their rows can still be in the -wal file; the databases
+    are switched back to a rollback journal, which viewers can open from read-only media.
+    '''
+    for key in [key for key in _output_dbs if key[0] == os.getpid()]:
+        _output_dbs.pop(key).close()
+    for db_path, index in ((os.path.join(output_folder_base, '_Timeline', 'tl.db'),
+                            '''CREATE INDEX IF NOT EXISTS data_key ON data(key)'''),
+                           (os.path.join(output_folder_base, '_KML Exports', '_latlong.db'), None)):
+        if not os.path.exists(db_path):
+            continue
+        db = sqlite3.connect(db_path, timeout=sqlite_busy_timeout)
+        try:
+            if index:
+                db.execute(index)
+                db.commit()
+            db.execute('''PRAGMA wal_checkpoint(TRUNCATE)''')
+            db.execute('''PRAGMA journal_mode = DELETE''')
+        except sqlite3.Error as ex:
+            logfunc(f"Error finalizing {db_path}: {str(ex)}")
+        finally:
+            db.close()
+
+def _timeline_key(value):
+    '''The key of a timeline row: its date and time as a Unix timestamp, or its text'''
+    if not isinstance(value, datetime):
+        value = str(value)
+        # fromisoformat accepts more formats from Python 3.11 on, the keys have to be the same
+        if not _timeline_datetime_text.fullmatch(value):
+            return value
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    # Naive datetimes are UTC, the project convention
+    return (value - (_naive_unix_epoch if value.tzinfo is None else _unix_epoch)) // _one_second
+
+def _timeline_datalist(data_headers):
+    '''
+    Returns the function giving the datalist of a timeline row, the JSON of a dict of its
+    values as text by header. The JSON is filled in a template made from the headers, without
+    building the dict, unless a header is repeated or the row does not have one value per header.
+    '''
+    def dumps(entry):
+        return json.dumps(dict(zip(data_headers, map(str, entry))))
+
+    header_count = len(data_headers)
+    if len(set(data_headers)) < header_count:
+        return dumps
+    encode = json.encoder.encode_basestring_ascii
+    template = '{' + ', '.join(encode(str(header)).replace('%', '%%') + ': %s' for header in data_headers) + '}'
+
+    def fill(entry):
+        if len(entry) != header_count:
+            return dumps(entry)
+        return template % tuple(map(encode, map(str, entry)))
+    return fill
+
+def add_timeline_rows(db, tlactivity, data_list, data_headers):
+    '''
+    Inserts rows in the timeline database opened by open_timeline_db, the caller commits
+    (a worker process commits them here, see output_dbs_commit_each_write)
+    '''
+    datalist = _timeline_datalist(data_headers)
+    db.executemany(
+        "INSERT INTO data VALUES(?,?,?)",
+        ((_timeline_key(entry[0]), tlactivity, datalist(entry)) for entry in data_list))
+    _commit_output_db_if_shared(db)
 
 def kmlgen(report_folder, kmlactivity, data_list, data_headers):
     if 'Longitude' not in data_headers or 'Latitude' not in data_headers:
         return
 
-    data = []
-    kml = simplekml.Kml(open=1)    
-    a = 0
-    length = len(data_list)
-    while a < length:
-        modifiedDict = dict(zip(data_headers, data_list[a]))
-        lon = modifiedDict['Longitude']
-        lat = modifiedDict['Latitude']
-        times_header = "Timestamp"
+    kml = KmlWriter(report_folder, kmlactivity)
+    try:
+        kml.write(data_list, data_headers)
+        kml.finish()
+    finally:
+        kml.close()
+
+def kml_points(data_list, data_headers):
+    '''Yields the timestamp, its header, the latitude and the longitude of the rows with a location'''
+    # The index of each header, the last one for a repeated header, in the order of the headers
+    columns = {}
+    for index, header in enumerate(data_headers):
+        columns[header] = index
+    lat_index = columns['Latitude']
+    lon_index = columns['Longitude']
+    times_index = columns.get('Timestamp')
+    for row in data_list:
+        lat = row[lat_index]
+        lon = row[lon_index]
         if lat and lon:
-            pnt = kml.newpoint()
-            times = modifiedDict.get('Timestamp','N/A')
+            times_header = "Timestamp"
+            times = 'N/A' if times_index is None else row[times_index]
             if times == 'N/A':
-                for key, value in modifiedDict.items():
-                    if isinstance(value, datetime):
+                for key, index in columns.items():
+                    if isinstance(row[index], datetime):
                         times_header = key
-                        times = value
+                        times = row[index]
                         break
-            pnt.name = times
-            pnt.description = f"{times_header}: {times} - {kmlactivity}"
-            pnt.coords = [(lon, lat)]
-            data.append((times, lat, lon, kmlactivity))
-        a += 1
-
-    if len(data) > 0:
-        report_folder = report_folder.rstrip('/')
-        report_folder = report_folder.rstrip('\\')
-        report_folder_base = os.path.dirname(os.path.dirname(report_folder))
-        kml_report_folder = os.path.join(report_folder_base, '_KML Exports')
-        if os.path.isdir(kml_report_folder):
-            latlongdb = os.path.join(kml_report_folder, '_latlong.db')
-            db = sqlite3.connect(latlongdb)
-            cursor = db.cursor()
-            cursor.execute('''PRAGMA synchronous = EXTRA''')
-            cursor.execute('''PRAGMA journal_mode = WAL''')
-            db.commit()
-        else:
-            os.makedirs(kml_report_folder)
-            latlongdb = os.path.join(kml_report_folder, '_latlong.db')
-            db = sqlite3.connect(latlongdb)
-            cursor = db.cursor()
-            cursor.execute(
-            """
-            CREATE TABLE data(timestamp TEXT, latitude TEXT, longitude TEXT, activity TEXT)
-            """
-                )
-            db.commit()
-        
-        cursor.executemany("INSERT INTO data VALUES(?, ?, ?, ?)", data)
-        db.commit()
-        db.close()
-        kml.save(os.path.join(kml_report_folder, f'{kmlactivity}.kml'))
+            yield times, times_header, lat, lon
+
+
+class KmlWriter:
+    '''
+    Writes the rows of an artifact with a location to its KML export, a placemark at a
+    time, and to _latlong.db. The export is only created for the first placemark, and
+    removed if the artifact fails before finish.
+    '''
+
+    _header = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+               '<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">\n'
+               '    <Document>\n'
+               '        <open>1</open>\n')
+    _placemark = ('        <Placemark>\n'
+                  '            <name>{}</name>\n'
+                  '            <description>{}</description>\n'
+                  '            <Point>\n'
+                  '                <coordinates>{},{},0.0</coordinates>\n'
+                  '            </Point>\n'
+                  '        </Placemark>\n')
+    _footer = '    </Document>\n</kml>\n'
+
+    def __init__(self, report_folder, kmlactivity):
+        self.report_folder = report_folder
+        self.kmlactivity = kmlactivity
+        self.kml_path = None
+        self.kml_file = None
+        self.latlong_db = None
+
+    def write(self, data_list, data_headers):
+        '''Writes the rows of a chunk that have a location'''
+        latlong_rows = []
+        placemarks = []
+        escape = html.escape
+        for times, times_header, lat, lon in kml_points(data_list, data_headers):
+            placemarks.append(self._placemark.format(escape(str(times)),
+                                                     escape(f"{times_header}: {times} - {self.kmlactivity}"),
+                                                     lon, lat))
+            latlong_rows.append((times, lat, lon, self.kmlactivity))
+        if not placemarks:
+            return
+        if self.kml_file is None:
+            kml_report_folder = _export_folder(self.report_folder, '_KML Exports')
+            self.kml_path = os.path.join(kml_report_folder, f'{self.kmlactivity}.kml')
+            self.kml_file = open(self.kml_path, 'w', encoding='utf-8', buffering=export_buffer_size)
+            self.kml_file.write(self._header)
+            self.latlong_db = open_latlong_db(self.report_folder)
+        self.kml_file.writelines(placemarks)
+        self.latlong_db.executemany("INSERT INTO data VALUES(?, ?, ?, ?)", latlong_rows)
+        _commit_output_db_if_shared(self.latlong_db)
+
+    def finish(self):
+        '''Completes the export and commits the rows of _latlong.db (a worker process committed them already)'''
+        if self.kml_file is not None:
+            self.kml_file.write(self._footer)
+            self.kml_file.close()
+            self.kml_file = None
+            self.latlong_db.commit()
+
+    def close(self):
+        '''
+        Removes what was written if the artifact failed before finish, but for the rows of
+        _latlong.db a worker process already committed
+        '''
+        if self.kml_file is not None:
+            self.kml_file.close()
+            self.kml_file = None
+            os.remove(self.kml_path)
+            self.latlong_db.rollback()
 
 def media_to_html(media_path, files_found, report_folder):
 
@@ -1132,15 +1854,26 @@ def device_info(category, label, value, source_file=""):
     except:  # pylint: disable=bare-except
         func_name = 'unknown'
     
-    values = identifiers.get(category, {})
-    
     # Create value object with both the value and source module
     value_obj = {
         'value': value,
         'source_file': source_file,
         'artifact': func_name
     }
-    
+    add_identifier(category, label, value_obj)
+
+def add_identifier(category, label, value_obj):
+    """
+    Adds a value object built by device_info to the identifiers dictionary
+    Args:
+        category (str): The category of the information
+        label (str): The label/description to use as the key
+        value_obj (dict): The value, its source file and the artifact that found it
+    """
+    if _recorded_identifiers is not None:
+        _recorded_identifiers.append((category, label, value_obj))
+    values = identifiers.get(category, {})
+
     if label in values:
         # If the label exists, check if it's already a list
         if isinstance(values[label], list):
@@ -1246,6 +1979,131 @@ def convert_cocoa_core_data_ts_to_utc(cocoa_core_data_ts):
     else:
         return cocoa_core_data_ts
 
+def _unix_ts_column_in_seconds(numbers):
+    '''
+    convert_unix_ts_in_seconds for an array of positive floats. Returns the seconds, and
+    where math.log10 could count the digits of the number differently from numpy.
+    '''
+    logs = numpy.log10(numbers)
+    extra_digits = numpy.maximum(numpy.trunc(logs).astype(numpy.int64) - 9, 0)
+    divisors = _ts_divisors[extra_digits]
+    # numpy.floor_divide computes // as Python does, but slowly: a quotient of 10 digits,
+    # off by 2e-6 at most once rounded, has the same floor unless it is within 1e-5 of an integer
+    quotients = numbers / divisors
+    seconds = numpy.floor(quotients)
+    fractions = quotients - seconds
+    exact = numpy.flatnonzero(((fractions < 1e-5) | (fractions > 1 - 1e-5)) & (extra_digits > 0))
+    seconds[exact] = numpy.floor_divide(numbers[exact], divisors[exact])
+    seconds = seconds.astype(numpy.int64)
+    # Only the numbers of 11 digits or more are divided, an error of the last bit of a
+    # log10 only matters next to their powers of ten
+    nearest = numpy.maximum(numpy.rint(logs).astype(numpy.int64), 0)
+    unsure = (nearest >= 10) & (numpy.abs(numbers / _ts_divisors[nearest] - 1) < 1e-12)
+    return seconds, unsure
+
+def _ts_column_numbers(values, epoch_offset):
+    '''
+    Returns the float(value + epoch_offset) of the int and float values of a column, NaN
+    where it is not a timestamp after 1970 or the value is 0 (which is not converted).
+    '''
+    types = set(map(type, values))
+    if types == {float}:
+        numbers = numpy.array(values, numpy.float64)
+        others = numbers == 0
+        numbers += epoch_offset
+    elif types == {int} and -2 ** 62 < min(values) and max(values) < 2 ** 62:
+        # Added as ints, float(value + epoch_offset) being rounded once
+        numbers = numpy.array(values, numpy.int64)
+        others = numbers == 0
+        numbers = (numbers + epoch_offset).astype(numpy.float64)
+    else:
+        return numpy.fromiter(
+            (value + epoch_offset if value.__class__ in (int, float) and value and 0 < value + epoch_offset < 1e300
+             else math.nan for value in values), numpy.float64, len(values))
+    numbers[others | ~((numbers > 0) & (numbers < 1e300))] = math.nan
+    return numbers
+
+def _convert_ts_column(values, convert, epoch_offset, in_seconds):
+    '''
+    Converts the values of a column with convert (convert_unix_ts_to_utc or
+    convert_cocoa_core_data_ts_to_utc, epoch_offset the seconds it adds), to the
+    datetimes it returns or their Unix timestamps in seconds.
+    '''
+    values = values if isinstance(values, list) else list(values)
+    if numpy is None or len(values) < ts_column_min_size:
+        converted = [convert(value) for value in values]
+        if in_seconds:
+            converted = [int(value.timestamp()) if isinstance(value, datetime) else value for value in converted]
+        return converted
+
+    # The int and float timestamps after 1970 in numpy, the other values (None, str,
+    # bytes, negative or not finite...) one at a time by convert
+    numbers = _ts_column_numbers(values, epoch_offset)
+    others = numpy.isnan(numbers)
+    seconds, unsure = _unix_ts_column_in_seconds(numpy.where(others, 1.0, numbers))
+    seconds = seconds.tolist()
+    if in_seconds:
+        converted = seconds
+    else:
+        converted = list(map(datetime.fromtimestamp, seconds, [timezone.utc] * len(seconds)))
+    for index in numpy.flatnonzero(others | unsure).tolist():
+        value = convert(values[index])
+        converted[index] = int(value.timestamp()) if in_seconds and isinstance(value, datetime) else value
+    return converted
+
+def convert_unix_ts_column_to_utc(values):
+    '''
+    Converts a column of Unix timestamps at once, like convert_unix_ts_to_utc does them one by one.
+    Args:
+        values (iterable): The timestamps, in seconds, milliseconds, microseconds or nanoseconds.
+    Returns:
+        list: The datetimes in UTC, the values convert_unix_ts_to_utc does not convert unchanged.
+    '''
+    return _convert_ts_column(values, convert_unix_ts_to_utc, 0, False)
+
+def convert_cocoa_core_data_ts_column_to_utc(values):
+    '''
+    Converts a column of Cocoa Core Data timestamps (and of the WebKit ones of Safari, counted from
+    the same epoch) at once, like convert_cocoa_core_data_ts_to_utc does them one by one.
+    Args:
+        values (iterable): The timestamps, in seconds, milliseconds, microseconds or nanoseconds.
+    Returns:
+        list: The datetimes in UTC, the values convert_cocoa_core_data_ts_to_utc does not convert unchanged.
+    '''
+    return _convert_ts_column(values, convert_cocoa_core_data_ts_to_utc, 978307200, False)
+
+def convert_unix_ts_column_to_seconds(values):
+    '''
+    Converts a column of Unix timestamps to Unix timestamps in seconds, without creating the
+    datetimes of convert_unix_ts_column_to_utc: what LAVA stores for a datetime column, for
+    the rows written with lava_bulk_insert.
+    Returns:
+        list: The timestamps in seconds, the values convert_unix_ts_to_utc does not convert unchanged.
+    '''
+    return _convert_ts_column(values, convert_unix_ts_to_utc, 0, True)
+
+def convert_cocoa_core_data_ts_column_to_seconds(values):
+    '''
+    Converts a column of Cocoa Core Data timestamps to Unix timestamps in seconds, without
+    creating the datetimes of convert_cocoa_core_data_ts_column_to_utc.
+    Returns:
+        list: The timestamps in seconds, the values convert_cocoa_core_data_ts_to_utc does not convert unchanged.
+    '''
+    return _convert_ts_column(values, convert_cocoa_core_data_ts_to_utc, 978307200, True)
+
+def _convert_plist_column(values):
+    return [get_plist_content(value) if value else value for value in values]
+
+# The column types of get_sqlite_db_rows, with the functions converting a column of values
+sqlite_column_types = {
+    'cocoa_date': convert_cocoa_core_data_ts_column_to_utc,
+    'unix_date': convert_unix_ts_column_to_utc,
+    # Unix timestamps in seconds, for the rows written with lava_bulk_insert
+    'cocoa_seconds': convert_cocoa_core_data_ts_column_to_seconds,
+    'unix_seconds': convert_unix_ts_column_to_seconds,
+    'plist_blob': _convert_plist_column,
+}
+
 def convert_log_ts_to_utc(str_dt):
     if str_dt:
         try:
@@ -8,30 +8,43 @@ Global Variables:
     lava_db (sqlite3.Connection): SQLite database connection for artifact storage.
     lava_db_name (str): Name of the SQLite database file.
     lava_json_name (str): Name of the JSON metadata file.
+    sqlite_busy_timeout (int): Seconds to wait for a database locked by another worker process.
+    lava_flush_size (int): Number of rows written to the database before an intermediate commit.
+    media_cache_size (int): Number of media items, and of media references, kept in the media registry.
 
 Functions:
     sanitize_sql_name: Sanitizes strings for use as SQL identifiers.
     quote_sql_name: Quotes an identifier so reserved words are safe in SQL.
     get_sql_type: Maps Python types to SQL types.
     initialize_lava: Initializes the LAVA data structure and database.
+    lava_reopen_db: Opens a worker process's own connection to the LAVA database.
+    lava_commit: Commits the rows written to the LAVA database since the last commit.
+    lava_mark_db_shared: Makes media lookups missing from the registry fall back to the database.
     lava_process_artifact: Processes and stores artifact data.
+    lava_set_record_count: Records the number of rows of an artifact once they are all written.
     lava_add_module: Adds module information to the LAVA data.
     lava_create_sqlite_table: Creates a SQLite table for artifact data.
     lava_insert_sqlite_data: Inserts data rows into a SQLite table.
+    lava_bulk_insert: Streams rows already in their stored form into a SQLite table.
+    lava_create_text_index: Creates a full-text index answering LIKE '%...%' searches on a column.
+    lava_write_matches: Records the rows of a table matched by the rules of a classifier.
     lava_get_media_item: Retrieves media item information from database.
     lava_insert_sqlite_media_item: Inserts media item metadata into database.
     lava_get_media_references: Retrieves media reference information.
     lava_insert_sqlite_media_references: Inserts media reference into database.
     lava_get_full_media_info: Retrieves complete media information with joins.
+    lava_insert_sqlite_artifact_timings: Inserts the timings of the artifacts of the run.
     lava_finalize_output: Finalizes and saves LAVA output files.
 """
 
+import gc
 import json
 import sqlite3
 import sys
 import os
 from platform import platform
 from collections import OrderedDict
+from itertools import islice
 import re
 import datetime
 
@@ -43,6 +56,29 @@ lava_data = None
 lava_db = None
 lava_db_name = '_lava_artifacts.db'
 lava_json_name = '_lava_data.lava'
+_unix_epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+# Seconds a connection waits on a database another worker process is writing to
+sqlite_busy_timeout = 300
+# Rows written to the LAVA database between two commits, besides the commit after each artifact
+lava_flush_size = 50000
+# lava_db.total_changes at the last commit
+_lava_committed_changes = 0
+# True in a worker process, which commits after every write instead of every lava_flush_size
+# rows: an open write transaction locks the database for the other workers
+_lava_commit_each_write = False
+# Media items and media references kept in memory, so that checking in media does not query
+# _lava_media_items and _lava_media_references for every call
+media_cache_size = 200000
+# Process-local media registry: ids -> rows of _lava_media_items and _lava_media_references,
+# least recently used first
+_media_items = OrderedDict()
+_media_references = OrderedDict()
+# Rows in the registry not yet written to the database
+_pending_media_items = []
+_pending_media_references = []
+# True while the registry holds every media row of the database, a miss then means the
+# row does not exist; cleared when rows are evicted or other processes write media
+_media_registry_complete = True
 
 
 def sanitize_sql_name(name):
@@ -114,8 +150,9 @@ def initialize_lava(input_path, output_path, input_type):
 
     # lava_data and lava_db are module level singletons for the run; this is the one
     # function that creates them, so the global statement is deliberate.
-    global lava_data, lava_db  # pylint: disable=global-statement
+    global lava_data, lava_db, _lava_committed_changes, _lava_commit_each_write  # pylint: disable=global-statement
 
+    _reset_media_registry()
     lava_data = {
         "parser_info": {
             "leapp_name": leapp_name,
@@ -139,6 +176,12 @@ def initialize_lava(input_path, output_path, input_type):
 
     db_path = os.path.join(output_path, lava_db_name)
     lava_db = sqlite3.connect(db_path)
+    # Rows are committed in batches (see lava_commit); WAL makes each commit an append
+    # to the log rather than a rewrite of the journal, and NORMAL skips the fsync per commit
+    lava_db.execute('PRAGMA journal_mode = WAL')
+    lava_db.execute('PRAGMA synchronous = NORMAL')
+    _lava_committed_changes = 0
+    _lava_commit_each_write = False
 
     cursor = lava_db.cursor()
     cursor.execute('''CREATE TABLE _artifact_search_patterns (
@@ -187,6 +230,81 @@ def initialize_lava(input_path, output_path, input_type):
                             lmi.is_embedded
                         FROM _lava_media_references as lmr
                         LEFT JOIN _lava_media_items as lmi ON lmr.media_item_id = lmi.id''')
+    cursor.execute('''CREATE TABLE _artifact_timings (
+                        id INTEGER PRIMARY KEY,
+                        module_name TEXT NOT NULL,
+                        artifact_name TEXT NOT NULL,
+                        wall_secs REAL,
+                        cpu_secs REAL,
+                        search_secs REAL,
+                        parse_secs REAL,
+                        html_secs REAL,
+                        tsv_secs REAL,
+                        timeline_secs REAL,
+                        lava_secs REAL,
+                        kml_secs REAL,
+                        rows INTEGER,
+                        files_found INTEGER,
+                        files_bytes INTEGER,
+                        peak_rss_delta_kb INTEGER)''')
+
+
+def lava_reopen_db():
+    '''
+    Replace the LAVA database connection inherited by a forked worker process.
+    A SQLite connection must not be used across a fork, so each worker opens its own.
+    The connection waits for the other workers' writes instead of failing with
+    "database is locked", and each insert call commits its rows, so that no worker
+    holds the write lock for a whole artifact.
+    '''
+
+    global lava_db, _lava_committed_changes, _lava_commit_each_write  # pylint: disable=global-statement
+
+    db_path = os.path.join(lava_data['param_output'], lava_db_name)
+    lava_db = sqlite3.connect(db_path, timeout=sqlite_busy_timeout)
+    lava_db.execute('PRAGMA synchronous = NORMAL')
+    _lava_committed_changes = 0
+    _lava_commit_each_write = True
+    # The registry inherited from the parent stays valid, but rows still pending there are
+    # the parent's to write, and the other workers' media are only in the database
+    _pending_media_items.clear()
+    _pending_media_references.clear()
+    lava_mark_db_shared()
+
+
+def lava_commit():
+    '''
+    Commit the rows written to the LAVA database since the last commit.
+    The insert functions below leave their rows in the open transaction and only commit
+    every lava_flush_size rows (a worker process after every insert call): crunch_artifacts
+    commits once per artifact, and lava_finalize_output commits what is left. Anything that reads the LAVA database
+    through another connection must run after a commit.
+    '''
+
+    global _lava_committed_changes  # pylint: disable=global-statement
+
+    _lava_flush_media()
+    lava_db.commit()
+    _lava_committed_changes = lava_db.total_changes
+
+
+def lava_mark_db_shared():
+    '''
+    Tell the media registry that other processes write media to the LAVA database.
+    From then on a media item or reference missing from the registry is looked up in
+    the database instead of being taken as new.
+    '''
+
+    global _media_registry_complete  # pylint: disable=global-statement
+
+    _media_registry_complete = False
+
+
+def _lava_commit_if_due():
+    '''Commits once lava_flush_size rows are pending, instead of after every insert'''
+    pending = lava_db.total_changes - _lava_committed_changes
+    if pending >= lava_flush_size or (pending and _lava_commit_each_write):
+        lava_commit()
 
 
 def lava_process_artifact(
@@ -307,6 +425,21 @@ def lava_process_artifact(
     return sanitized_table_name, object_columns, column_map
 
 
+def lava_set_record_count(category, table_name, record_count):
+    '''
+    Set the record count of an artifact processed without one, once its rows are all written.
+    Args:
+        category: The category of the artifact.
+        table_name: The table name returned by lava_process_artifact.
+        record_count: The number of records in the artifact.
+    '''
+
+    for artifact in reversed(lava_data["artifacts"].get(category, [])):
+        if artifact["tablename"] == table_name:
+            artifact["record_count"] = record_count
+            return
+
+
 def lava_add_module(module_name, module_status, file_count=None):
     """
     Adds a module to the global lava_data structure.
@@ -373,7 +506,7 @@ def lava_create_sqlite_table(table_name, data):
 
     columns_sql = ', '.join(columns)
     cursor.execute(f"CREATE TABLE IF NOT EXISTS {quote_sql_name(sanitized_table_name)} ({columns_sql})")
-    lava_db.commit()
+    _lava_commit_if_due()
 
     return sanitized_table_name, column_map, object_columns
 
@@ -413,60 +546,224 @@ def lava_insert_sqlite_data(table_name, data, object_columns, headers, column_ma
     quoted_columns = ', '.join(quote_sql_name(column) for column in sanitized_columns)
     query = f"INSERT INTO {quote_sql_name(table_name)} ({quoted_columns}) VALUES ({placeholders})"
 
-    # Prepare the data for insertion
-    rows_to_insert = []
-    for row in data:
-        processed_row = []
-        for sanitized_column, value in zip(sanitized_columns, row):
-            if isinstance(value, dict) or isinstance(value, list):
-                value = json.dumps(value)
-            if sanitized_column in object_columns and object_columns[sanitized_column] == 'datetime':
-                # Convert datetime to integer (Unix timestamp)
-                if isinstance(value, str):
-                    try:
-                        dt = datetime.datetime.fromisoformat(value)
-                        # Treat naive datetimes as UTC; otherwise int(dt.timestamp()) interprets the
-                        # value in the examiner machine's local tz, producing a wrong epoch off-UTC.
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=datetime.timezone.utc)
-                        value = int(dt.timestamp())
-                    except ValueError:
-                        # If conversion fails, keep the original value
-                        pass
-                elif isinstance(value, datetime.datetime):
-                    # Treat naive datetimes as UTC (the project convention is to store UTC) so the
-                    # subtraction below doesn't raise "can't subtract offset-naive and offset-aware".
-                    if value.tzinfo is None:
-                        value = value.replace(tzinfo=datetime.timezone.utc)
-                    # Need to do it this way due to dates that could be before Epoch
-                    epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
-                    value = (value - epoch).total_seconds()
-            processed_row.append(value)
-        rows_to_insert.append(tuple(processed_row))
+    # Prepare the data for insertion. Rows are converted as executemany consumes them, so a
+    # large artifact is not copied in memory, and only the datetime columns are revisited.
+    width = len(sanitized_columns)
+    datetime_indexes = [index for index, column in enumerate(sanitized_columns)
+                        if column in object_columns and object_columns[column] == 'datetime']
+
+    def process_row(row):
+        processed_row = [json.dumps(value) if isinstance(value, (dict, list)) else value
+                         for value in islice(row, width)]
+        for index in datetime_indexes:
+            if index < len(processed_row):
+                processed_row[index] = _lava_timestamp(processed_row[index])
+        return processed_row
 
     # Execute the insert
-    cursor.executemany(query, rows_to_insert)
-    lava_db.commit()
+    cursor.executemany(query, map(process_row, data))
+    _lava_commit_if_due()
+
+
+def lava_bulk_insert(table_name, headers, rows):
+    '''
+    Insert a stream of rows into a table created by lava_process_artifact, lava_flush_size
+    rows per statement, without the conversions of lava_insert_sqlite_data: the rows must
+    already hold what is stored, datetime columns as Unix timestamps and no dict or list.
+    Used by artifacts loading millions of rows, which write them before returning.
+    Args:
+        table_name (str): The table name returned by lava_process_artifact.
+        headers (list): The column headers, as given to lava_process_artifact.
+        rows (iterable): The rows, consumed as they are written.
+    Returns:
+        int: The number of rows inserted.
+    '''
+
+    columns = [sanitize_sql_name(h[0] if isinstance(h, tuple) else h) for h in headers]
+    query = f"INSERT INTO {quote_sql_name(table_name)} ({', '.join(quote_sql_name(column) for column in columns)}) " \
+            f"VALUES ({', '.join('?' for _ in columns)})"
+    cursor = lava_db.cursor()
+    record_count = 0
+    rows = iter(rows)
+    while True:
+        changes = lava_db.total_changes
+        cursor.executemany(query, islice(rows, lava_flush_size))
+        inserted = lava_db.total_changes - changes
+        if not inserted:
+            break
+        record_count += inserted
+        _lava_commit_if_due()
+    return record_count
+
+
+def lava_create_text_index(table_name, column_name):
+    '''
+    Create a full-text index of a column, for searches of substrings in large tables.
+    The index is an FTS5 table named <table_name>_fts using the trigram tokenizer, with
+    the table as external content: it holds no copy of the text, and a LIKE '%...%' (or
+    GLOB) on its column is answered from the index instead of a scan of the table, with the
+    rowid of the matching rows. It is built in one pass, once all the rows are inserted.
+    Args:
+        table_name (str): The table name returned by lava_process_artifact.
+        column_name (str): The column to index, as given in the headers.
+    Returns:
+        str: The name of the index table, or None if this SQLite has no FTS5 trigram tokenizer.
+    '''
+
+    index_name = f'{table_name}_fts'
+    try:
+        lava_db.execute(f"CREATE VIRTUAL TABLE {quote_sql_name(index_name)} USING fts5("
+                        f"{quote_sql_name(sanitize_sql_name(column_name))}, content={quote_sql_name(table_name)}, "
+                        "content_rowid='rowid', tokenize='trigram')")
+    except sqlite3.OperationalError:
+        return None
+    lava_db.execute(f"INSERT INTO {quote_sql_name(index_name)}({quote_sql_name(index_name)}) VALUES('rebuild')")
+    lava_commit()
+    return index_name
+
+
+def lava_write_matches(table_name, matches):
+    '''
+    Create the <table_name>_matches table, holding the rowid of the rows of a table matched
+    by each rule of an artifact classifying them in one pass: the artifacts reading the rows
+    of a rule join it to the table instead of scanning the whole table again.
+    Args:
+        table_name (str): The table the rows are from.
+        matches (iterable): (rule id, rowid) tuples, consumed as they are written.
+    Returns:
+        str: The name of the matches table.
+    '''
+
+    matches_name = f'{table_name}_matches'
+    lava_db.execute(f"CREATE TABLE IF NOT EXISTS {quote_sql_name(matches_name)} "
+                    "(rule_id TEXT, row_id INTEGER, PRIMARY KEY (rule_id, row_id)) WITHOUT ROWID")
+    lava_db.executemany(f"INSERT OR IGNORE INTO {quote_sql_name(matches_name)} VALUES (?, ?)", matches)
+    lava_commit()
+    return matches_name
+
+
+def _lava_timestamp(value):
+    '''Converts a datetime, or its ISO format string, to a Unix timestamp for a datetime column'''
+    if value.__class__ in (int, float):
+        # Already a Unix timestamp, e.g. from convert_cocoa_core_data_ts_column_to_seconds
+        return value
+    if isinstance(value, str):
+        try:
+            dt = datetime.datetime.fromisoformat(value)
+            # Treat naive datetimes as UTC; otherwise int(dt.timestamp()) interprets the
+            # value in the examiner machine's local tz, producing a wrong epoch off-UTC.
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=datetime.timezone.utc)
+            value = int(dt.timestamp())
+        except ValueError:
+            # If conversion fails, keep the original value
+            pass
+    elif isinstance(value, datetime.datetime):
+        # Treat naive datetimes as UTC (the project convention is to store UTC) so the
+        # subtraction below doesn't raise "can't subtract offset-naive and offset-aware".
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        # Need to do it this way due to dates that could be before Epoch
+        value = (value - _unix_epoch).total_seconds()
+    return value
+
+
+class _MediaInfoRow(tuple):
+    """A row of the _lava_media_info view built from the media registry.
+    Like sqlite3.Row, columns are read by index or by name."""
+
+    columns = ('media_ref_id', 'media_item_id', 'module_name', 'artifact_name', 'name', 'source_path',
+               'extraction_path', 'type', 'metadata', 'created_at', 'updated_at', 'is_embedded')
+    _indexes = {column: index for index, column in enumerate(columns)}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = self._indexes[key]
+        return tuple.__getitem__(self, key)
+
+    def keys(self):
+        """Returns the column names, as sqlite3.Row.keys() does."""
+        return list(self.columns)
+
+
+def _reset_media_registry():
+    '''Empties the media registry of a new LAVA database'''
+    global _media_items, _media_references  # pylint: disable=global-statement
+    global _pending_media_items, _pending_media_references, _media_registry_complete  # pylint: disable=global-statement
+
+    _media_items = OrderedDict()
+    _media_references = OrderedDict()
+    _pending_media_items = []
+    _pending_media_references = []
+    _media_registry_complete = True
+
+
+def _lava_flush_media():
+    '''Writes the media rows pending in the registry, in one statement per table'''
+    if _pending_media_items:
+        lava_db.executemany('''INSERT OR IGNORE INTO _lava_media_items
+            ("id", "source_path", "extraction_path", "type", "metadata", "created_at", "updated_at", "is_embedded")
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)''', _pending_media_items)
+        _pending_media_items.clear()
+    if _pending_media_references:
+        lava_db.executemany('''INSERT OR IGNORE INTO _lava_media_references
+            ("id", "media_item_id", "module_name", "artifact_name", "name")
+            VALUES (?, ?, ?, ?, ?)''', _pending_media_references)
+        _pending_media_references.clear()
+
+
+def _lava_flush_media_if_due():
+    '''Commits once lava_flush_size media rows are pending in the registry'''
+    if len(_pending_media_items) + len(_pending_media_references) >= lava_flush_size:
+        lava_commit()
+
+
+def _remember_media(registry, key, row):
+    '''Adds a row to the registry, evicting the least recently used rows once it is full'''
+    global _media_registry_complete  # pylint: disable=global-statement
+
+    registry[key] = row
+    if len(registry) > media_cache_size:
+        # Evicted rows are looked up in the database again, so they must be written first
+        _lava_flush_media()
+        _media_registry_complete = False
+        while len(registry) > media_cache_size * 0.9:
+            registry.popitem(last=False)
+
+
+def _lookup_media(registry, key, query):
+    '''Returns the registry row for key, reading it from the database when it may be there'''
+    row = registry.get(key)
+    if row is not None:
+        registry.move_to_end(key)
+        return row
+    if _media_registry_complete:
+        return None
+    row = lava_db.execute(query, (key,)).fetchone()
+    if row is not None:
+        row = tuple(row)
+        _remember_media(registry, key, row)
+    return row
 
 
 def lava_get_media_item(media_id):
     """
     Retrieve a media item from the lava database by its ID.
+    The media registry answers for the items this process wrote or already read.
     Args:
         media_id (str): The unique identifier of the media item to retrieve.
     Returns:
-        sqlite3.Row or None: A row object containing all columns from the _lava_media_items table
+        tuple or None: All columns from the _lava_media_items table
     """
 
-    cursor = lava_db.cursor()
-    query = "SELECT * FROM _lava_media_items WHERE id = ?"
-    return cursor.execute(query, (media_id,)).fetchone()
-    # return result.fetchone()
+    return _lookup_media(_media_items, media_id, "SELECT * FROM _lava_media_items WHERE id = ?")
 
 
 def lava_insert_sqlite_media_item(media_item):
     """
     Insert a media item record into the _lava_media_items SQLite table.
+    The row is kept in the media registry and written with the next batch; an item
+    already in the table is left unchanged.
     Args:
         media_item: A media item object containing the following attributes:
             - id: Unique identifier for the media item
@@ -480,11 +777,8 @@ def lava_insert_sqlite_media_item(media_item):
         None
     """
 
-    cursor = lava_db.cursor()
-    sql = '''INSERT INTO _lava_media_items
-                ("id", "source_path", "extraction_path", "type", "metadata", "created_at", "updated_at", "is_embedded")
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)'''
-
+    if media_item.id in _media_items:
+        return
     params = (
         media_item.id,
         str(media_item.source_path),
@@ -495,31 +789,28 @@ def lava_insert_sqlite_media_item(media_item):
         media_item.updated_at if media_item.updated_at else None,
         media_item.is_embedded
     )
-
-    try:
-        cursor.execute(sql, params)
-        lava_db.commit()
-    except sqlite3.IntegrityError as e:
-        print(str(e))
+    _pending_media_items.append(params)
+    _remember_media(_media_items, media_item.id, params)
+    _lava_flush_media_if_due()
 
 
 def lava_get_media_references(media_ref):
     """
     Retrieves a single media reference record from the _lava_media_references table.
+    The media registry answers for the references this process wrote or already read.
     Args:
         media_ref (str): The ID of the media reference to retrieve.
     Returns:
         tuple or None: A tuple containing the row data if found, None otherwise.
     """
 
-    cursor = lava_db.cursor()
-    query = "SELECT * FROM _lava_media_references WHERE id = ?"
-    return cursor.execute(query, (media_ref,)).fetchone()
+    return _lookup_media(_media_references, media_ref, "SELECT * FROM _lava_media_references WHERE id = ?")
 
 
 def lava_insert_sqlite_media_references(media_references):
     """
     Insert a media reference record into the _lava_media_references table.
+    The row is kept in the media registry and written with the next batch.
     Args:
         media_references: An object containing media reference data with the following attributes:
             - id: Unique identifier for the media reference
@@ -532,11 +823,8 @@ def lava_insert_sqlite_media_references(media_references):
         None
     """
 
-    cursor = lava_db.cursor()
-    sql = '''INSERT INTO _lava_media_references
-                ("id", "media_item_id", "module_name", "artifact_name", "name")
-                VALUES (?, ?, ?, ?, ?)'''
-
+    if media_references.id in _media_references:
+        return
     params = (
         media_references.id,
         media_references.media_item_id,
@@ -544,31 +832,31 @@ def lava_insert_sqlite_media_references(media_references):
         media_references.artifact_name,
         media_references.name
     )
-    cursor.execute(sql, params)
-    lava_db.commit()
+    _pending_media_references.append(params)
+    _remember_media(_media_references, media_references.id, params)
+    _lava_flush_media_if_due()
 
 
 def lava_get_full_media_info(media_ref_id):
     """
     Retrieves complete media information for a given media reference ID from the LAVA database.
-    This function queries the _lava_media_info table to fetch all columns for a specific
-    media item identified by its reference ID. The function uses a global database connection
-    and sets the row factory to sqlite3.Row for dictionary-like access to results.
+    The reference and its media item are read from the media registry, or from the
+    _lava_media_info view when the registry does not hold them.
     Args:
         media_ref_id (str): The unique media reference identifier to look up in the database.
     Returns:
-        sqlite3.Row or None: A Row object containing all media information fields if found,
-                            None if no matching media_ref_id exists in the database.
+        _MediaInfoRow or None: The columns of the _lava_media_info view, accessed by index or
+                               by name like a sqlite3.Row, None if no matching media_ref_id
+                               exists in the database.
     """
 
-    lava_db.row_factory = sqlite3.Row
-    cursor = lava_db.cursor()
-    query = '''
-    SELECT *
-    FROM _lava_media_info
-    WHERE media_ref_id = ?
-    '''
-    return cursor.execute(query, (media_ref_id,)).fetchone()
+    reference = lava_get_media_references(media_ref_id)
+    if reference is None:
+        return None
+    item = lava_get_media_item(reference[1])
+    if item is None:
+        item = (None,) * 8
+    return _MediaInfoRow(reference + item[1:])
 
 
 def lava_insert_sqlite_artifact_search_pattern(artifact_regex_id, module_name, artifact_name, regex):
@@ -590,7 +878,7 @@ def lava_insert_sqlite_artifact_search_pattern(artifact_regex_id, module_name, a
 
     try:
         cursor.execute(sql, data)
-        lava_db.commit()
+        _lava_commit_if_due()
     except sqlite3.IntegrityError as e:
         print(str(e))
 
@@ -612,7 +900,7 @@ def lava_insert_sqlite_file_path(file_id, file_path):
 
     try:
         cursor.execute(sql, data)
-        lava_db.commit()
+        _lava_commit_if_due()
     except sqlite3.IntegrityError as e:
         print(str(e))
 
@@ -634,11 +922,33 @@ def lava_insert_sqlite_artifact_link_pattern_to_file(artifact_regex_id, file_id)
 
     try:
         cursor.execute(sql, data)
-        lava_db.commit()
+        _lava_commit_if_due()
     except sqlite3.IntegrityError as e:
         print(str(e))
 
 
+def lava_insert_sqlite_artifact_timings(timings):
+    """
+    Insert the timings of the artifacts of the run into the _artifact_timings table.
+    Args:
+        timings (list): The ArtifactTiming objects of the run, see artifact_profiler.
+    """
+
+    sql = '''INSERT INTO _artifact_timings
+                ("id", "module_name", "artifact_name", "wall_secs", "cpu_secs", "search_secs", "parse_secs",
+                 "html_secs", "tsv_secs", "timeline_secs", "lava_secs", "kml_secs", "rows", "files_found",
+                 "files_bytes", "peak_rss_delta_kb")
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'''
+
+    lava_db.executemany(sql, (
+        (timing.number, timing.module_name, timing.artifact_name, timing.wall_secs, timing.cpu_secs,
+         timing.search_secs, timing.parse_secs)
+        + tuple(timing.output_secs.get(output_type, 0.0) for output_type in ('html', 'tsv', 'timeline', 'lava', 'kml'))
+        + (timing.rows, timing.files_found, timing.files_bytes, timing.peak_rss_delta_kb)
+        for timing in timings))
+    _lava_commit_if_due()
+
+
 def lava_finalize_output(output_path):
     """
     Finalizes the LAVA output by completing data processing and saving results.
@@ -648,7 +958,7 @@ def lava_finalize_output(output_path):
     3. Sorts artifact categories alphabetically
     4. Sorts artifacts within each category alphabetically by name
     5. Saves the LAVA data structure to a JSON file
-    6. Closes the SQLite database connection
+    6. Commits the pending rows and closes the SQLite database connection
     Args:
         output_path (str): The directory path where the LAVA JSON output file will be saved
     Global Variables:
@@ -677,5 +987,12 @@ def lava_finalize_output(output_path):
     with open(os.path.join(output_path, lava_json_name), 'w', encoding='utf-8') as f:
         json.dump(lava_data, f, indent=4)
 
-    # Close the SQLite database
+    # Commit the last rows and leave a self-contained database file (no -wal/-shm), which
+    # viewers can open from read-only media
+    lava_commit()
+    # Artifacts read the database through read-only connections they do not close (the
+    # cursor of get_sqlite_db_records); a connection is only freed by the garbage collector,
+    # and one still open would keep the journal mode from changing
+    gc.collect()
+    lava_db.execute('PRAGMA journal_mode = DELETE')
     lava_db.close()
@@ -0,0 +1,142 @@
+"""
+Shared query engine for the Photos.sqlite (Ph) artifacts.
+
+The Photos.sqlite schema changes with almost every iOS version, so each Ph artifact has
+a query per range of iOS versions. An artifact declares them in a registry, a tuple of
+PhotosQuery, and run_photos_query runs the one matching the iOS version of the
+extraction. The Ph artifacts of a run all read the same few Photos.sqlite databases
+through the connections of open_sqlite_db_readonly, which stay open for the next
+artifacts: with a page cache large enough for the asset tables, they read the pages the
+previous artifacts already loaded instead of reading the database again. The rows are
+streamed from the cursor to the outputs.
+
+Classes:
+    PhotosQuery: The query of an artifact for a range of iOS versions.
+
+Functions:
+    open_photos_db: Returns the connection to a Photos.sqlite shared by the artifacts.
+    select_photos_query: Returns the query of a registry matching an iOS version.
+    run_photos_query: Runs the query of a registry matching the iOS version of the extraction.
+"""
+
+import dataclasses
+import functools
+import os
+import sqlite3
+from operator import itemgetter
+
+from packaging import version
+
+from scripts.ilapfuncs import get_file_path, iOS, logfunc, open_sqlite_db_readonly
+
+# Pages kept in memory for each database, in KiB (SQLite takes a negative cache_size as KiB)
+photos_cache_kib = 65536
+
+
+@dataclasses.dataclass(frozen=True)
+class PhotosQuery:
+    """
+    The query of a Ph artifact for a range of iOS versions.
+    Attributes:
+        min_version (str): First iOS version of the range.
+        max_version (str): iOS version following the range.
+        query (str): The query.
+        data_headers (tuple): The headers of the columns of the query.
+    """
+
+    min_version: str
+    max_version: str
+    query: str
+    data_headers: tuple
+
+    def matches(self, ios_version):
+        '''True if ios_version is in the range of the query'''
+        parsed = _parse_version(ios_version)
+        return _parse_version(self.min_version) <= parsed < _parse_version(self.max_version)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_version(ios_version):
+    return version.parse(ios_version)
+
+
+def open_photos_db(path):
+    '''
+    Returns the read-only connection to a Photos.sqlite shared by the artifacts, with the
+    page cache of the Photos.sqlite databases.
+    Args:
+        path (str): The path of the database.
+    Returns:
+        sqlite3.Connection: The connection, None if the database cannot be opened.
+    '''
+
+    db = open_sqlite_db_readonly(path)
+    if db is not None:
+        try:
+            db.execute(f'PRAGMA cache_size = -{photos_cache_kib}')
+            # The sorts of the ORDER BY clauses are done in memory
+            db.execute('PRAGMA temp_store = MEMORY')
+        except sqlite3.DatabaseError as ex:
+            logfunc(f"Error with {path}:")
+            logfunc(f" - {str(ex)}")
+            return None
+    return db
+
+
+def select_photos_query(queries, ios_version):
+    '''
+    Returns the query of a registry matching an iOS version.
+    Args:
+        queries (tuple): The PhotosQuery of an artifact.
+        ios_version (str): The iOS version.
+    Returns:
+        PhotosQuery: The matching query, None if the version is not supported.
+    '''
+
+    if not ios_version:
+        return None
+    return next((photos_query for photos_query in queries if photos_query.matches(ios_version)), None)
+
+
+def run_photos_query(context, queries, library='PhotoData-Photos.sqlite', db_name='Photos.sqlite'):
+    '''
+    Runs the query of a registry matching the iOS version of the extraction.
+    Args:
+        context (Context): The context of the artifact.
+        queries (tuple): The PhotosQuery of the artifact.
+        library (str): The name of the Photos library, for the log.
+        db_name (str): The file name of the database among the files found.
+    Returns:
+        tuple: The headers, the rows and the source path, as returned by an artifact.
+    '''
+
+    files_found = context.get_files_found()
+    source_path = ''
+    for source_path in files_found:
+        source_path = str(source_path)
+
+        if source_path.endswith('.sqlite'):
+            break
+
+    ios_version = iOS.get_version()
+    photos_query = select_photos_query(queries, ios_version)
+    if photos_query is None:
+        logfunc(f"Unsupported version for {library} iOS {ios_version}")
+        return (), [], source_path
+
+    source_path = get_file_path(files_found, db_name)
+    if source_path is None or not os.path.exists(source_path):
+        logfunc(f"{db_name} not found for iOS version {ios_version}")
+        return (), [], source_path
+
+    db = open_photos_db(source_path)
+    if db is None:
+        return photos_query.data_headers, [], source_path
+    try:
+        cursor = db.execute(photos_query.query)
+    except sqlite3.DatabaseError as ex:
+        logfunc(f"Error with {source_path}:")
+        logfunc(f" - {str(ex)}")
+        return photos_query.data_headers, [], source_path
+    # Only the columns with a header are kept
+    return photos_query.data_headers, map(itemgetter(slice(len(photos_query.data_headers))), cursor), source_path
@@ -0,0 +1,324 @@
+"""
+Decodes protobuf messages with a typedef compiled once, for the artifacts decoding a
+message per record (Biome SEGB entries, WhatsApp messages...).
+
+blackboxprotobuf.decode_message copies the whole typedef on every call, looks every
+field up by its number as a string and goes through the dicts of the typedef for its
+type and decoder. Compiling the typedef once turns it into tables keyed by field number
+holding the name and decoder of each field, that decode_protobuf reuses for every
+message decoded with that typedef.
+
+The values are those blackboxprotobuf.decode_message returns. The fields the typedef
+does not pin are still guessed the same way, and the types guessed for a field are then
+used for its next occurrences in the same message, as blackboxprotobuf does: the tables
+of a message are copied when a type is learned, not on every call. What is rare enough
+not to be worth porting (the alternative typedefs tried when a message does not decode
+with its own) and any error hand the message over to blackboxprotobuf.decode_message,
+which gives the values or raises the error.
+
+Classes:
+    CompiledTypedef: A typedef compiled for decoding messages.
+
+Functions:
+    compile_typedef: Returns the compiled version of a typedef.
+    decode_protobuf: Decodes a protobuf message to a dict, like blackboxprotobuf.decode_message.
+"""
+
+import copy
+import struct
+from collections import OrderedDict
+
+from google.protobuf.internal import decoder, wire_format
+
+from scripts import blackboxprotobuf
+from scripts.blackboxprotobuf.lib.types import decoders, wire_type_defaults, wiretypes
+
+# Typedefs compiled by decode_protobuf, by their repr, least recently used first
+compiled_typedefs_size = 256
+_compiled_typedefs = OrderedDict()
+
+_decode_varint = decoder._DecodeVarint  # pylint: disable=protected-access
+_decode_signed_varint = decoder._DecodeSignedVarint  # pylint: disable=protected-access
+
+
+def _decode_int(buf, pos):
+    """varint.decode_varint, without a call for a value of a byte"""
+    value = buf[pos]
+    if value < 0x80:
+        return value, pos + 1
+    return _decode_signed_varint(buf, pos)
+
+
+def _decode_uint(buf, pos):
+    """varint.decode_uvarint, without a call for a value of a byte"""
+    value = buf[pos]
+    if value < 0x80:
+        return value, pos + 1
+    return _decode_varint(buf, pos)
+
+
+def _decode_bytes(buf, pos):
+    """length_delim.decode_bytes, without a call for a length of a byte"""
+    length = buf[pos]
+    if length < 0x80:
+        pos += 1
+    else:
+        length, pos = _decode_signed_varint(buf, pos)
+    end = pos + length
+    return buf[pos:end], end
+
+
+def _decode_str(buf, pos):
+    """length_delim.decode_str, without a call for a length of a byte"""
+    length = buf[pos]
+    if length < 0x80:
+        pos += 1
+    else:
+        length, pos = _decode_signed_varint(buf, pos)
+    end = pos + length
+    return buf[pos:end].decode('utf-8', 'backslashreplace'), end
+
+
+def _struct_decoder(fmt):
+    """fixed.decode_struct for a format, with the struct compiled once"""
+    unpack = struct.Struct(fmt).unpack
+    size = struct.calcsize(fmt)
+
+    def decode(buf, pos):
+        end = pos + size
+        return unpack(buf[pos:end])[0], end
+    return decode
+
+
+# The decoders of blackboxprotobuf, those of the most common types decoding the same values faster
+_decoders = dict(decoders, int=_decode_int, uint=_decode_uint, bytes=_decode_bytes, str=_decode_str,
+                 fixed32=_struct_decoder('<I'), sfixed32=_struct_decoder('<i'), float=_struct_decoder('<f'),
+                 fixed64=_struct_decoder('<Q'), sfixed64=_struct_decoder('<q'), double=_struct_decoder('<d'))
+
+
+class _Fallback(Exception):
+    """Raised for what only blackboxprotobuf.decode_message decodes, never taken for a decoding error."""
+
+
+class _Field:
+    """
+    A field of a compiled typedef.
+    Attributes:
+        number (str): The field number, as the key of its typedef.
+        key (str): The key of its values in the decoded message, its name if it has one.
+        wire_type (int): The wire type of its type.
+        decode (callable): The decoder of its type, None for a message or group.
+        message (dict): The fields of its message or group by number, None if it is neither.
+        group (bool): Whether it is a group.
+    """
+    __slots__ = ('number', 'key', 'wire_type', 'decode', 'message', 'group')
+
+    def __init__(self, number, name, field_type, message=None):
+        self.number = number
+        self.key = name if name != '' else number
+        self.message = message
+        self.group = field_type == 'group'
+        if field_type in ('message', 'group'):
+            self.wire_type = wiretypes[field_type]
+            self.decode = None
+        elif field_type in _decoders:
+            self.wire_type = wiretypes[field_type]
+            self.decode = _decoders[field_type]
+        else:
+            # The types blackboxprotobuf fails on when the field is found
+            self.wire_type = None
+            self.decode = _fall_back
+
+    def with_message(self, message):
+        """Returns the field with the fields learned for its message"""
+        field = _Field.__new__(_Field)
+        field.number, field.key, field.wire_type, field.decode = self.number, self.key, self.wire_type, self.decode
+        field.message, field.group = message, self.group
+        return field
+
+
+def _fall_back(buf, pos):
+    raise _Fallback
+
+
+_no_fields = {}
+# Fields whose type was guessed, by type then number
+_guessed_fields = {field_type: {} for field_type in ('int', 'fixed32', 'fixed64', 'bytes')}
+
+
+def _guessed_field(field_number, field_type):
+    field = _guessed_fields[field_type].get(field_number)
+    if field is None:
+        field = _guessed_fields[field_type][field_number] = _Field(str(field_number), '', field_type)
+    return field
+
+
+def _compile_fields(typedef):
+    """Returns the fields of a message typedef by number"""
+    fields = {}
+    for number, field_typedef in (typedef or {}).items():
+        # blackboxprotobuf only finds the fields whose key is their number as str() gives it
+        if not isinstance(number, str) or not number.isdigit() or str(int(number)) != number:
+            continue
+        if not isinstance(field_typedef, dict) or 'type' not in field_typedef:
+            fields[int(number)] = _Field(number, '', None)
+            continue
+        field_type = field_typedef['type']
+        message = None
+        if field_type == 'message':
+            if 'message_typedef' in field_typedef:
+                message = _compile_fields(field_typedef['message_typedef'])
+            elif 'message_type_name' in field_typedef:
+                field_type = None
+            else:
+                message = _no_fields
+        elif field_type == 'group':
+            message = _compile_fields(field_typedef.get('group_typedef'))
+        fields[int(number)] = _Field(number, field_typedef.get('name', ''), field_type, message)
+    return fields
+
+
+def _decode_message(buf, pos, end, fields, group=False):
+    """
+    Decodes the fields of a message or group, the way length_delim.decode_message does.
+    Returns:
+        tuple: The values by key, the fields with those learned while decoding (fields itself
+               if none was) and the position after the message.
+    """
+    output = {}
+    learned = fields
+    while pos < end:
+        tag = buf[pos]
+        if tag < 0x80:
+            pos += 1
+        else:
+            tag, pos = _decode_varint(buf, pos)
+        field_number = tag >> 3
+        wire_type = tag & 7
+
+        field = learned.get(field_number)
+        guessed = field is None
+        if guessed:
+            # KeyError for the wire types that do not exist, as blackboxprotobuf
+            field_type = wire_type_defaults[wire_type]
+            if field_type is None:
+                if wire_type == wire_format.WIRETYPE_END_GROUP:
+                    if not group:
+                        raise ValueError('Found END_GROUP before START_GROUP')
+                    return output, learned, pos
+                # Decoded as a message if it is one, as bytes otherwise
+                try:
+                    length, start = _decode_int(buf, pos)
+                    value, message, pos = _decode_message(buf, start, start + length, _no_fields)
+                    field = _Field(str(field_number), '', 'message', message)
+                except _Fallback:
+                    raise
+                except Exception:  # pylint: disable=broad-except
+                    value, pos = _decode_bytes(buf, pos)
+                    field = _guessed_field(field_number, 'bytes')
+            elif field_type == 'group':
+                # A group ends with its END_GROUP, wherever the message ends
+                value, message, pos = _decode_message(buf, pos, len(buf), _no_fields, True)
+                field = _Field(str(field_number), '', 'group', message)
+            else:
+                field = _guessed_field(field_number, field_type)
+                value, pos = field.decode(buf, pos)
+        elif field.group:
+            value, message, pos = _decode_message(buf, pos, len(buf), field.message, True)
+            if message is not field.message:
+                if learned is fields:
+                    learned = dict(fields)
+                learned[field_number] = field = field.with_message(message)
+        elif field.message is not None:
+            # A message is decoded whatever the wire type, failing that blackboxprotobuf tries
+            # alternative typedefs
+            try:
+                length, start = _decode_int(buf, pos)
+                value, message, pos = _decode_message(buf, start, start + length, field.message)
+            except _Fallback:
+                raise
+            except Exception as ex:  # pylint: disable=broad-except
+                raise _Fallback from ex
+            if message is not field.message:
+                if learned is fields:
+                    learned = dict(fields)
+                learned[field_number] = field = field.with_message(message)
+        else:
+            if field.wire_type != wire_type and field.decode is not _fall_back:
+                raise ValueError(f'Invalid wiretype for field number {field.number}. '
+                                 f'{wire_type} is not wiretype {field.wire_type}')
+            value, pos = field.decode(buf, pos)
+
+        key = field.key
+        if key in output:
+            # The repeated values are merged exactly as blackboxprotobuf does
+            previous = output[field.number]
+            if isinstance(value, list):
+                if isinstance(previous, list):
+                    output[key] += value
+                else:
+                    output[key] = value.append(output[key])
+            elif isinstance(previous, list):
+                output[key].append(value)
+            else:
+                output[key] = [output[key], value]
+        else:
+            output[key] = value
+            if guessed:
+                if learned is fields:
+                    learned = dict(fields)
+                learned[field_number] = field
+    if pos > end:
+        raise decoder._DecodeError('Invalid Message Length')  # pylint: disable=protected-access
+    if group:
+        raise ValueError('Got START_GROUP with no END_GROUP.')
+    return output, learned, pos
+
+
+class CompiledTypedef:
+    """
+    A typedef compiled for decoding messages.
+    Attributes:
+        typedef (dict): The typedef, as blackboxprotobuf takes it.
+    """
+
+    def __init__(self, typedef=None):
+        # Kept for blackboxprotobuf as it was compiled
+        self.typedef = copy.deepcopy(typedef)
+        self._fields = _compile_fields(typedef)
+
+    def decode(self, buf):
+        """Decodes a protobuf message to a dict, like blackboxprotobuf.decode_message"""
+        try:
+            return _decode_message(buf, 0, len(buf), self._fields)[0]
+        except Exception:  # pylint: disable=broad-except
+            # Either only blackboxprotobuf decodes it, or it raises the error
+            return blackboxprotobuf.decode_message(buf, self.typedef)[0]
+
+
+def compile_typedef(typedef=None):
+    """Returns the compiled version of a typedef, shared by the calls with an equal typedef"""
+    key = repr(typedef)
+    compiled = _compiled_typedefs.get(key)
+    if compiled is None:
+        compiled = _compiled_typedefs[key] = CompiledTypedef(typedef)
+        if len(_compiled_typedefs) > compiled_typedefs_size:
+            _compiled_typedefs.popitem(last=False)
+    else:
+        _compiled_typedefs.move_to_end(key)
+    return compiled
+
+
+def decode_protobuf(buf, typedef=None):
+    """
+    Decodes a protobuf message to a dict, like blackboxprotobuf.decode_message.
+    Args:
+        buf (bytes): The message.
+        typedef (dict): The typedef of the message, see blackboxprotobuf.
+    Returns:
+        dict: The values of the message. Unlike blackboxprotobuf.decode_message, the typedef
+              completed with the types guessed is not returned.
+    """
+    if isinstance(typedef, str):
+        return blackboxprotobuf.decode_message(buf, typedef)[0]
+    return compile_typedef(typedef).decode(buf)
@@ -12,8 +12,9 @@ from collections import OrderedDict
 from scripts.html_parts import nav_bar_script, nav_bar_script_footer, \
     page_header, page_footer, body_start, body_end, body_sidebar_setup, body_sidebar_trailer, \
     body_main_header, body_main_data_title, body_main_trailer, thank_you_note, credits_block, \
-    individual_contributor, blog_icon, twitter_icon, github_icon, blank_icon, tabs_code, \
-    tabs_code_with_lava, body_sidebar_dynamic_data_placeholder
+    individual_contributor, blog_icon, twitter_icon, github_icon, blank_icon, tabs_nav, tabs_nav_lava_item, \
+    tabs_nav_timings_item, tabs_contents, tabs_pane_lava, tabs_pane_timings, tabs_end, artifact_timings_script, \
+    body_sidebar_dynamic_data_placeholder
 from scripts.ilapfuncs import logfunc
 from scripts.version_info import leapp_version, ileapp_contributors
 
@@ -219,13 +220,23 @@ def create_index_html(reportfolderbase, time_in_secs, time_hms, extraction_type,
     processed_files_path = os.path.join(reportfolderbase, '_HTML', '_Script_Logs', 'ProcessedFilesLog.html')
     tab4_content = get_file_content(processed_files_path)
 
+    tabs_nav_code = tabs_nav
+    tabs_panes_code = tabs_contents.format(tab1_content, tab2_content, tab3_content, tab4_content)
+
     # Get processed LAVA list (this will be tab5)
     if lava_only:
         lava_path = os.path.join(reportfolderbase, '_HTML', '_Script_Logs', 'Lava_only_artifacts_log.html')
-        tab5_content = get_file_content(lava_path)
-        content += tabs_code_with_lava.format(tab1_content, tab2_content, tab3_content, tab4_content, tab5_content)
-    else:
-        content += tabs_code.format(tab1_content, tab2_content, tab3_content, tab4_content)
+        tabs_nav_code += tabs_nav_lava_item
+        tabs_panes_code += tabs_pane_lava.format(get_file_content(lava_path))
+
+    # Get the artifact timings (last tab)
+    timings_path = os.path.join(reportfolderbase, '_HTML', '_Script_Logs', 'Artifact_Timings.html')
+    has_timings = os.path.exists(timings_path)
+    if has_timings:
+        tabs_nav_code += tabs_nav_timings_item
+        tabs_panes_code += tabs_pane_timings.format(get_file_content(timings_path))
+
+    content += tabs_nav_code + tabs_panes_code + tabs_end
 
     content += '</div>'  # CARD end
 
@@ -250,7 +261,10 @@ def create_index_html(reportfolderbase, time_in_secs, time_hms, extraction_type,
         f.write(content)
         f.write(thank_you_note)
         f.write(credits_code)
-        f.write(body_main_trailer + body_end + nav_bar_script_footer + page_footer)
+        f.write(body_main_trailer + body_end + nav_bar_script_footer)
+        if has_timings:
+            f.write(artifact_timings_script)
+        f.write(page_footer)
 
     # Create Index Redirection Page
     redirection = \
@@ -5,7 +5,9 @@ It handles file pattern matching, copying files to a data folder, extracting
 metadata (creation/modification dates), and decrypting encrypted iTunes backups.
 
 Classes:
+    PathIndex: Path index that narrows each glob search to a small candidate set
     FileInfo: Container for file metadata (source path, creation date, modification date)
+    FileListing: Compact listing of a directory tree, with the entry types found while listing it
     FileSeekerBase: Abstract base class for file searching implementations
     FileSeekerDir: File seeker for local directories
     FileSeekerItunes: File seeker for iTunes backups (supports encryption)
@@ -14,21 +16,32 @@ Classes:
     FileSeekerFile: File seeker for individual files
 
 Functions:
+    split_glob: Splits a glob pattern into its literal runs and wildcards
     get_itunes_backup_type: Determines iTunes backup type (db/mbdb)
     get_itunes_backup_encryption: Checks if iTunes backup is encrypted
     check_itunes_backup_status: Validates iTunes backup status and encryption
     decrypt_itunes_backup: Decrypts encrypted iTunes backups using provided passcode
+    decrypt_itunes_backup_with_passwords: Decrypts encrypted iTunes backups with the first working
+        password of a list
+    load_cached_itunes_backup_keys: Decrypts encrypted iTunes backups with a key cached by an earlier run
 """
 
 import time as timex
-import fnmatch
 import os
 import tarfile
 import hashlib
+import multiprocessing
 import struct
-
+import sys
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
+from itertools import chain, repeat
 from pathlib import Path
-from shutil import copy2
+from shutil import copy2, copyfileobj, copystat
 from zipfile import ZipFile
 from fnmatch import _compile_pattern
 from functools import lru_cache
@@ -38,11 +51,21 @@ import cryptography.hazmat.primitives.keywrap as crypt
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 
-from scripts.ilapfuncs import get_plist_file_content, get_plist_content, logfunc, \
+from leapp_functions.app.history import get_shared_directory
+from scripts.artifact_cache import load_local_key
+from scripts.ilapfuncs import OutputParameters, get_plist_file_content, get_plist_content, logfunc, \
     is_platform_windows, open_sqlite_db_readonly, sanitize_file_path
 from scripts.filetype import guess_mime
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 normcase = lru_cache(maxsize=None)(os.path.normcase)
+# The file of the key wrapping the backup keys of the key cache, itunes_key_cache.key in the
+# LEAPP settings folder when None. It must not be in the cache directory.
+backup_key_wrapping_key_path = None
 domains = {
     "AppDomain-": "private/var/mobile/Containers/Data/Application",
     "AppDomainGroup-": "private/var/mobile/Containers/Shared/AppGroup",
@@ -141,39 +164,23 @@ def check_itunes_backup_status(directory, backup_type):
     return False, "Missing Manifest.db, Manifest.mbdb or Manifest.plist"
 
 
-def decrypt_itunes_backup(directory, passcode):
+def _parse_backup_keybag(directory):
     """
-    Decrypt an iTunes backup using the provided passcode.
-    This function parses the backup's Manifest.plist file to extract the encryption
-    keybag and manifest key, then uses the provided passcode to decrypt the protection
-    class keys and ultimately the Manifest.db encryption key.
+    Parse the keybag of an encrypted iTunes backup from its Manifest.plist.
     Args:
         directory (str): Path to the iTunes backup directory containing Manifest.plist
-        passcode (str): The backup password/passcode used to encrypt the backup
     Returns:
-        tuple: A tuple containing:
-            - If successful: ((dict, bytes), str) where dict contains protection classes
-              with unwrapped keys, bytes is the unwrapped manifest key, and str is success message
-            - If failed: (None, str) where str contains the error message
-        Possible return messages:
-            - "Decryption successful": Backup was successfully decrypted
-            - "No password provided": Passcode was None or invalid type
-            - "Incorrect password": Passcode was incorrect, could not unwrap protection class keys
-            - "Could not find protection class for Manifest.db": Missing required protection class
-    Notes:
-        - The function uses PBKDF2 key derivation with the passcode and keybag salt/iterations
-        - Protection class keys are unwrapped using AES key unwrapping
-        - The manifest key class identifies which protection class is used for Manifest.db
-        - Logs decryption status and errors using logfunc()
+        dict: The raw keybag ('BackupKeyBag'), its protection classes by class number
+              ('ProtectionClasses', each with its wrapped key 'WPKY'), the salts and
+              iteration counts of the key derivation ('SALT', 'ITER', 'DPSL', 'DPIC'), and
+              the protection class and wrapped key of Manifest.db ('ManifestKeyClass',
+              'ManifestWrappedKey').
     """
     protection_classes = {}
-    manifest_key_class = None
     manifest_path = os.path.join(directory, "Manifest.plist")
     manifest = get_plist_file_content(manifest_path)
 
     manifest_key = manifest.get("ManifestKey")
-    manifest_key_class = int.from_bytes(manifest_key[0:4], byteorder="little")
-    manifest_wrapped_key = manifest_key[4:]
     backup_keybag = manifest.get("BackupKeyBag")
 
     # Initialize some values
@@ -231,15 +238,44 @@ def decrypt_itunes_backup(directory, passcode):
     # Clean up the open protection class
     protection_classes[tmp_protection_class['CLAS']] = tmp_protection_class
 
-    # Decrypt the Manifest password
+    return {
+        'BackupKeyBag': backup_keybag,
+        'ProtectionClasses': protection_classes,
+        'SALT': tmp_salt,
+        'ITER': tmp_iter,
+        'DPSL': tmp_double_protection_salt,
+        'DPIC': tmp_double_protection_iter,
+        'ManifestKeyClass': int.from_bytes(manifest_key[0:4], byteorder="little"),
+        'ManifestWrappedKey': manifest_key[4:],
+    }
+
+
+def _derive_backup_key(passcode, keybag):
+    """Runs the double PBKDF2 derivation of the key unwrapping the protection class keys"""
+    initial_unwrapped_key = hashlib.pbkdf2_hmac(
+        'sha256', str.encode(passcode), keybag['DPSL'], keybag['DPIC'])
+    return hashlib.pbkdf2_hmac('sha1', initial_unwrapped_key, keybag['SALT'], keybag['ITER'], dklen=32)
+
+
+def _try_backup_password(passcode, keybag):
+    """Returns the derived key of a candidate password if it unwraps a protection class key, else None"""
+    unwrapped_key = _derive_backup_key(passcode, keybag)
+    protection_class = keybag['ProtectionClasses'].get(keybag['ManifestKeyClass'])
+    if protection_class is None:
+        protection_class = next(iter(keybag['ProtectionClasses'].values()))
     try:
-        initial_unwrapped_key = hashlib.pbkdf2_hmac(
-            'sha256', str.encode(passcode), tmp_double_protection_salt,
-            tmp_double_protection_iter)
-        unwrapped_key = hashlib.pbkdf2_hmac('sha1', initial_unwrapped_key,
-                                            tmp_salt, tmp_iter, dklen=32)
-    except TypeError:
-        return None, "No password provided"
+        crypt.aes_key_unwrap(unwrapped_key, protection_class['WPKY'])
+    except crypt.InvalidUnwrap:
+        return None
+    return unwrapped_key
+
+
+def _unwrap_backup_keys(keybag, unwrapped_key):
+    """
+    Unwrap the protection class keys and the Manifest.db key with the derived key.
+    Returns the same tuple as decrypt_itunes_backup.
+    """
+    protection_classes = keybag['ProtectionClasses']
     # Unwrap all of the protection class keys
     for _, protection_class_value in protection_classes.items():
         protection_class = protection_class_value
@@ -251,17 +287,413 @@ def decrypt_itunes_backup(directory, passcode):
             return None, "Incorrect password"
 
     # Find the right one for the Manifest.db
+    manifest_key_class = keybag['ManifestKeyClass']
     if manifest_key_class not in protection_classes:
         logfunc("Did not find the right protection class to decrypt Manifest.db. Exiting.")
         return None, "Could not find protection class for Manifest.db"
 
     manifest_protection_class = protection_classes[manifest_key_class]
-    unwrapped_manifest_key = crypt.aes_key_unwrap(manifest_protection_class["Unwrapped"], manifest_wrapped_key)
-
-    logfunc(f"Manifest.db was successfully decrypted with passcode {passcode}")
+    unwrapped_manifest_key = crypt.aes_key_unwrap(manifest_protection_class["Unwrapped"],
+                                                  keybag['ManifestWrappedKey'])
     return (protection_classes, unwrapped_manifest_key), "Decryption successful"
 
 
+def _key_cache_path(key_cache_dir, keybag):
+    """Returns the cache file of a backup's keybag"""
+    keybag_hash = hashlib.sha256(keybag['BackupKeyBag']).hexdigest()
+    return os.path.join(key_cache_dir, 'itunes_keys', f'{keybag_hash}.key')
+
+
+def _key_cache_wrapping_key():
+    """Returns the key wrapping the cached backup keys, kept outside the cache directory"""
+    return load_local_key(backup_key_wrapping_key_path or
+                          os.path.join(get_shared_directory(), 'itunes_key_cache.key'))
+
+
+def _store_cached_backup_key(key_cache_dir, keybag, unwrapped_key):
+    """
+    Stores the derived key of a backup in the key cache, wrapped (RFC 3394) with the key
+    of the LEAPP settings folder: the cache folder alone does not decrypt the backup.
+    """
+    entry_path = _key_cache_path(key_cache_dir, keybag)
+    try:
+        wrapped_key = crypt.aes_key_wrap(_key_cache_wrapping_key(), unwrapped_key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # Only readable by the examiner running iLEAPP, where the file system has such permissions
+        with os.fdopen(os.open(entry_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as entry_file:
+            entry_file.write(wrapped_key)
+    except (OSError, ValueError) as ex:
+        logfunc(f'Could not store the backup key in the key cache: {ex}')
+
+
+def load_cached_itunes_backup_keys(directory, key_cache_dir):
+    """
+    Decrypt an iTunes backup with the key stored in the key cache by an earlier run,
+    without the password and its multi-second key derivation.
+    Args:
+        directory (str): Path to the iTunes backup directory containing Manifest.plist
+        key_cache_dir (str): The cache directory (--cache-dir) when --cache-backup-keys is
+                             given, or None
+    Returns:
+        tuple: The decryption keys returned by decrypt_itunes_backup, or None if the
+               backup is not in the cache, or its entry does not unwrap with the key of
+               the LEAPP settings folder.
+    """
+    if not key_cache_dir:
+        return None
+    keybag = _parse_backup_keybag(directory)
+    try:
+        with open(_key_cache_path(key_cache_dir, keybag), 'rb') as entry_file:
+            unwrapped_key = crypt.aes_key_unwrap(_key_cache_wrapping_key(), entry_file.read())
+        decryption_keys, _ = _unwrap_backup_keys(keybag, unwrapped_key)
+    except (OSError, ValueError, crypt.InvalidUnwrap):
+        return None
+    if decryption_keys:
+        logfunc("Manifest.db was successfully decrypted with the key from the key cache")
+    return decryption_keys
+
+
+def decrypt_itunes_backup(directory, passcode, key_cache_dir=None):
+    """
+    Decrypt an iTunes backup using the provided passcode.
+    This function parses the backup's Manifest.plist file to extract the encryption
+    keybag and manifest key, then uses the provided passcode to decrypt the protection
+    class keys and ultimately the Manifest.db encryption key.
+    Args:
+        directory (str): Path to the iTunes backup directory containing Manifest.plist
+        passcode (str): The backup password/passcode used to encrypt the backup
+        key_cache_dir (str): The cache directory (--cache-dir) where the derived key is
+                             stored on success, or None
+    Returns:
+        tuple: A tuple containing:
+            - If successful: ((dict, bytes), str) where dict contains protection classes
+              with unwrapped keys, bytes is the unwrapped manifest key, and str is success message
+            - If failed: (None, str) where str contains the error message
+        Possible return messages:
+            - "Decryption successful": Backup was successfully decrypted
+            - "No password provided": Passcode was None or invalid type
+            - "Incorrect password": Passcode was incorrect, could not unwrap protection class keys
+            - "Could not find protection class for Manifest.db": Missing required protection class
+    Notes:
+        - The function uses PBKDF2 key derivation with the passcode and keybag salt/iterations
+        - Protection class keys are unwrapped using AES key unwrapping
+        - The manifest key class identifies which protection class is used for Manifest.db
+        - Logs decryption status and errors using logfunc()
+    """
+    keybag = _parse_backup_keybag(directory)
+
+    # Decrypt the Manifest password
+    try:
+        unwrapped_key = _derive_backup_key(passcode, keybag)
+    except TypeError:
+        return None, "No password provided"
+    decryption_keys, message = _unwrap_backup_keys(keybag, unwrapped_key)
+    if decryption_keys:
+        logfunc(f"Manifest.db was successfully decrypted with passcode {passcode}")
+        if key_cache_dir:
+            _store_cached_backup_key(key_cache_dir, keybag, unwrapped_key)
+    return decryption_keys, message
+
+
+def decrypt_itunes_backup_with_passwords(directory, passcodes, key_cache_dir=None, processes=None):
+    """
+    Decrypt an iTunes backup with the first of a list of candidate passwords that works.
+    The candidates are tried from a pool of processes, each running the key derivation
+    of one candidate, and the pool stops at the first one unwrapping a protection class key.
+    Where workers cannot be forked, they are tried one after the other.
+    Args:
+        directory (str): Path to the iTunes backup directory containing Manifest.plist
+        passcodes (list): The candidate passwords
+        key_cache_dir (str): The cache directory (--cache-dir) where the derived key is
+                             stored on success, or None
+        processes (int): Number of processes, by default the number of CPUs
+    Returns:
+        tuple: The same tuple as decrypt_itunes_backup; "Incorrect password" when no
+               candidate works.
+    """
+    keybag = _parse_backup_keybag(directory)
+    passcodes = list(dict.fromkeys(passcodes))
+    if not passcodes:
+        return None, "No password provided"
+    logfunc(f'Trying {len(passcodes)} candidate passwords for the iTunes backup...')
+    found = None
+    processes = min(processes or os.cpu_count() or 1, len(passcodes))
+    # The candidates are tried one after the other where workers cannot be forked
+    if processes > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        with multiprocessing.get_context('fork').Pool(processes) as pool:
+            candidates = pool.imap_unordered(_try_backup_password_star, ((passcode, keybag) for passcode in passcodes))
+            found = next((candidate for candidate in candidates if candidate[1] is not None), None)
+            pool.terminate()
+    else:
+        found = next(((passcode, unwrapped_key) for passcode in passcodes
+                      if (unwrapped_key := _try_backup_password(passcode, keybag)) is not None), None)
+    if found is None:
+        logfunc("None of the candidate passwords unwraps the protection class keys.")
+        return None, "Incorrect password"
+    passcode, unwrapped_key = found
+    decryption_keys, message = _unwrap_backup_keys(keybag, unwrapped_key)
+    if decryption_keys:
+        logfunc(f"Manifest.db was successfully decrypted with passcode {passcode}")
+        if key_cache_dir:
+            _store_cached_backup_key(key_cache_dir, keybag, unwrapped_key)
+    return decryption_keys, message
+
+
+def _try_backup_password_star(arguments):
+    """Pool worker: returns the candidate password with its derived key, or None for the key"""
+    passcode, keybag = arguments
+    return passcode, _try_backup_password(passcode, keybag)
+
+
+_SEP = normcase('/')
+_MAX_SET_SIZE = 32
+_MAX_SUFFIX_EXPANSIONS = 64
+
+
+def _expand_glob_set(stuff):
+    """
+    Returns the characters an fnmatch bracket set matches, or None when the set is
+    negated or not simple enough to expand safely.
+    Args:
+        stuff (str): The text between '[' and ']'.
+    Returns:
+        list or None: The characters the set matches.
+    """
+    if stuff.startswith('!') or '\\' in stuff:
+        return None
+    chars = set()
+    i, n = 0, len(stuff)
+    while i < n:
+        # fnmatch only reads a '-' as a range from the second character on
+        if i + 2 < n and stuff[i + 1] == '-':
+            low, high = ord(stuff[i]), ord(stuff[i + 2])
+            if high < low or high - low > _MAX_SET_SIZE:
+                return None
+            chars.update(chr(code) for code in range(low, high + 1))
+            i += 3
+        else:
+            chars.add(stuff[i])
+            i += 1
+    return sorted(chars) if len(chars) <= _MAX_SET_SIZE else None
+
+
+def _glob_tokens(pattern):
+    """
+    Tokenizes an fnmatch pattern with the same bracket rules fnmatch.translate uses:
+    a ']' right after '[' or '[!' is part of the set, and an unclosed '[' is literal.
+    Args:
+        pattern (str): The (already normcased) glob pattern.
+    Returns:
+        list: (kind, value) tuples, kind being 'char', 'any' ('*'), 'one' ('?') or
+            'set' with the expanded characters (or None) as value.
+    """
+    tokens = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == '*':
+            tokens.append(('any', None))
+        elif c == '?':
+            tokens.append(('one', None))
+        elif c == '[':
+            j = i
+            if j < n and pattern[j] == '!':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                tokens.append(('char', c))
+            else:
+                tokens.append(('set', _expand_glob_set(pattern[i:j])))
+                i = j + 1
+        else:
+            tokens.append(('char', c))
+    return tokens
+
+
+def split_glob(pattern):
+    """
+    Splits an fnmatch pattern into its literal runs and wildcards.
+    Characters inside a set such as '[ab]' never count as literal text.
+    Args:
+        pattern (str): The (already normcased) glob pattern.
+    Returns:
+        list: Literal runs as str, each run of wildcards ('*', '?' or a set) as None.
+    """
+    segments = []
+    literal = []
+    for kind, value in _glob_tokens(pattern):
+        if kind == 'char':
+            literal.append(value)
+            continue
+        if literal:
+            segments.append(''.join(literal))
+            literal = []
+        if not segments or segments[-1] is not None:
+            segments.append(None)
+    if literal:
+        segments.append(''.join(literal))
+    return segments
+
+
+def _glob_suffixes(tokens):
+    """
+    Returns the literal endings one of which every path matching the pattern ends with.
+    Trailing sets are expanded, so '*.[jJ][pP][gG]' gives the eight spellings of '.jpg'.
+    Args:
+        tokens (list): The pattern tokens from _glob_tokens().
+    Returns:
+        list or None: The possible endings, or None when the pattern ends in a wildcard.
+    """
+    suffixes = ['']
+    for kind, value in reversed(tokens):
+        if kind == 'char':
+            choices = (value,)
+        elif kind == 'set' and value:
+            choices = value
+        else:
+            break
+        if len(suffixes) * len(choices) > _MAX_SUFFIX_EXPANSIONS:
+            break
+        suffixes = [choice + suffix for choice in choices for suffix in suffixes]
+    return suffixes if suffixes != [''] else None
+
+
+class PathIndex:
+    """
+    A path index built once per seeker so each glob only tests a small candidate set.
+    Every search used to run the compiled fnmatch pattern against every path of the
+    extraction, once per pattern, which on a 2M entry file system meant hundreds of
+    millions of regex calls before the first parser ran. The index buckets the paths by
+    basename extension, by the last two characters of the path, by the first three
+    characters of the basename and by parent directory, and keeps a sorted view for literal path prefixes. A pattern picks the smallest
+    candidate set its literal parts allow, and every candidate is still confirmed with
+    the fnmatch regex, so results are exactly what the linear scan returns, in listing
+    order.
+    Attributes:
+        items (list): The indexed items (paths, TarInfo members...), in listing order.
+    Methods:
+        search(pattern): Returns the items whose key matches the normcased pattern.
+    """
+
+    _TAIL_LENGTH = 2
+    _HEAD_LENGTH = 3
+
+    def __init__(self, items, key=None):
+        self.items = items
+        self._key = key or (lambda item: item)
+        self._by_extension = {}
+        self._by_tail = {}
+        self._by_head = {}
+        self._by_directory = {}
+        self._directory_scans = {}
+        self._sorted = None
+        for index, item in enumerate(items):
+            path = self._key(item)
+            cut = path.rfind(_SEP) + 1
+            dot = path.rfind('.', cut)
+            if dot != -1:
+                self._by_extension.setdefault(path[dot + 1:], []).append(index)
+            self._by_tail.setdefault(path[-self._TAIL_LENGTH:], []).append(index)
+            self._by_head.setdefault(path[cut:cut + self._HEAD_LENGTH], []).append(index)
+            self._by_directory.setdefault(path[:cut], []).append(index)
+
+    def _suffix_candidates(self, suffixes):
+        '''Returns the indexes of the items ending with one of suffixes, or None if too short'''
+        buckets = []
+        for suffix in suffixes:
+            options = []
+            basename = suffix[suffix.rfind(_SEP) + 1:]
+            if '.' in basename:
+                # Matching paths end with suffix, so their extension is the suffix's
+                options.append(self._by_extension.get(basename.rsplit('.', 1)[1], []))
+            if len(suffix) >= self._TAIL_LENGTH:
+                options.append(self._by_tail.get(suffix[-self._TAIL_LENGTH:], []))
+            if not options:
+                return None
+            buckets.append(min(options, key=len))
+        if len(buckets) == 1:
+            return buckets[0]
+        return sorted(set(chain.from_iterable(buckets)))
+
+    def _scan_directories(self, needle):
+        '''Returns the index lists of the directories whose path contains needle'''
+        buckets = self._directory_scans.get(needle)
+        if buckets is None:
+            buckets = [indexes for directory, indexes in self._by_directory.items() if needle in directory]
+            self._directory_scans[needle] = buckets
+        return buckets
+
+    def _component_candidates(self, segments):
+        '''Returns the indexes of the items whose path components can hold a match, or None'''
+        best_count, best_buckets = None, None
+        for segment in segments:
+            if segment is None or _SEP not in segment:
+                continue
+            cut = segment.rfind(_SEP) + 1
+            options = []
+            # The run appears in any matching path, so everything up to its last separator
+            # appears in the parent directory of the item
+            if cut > len(_SEP):
+                options.append(self._scan_directories(segment[:cut]))
+            # What follows the last separator starts a path component: either the basename,
+            # or a component of the parent directory
+            tail = segment[cut:]
+            if len(tail) >= self._HEAD_LENGTH:
+                options.append(self._scan_directories(_SEP + tail) +
+                               [self._by_head.get(tail[:self._HEAD_LENGTH], [])])
+            for buckets in options:
+                count = sum(map(len, buckets))
+                if best_count is None or count < best_count:
+                    best_count, best_buckets = count, buckets
+        if best_buckets is None:
+            return None
+        return sorted(set(chain.from_iterable(best_buckets)))
+
+    def _prefix_candidates(self, prefix):
+        '''Returns the indexes of the items whose key starts with prefix, in listing order'''
+        def key(index):
+            return self._key(self.items[index])
+        if self._sorted is None:
+            self._sorted = sorted(range(len(self.items)), key=key)
+        start = bisect_left(self._sorted, prefix, key=key)
+        end = bisect_right(self._sorted, prefix + '\U0010ffff', key=key)
+        return sorted(self._sorted[start:end])
+
+    def _candidates(self, pattern):
+        '''Returns the smallest candidate index list the literal parts of a pattern allow'''
+        tokens = _glob_tokens(pattern)
+        segments = split_glob(pattern)
+        suffixes = _glob_suffixes(tokens)
+        candidates = self._suffix_candidates(suffixes) if suffixes else None
+        if candidates is None or len(candidates) > len(self._by_directory):
+            # Scanning the directories is only worth it when the suffix left more items than that
+            in_directories = self._component_candidates(segments)
+            if in_directories is not None and (candidates is None or len(in_directories) < len(candidates)):
+                candidates = in_directories
+        if candidates is None and segments and segments[0] is not None:
+            # Sorting is only paid for when nothing else narrowed the search
+            candidates = self._prefix_candidates(segments[0])
+        return candidates
+
+    def search(self, pattern):
+        '''Returns the items matching pattern (already normcased), in listing order'''
+        pat = _compile_pattern(pattern)
+        key = self._key
+        candidates = self._candidates(pattern)
+        if candidates is None:
+            # Nothing to narrow on, fall back to a scan pre-filtered on the longest literal
+            literals = [segment for segment in split_glob(pattern) if segment is not None]
+            longest = max(literals, key=len) if literals else ''
+            return [item for item in self.items
+                    if longest in (path := key(item)) and pat(path) is not None]
+        items = self.items
+        return [items[index] for index in candidates if pat(key(items[index])) is not None]
+
+
 class FileInfo:
     """
     A class to store file metadata information.
@@ -277,6 +709,125 @@ class FileInfo:
         self.modification_date = modification_date
 
 
+class FileListing(Sequence):
+    """
+    The paths of a directory tree, in listing order, stored compactly: every directory
+    prefix is kept once and every entry as an index to its directory and its basename
+    (basenames repeated across the tree, like Info.plist, are interned). A path is only
+    built when it is read. The type of each entry comes from the directory listing, and
+    on Windows, where listing a directory returns them for free, the creation and
+    modification dates too, so that searches do not have to ask the disk again.
+    Attributes:
+        directories (list): The directory prefixes, ending with a separator.
+    Methods:
+        add_directory(prefix): Adds a directory prefix, returns its id.
+        extend(directory_id, names, kinds, times): Adds entries of a directory.
+        kind(index): Returns the type of an entry, FILE, DIRECTORY, LINK or OTHER.
+        times(index): Returns the (creation, modification) dates of an entry, or None.
+    """
+
+    FILE = 1
+    DIRECTORY = 2
+    # Symbolic links, whose target type is only known by following them
+    LINK = 3
+    OTHER = 4
+
+    def __init__(self):
+        self.directories = []
+        self._directory_ids = array('I')
+        self._names = []
+        self._kinds = bytearray()
+        self._times = {}
+
+    def add_directory(self, prefix):
+        '''Adds a directory prefix, returns its id'''
+        self.directories.append(prefix)
+        return len(self.directories) - 1
+
+    def extend(self, directory_id, names, kinds, times=None):
+        '''
+        Adds entries of a directory.
+        Args:
+            directory_id (int): The id of their directory prefix.
+            names (list): Their basenames, interned.
+            kinds (bytes): Their types.
+            times (list): Their (creation, modification) dates, None for those not known.
+        '''
+        if times:
+            start = len(self._names)
+            self._times.update((start + position, value) for position, value in enumerate(times)
+                               if value is not None)
+        self._directory_ids.extend(repeat(directory_id, len(names)))
+        self._names.extend(names)
+        self._kinds.extend(kinds)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, index):
+        return self.directories[self._directory_ids[index]] + self._names[index]
+
+    def __iter__(self):
+        directories = self.directories
+        for directory_id, name in zip(self._directory_ids, self._names):
+            yield directories[directory_id] + name
+
+    def kind(self, index):
+        '''Returns the type of an entry, FILE, DIRECTORY, LINK or OTHER'''
+        return self._kinds[index]
+
+    def times(self, index):
+        '''Returns the (creation, modification) dates of an entry, None if they were not listed'''
+        return self._times.get(index)
+
+
+class _DirectoryScan:
+    '''The entries of one directory, as listed by os.scandir'''
+
+    __slots__ = ('path', 'names', 'kinds', 'times', 'subdirectories', 'error')
+
+    def __init__(self, path, with_times):
+        self.path = path
+        self.names = []
+        self.kinds = bytearray()
+        # (creation, modification) dates by position in names, only filled in with_times
+        self.times = []
+        # Positions of the subdirectories in names
+        self.subdirectories = []
+        self.error = None
+        intern = sys.intern
+        try:
+            with os.scandir(path) as listing:
+                for entry in listing:
+                    times = None
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            kind = FileListing.FILE
+                            if with_times:
+                                stat = entry.stat(follow_symlinks=False)
+                                times = (stat.st_ctime, stat.st_mtime)
+                        elif entry.is_dir(follow_symlinks=False):
+                            kind = FileListing.DIRECTORY
+                            self.subdirectories.append(len(self.names))
+                        elif entry.is_symlink():
+                            kind = FileListing.LINK
+                        else:
+                            kind = FileListing.OTHER
+                    except OSError:
+                        kind = FileListing.LINK
+                    self.names.append(intern(entry.name))
+                    self.kinds.append(kind)
+                    if with_times:
+                        self.times.append(times)
+        except OSError as ex:
+            self.error = ex
+
+    def subdirectory_paths(self):
+        '''Returns the paths of the subdirectories, as they are passed to os.scandir'''
+        prefix = os.path.join(self.path, '')
+        return [prefix + self.names[position] for position in self.subdirectories]
+
+
 class FileSeekerBase:
     """
     Abstract base class for file seeking operations.
@@ -287,9 +838,53 @@ class FileSeekerBase:
         '''Returns a list of paths for files/folders that matched'''
         raise NotImplementedError
 
+    def prefetch(self, filepatterns):
+        '''Extract in one pass the files matching all the patterns, ahead of the searches'''
+
     def cleanup(self):
         '''close any open handles'''
 
+    def reopen(self):
+        '''Reopen any handles in a forked worker, so it does not share file offsets with other processes'''
+
+    def materialize(self, path):
+        '''Returns path, a file returned by search, as a file of its own that a parser can write to'''
+        return path
+
+
+# ioctl request cloning a whole file on Linux (Btrfs, XFS, bcachefs...)
+_FICLONE = 0x40049409
+_SQLITE_HEADER = b'SQLite format 3\x00'
+_SQLITE_SIDE_FILES = ('-wal', '-shm', '-journal')
+
+
+def _is_sqlite_file(path):
+    '''True for a SQLite database or one of its -wal, -shm and -journal files'''
+    if path.endswith(_SQLITE_SIDE_FILES):
+        return True
+    try:
+        with open(path, 'rb') as file:
+            return file.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def _clone_file(source, destination):
+    '''Makes destination a copy-on-write clone of source, returns False where the file system cannot'''
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+    try:
+        with open(source, 'rb') as source_file, open(destination, 'wb') as destination_file:
+            fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+    except OSError:
+        try:
+            os.remove(destination)
+        except OSError:
+            pass
+        return False
+    copystat(source, destination)
+    return True
+
 
 class FileSeekerDir(FileSeekerBase):
     """
@@ -299,78 +894,260 @@ class FileSeekerDir(FileSeekerBase):
     Attributes:
         directory (str): The root directory to search within.
         data_folder (str): The destination folder where matched files will be copied.
-        _all_files (list): Internal list containing all file paths found in the directory tree.
+        _all_files (FileListing): Internal listing of all file paths found in the directory tree.
         searched (dict): Cache of search results, mapping file patterns to lists of matched paths.
         copied (dict): Mapping of source file paths to their copied destination paths.
         file_infos (dict): Dictionary storing FileInfo objects with metadata for copied files.
+        walk_threads (int): Number of directories listed at the same time, 1 for a walk on
+            a single thread.
+        link_files (bool): Whether matched files are hard linked or cloned into data_folder
+            instead of being copied.
+        linked (set): The paths in data_folder hard linked to a file of the extraction.
     Methods:
-        build_files_list(directory): Recursively scans directory and populates _all_files list.
+        build_files_list(directory): Scans directory and populates the _all_files listing.
         search(filepattern, return_on_first_hit=False, force=False): Searches for files matching
             the given pattern, copies them to data_folder, and returns matching paths.
+        materialize(path): Replaces a hard linked file of data_folder with a copy of its own.
+
+    With link_files, a matched file is hard linked into data_folder when the extraction
+    and the output are on the same file system, else cloned where the file system
+    supports copy-on-write clones, else copied. SQLite databases and their -wal, -shm
+    and -journal files are never hard linked: SQLite writes to them, even through a
+    read-only connection (the -shm index, the checkpoint of a read-write connection), and
+    a hard link would carry those writes back into the extraction. They are cloned or
+    copied. The paths in data_folder, and so the paths in the report, are the same in
+    both modes.
     """
 
-    def __init__(self, directory, data_folder):
+    def __init__(self, directory, data_folder, link_files=False, walk_threads=1):
         FileSeekerBase.__init__(self)
         self.directory = directory
-        self._all_files = []
+        # On a local disk the directories come from the OS cache and a single thread is
+        # fastest. On a network share or a slow disk, listing a directory mostly waits with
+        # the GIL released, and more threads than processors keep more requests in flight
+        self.walk_threads = walk_threads
+        self._all_files = FileListing()
         self.data_folder = data_folder
+        self.link_files = link_files
+        self.linked = set()
+        # Cleared on the first failure, the output being on another file system for instance
+        self._can_link = link_files
+        self._can_clone = link_files
         logfunc('Building files listing...')
         self.build_files_list(directory)
         logfunc(f'File listing complete - {len(self._all_files)} files')
+        root = normcase("root/")
+        listing = self._all_files
+        # The index holds positions in the listing; the paths are built when they are tested
+        # and not kept (the cached normcase would keep every one of them)
+        self._index = PathIndex(range(len(listing)),
+                                key=lambda index: root + os.path.normcase(listing[index]))
         self.searched = {}
         self.copied = {}
         self.file_infos = {}
 
     def build_files_list(self, directory):
-        '''Populates all paths in directory into _all_files'''
-        try:
-            files_list = os.scandir(directory)
-            for item in files_list:
-                self._all_files.append(item.path)
-                if item.is_dir(follow_symlinks=False):
-                    self.build_files_list(item.path)
-        except OSError as ex:
-            logfunc(f'Error reading {directory} ' + str(ex))
+        '''
+        Populates all paths in directory into _all_files.
+        The directories are listed by a pool of threads, each subdirectory being queued as
+        soon as its parent is listed, then the entries are added in the order of a
+        recursive walk: each directory's entries in scandir order, the content of a
+        subdirectory right after it.
+        '''
+        # Windows returns the dates with the listing, elsewhere they would cost a call per file
+        with_times = is_platform_windows()
+        listed = {}
+
+        def add(scan):
+            if scan.error is not None:
+                logfunc(f'Error reading {scan.path} ' + str(scan.error))
+            listed[scan.path] = scan
+            return scan.subdirectory_paths()
+
+        if self.walk_threads <= 1:
+            to_scan = [directory]
+            while to_scan:
+                to_scan.extend(add(_DirectoryScan(to_scan.pop(), with_times)))
+        else:
+            results = SimpleQueue()
+
+            def scan_in_thread(path):
+                try:
+                    results.put(_DirectoryScan(path, with_times))
+                except BaseException:
+                    # Every queued directory has to come back, or the walk would wait forever
+                    results.put(None)
+                    raise
+
+            with ThreadPoolExecutor(max_workers=self.walk_threads) as pool:
+                pool.submit(scan_in_thread, directory)
+                pending = 1
+                while pending:
+                    scan = results.get()
+                    pending -= 1
+                    if scan is not None:
+                        for path in add(scan):
+                            pool.submit(scan_in_thread, path)
+                            pending += 1
+
+        # Put the entries back in the order of a recursive walk: a directory's entries up
+        # to its next subdirectory, then the content of that subdirectory
+        listing = self._all_files
+        stack = []
+
+        def enter(path):
+            scan = listed.pop(path, None)
+            if scan is not None:
+                stack.append((scan, listing.add_directory(os.path.join(path, '')), 0, 0))
+
+        enter(directory)
+        while stack:
+            scan, directory_id, next_subdirectory, position = stack.pop()
+            if next_subdirectory < len(scan.subdirectories):
+                end = scan.subdirectories[next_subdirectory] + 1
+                listing.extend(directory_id, scan.names[position:end], scan.kinds[position:end],
+                               scan.times[position:end] if scan.times else None)
+                stack.append((scan, directory_id, next_subdirectory + 1, end))
+                enter(os.path.join(scan.path, '') + scan.names[end - 1])
+            else:
+                listing.extend(directory_id, scan.names[position:], scan.kinds[position:],
+                               scan.times[position:] if scan.times else None)
 
     def search(self, filepattern, return_on_first_hit=False, force=False):
         if filepattern in self.searched and not force:
             pathlist = self.searched[filepattern]
             return self.searched[filepattern][0] if return_on_first_hit and pathlist else pathlist
         pathlist = []
-        pat = _compile_pattern(normcase(filepattern))
-        root = normcase("root/")
-        for item in self._all_files:
-            if pat(root + normcase(item)) is not None:
-                item_rel_path = item.replace(self.directory, '')
-                data_path = os.path.join(self.data_folder, item_rel_path[1:])
-                if is_platform_windows():
-                    data_path = data_path.replace('/', '\\')
-                if item not in self.copied or force:
-                    try:
-                        if os.path.isdir(item):
-                            pass
-                        elif os.path.isfile(item):
-                            os.makedirs(os.path.dirname(data_path), exist_ok=True)
-                            copy2(item, data_path)
-                            self.copied[item] = data_path
-                            creation_date = Path(item).stat().st_ctime
-                            modification_date = Path(item).stat().st_mtime
-                            file_info = FileInfo(item, creation_date, modification_date)
-                            self.file_infos[data_path] = file_info
-                        else:
-                            logfunc(f"INFO: Item '{item}' is neither a file nor a directory "
-                                    "(e.g. symlink not followed, or broken). Skipped.")
-                    except OSError as ex:
-                        logfunc(f'Could not copy {item} to {data_path} ' + str(ex))
-                else:
-                    data_path = self.copied[item]
-                pathlist.append(data_path)
-                if return_on_first_hit:
-                    self.searched[filepattern] = pathlist
-                    return data_path
+        listing = self._all_files
+        for index in self._index.search(normcase(filepattern)):
+            item = listing[index]
+            # The type found while listing saves asking the disk, except for links
+            kind = listing.kind(index)
+            if kind == FileListing.LINK:
+                kind = FileListing.DIRECTORY if os.path.isdir(item) else \
+                    FileListing.FILE if os.path.isfile(item) else FileListing.OTHER
+            item_rel_path = item.replace(self.directory, '')
+            data_path = os.path.join(self.data_folder, item_rel_path[1:])
+            if is_platform_windows():
+                data_path = data_path.replace('/', '\\')
+            if item not in self.copied or force:
+                try:
+                    if kind == FileListing.DIRECTORY:
+                        pass
+                    elif kind == FileListing.FILE:
+                        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+                        times = listing.times(index)
+                        if times is None:
+                            # Before the file is placed: a hard link changes its ctime
+                            stat = os.stat(item)
+                            times = (stat.st_ctime, stat.st_mtime)
+                        self._place_file(item, data_path)
+                        self.copied[item] = data_path
+                        file_info = FileInfo(item, *times)
+                        self.file_infos[data_path] = file_info
+                    else:
+                        logfunc(f"INFO: Item '{item}' is neither a file nor a directory "
+                                "(e.g. symlink not followed, or broken). Skipped.")
+                except OSError as ex:
+                    logfunc(f'Could not copy {item} to {data_path} ' + str(ex))
+            else:
+                data_path = self.copied[item]
+            pathlist.append(data_path)
+            if return_on_first_hit:
+                self.searched[filepattern] = pathlist
+                return data_path
         self.searched[filepattern] = pathlist
         return pathlist
 
+    def _place_file(self, item, data_path):
+        '''
+        Puts the file item of the extraction at data_path: a hard link, a clone or a copy.
+        A worker process (--workers) does not see the files the other workers place, and two
+        of them can search the same file: it places the file under a name of its own and
+        renames it to data_path, so that no worker reads a file another one is still writing.
+        '''
+        if OutputParameters.log_buffer is None:
+            linked = self._place_file_at(item, data_path)
+        else:
+            temp_path = f'{data_path}.{os.getpid()}.tmp'
+            try:
+                linked = self._place_file_at(item, temp_path)
+                os.replace(temp_path, data_path)
+                if linked and os.path.lexists(temp_path):
+                    # Renaming a hard link over another link to the same file does nothing
+                    os.remove(temp_path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+        if linked:
+            self.linked.add(data_path)
+        else:
+            self.linked.discard(data_path)
+
+    def _place_file_at(self, item, path):
+        '''Hard links, clones or copies the file item of the extraction to path, returns True for a hard link'''
+        if self.link_files:
+            if os.path.lexists(path):
+                os.remove(path)
+            if self._can_link and not _is_sqlite_file(item):
+                try:
+                    os.link(item, path)
+                    return True
+                except OSError as ex:
+                    self._can_link = False
+                    logfunc(f'Files cannot be hard linked into the data folder ({ex}), they are cloned or copied')
+            if self._can_clone:
+                if _clone_file(item, path):
+                    return False
+                self._can_clone = False
+        copy2(item, path)
+        return False
+
+    def materialize(self, path):
+        '''
+        Returns path, a file returned by search, as a file of its own that a parser can write to.
+        A file hard linked to the extraction is replaced by a copy; other files are already
+        copies, or clones that the file system copies on the first write.
+        '''
+        if path in self.linked:
+            temp_path = f'{path}.materialize'
+            copy2(path, temp_path)
+            os.replace(temp_path, path)
+            self.linked.discard(path)
+        return path
+
+
+# Apple encrypts the files of a backup with AES-CBC and a zeroed IV
+_ITUNES_IV = bytes(16)
+
+
+def _decrypt_file(source, destination, key, chunk_size, size=None):
+    """
+    Decrypt a file of an encrypted iTunes backup, a chunk at a time.
+    Args:
+        source (str): The encrypted file.
+        destination (str): The file written with the plaintext.
+        key (bytes): The unwrapped AES key of the file.
+        chunk_size (int): Bytes decrypted at a time, a multiple of the AES block size.
+        size (int): The size of the plaintext, the padding after it is not written.
+                    None writes all of it.
+    """
+    decryptor = Cipher(algorithms.AES(key), modes.CBC(_ITUNES_IV)).decryptor()
+    remaining = size
+    with open(source, 'rb') as encrypted_file, open(destination, 'wb') as decrypted_file:
+        while True:
+            chunk = encrypted_file.read(chunk_size)
+            data = decryptor.update(chunk) if chunk else decryptor.finalize()
+            if remaining is not None:
+                data = data[:remaining]
+                remaining -= len(data)
+            decrypted_file.write(data)
+            if not chunk:
+                break
+
 
 class FileSeekerItunes(FileSeekerBase):
     """
@@ -384,11 +1161,13 @@ class FileSeekerItunes(FileSeekerBase):
         backup_type (str): The type of backup, either 'db' or 'mbdb'.
         decryption_keys (list): A list of keys used for decrypting files, if applicable.
         _all_files (dict): A dictionary mapping full file paths to their corresponding hash filenames.
-        _all_file_meta (dict): A dictionary storing metadata for each file.
-        files_metadata (dict): A dictionary mapping hash filenames to their metadata.
+        files_metadata (dict): A dictionary mapping hash filenames to their metadata plist, parsed
+            when the file is extracted.
         searched (dict): A dictionary storing search results for file patterns.
         copied (dict): A dictionary tracking copied files and their destinations.
         file_infos (dict): A dictionary storing file information such as creation and modification dates.
+        extract_threads (int): Number of files prefetch decrypts or copies at the same time.
+        decrypt_chunk_size (int): Bytes of a file decrypted at a time, a multiple of the AES block size.
     Methods:
         __init__(directory, data_folder, backup_type, decryption_keys):
             Initializes the FileSeekerItunes instance and builds the file listing based on the backup type.
@@ -400,13 +1179,21 @@ class FileSeekerItunes(FileSeekerBase):
             Populates paths from Manifest.mbdb files into _all_files.
         search(filepattern, return_on_first_hit=False, force=False):
             Searches for files matching the given pattern and returns their paths.
+        prefetch(filepatterns):
+            Decrypts or copies the files matching all the patterns from a pool of threads.
+
+    The files of an encrypted backup are decrypted as a stream, so a large video takes no
+    more memory than a small plist, and the key of a file is only unwrapped when the file
+    is extracted. AES runs outside the GIL, so prefetch decrypts many files at once.
     """
 
+    extract_threads = min(32, (os.cpu_count() or 1) + 4)
+    decrypt_chunk_size = 1024 * 1024
+
     def __init__(self, directory, data_folder, backup_type, decryption_keys):
         FileSeekerBase.__init__(self)
         self.directory = directory
         self._all_files = {}
-        self._all_file_meta = {}
         self.data_folder = data_folder
         self.files_metadata = {}
         self.decryption_keys = decryption_keys
@@ -416,20 +1203,16 @@ class FileSeekerItunes(FileSeekerBase):
             manifest_path = os.path.join(directory, "Manifest.db")
             if decryption_keys:
                 unwrapped_manifest_key = decryption_keys[1]
-                with open(manifest_path, "rb") as manifest_contents:
-                    cipher = Cipher(algorithms.AES(unwrapped_manifest_key),
-                                    modes.CBC(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'))
-                    decryptor = cipher.decryptor()
-                    decrypted_manifest_contents = decryptor.update(manifest_contents.read()) + decryptor.finalize()
-                    manifest_path = os.path.join(data_folder, "Manifest.db")
-                    with open(manifest_path, "wb") as new_manifest_contents:
-                        new_manifest_contents.write(decrypted_manifest_contents)
+                decrypted_manifest_path = os.path.join(data_folder, "Manifest.db")
+                _decrypt_file(manifest_path, decrypted_manifest_path, unwrapped_manifest_key, self.decrypt_chunk_size)
+                manifest_path = decrypted_manifest_path
 
             self.build_files_list_from_manifest_db(manifest_path)
         elif backup_type == "mbdb":
             manifest_path = os.path.join(directory, "Manifest.mbdb")
             self.build_files_list_from_manifest_mbdb(manifest_path)
         logfunc(f'File listing complete - {len(self._all_files)} files')
+        self._index = PathIndex(list(self._all_files), key=normcase)
         self.searched = {}
         self.copied = {}
         self.file_infos = {}
@@ -473,16 +1256,7 @@ class FileSeekerItunes(FileSeekerBase):
                 file_metadata = row[3]
                 full_path = os.path.join(root_path, relative_path)
                 self._all_files[full_path] = hash_filename
-                if self.decryption_keys:
-                    # Load the file's plist and find the encryption key
-                    tmp_file_plist = get_plist_content(row[3])
-                    tmp_wrapped_key = tmp_file_plist["EncryptionKey"]["NS.data"]
-
-                    # Store the results into a dict for future
-                    self._all_file_meta[full_path] = {}
-                    self._all_file_meta[full_path]['Class'] = int.from_bytes(tmp_wrapped_key[0:4], byteorder="little")
-                    self._all_file_meta[full_path]['Key'] = tmp_wrapped_key[4:]
-                    self._all_file_meta[full_path]['Size'] = tmp_file_plist["Size"]
+                # Parsed, and the encryption key unwrapped, when the file is extracted
                 self.files_metadata[hash_filename] = file_metadata
             db.close()
         except Exception as ex:
@@ -558,64 +1332,12 @@ class FileSeekerItunes(FileSeekerBase):
             pathlist = self.searched[filepattern]
             return self.searched[filepattern][0] if return_on_first_hit and pathlist else pathlist
         pathlist = []
-        matching_keys = fnmatch.filter(self._all_files, filepattern)
+        matching_keys = self._index.search(normcase(filepattern))
         for relative_path in matching_keys:
-            hash_filename = self._all_files[relative_path]
-            if self.backup_type == "db":
-                original_location = os.path.join(self.directory, hash_filename[:2], hash_filename)
-                metadata = get_plist_content(self.files_metadata[hash_filename])
-                creation_date = metadata.get('Birth', 0)
-                modification_date = metadata.get('LastModified', 0)
-            else:
-                original_location = os.path.join(self.directory, hash_filename)
-                # TO DO: extract creation and modification dates from manifest.mbdb
-                creation_date = 0
-                modification_date = 0
-            data_path = os.path.join(self.data_folder, sanitize_file_path(relative_path))
-            if is_platform_windows():
-                data_path = data_path.replace('/', '\\')
+            original_location, data_path = self._locations(relative_path)
             if original_location not in self.copied or force:
-                try:
-                    os.makedirs(os.path.dirname(data_path), exist_ok=True)
-
-                    # Handle encrypted backups differently, don't just copy the encrypted files
-                    if self.decryption_keys:
-                        protection_classes = self.decryption_keys[0]
-                        # Snag the right protection class
-                        tmp_file_meta = self._all_file_meta[relative_path]
-                        if tmp_file_meta['Class'] not in protection_classes:
-                            logfunc(f'Can\'t locate the protection class for {relative_path}: {tmp_file_meta["Class"]}')
-                            raise KeyError
-                        tmp_protection_class = protection_classes[tmp_file_meta['Class']]
-
-                        # Grab the file's key
-                        tmp_file_wrapped_key = tmp_file_meta['Key']
-                        tmp_file_unwrapped_key = crypt.aes_key_unwrap(tmp_protection_class['Unwrapped'],
-                                                                      tmp_file_wrapped_key)
-
-                        # Open the file and snag the contents
-                        with open(original_location, "rb") as temp_original_file:
-                            # Decrypt the contents, Apple uses a 0'd out 16-byte IV
-                            cipher = Cipher(
-                                algorithms.AES(tmp_file_unwrapped_key),
-                                modes.CBC(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'))
-                            decryptor = cipher.decryptor()
-                            decrypted_contents = decryptor.update(temp_original_file.read()) + decryptor.finalize()
-
-                            # Write the decrypt into the expected located, only write the expected size, no padding
-                            with open(data_path, "wb") as temp_new_file:
-                                temp_new_file.write(decrypted_contents[0:tmp_file_meta['Size']])
-
-                    # If not encrypted, just copy the thing
-                    else:
-                        copy2(original_location, data_path)
-
-                    source_path = relative_path.replace('\\', '/')
-                    file_info = FileInfo(source_path, creation_date, modification_date)
-                    self.file_infos[data_path] = file_info
-                    self.copied[original_location] = data_path
-                except OSError as ex:
-                    logfunc(f'Could not copy {original_location} to {data_path} ' + str(ex))
+                self._record(original_location, data_path,
+                             self._extract_file(relative_path, original_location, data_path))
             else:
                 data_path = self.copied[original_location]
             pathlist.append(data_path)
@@ -625,6 +1347,82 @@ class FileSeekerItunes(FileSeekerBase):
         self.searched[filepattern] = pathlist
         return pathlist
 
+    def prefetch(self, filepatterns):
+        files = {}
+        for filepattern in filepatterns:
+            for relative_path in self._index.search(normcase(filepattern)):
+                original_location, data_path = self._locations(relative_path)
+                if original_location not in self.copied:
+                    files.setdefault(original_location, (relative_path, original_location, data_path))
+        if not files:
+            return
+        logfunc(f'{"Decrypting" if self.decryption_keys else "Copying"} {len(files)} files '
+                'for the selected artifacts...')
+        with ThreadPoolExecutor(max_workers=self.extract_threads) as executor:
+            file_infos = executor.map(lambda file: self._extract_file(*file), files.values())
+            for (_, original_location, data_path), file_info in zip(files.values(), file_infos):
+                self._record(original_location, data_path, file_info)
+
+    def _locations(self, relative_path):
+        '''Returns the path of a file in the backup and its path in the data folder'''
+        hash_filename = self._all_files[relative_path]
+        if self.backup_type == "db":
+            original_location = os.path.join(self.directory, hash_filename[:2], hash_filename)
+        else:
+            original_location = os.path.join(self.directory, hash_filename)
+        data_path = os.path.join(self.data_folder, sanitize_file_path(relative_path))
+        if is_platform_windows():
+            data_path = data_path.replace('/', '\\')
+        return original_location, data_path
+
+    def _extract_file(self, relative_path, original_location, data_path):
+        '''
+        Decrypts or copies a file of the backup to the data folder. Called from the threads of
+        prefetch, so it only reads the seeker.
+        Returns:
+            FileInfo: The information of the file, None if it could not be extracted.
+        '''
+        if self.backup_type == "db":
+            metadata = get_plist_content(self.files_metadata[self._all_files[relative_path]])
+            creation_date = metadata.get('Birth', 0)
+            modification_date = metadata.get('LastModified', 0)
+        else:
+            metadata = {}
+            # TO DO: extract creation and modification dates from manifest.mbdb
+            creation_date = 0
+            modification_date = 0
+        try:
+            os.makedirs(os.path.dirname(data_path), exist_ok=True)
+
+            # Handle encrypted backups differently, don't just copy the encrypted files
+            if self.decryption_keys:
+                protection_classes = self.decryption_keys[0]
+                wrapped_key = metadata["EncryptionKey"]["NS.data"]
+                # Snag the right protection class
+                protection_class = int.from_bytes(wrapped_key[0:4], byteorder="little")
+                if protection_class not in protection_classes:
+                    logfunc(f'Can\'t locate the protection class for {relative_path}: {protection_class}')
+                    return None
+
+                # Grab the file's key, then decrypt the file, only writing the expected size, no padding
+                unwrapped_key = crypt.aes_key_unwrap(protection_classes[protection_class]['Unwrapped'],
+                                                     wrapped_key[4:])
+                _decrypt_file(original_location, data_path, unwrapped_key, self.decrypt_chunk_size, metadata["Size"])
+
+            # If not encrypted, just copy the thing
+            else:
+                copy2(original_location, data_path)
+        except (OSError, KeyError, ValueError, crypt.InvalidUnwrap) as ex:
+            logfunc(f'Could not copy {original_location} to {data_path} ' + str(ex))
+            return None
+        return FileInfo(relative_path.replace('\\', '/'), creation_date, modification_date)
+
+    def _record(self, original_location, data_path, file_info):
+        '''Records a file extracted to the data folder'''
+        if file_info is not None:
+            self.file_infos[data_path] = file_info
+            self.copied[original_location] = data_path
+
 
 class FileSeekerTar(FileSeekerBase):
     """
@@ -644,16 +1442,23 @@ class FileSeekerTar(FileSeekerBase):
         search(filepattern, return_on_first_hit=False, force=False):
             Searches for files matching the given pattern in the tar archive and extracts them to the data folder.
             Returns a list of paths to the extracted files or the first hit if specified.
+        prefetch(filepatterns):
+            Extracts the members matching all the patterns in one sequential pass over the archive.
         cleanup():
             Closes the tar file to free up resources.
+        reopen():
+            Opens the tar file again in a forked worker process.
     """
 
     def __init__(self, tar_file_path, data_folder):
         FileSeekerBase.__init__(self)
         self.is_gzip = tar_file_path.lower().endswith('gz')
+        self.tar_file_path = tar_file_path
         mode = 'r:gz' if self.is_gzip else 'r'
         self.tar_file = tarfile.open(tar_file_path, mode)
         self.data_folder = data_folder
+        root = normcase("root/")
+        self._index = PathIndex(self.tar_file.getmembers(), key=lambda member: root + normcase(member.name))
         self.searched = {}
         self.copied = {}
         self.file_infos = {}
@@ -663,46 +1468,65 @@ class FileSeekerTar(FileSeekerBase):
             pathlist = self.searched[filepattern]
             return self.searched[filepattern][0] if return_on_first_hit and pathlist else pathlist
         pathlist = []
-        pat = _compile_pattern(normcase(filepattern))
-        root = normcase("root/")
-        for member in self.tar_file.getmembers():
-            if pat(root + normcase(member.name)) is not None:
-                clean_name = sanitize_file_path(member.name)
-                full_path = os.path.join(self.data_folder, Path(clean_name))
-                if member.name not in self.copied or force:
-                    try:
-                        if member.isdir():
-                            os.makedirs(full_path, exist_ok=True)
-                        else:
-                            parent_dir = os.path.dirname(full_path)
-                            if not os.path.exists(parent_dir):
-                                os.makedirs(parent_dir)
-                            with open(full_path, "wb") as fout:
-                                fout.write(tarfile.ExFileObject(self.tar_file, member).read())
-                                fout.close()
-                                file_info = FileInfo(member.name, 0, member.mtime)
-                                self.file_infos[full_path] = file_info
-                                self.copied[member.name] = full_path
-                            os.utime(full_path, (member.mtime, member.mtime))
-                    except OSError as ex:
-                        logfunc(f'Could not write file to filesystem, path was {member.name} ' + str(ex))
-                else:
-                    full_path = self.copied[member.name]
-                pathlist.append(full_path)
-                if return_on_first_hit:
-                    self.searched[filepattern] = pathlist
-                    return full_path
+        for member in self._index.search(normcase(filepattern)):
+            if member.name not in self.copied or force:
+                full_path = self._extract_member(member)
+            else:
+                full_path = self.copied[member.name]
+            pathlist.append(full_path)
+            if return_on_first_hit:
+                self.searched[filepattern] = pathlist
+                return full_path
         self.searched[filepattern] = pathlist
         return pathlist
 
+    def prefetch(self, filepatterns):
+        # Members are extracted in the order of the archive: reading a compressed tar
+        # backwards means decompressing it again from the start for every member
+        members = {}
+        for filepattern in filepatterns:
+            for member in self._index.search(normcase(filepattern)):
+                if not member.isdir() and member.name not in self.copied:
+                    members.setdefault(member.name, member)
+        if members:
+            logfunc(f'Extracting {len(members)} files for the selected artifacts...')
+        for member in sorted(members.values(), key=lambda member: member.offset_data):
+            self._extract_member(member)
+
+    def _extract_member(self, member):
+        '''Writes a member to the data folder and returns its path there'''
+        clean_name = sanitize_file_path(member.name)
+        full_path = os.path.join(self.data_folder, Path(clean_name))
+        try:
+            if member.isdir():
+                os.makedirs(full_path, exist_ok=True)
+            else:
+                parent_dir = os.path.dirname(full_path)
+                if not os.path.exists(parent_dir):
+                    os.makedirs(parent_dir)
+                with open(full_path, "wb") as fout:
+                    copyfileobj(tarfile.ExFileObject(self.tar_file, member), fout)
+                    file_info = FileInfo(member.name, 0, member.mtime)
+                    self.file_infos[full_path] = file_info
+                    self.copied[member.name] = full_path
+                os.utime(full_path, (member.mtime, member.mtime))
+        except OSError as ex:
+            logfunc(f'Could not write file to filesystem, path was {member.name} ' + str(ex))
+        return full_path
+
     def cleanup(self):
         self.tar_file.close()
 
+    def reopen(self):
+        # Members are read from their recorded offsets, so the indexed TarInfo objects stay valid
+        self.tar_file = tarfile.open(self.tar_file_path, 'r:gz' if self.is_gzip else 'r')
+
 
 class FileSeekerZip(FileSeekerBase):
     """
     This is a class that extends FileSeekerBase to facilitate searching and extracting files from a ZIP archive.
     Attributes:
+        zip_file_path (str): The path to the ZIP file.
         zip_file (ZipFile): The ZIP file object representing the archive.
         name_list (list): A list of file names contained in the ZIP archive.
         data_folder (str): The directory where extracted files will be stored.
@@ -716,15 +1540,23 @@ class FileSeekerZip(FileSeekerBase):
             Decodes the extended timestamp information from the extra data of a file in the ZIP archive.
         search(filepattern, return_on_first_hit=False, force=False):
             Searches for files matching the specified pattern in the ZIP archive and extracts them if found.
+        prefetch(filepatterns):
+            Extracts the members matching all the patterns in the order they are stored in the archive.
         cleanup():
             Closes the ZIP file to free up resources.
+        reopen():
+            Opens the ZIP file again in a forked worker process.
     """
 
     def __init__(self, zip_file_path, data_folder):
         FileSeekerBase.__init__(self)
+        self.zip_file_path = zip_file_path
         self.zip_file = ZipFile(zip_file_path)
         self.name_list = self.zip_file.namelist()
         self.data_folder = data_folder
+        root = normcase("root/")
+        self._index = PathIndex([member for member in self.name_list if not member.startswith("__MACOSX")],
+                                key=lambda member: root + normcase(member))
         self.searched = {}
         self.copied = {}
         self.file_infos = {}
@@ -766,38 +1598,55 @@ class FileSeekerZip(FileSeekerBase):
             pathlist = self.searched[filepattern]
             return self.searched[filepattern][0] if return_on_first_hit and pathlist else pathlist
         pathlist = []
-        pat = _compile_pattern(normcase(filepattern))
-        root = normcase("root/")
-        for member in self.name_list:
-            if member.startswith("__MACOSX"):
-                continue
-            if pat(root + normcase(member)) is not None:
-                if member not in self.copied or force:
-                    try:
-                        # already replaces illegal chars with _ when exporting
-                        extracted_path = self.zip_file.extract(member, path=self.data_folder)
-                        f = self.zip_file.getinfo(member)
-                        creation_date, modification_date = self.decode_extended_timestamp(f.extra)
-                        file_info = FileInfo(member, creation_date, modification_date)
-                        self.file_infos[extracted_path] = file_info
-                        date_time = f.date_time
-                        date_time = timex.mktime(date_time + (0, 0, -1))
-                        os.utime(extracted_path, (date_time, date_time))
-                        self.copied[member] = extracted_path
-                    except OSError as ex:
-                        logfunc(f'Could not write file to filesystem, path was {member} ' + str(ex))
-                else:
-                    extracted_path = self.copied[member]
-                pathlist.append(extracted_path)
-                if return_on_first_hit:
-                    self.searched[filepattern] = pathlist
-                    return extracted_path
+        for member in self._index.search(normcase(filepattern)):
+            if member not in self.copied or force:
+                extracted_path = self._extract_member(member)
+                if extracted_path is None:
+                    continue
+            else:
+                extracted_path = self.copied[member]
+            pathlist.append(extracted_path)
+            if return_on_first_hit:
+                self.searched[filepattern] = pathlist
+                return extracted_path
         self.searched[filepattern] = pathlist
         return pathlist
 
+    def prefetch(self, filepatterns):
+        # Members are extracted in the order of the archive, so the input is read front to back
+        members = set()
+        for filepattern in filepatterns:
+            members.update(member for member in self._index.search(normcase(filepattern))
+                           if member not in self.copied)
+        if members:
+            logfunc(f'Extracting {len(members)} files for the selected artifacts...')
+        for member in sorted(members, key=lambda member: self.zip_file.getinfo(member).header_offset):
+            self._extract_member(member)
+
+    def _extract_member(self, member):
+        '''Extracts a member to the data folder and returns its path there, None if it failed'''
+        extracted_path = None
+        try:
+            # already replaces illegal chars with _ when exporting
+            extracted_path = self.zip_file.extract(member, path=self.data_folder)
+            f = self.zip_file.getinfo(member)
+            creation_date, modification_date = self.decode_extended_timestamp(f.extra)
+            file_info = FileInfo(member, creation_date, modification_date)
+            self.file_infos[extracted_path] = file_info
+            date_time = f.date_time
+            date_time = timex.mktime(date_time + (0, 0, -1))
+            os.utime(extracted_path, (date_time, date_time))
+            self.copied[member] = extracted_path
+        except OSError as ex:
+            logfunc(f'Could not write file to filesystem, path was {member} ' + str(ex))
+        return extracted_path
+
     def cleanup(self):
         self.zip_file.close()
 
+    def reopen(self):
+        self.zip_file = ZipFile(self.zip_file_path)
+
 
 class FileSeekerFile(FileSeekerBase):
     """
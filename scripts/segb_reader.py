@@ -0,0 +1,173 @@
+"""
+Reads the SEGB files of the Biome streams (and of the other streams in the format, like
+the Duet notifications) from a single memory mapping.
+
+ccl_segb.read_segb_file opens a file to check the SEGB v1 signature, opens it again for
+the v2 one and then a third time to read it, reading every record with a read call for
+its header and another for its data. read_segb_file here memory-maps the file once,
+checks its signature and reads its entries from the mapped pages, with the structs of
+the headers compiled once and a v2 trailer unpacked in a single call. The data of an
+entry is the bytes of its record, sliced once from the mapping.
+
+The entries are those of ccl_segb, the same Segb1Entry and Segb2Entry read the same way,
+including what ccl_segb does with a damaged file: the entries read before the damage
+are yielded, then the error is raised.
+
+Functions:
+    read_segb_file: Yields the entries of a SEGB v1 or v2 file, like ccl_segb.read_segb_file.
+"""
+
+import dataclasses
+import datetime
+import errno
+import mmap
+import os
+import pathlib
+import struct
+import zlib
+
+from scripts.ccl_segb import ccl_segb1, ccl_segb2
+from scripts.ccl_segb.ccl_segb_common import COCOA_EPOCH, EntryState, decode_cocoa_time
+
+_segb1_record_header = struct.Struct('<iiddIi')
+_segb2_header = struct.Struct('<4sid16s')
+_segb2_trailer_entry = struct.Struct('<2id')
+_segb2_entry_header = struct.Struct('Ii')
+
+_entry_states = {state.value: state for state in EntryState}
+_new = object.__new__
+_timedelta = datetime.timedelta
+
+
+def _read_segb1(data):
+    """Returns the entries of a SEGB v1 file, the way ccl_segb1.read_segb1_stream reads them, and its error"""
+    entries = []
+    size = len(data)
+    end_of_data_offset, = struct.unpack_from('<I', data, 0)
+    pos = ccl_segb1.HEADER_LENGTH
+    try:
+        while pos < end_of_data_offset:
+            (record_length, entry_state_raw, timestamp1_raw, timestamp2_raw, crc32_stored,
+             unknown_raw) = _segb1_record_header.unpack(data[pos:pos + ccl_segb1.RECORD_HEADER_LENGTH])
+            # decode_cocoa_time, and EntryState() raising its error for the unknown states
+            timestamp1 = COCOA_EPOCH + _timedelta(0, timestamp1_raw)
+            timestamp2 = COCOA_EPOCH + _timedelta(0, timestamp2_raw)
+            record_offset = pos = min(pos + ccl_segb1.RECORD_HEADER_LENGTH, size)
+            if record_length >= 0:
+                record_data = data[pos:pos + record_length]
+            elif record_length == -1:
+                record_data = data[pos:]  # as read(-1) does
+            else:
+                raise ValueError('read length must be non-negative or -1')
+            pos += len(record_data)
+            entry_state = _entry_states.get(entry_state_raw) or EntryState(entry_state_raw)
+            # The fields of the frozen dataclass set at once, without its __init__ setting them one by one
+            entry = _new(ccl_segb1.Segb1Entry)
+            entry.__dict__.update(timestamp1=timestamp1, timestamp2=timestamp2, data_start_offset=record_offset,
+                                  metadata_crc=crc32_stored, actual_crc=zlib.crc32(record_data), data=record_data,
+                                  state=entry_state, _unknown_value=unknown_raw)
+            entries.append(entry)
+            if (remainder := pos % ccl_segb1.ALIGNMENT_BYTES_LENGTH) != 0:
+                pos += ccl_segb1.ALIGNMENT_BYTES_LENGTH - remainder
+    except Exception as ex:  # pylint: disable=broad-except
+        return entries, ex
+    return entries, None
+
+
+def _read_segb2(data):
+    """Returns the entries of a SEGB v2 file, the way ccl_segb2.read_segb2_stream reads them, and its error"""
+    entries = []
+    size = len(data)
+    header_length = ccl_segb2.HEADER_LENGTH
+    _, entries_count, creation_timestamp_raw, _ = _segb2_header.unpack_from(data, 0)
+    try:
+        # Not used, but a timestamp out of range is an error
+        decode_cocoa_time(creation_timestamp_raw)
+    except Exception as ex:  # pylint: disable=broad-except
+        return entries, ex
+
+    trailer_offset = size - ccl_segb2.TRAILER_ENTRY_LENGTH * entries_count
+    if trailer_offset < 0:
+        # Seeking before the start of the file
+        return entries, OSError(errno.EINVAL, os.strerror(errno.EINVAL))
+    trailer_list = []
+    try:
+        trailer = data[trailer_offset:trailer_offset + ccl_segb2.TRAILER_ENTRY_LENGTH * max(entries_count, 0)]
+        for index, (entry_end_offset, entry_state_raw, entry_timestamp_raw) in enumerate(
+                _segb2_trailer_entry.iter_unpack(trailer)):
+            entry_state = _entry_states.get(entry_state_raw)
+            if entry_state is None:
+                # Zeroed/unused trailer slots reference no record data
+                continue
+            metadata = _new(ccl_segb2.EntryMetadata)
+            metadata.__dict__.update(metadata_offset=trailer_offset + index * ccl_segb2.TRAILER_ENTRY_LENGTH,
+                                     end_offset=entry_end_offset, state=entry_state,
+                                     creation=COCOA_EPOCH + _timedelta(0, entry_timestamp_raw))
+            trailer_list.append(metadata)
+
+        trailer_list.sort(key=lambda x: x.end_offset)
+        pos = header_length
+        previous_entry = None
+        for trailer_entry in trailer_list:
+            entry_offset = pos
+            if trailer_entry.state == 4:
+                continue
+            # Two trailer entries sharing an end offset reference the same data
+            if previous_entry is not None and trailer_entry.end_offset == previous_entry.metadata.end_offset:
+                entries.append(dataclasses.replace(previous_entry, metadata=trailer_entry))
+                continue
+            entry_length = trailer_entry.end_offset - pos + header_length
+            # Stale trailer entries pointing inside a record already read
+            if entry_length < ccl_segb2.ENTRY_HEADER_LENGTH:
+                continue
+            end = pos + entry_length
+            crc32_stored, unknown_raw = _segb2_entry_header.unpack(data[pos:pos + ccl_segb2.ENTRY_HEADER_LENGTH])
+            entry_data = data[pos + ccl_segb2.ENTRY_HEADER_LENGTH:end]
+            pos = min(end, max(pos, size))
+            if (remainder := trailer_entry.end_offset % 4) != 0:
+                pos += 4 - remainder
+            previous_entry = _new(ccl_segb2.Segb2Entry)
+            previous_entry.__dict__.update(metadata=trailer_entry, data_start_offset=entry_offset,
+                                           metadata_crc=crc32_stored, actual_crc=zlib.crc32(entry_data),
+                                           data=entry_data, _unknown_value=unknown_raw)
+            entries.append(previous_entry)
+    except Exception as ex:  # pylint: disable=broad-except
+        return entries, ex
+    return entries, None
+
+
+def _read_segb(path):
+    """Returns the entries of a SEGB file and the error reading them raised"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < ccl_segb2.HEADER_LENGTH:
+            raise ValueError("File is not a SEGB File", path)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Checked in the order of ccl_segb.read_segb_file
+            if size >= ccl_segb1.HEADER_LENGTH and data[ccl_segb1.HEADER_LENGTH - 4:ccl_segb1.HEADER_LENGTH] == \
+                    ccl_segb1.MAGIC:
+                return _read_segb1(data)
+            if data[0:4] == ccl_segb2.MAGIC:
+                return _read_segb2(data)
+    raise ValueError("File is not a SEGB File", path)
+
+
+def _entries(entries, error):
+    yield from entries
+    if error is not None:
+        raise error
+
+
+def read_segb_file(file_path: pathlib.Path | os.PathLike | str):
+    """
+    Yields the entries of a SEGB v1 or v2 file, like ccl_segb.read_segb_file.
+    Args:
+        file_path (str): The path of the file.
+    Returns:
+        iterator: The Segb1Entry or Segb2Entry objects of the file. If the file is damaged,
+                  the error ccl_segb raises is raised once the entries before it are yielded.
+    Raises:
+        ValueError: The file is not a SEGB file.
+    """
+    entries, error = _read_segb(os.fspath(file_path))
+    return _entries(entries, error)